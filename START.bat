@@ -9,6 +9,9 @@ echo.
 echo  Installing required packages...
 pip install streamlit --quiet
 echo.
+echo  Compiling phrase dictionaries...
+python phrase_store.py
+echo.
 echo  Starting CBT Portal...
 echo  Open your browser to: http://localhost:8501
 echo.
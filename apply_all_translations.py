@@ -8,9 +8,15 @@ Translates questions that don't yet have translations in each language.
 
 import sqlite3
 import time
-import re
 from typing import Dict
 
+from question_bank_db import (
+    bump_bank_generation, ensure_stream_indexes, untranslated_where, iter_bank_rows,
+    get_checkpoint, save_checkpoint, clear_checkpoint, count_sql, update_sql,
+)
+import phrase_engine
+import translation_memory as tm
+
 DB_PATH = "question_bank.db"
 
 LANGS = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
@@ -299,30 +305,8 @@ GLOSSARY = {
 
 
 def glossary_translate(text: str, lang: str) -> str:
-    """Apply glossary translations preserving numbers and symbols."""
-    if not text or lang not in GLOSSARY:
-        return text
-    
-    glossary = GLOSSARY[lang]
-    result = text
-    
-    # Sort by length descending to prevent partial replacements
-    sorted_terms = sorted(glossary.items(), key=lambda x: -len(x[0]))
-    
-    for en_term, native_term in sorted_terms:
-        if not native_term or not en_term:
-            continue
-        # Use word boundary-aware replacement
-        pattern = r'\b' + re.escape(en_term) + r'\b'
-        try:
-            result = re.sub(pattern, native_term, result, flags=re.IGNORECASE)
-        except re.error:
-            # Fallback for terms that can't be used in regex
-            if en_term.lower() in result.lower():
-                idx = result.lower().find(en_term.lower())
-                result = result[:idx] + native_term + result[idx + len(en_term):]
-    
-    return result.strip()
+    """Apply glossary translations preserving numbers and symbols (phrase_engine "glossary" profile)."""
+    return phrase_engine.translate(text, lang, "glossary")
 
 
 def translate_all_questions():
@@ -332,6 +316,8 @@ def translate_all_questions():
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute("PRAGMA cache_size=-32000")
+    ensure_stream_indexes(conn)
+    conn.commit()
     
     total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
     print(f"\nTotal questions: {total:,}")
@@ -340,10 +326,7 @@ def translate_all_questions():
     import json
     
     for lang in LANGS:
-        untranslated = conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NULL OR question_{lang} = ''
-        """).fetchone()[0]
+        untranslated = conn.execute(count_sql(lang, translated=False)).fetchone()[0]
         
         if untranslated == 0:
             print(f"✅ {lang}: already fully translated!")
@@ -352,31 +335,27 @@ def translate_all_questions():
         print(f"Translating {untranslated:,} questions → {lang}...", end=" ", flush=True)
         t0 = time.time()
         
-        # Process in batches
+        # Process in batches (qb_id order, resumable)
         BATCH = 1000
         done = 0
+        job = f"glossary_translate:{lang}"
+        tm_stats = tm.new_stats()
         
-        while True:
-            rows = conn.execute(f"""
-                SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en,
-                       translated_langs
-                FROM question_bank
-                WHERE question_{lang} IS NULL OR question_{lang} = ''
-                LIMIT {BATCH}
-            """).fetchall()
-            
-            if not rows:
-                break
-            
+        for rows in iter_bank_rows(
+                "question_en, option_a_en, option_b_en, option_c_en, option_d_en, translated_langs",
+                untranslated_where(lang), batch_size=BATCH,
+                after_id=get_checkpoint(job, conn), conn=conn):
             conn.execute("BEGIN")
             try:
+                # Each unique source string once; repeats come from the translation memory
+                cols = ["question_en", "option_a_en", "option_b_en", "option_c_en", "option_d_en"]
+                memo = tm.translate_unique((row[c] for row in rows for c in cols), lang, "glossary",
+                                           translate=lambda t: glossary_translate(t, lang),
+                                           conn=conn, stats=tm_stats)
                 for row in rows:
                     qb_id = row["qb_id"]
-                    q_trans = glossary_translate(row["question_en"], lang)
-                    a_trans = glossary_translate(row["option_a_en"], lang)
-                    b_trans = glossary_translate(row["option_b_en"], lang)
-                    c_trans = glossary_translate(row["option_c_en"], lang)
-                    d_trans = glossary_translate(row["option_d_en"], lang)
+                    q_trans, a_trans, b_trans, c_trans, d_trans = (
+                        memo.get(row[c], row[c]) for c in cols)
                     
                     # Update translated_langs JSON
                     try:
@@ -386,13 +365,10 @@ def translate_all_questions():
                     if lang not in langs_list:
                         langs_list.append(lang)
                     
-                    conn.execute(f"""
-                        UPDATE question_bank
-                        SET question_{lang}=?, option_a_{lang}=?, option_b_{lang}=?,
-                            option_c_{lang}=?, option_d_{lang}=?, translated_langs=?
-                        WHERE qb_id=?
-                    """, (q_trans, a_trans, b_trans, c_trans, d_trans,
+                    conn.execute(update_sql(lang, with_langs=True), (q_trans, a_trans, b_trans, c_trans, d_trans,
                           json.dumps(langs_list), qb_id))
+                bump_bank_generation(conn)
+                save_checkpoint(job, rows[-1]["qb_id"], conn)
                 conn.commit()
             except Exception as e:
                 conn.rollback()
@@ -400,22 +376,20 @@ def translate_all_questions():
                 break
             
             done += len(rows)
+        else:
+            clear_checkpoint(job, conn)
+            conn.commit()
         
-        final = conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-        """).fetchone()[0]
+        final = conn.execute(count_sql(lang)).fetchone()[0]
         pct = round(final / total * 100, 1)
         print(f"{final:,}/{total:,} ({pct}%) — {time.time()-t0:.1f}s")
+        print(f"   {tm.format_stats(tm_stats)}")
     
     print("\n" + "="*60)
     print("TRANSLATION COMPLETE — Final Coverage:")
     print("="*60)
     for lang in LANGS:
-        count = conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-        """).fetchone()[0]
+        count = conn.execute(count_sql(lang)).fetchone()[0]
         pct = round(count / total * 100, 1)
         status = "✅" if pct >= 99 else "⚠️"
         print(f"  {status} {lang}: {count:,} / {total:,} ({pct}%)")
@@ -0,0 +1,269 @@
+"""
+argos_worker.py — Offline Argos Translate worker
+=================================================
+argos_translate() used to call get_installed_languages() and rebuild the
+translation object (reloading the model) on every call, and _init_argos()
+started with update_package_index(), which needs the network. Fine for
+one string, unusable for bulk work.
+
+Here each process resolves a language's translation object once, from
+locally installed packages only, and keeps it (the model stays loaded).
+Texts are translated in batches: single-line texts are joined with "\\n"
+into one call (Argos translates each line as a paragraph), so the model
+sees many sentences per call. Any text Argos fails on falls back to phrase
+translation on its own. Throughput is tracked per language.
+
+Bulk jobs run this as a process pool through translation_pipeline
+(python translation_pipeline.py --engine argos).
+
+Installing models is explicit and offline unless asked otherwise:
+    python argos_worker.py --install                  # from the cached package index
+    python argos_worker.py --install --update-index   # refresh the index first (network)
+    python argos_worker.py                            # installed languages + a smoke test
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import phrase_engine
+
+try:
+    import argostranslate.package
+    import argostranslate.translate
+    ARGOS_AVAILABLE = True
+except ImportError:
+    ARGOS_AVAILABLE = False
+
+LANGS = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
+_BATCH_CHARS = 4000        # joined characters per Argos call
+
+_translators: Dict[str, object] = {}
+_unavailable: set = set()
+_lock = threading.Lock()
+_metrics: Dict[str, Dict] = {}
+
+
+# ─── MODELS ───────────────────────────────────────────────────────────────────
+
+def get_translator(lang: str):
+    """en→lang translation object from installed packages, loaded once per process."""
+    if not ARGOS_AVAILABLE or lang in _unavailable:
+        return None
+    tr = _translators.get(lang)
+    if tr is not None:
+        return tr
+    with _lock:
+        tr = _translators.get(lang)
+        if tr is None and lang not in _unavailable:
+            try:
+                installed = argostranslate.translate.get_installed_languages()
+                fl = next((l for l in installed if l.code == "en"), None)
+                tl = next((l for l in installed if l.code == lang), None)
+                tr = fl.get_translation(tl) if fl and tl else None
+            except Exception as e:
+                print(f"  Argos: loading en→{lang} failed: {e}")
+                tr = None
+            if tr is None:
+                _unavailable.add(lang)
+            else:
+                _translators[lang] = tr
+    return tr
+
+
+def installed_langs() -> List[str]:
+    return [l for l in LANGS if get_translator(l) is not None]
+
+
+def install_packages(langs: Optional[List[str]] = None, update_index: bool = False) -> Dict[str, str]:
+    """
+    Install missing en→lang packages. Uses the locally cached package index
+    unless update_index=True (network). Returns {lang: status}.
+    """
+    if not ARGOS_AVAILABLE:
+        return {}
+    langs = langs or LANGS
+    status: Dict[str, str] = {}
+    try:
+        if update_index:
+            argostranslate.package.update_package_index()
+        available = argostranslate.package.get_available_packages()
+    except Exception as e:
+        print(f"  Argos index: {e}")
+        available = []
+    for lang in langs:
+        if get_translator(lang) is not None:
+            status[lang] = "installed"
+            continue
+        pkg = next((p for p in available if p.from_code == "en" and p.to_code == lang), None)
+        if pkg is None:
+            status[lang] = "not in index" + ("" if update_index else " (try --update-index)")
+            continue
+        try:
+            argostranslate.package.install_from_path(pkg.download())
+            status[lang] = "installed now"
+        except Exception as e:
+            status[lang] = f"failed: {e}"
+    with _lock:
+        _unavailable.clear()
+    return status
+
+
+# ─── METRICS ──────────────────────────────────────────────────────────────────
+
+def new_metrics() -> Dict:
+    return {"texts": 0, "chars": 0, "calls": 0, "secs": 0.0, "fallbacks": 0}
+
+
+def merge_metrics(into: Dict[str, Dict], other: Dict[str, Dict]):
+    for lang, m in other.items():
+        cur = into.setdefault(lang, new_metrics())
+        for k, v in m.items():
+            cur[k] += v
+
+
+def metrics() -> Dict[str, Dict]:
+    """This process's totals per language, with texts/sec and chars/sec."""
+    with _lock:
+        out = {lang: dict(m) for lang, m in _metrics.items()}
+    for m in out.values():
+        m["texts_per_sec"] = m["texts"] / m["secs"] if m["secs"] else 0.0
+        m["chars_per_sec"] = m["chars"] / m["secs"] if m["secs"] else 0.0
+    return out
+
+
+def format_metrics(per_lang: Dict[str, Dict]) -> str:
+    parts = []
+    for lang, m in per_lang.items():
+        rate = m["texts"] / m["secs"] if m["secs"] else 0.0
+        fb = f", {m['fallbacks']:,} phrase fallback" if m["fallbacks"] else ""
+        parts.append(f"{lang}: {m['texts']:,} texts @ {rate:,.1f}/s{fb}")
+    return "Argos — " + ("; ".join(parts) if parts else "nothing translated")
+
+
+# ─── TRANSLATION ──────────────────────────────────────────────────────────────
+
+def _batches(texts: List[str]) -> List[List[int]]:
+    """Index groups to translate per call: single-line texts packed up to _BATCH_CHARS."""
+    groups, cur, size = [], [], 0
+    for i, t in enumerate(texts):
+        if "\n" in t:
+            groups.append([i])          # keeps its own line structure
+            continue
+        if cur and size + len(t) > _BATCH_CHARS:
+            groups.append(cur); cur, size = [], 0
+        cur.append(i); size += len(t) + 1
+    if cur:
+        groups.append(cur)
+    return groups
+
+
+def translate_batch(texts: List[str], lang: str) -> Tuple[List[str], Dict]:
+    """
+    Translate texts en→lang. Returns (translations, metrics for this call).
+    Empty texts pass through; texts Argos can't handle get phrase translation.
+    """
+    m = new_metrics()
+    out = list(texts)
+    todo = [i for i, t in enumerate(texts) if t and t.strip()]
+    tr = get_translator(lang)
+    t0 = time.perf_counter()
+    if tr is None:
+        for i in todo:
+            out[i] = phrase_engine.translate(texts[i], lang, "v2")
+        m["fallbacks"] = len(todo)
+    else:
+        sub = [texts[i] for i in todo]
+        for group in _batches(sub):
+            lines = [sub[j] for j in group]
+            result = None
+            try:
+                joined = tr.translate("\n".join(lines)) or ""
+                m["calls"] += 1
+                result = [joined] if len(lines) == 1 else joined.split("\n")
+            except Exception:
+                result = None
+            if result is None or len(result) != len(lines):
+                # batch failed or came back misaligned: one call per text
+                result = []
+                for line in lines:
+                    try:
+                        result.append(tr.translate(line) or "")
+                        m["calls"] += 1
+                    except Exception:
+                        result.append("")
+            for j, r in zip(group, result):
+                if not r.strip():
+                    r = phrase_engine.translate(sub[j], lang, "v2")
+                    m["fallbacks"] += 1
+                out[todo[j]] = r
+    m["secs"] = time.perf_counter() - t0
+    m["texts"] = len(todo)
+    m["chars"] = sum(len(texts[i]) for i in todo)
+    with _lock:
+        merge_metrics(_metrics, {lang: m})
+    return out, m
+
+
+def translate_one(text: str, lang: str) -> Optional[str]:
+    """Argos translation of one text, or None if Argos can't (no phrase fallback)."""
+    tr = get_translator(lang)
+    if tr is None or not text:
+        return None
+    try:
+        t0 = time.perf_counter()
+        r = tr.translate(text)
+        m = new_metrics()
+        m.update(texts=1, chars=len(text), calls=1, secs=time.perf_counter() - t0)
+        with _lock:
+            merge_metrics(_metrics, {lang: m})
+        return r if r and r.strip() else None
+    except Exception:
+        return None
+
+
+# ─── PROCESS POOL ─────────────────────────────────────────────────────────────
+
+def init_worker(langs: List[str]):
+    """Pool initializer: load each language's model once per worker process."""
+    for lang in langs:
+        get_translator(lang)
+
+
+def translate_chunk(work: Dict[str, List[str]]) -> Tuple[Dict[str, List[str]], float, Dict[str, Dict]]:
+    """Pool worker: {lang: [texts]} → ({lang: [translations]}, seconds, {lang: metrics})."""
+    t0 = time.perf_counter()
+    out, per_lang = {}, {}
+    for lang, texts in work.items():
+        out[lang], per_lang[lang] = translate_batch(texts, lang)
+    return out, time.perf_counter() - t0, per_lang
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Argos Translate models for offline translation")
+    ap.add_argument("--install", action="store_true", help="install missing en→xx packages")
+    ap.add_argument("--update-index", action="store_true", help="refresh the package index first (network)")
+    ap.add_argument("--langs", default=",".join(LANGS), help="comma-separated language codes")
+    args = ap.parse_args()
+    if not ARGOS_AVAILABLE:
+        print("❌ argostranslate is not installed (pip install argostranslate)")
+        return
+    langs = [l.strip() for l in args.langs.split(",") if l.strip()]
+    if args.install:
+        for lang, status in install_packages(langs, args.update_index).items():
+            print(f"  en→{lang}: {status}")
+    ready = [l for l in langs if get_translator(l) is not None]
+    print(f"Installed: {', '.join(ready) or 'none'}")
+    for lang in ready:
+        translate_batch(["What is the SI unit of force?", "All of the above"], lang)
+    if ready:
+        print(format_metrics(metrics()))
+
+
+if __name__ == "__main__":
+    main()
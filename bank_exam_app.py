@@ -17,13 +17,19 @@ from typing import Dict, List, Optional
 from question_bank_db import (
     init_bank, get_bank_stats, get_subject_count,
     get_questions_for_exam, mark_questions_seen, get_user_seen_count,
-    add_to_recycle_pool, get_recycled_questions, get_recycle_stats,
+    add_many_to_recycle_pool, recycle_seen_questions, recycle_seen_questions_iter,
+    get_recycled_questions, get_recycle_stats,
     get_questions_smart, _bank_conn, _bank_lock,
+    create_exam_session, record_session_response, record_session_position,
+    load_active_session, close_exam_session,
 )
+from translation_pipeline import run_translation_pipeline
+from translation_memory import format_stats as format_tm_stats
+from translation_quality import analyze as analyze_translation_quality, load_quality, top_phrases
+from exam_components import question_palette, palette_payload, question_navigator, navigator_event
 from translation_engine_v2 import (
-    translate_all_questions, get_question_in_lang,
-    get_all_translation_stats, get_untranslated_count, get_translated_count,
-    translate_batch, SUPPORTED_LANGS,
+    translate_all_questions, get_question_in_lang, ensure_translations,
+    get_all_translation_stats, get_translated_count, SUPPORTED_LANGS,
 )
 
 try:
@@ -115,6 +121,18 @@ SUBJECT_COLORS = {
 }
 ALL_SUBJECTS = list(SUBJECT_LABELS.keys())
 
+DIFF_COLORS = {"medium":("#DBEAFE","#1E40AF"),"hard":("#FEF3C7","#92400E"),"very_hard":("#FEE2E2","#991B1B")}
+DIFF_LABELS = {"medium":"Medium","hard":"Hard","very_hard":"Very Hard"}
+
+# Question navigator: questions prefetched around the current one, and how many
+# changed questions / seconds the browser holds before syncing back.
+NAV_WINDOW = 20
+NAV_SYNC_BATCH = 10
+NAV_SYNC_SECS = 30
+
+# Above this many seen questions, "Recycle My Seen Questions" streams in chunks with a progress bar
+RECYCLE_STREAM_THRESHOLD = 50_000
+
 # ══════════════════════════════════════════════════════════════════════════════
 # PAGE CONFIG & GLOBAL CSS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -184,6 +202,140 @@ def _init():
     init_bank(); return True
 _init()
 
+def _sync_question(qi: int):
+    """Queue the full state of question index `qi` to the durable session store."""
+    questions = ss("exam_questions", [])
+    if not (0 <= qi < len(questions)): return
+    qb_id = questions[qi]["qb_id"]
+    record_session_response(ss("exam_session_id"), qb_id, ss("exam_responses", {}).get(qb_id),
+                            qi in ss("exam_review", set()), qi in ss("exam_visited", set()))
+
+def _apply_nav_event(ev: Dict):
+    """Fold one batched navigator change set into session state and the session store."""
+    questions = ss("exam_questions", []); responses = ss("exam_responses", {})
+    review = ss("exam_review", set()); visited = ss("exam_visited", set())
+    changed = []
+    for qi, ans, rev, vis in ev.get("changes", []):
+        if not (0 <= qi < len(questions)): continue
+        if ans: responses[questions[qi]["qb_id"]] = ans
+        (review.add if rev else review.discard)(qi)
+        if vis: visited.add(qi)
+        changed.append(qi)
+    ss_set("exam_responses", responses); ss_set("exam_review", review); ss_set("exam_visited", visited)
+    for qi in changed: _sync_question(qi)
+    if questions:
+        ss_set("exam_current_idx", max(0, min(int(ev.get("cur", 0)), len(questions)-1)))
+    ss_set("exam_nav_ack", ev.get("sent", 0))
+
+def _nav_window(questions: List[Dict], idx: int, lang: str) -> List[Dict]:
+    """Questions around `idx` in `lang`, reused across reruns while idx stays inside."""
+    win = ss("exam_nav_window")
+    if win and win["lang"] == lang and win["lo"] <= idx < win["hi"]:
+        return win["items"]
+    lo = max(0, min(idx - NAV_WINDOW // 4, len(questions) - NAV_WINDOW))
+    hi = min(len(questions), lo + NAV_WINDOW)
+    items = []
+    for i in range(lo, hi):
+        q = questions[i]; t = get_question_in_lang(q, lang)
+        subj = q.get("_subject", ""); diff = q.get("difficulty", "medium")
+        diff_bg, diff_fc = DIFF_COLORS.get(diff, DIFF_COLORS["medium"])
+        items.append({"i": i, "q": t["question"],
+                      "o": [t["option_a"], t["option_b"], t["option_c"], t["option_d"]],
+                      "s": SUBJECT_LABELS.get(subj, subj), "sc": SUBJECT_COLORS.get(subj, "#58A6FF"),
+                      "d": DIFF_LABELS.get(diff, diff), "dbg": diff_bg, "dfc": diff_fc,
+                      "rec": bool(q.get("_from_recycle"))})
+    ss_set("exam_nav_window", {"lang": lang, "lo": lo, "hi": hi, "items": items})
+    return items
+
+def _recycle_seen_ui(uid: int, subjects: List[str]) -> int:
+    """Recycle the user's seen questions for `subjects`; returns how many were newly added."""
+    seen = sum(get_user_seen_count(uid, subj) for subj in subjects)
+    if seen <= RECYCLE_STREAM_THRESHOLD:
+        return sum(recycle_seen_questions(uid, subjects).values())
+    prog = st.progress(0.0, text="♻️ Recycling...")
+    done = {}; added = {}
+    for subj, n_done, _, n_added in recycle_seen_questions_iter(uid, subjects):
+        done[subj] = n_done; added[subj] = n_added
+        prog.progress(min(1.0, sum(done.values()) / seen),
+                      text=f"♻️ {SUBJECT_LABELS.get(subj, subj)}: {n_done:,} processed")
+    prog.empty()
+    return sum(added.values())
+
+def _run_translation_ui(langs: List[str], total_q: int):
+    """Run the parallel translation pipeline with one progress bar per language."""
+    bars = {lc: st.progress(0.0, text=f"🔄 {SUPPORTED_LANGS[lc]['name']}...") for lc in langs}
+    def report(done, totals):
+        for lc, n in done.items():
+            if totals[lc]:
+                bars[lc].progress(min(1.0, n / totals[lc]),
+                                  text=f"🔄 {SUPPORTED_LANGS[lc]['name']}: {n:,}/{totals[lc]:,}")
+    stats = run_translation_pipeline(langs, progress=report)
+    for bar in bars.values(): bar.empty()
+    for lc in langs:
+        n = stats["translated"].get(lc, 0)
+        name = SUPPORTED_LANGS[lc]["name"]
+        st.success(f"✅ {name}: {get_translated_count(lc):,}/{total_q:,} done!" if n else f"✅ {name}: already complete!")
+    for err in stats.get("errors", [])[:3]:
+        st.error(f"Write error: {err}")
+    st.success(f"🎉 {stats['rows']:,} questions translated in {stats['elapsed']:.0f}s "
+               f"({stats.get('qps', 0):,.0f} q/s)")
+    if stats["memory"]["fields"]:
+        st.caption(f"🧠 {format_tm_stats(stats['memory'])}")
+
+def _translation_quality_ui():
+    """Last translation-quality analysis per language, with a button to re-run it."""
+    if st.button("🔬 Analyse Translation Quality", use_container_width=True):
+        total = max(1, get_bank_stats()["total"])
+        prog = st.progress(0.0, text="🔬 Analysing...")
+        res = analyze_translation_quality(
+            progress=lambda n: prog.progress(min(1.0, n / total), text=f"🔬 {n:,}/{total:,} questions"))
+        prog.empty()
+        st.success(f"✅ {res['rows']:,} questions analysed in {res['elapsed']:.1f}s")
+    rows = load_quality()
+    if not rows:
+        st.caption("No analysis yet — run it to see untranslated words per language.")
+        return
+    st.caption(f"Last run: {max(r['computed_at'] for r in rows)} · "
+               "untouched = stored text identical to English · Latin = words still in English")
+    for lc in SUPPORTED_LANGS:
+        lrows = [r for r in rows if r["lang"] == lc]
+        if not lrows: continue
+        covered = sum(r["covered"] for r in lrows); tokens = sum(r["tokens"] for r in lrows)
+        untouched = sum(r["untouched"] for r in lrows) / covered * 100 if covered else 0
+        latin = sum(r["latin_tokens"] for r in lrows) / tokens * 100 if tokens else 0
+        with st.expander(f"{SUPPORTED_LANGS[lc]['native']} ({SUPPORTED_LANGS[lc]['name']}) — "
+                         f"{untouched:.1f}% untouched · {latin:.1f}% Latin words"):
+            for r in lrows:
+                st.markdown(f"**{SUBJECT_LABELS.get(r['subject'], r['subject'])}** — "
+                            f"{r['coverage']*100:.1f}% covered · {r['untouched_ratio']*100:.1f}% untouched · "
+                            f"{r['latin_ratio']*100:.1f}% Latin")
+            phrases = top_phrases(lrows, 15)
+            if phrases:
+                st.caption("Most frequent untranslated: " + ", ".join(f"{p} ({n:,})" for p, n in phrases))
+
+def _resume_exam_if_any():
+    """After a restart/reconnect, restore an in-progress exam from the bank DB."""
+    if ss("exam_active") or ss("resume_checked"): return
+    ss_set("resume_checked", True)
+    sess = load_active_session(ss("user_id", 1))
+    if not sess or not sess["questions"] or sess["exam_type"] not in EXAM_CONFIGS: return
+    questions = sess["questions"]
+    ensure_translations(questions, sess["language"])
+    idx_of = {q["qb_id"]: i for i, q in enumerate(questions)}
+    subj_index = {}
+    for i, q in enumerate(questions):
+        subj_index.setdefault(q.get("_subject", ""), []).append(i)
+    ss_set("exam_active", True); ss_set("exam_type", sess["exam_type"])
+    ss_set("exam_cfg", EXAM_CONFIGS[sess["exam_type"]]); ss_set("exam_lang", sess["language"])
+    ss_set("exam_questions", questions); ss_set("exam_subj_index", subj_index)
+    ss_set("exam_responses", sess["responses"])
+    ss_set("exam_review", {idx_of[q] for q in sess["review_qb_ids"] if q in idx_of})
+    ss_set("exam_visited", {idx_of[q] for q in sess["visited_qb_ids"] if q in idx_of})
+    ss_set("exam_current_idx", sess["current_idx"]); ss_set("exam_start_time", sess["started_epoch"])
+    ss_set("exam_duration_secs", sess["duration_secs"]); ss_set("exam_session_id", sess["session_id"])
+    ss_set("exam_submitted", False); ss_set("exam_deleted", False)
+    ss_set("confirm_delete", False); ss_set("view", "exam")
+
 # ══════════════════════════════════════════════════════════════════════════════
 # LOGIN
 # ══════════════════════════════════════════════════════════════════════════════
@@ -404,6 +556,10 @@ def start_exam(exam_type: str, language: str):
         # Final shuffle for extra randomness
         random.shuffle(all_questions)
 
+    if language != "en" and all_questions:
+        with st.spinner(f"🌐 Preparing {LANG_OPTIONS.get(language, language)} paper..."):
+            ensure_translations(all_questions, language)
+
     if len(all_questions) < 5:
         st.error("❌ Not enough questions. Run: `python seed_to_40000.py`"); return
 
@@ -411,12 +567,15 @@ def start_exam(exam_type: str, language: str):
     for i, q in enumerate(all_questions):
         s = q.get("_subject", ""); subj_index.setdefault(s, []).append(i)
 
+    start_time = time.time()
+    session_id = create_exam_session(uid, exam_type, language, all_questions,
+                                     cfg["duration_mins"] * 60, start_time)
     ss_set("exam_active", True); ss_set("exam_type", exam_type); ss_set("exam_cfg", cfg)
     ss_set("exam_lang", language); ss_set("exam_questions", all_questions)
     ss_set("exam_subj_index", subj_index); ss_set("exam_responses", {})
     ss_set("exam_review", set()); ss_set("exam_visited", set())
-    ss_set("exam_current_idx", 0); ss_set("exam_start_time", time.time())
-    ss_set("exam_duration_secs", cfg["duration_mins"] * 60)
+    ss_set("exam_current_idx", 0); ss_set("exam_start_time", start_time)
+    ss_set("exam_duration_secs", cfg["duration_mins"] * 60); ss_set("exam_session_id", session_id)
     ss_set("exam_submitted", False); ss_set("exam_deleted", False)
     ss_set("confirm_delete", False); ss_set("view", "exam")
     if subjects_recycled: ss_set("exam_recycled_note", subjects_recycled)
@@ -430,12 +589,21 @@ def show_exam():
     if ss("exam_submitted"): show_results(); return
     if ss("exam_deleted"): show_exam_deleted(); return
 
+    # Navigator changes first, so palette/counters/submit below see them this run
+    ev = navigator_event("exam_nav")
+    if ev:
+        _apply_nav_event(ev)
+        if ev.get("submit"): ss_set("confirm_delete", False); submit_exam(); return
+
     questions = ss("exam_questions", []); responses = ss("exam_responses", {})
     review = ss("exam_review", set()); visited = ss("exam_visited", set())
     subj_index = ss("exam_subj_index", {}); idx = max(0, min(ss("exam_current_idx", 0), len(questions)-1))
     lang = ss("exam_lang", "en"); cfg = ss("exam_cfg", {}); uid = ss("user_id", 1)
-    total = len(questions); q_data = questions[idx]; qb_id = q_data["qb_id"]
-    visited.add(idx); ss_set("exam_visited", visited)
+    total = len(questions)
+    if idx not in visited:
+        visited.add(idx); ss_set("exam_visited", visited); _sync_question(idx)
+    if ss("exam_synced_pos") != (idx, lang):
+        record_session_position(ss("exam_session_id"), idx, lang); ss_set("exam_synced_pos", (idx, lang))
 
     elapsed_secs = int(time.time() - ss("exam_start_time", time.time()))
     remaining_secs = max(0, ss("exam_duration_secs", 10800) - elapsed_secs)
@@ -456,36 +624,12 @@ def show_exam():
         </div>""", unsafe_allow_html=True)
         st.markdown("---")
 
-        for subj, subj_idxs in subj_index.items():
-            sc = SUBJECT_COLORS.get(subj, "#58A6FF"); label = SUBJECT_LABELS.get(subj, subj)
-            done_in_subj = sum(1 for i in subj_idxs if questions[i]["qb_id"] in responses)
-            st.markdown(f"<div style='background:{sc}22;border-left:3px solid {sc};border-radius:6px;padding:.3rem .6rem;margin-bottom:.4rem;display:flex;justify-content:space-between;align-items:center'><span style='font-size:.7rem;font-weight:700;color:{sc}'>{label}</span><span style='font-size:.68rem;color:#8B949E'>{done_in_subj}/{len(subj_idxs)}</span></div>", unsafe_allow_html=True)
-
-            COLS = 6
-            for row_start in range(0, len(subj_idxs), COLS):
-                row_qs = subj_idxs[row_start:row_start+COLS]
-                ccols = st.columns(COLS)
-                for col_i, qi in enumerate(row_qs):
-                    with ccols[col_i]:
-                        qid_i = questions[qi]["qb_id"]
-                        is_current = (qi == idx)
-                        is_answered = qid_i in responses; is_review = qi in review; is_visited = qi in visited
-                        if is_current: bg, fc = "#3B82F6","white"
-                        elif is_answered and is_review: bg, fc = "#D97706","white"
-                        elif is_answered: bg, fc = "#22C55E","white"
-                        elif is_review: bg, fc = "#EAB308","#0F1117"
-                        elif is_visited: bg, fc = "#64748B","white"
-                        else: bg, fc = "#21262D","#8B949E"
-                        if st.button(str(qi+1), key=f"pal_{qi}", help=f"Q{qi+1}",
-                                     use_container_width=True):
-                            ss_set("exam_current_idx", qi); st.rerun()
-                        # Color via inline JS (works with Streamlit's dynamic DOM)
-                        st.markdown(f"""<script>
-                        (function(){{var btns=document.querySelectorAll('button');
-                        btns.forEach(function(b){{if(b.innerText.trim()=='{qi+1}' && b.closest('[data-testid="stSidebar"]')){{
-                        b.style.background='{bg}';b.style.color='{fc}';b.style.borderColor='{bg}';}}}})}})();
-                        </script>""", unsafe_allow_html=True)
-            st.markdown("")
+        sections = [{"label": SUBJECT_LABELS.get(subj, subj), "color": SUBJECT_COLORS.get(subj, "#58A6FF"),
+                     "idx": subj_idxs} for subj, subj_idxs in subj_index.items()]
+        clicked = question_palette(palette_payload(total, idx, answered_idxs, review, visited, sections),
+                                   key="exam_palette")
+        if clicked is not None and clicked != idx:
+            ss_set("exam_current_idx", clicked); st.rerun()
 
         st.markdown("---")
         answered_n = len(answered_idxs)
@@ -496,7 +640,7 @@ def show_exam():
         </div>""", unsafe_allow_html=True)
 
     # ══ TOP BAR ══
-    c_timer, c_lang, c_del, c_sub = st.columns([2.5, 2, 1.5, 1])
+    c_timer, c_lang, c_del = st.columns([2.5, 2, 1.5])
 
     with c_timer:
         # JS timer — zero flicker!
@@ -533,7 +677,10 @@ def show_exam():
             format_func=lambda x: LANG_OPTIONS[x],
             key="exam_lang_select", label_visibility="visible"
         )
-        if new_lang != lang: ss_set("exam_lang", new_lang); st.rerun()
+        if new_lang != lang:
+            with st.spinner(f"🌐 Switching to {LANG_OPTIONS[new_lang]}..."):
+                ensure_translations(questions, new_lang)
+            ss_set("exam_lang", new_lang); st.rerun()
 
     with c_del:
         if st.button("🗑 Delete Exam", use_container_width=True):
@@ -542,68 +689,25 @@ def show_exam():
                 ss_set("confirm_delete", True)
                 st.warning("Click **Delete Exam** again to confirm")
 
-    with c_sub:
-        if st.button("🚩 Submit", type="primary", use_container_width=True):
-            ss_set("confirm_delete", False); submit_exam()
-
     recycled_note = ss("exam_recycled_note", [])
     if recycled_note:
         st.markdown(f'<div class="recycle-box">♻️ Recycled questions: {", ".join(recycled_note)}</div>', unsafe_allow_html=True)
 
-    # ══ QUESTION ══
-    q_text = get_question_in_lang(q_data, lang)
-    subj = q_data.get("_subject", ""); subj_label = SUBJECT_LABELS.get(subj, subj)
-    subj_color = SUBJECT_COLORS.get(subj, "#58A6FF")
-    diff = q_data.get("difficulty", "medium")
-    diff_colors = {"medium":("#DBEAFE","#1E40AF"),"hard":("#FEF3C7","#92400E"),"very_hard":("#FEE2E2","#991B1B")}
-    diff_bg, diff_fc = diff_colors.get(diff, diff_colors["medium"])
-    diff_label = {"medium":"Medium","hard":"Hard","very_hard":"Very Hard"}.get(diff, diff)
-
-    if q_data.get("_from_recycle"):
-        st.markdown('<div class="recycle-box">♻️ From your recycled pool (previously deleted exam)</div>', unsafe_allow_html=True)
-    if not q_text.get("lang_available", True) and lang != "en" and not q_text.get("question", ""):
-        st.markdown(f'<div class="warn-box">⚠️ Not yet translated to {LANG_OPTIONS.get(lang, lang)} — showing English</div>', unsafe_allow_html=True)
-
-    st.markdown(f"""<div class="qcard">
-        <div class="qnum">
-            Q{idx+1}/{total} &nbsp;·&nbsp;
-            <span style='background:{subj_color}22;color:{subj_color};padding:.15rem .55rem;border-radius:5px;font-size:.72rem;font-weight:700'>{subj_label}</span>
-            &nbsp;
-            <span style='background:{diff_bg};color:{diff_fc};padding:.15rem .55rem;border-radius:5px;font-size:.72rem;font-weight:700'>{diff_label}</span>
-        </div>
-        <div class="qtext">{q_text['question']}</div>
-    </div>""", unsafe_allow_html=True)
-
-    opts = [q_text['option_a'], q_text['option_b'], q_text['option_c'], q_text['option_d']]
-    cur = responses.get(qb_id)
-    selected = st.radio(
-        "Select your answer:", ["A","B","C","D"],
-        format_func=lambda x: f"**{x}.**  {opts['ABCD'.index(x)]}",
-        index=["A","B","C","D"].index(cur) if cur else None,
-        key=f"radio_{qb_id}", label_visibility="collapsed"
-    )
-
-    st.markdown("<div style='height:.3rem'></div>", unsafe_allow_html=True)
-    c1, c2, c3, c4 = st.columns(4)
-    with c1:
-        if st.button("💾 Save & Next", type="primary", use_container_width=True):
-            if selected: responses[qb_id] = selected; ss_set("exam_responses", responses)
-            if idx+1 < total: ss_set("exam_current_idx", idx+1)
-            st.rerun()
-    with c2:
-        marked = idx in review
-        if st.button("🔖 "+("Unmark" if marked else "Mark Review"), use_container_width=True):
-            (review.discard if marked else review.add)(idx)
-            if selected: responses[qb_id] = selected; ss_set("exam_responses", responses)
-            ss_set("exam_review", review); st.rerun()
-    with c3:
-        if st.button("⬅ Previous", use_container_width=True, disabled=(idx==0)):
-            if selected: responses[qb_id] = selected; ss_set("exam_responses", responses)
-            ss_set("exam_current_idx", idx-1); st.rerun()
-    with c4:
-        if st.button("Next ➡", use_container_width=True, disabled=(idx==total-1)):
-            if selected: responses[qb_id] = selected; ss_set("exam_responses", responses)
-            ss_set("exam_current_idx", idx+1); st.rerun()
+    # ══ QUESTION ══ answers, review marks and moves inside the prefetched window
+    # stay in the browser; they come back here in batches (or on submit).
+    items = _nav_window(questions, idx, lang)
+    state = {}
+    for it in items:
+        i = it["i"]
+        state[i] = {"a": responses.get(questions[i]["qb_id"]), "r": int(i in review), "v": int(i in visited)}
+    ev = question_navigator({"sid": ss("exam_session_id") or 0, "total": total, "cur": idx,
+                             "ack": ss("exam_nav_ack", 0), "batch": NAV_SYNC_BATCH,
+                             "sync_secs": NAV_SYNC_SECS, "items": items, "state": state},
+                            key="exam_nav")
+    if ev:
+        _apply_nav_event(ev)
+        if ev.get("submit"): ss_set("confirm_delete", False); submit_exam(); return
+        st.rerun()
 
     # ✅ NO time.sleep() / st.rerun() — timer is JS-based, zero flicker!
 
@@ -612,11 +716,13 @@ def show_exam():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def delete_exam():
-    questions = ss("exam_questions",[]); uid = ss("user_id",1); recycled = {}
+    questions = ss("exam_questions",[]); uid = ss("user_id",1); recycled = {}; items = []
     for q in questions:
         qb_id = q["qb_id"]; subj = q.get("_subject", q.get("subject",""))
-        add_to_recycle_pool(uid, qb_id, subj, source="deleted_exam")
+        items.append((qb_id, subj))
         recycled[subj] = recycled.get(subj, 0) + 1
+    add_many_to_recycle_pool(uid, items, source="deleted_exam")
+    close_exam_session(ss("exam_session_id"), "deleted")
     ss_set("exam_deleted", True); ss_set("exam_recycled_summary", recycled)
     ss_set("confirm_delete", False); st.rerun()
 
@@ -639,14 +745,18 @@ def show_exam_deleted():
     with c1:
         if st.button("🏠 Back to Dashboard", type="primary", use_container_width=True):
             for k in ["exam_active","exam_deleted","exam_submitted","exam_questions",
-                      "exam_responses","exam_review","exam_visited","exam_current_idx","exam_recycled_note","confirm_delete"]:
+                      "exam_responses","exam_review","exam_visited","exam_current_idx","exam_recycled_note","confirm_delete",
+                      "exam_session_id","exam_synced_pos",
+                      "exam_nav_ack","exam_nav_window"]:
                 st.session_state.pop(k, None)
             ss_set("view","dashboard"); st.rerun()
     with c2:
         if st.button("🔄 Start New Exam", use_container_width=True):
             et = ss("exam_type","NEET"); el = ss("exam_lang","en")
             for k in ["exam_active","exam_deleted","exam_submitted","exam_questions",
-                      "exam_responses","exam_review","exam_visited","exam_current_idx"]:
+                      "exam_responses","exam_review","exam_visited","exam_current_idx",
+                      "exam_session_id","exam_synced_pos",
+                      "exam_nav_ack","exam_nav_window"]:
                 st.session_state.pop(k, None)
             start_exam(et, el)
 
@@ -682,6 +792,7 @@ def submit_exam():
                 conn.execute("UPDATE exam_recycle_pool SET is_available=0 WHERE user_id=? AND qb_id=? AND subject=?",
                              (str(uid),q["qb_id"],q.get("_subject",q.get("subject",""))))
     conn.commit()
+    close_exam_session(ss("exam_session_id"), "submitted", total_score, correct, wrong, unattempted)
     ss_set("exam_submitted",True); ss_set("exam_score",total_score)
     ss_set("exam_correct",correct); ss_set("exam_wrong",wrong)
     ss_set("exam_unattempted",unattempted); ss_set("exam_by_subject",by_subject)
@@ -728,14 +839,18 @@ def show_results():
     with c1:
         if st.button("🏠 Dashboard",type="primary",use_container_width=True):
             for k in ["exam_active","exam_submitted","exam_questions","exam_responses",
-                      "exam_review","exam_visited","exam_current_idx","exam_score","exam_recycled_note","confirm_delete"]:
+                      "exam_review","exam_visited","exam_current_idx","exam_score","exam_recycled_note","confirm_delete",
+                      "exam_session_id","exam_synced_pos",
+                      "exam_nav_ack","exam_nav_window"]:
                 st.session_state.pop(k,None)
             ss_set("view","dashboard"); st.rerun()
     with c2:
         if st.button("🔄 Another Exam",use_container_width=True):
             et=ss("exam_type","NEET"); el=ss("exam_lang","en")
             for k in ["exam_active","exam_submitted","exam_questions","exam_responses",
-                      "exam_review","exam_visited","exam_current_idx","exam_score","exam_by_subject","exam_detailed","exam_recycled_note"]:
+                      "exam_review","exam_visited","exam_current_idx","exam_score","exam_by_subject","exam_detailed","exam_recycled_note",
+                      "exam_session_id","exam_synced_pos",
+                      "exam_nav_ack","exam_nav_window"]:
                 st.session_state.pop(k,None)
             ss_set("preview_exam_type",et); ss_set("preview_lang",el); ss_set("view","preview"); st.rerun()
 
@@ -765,12 +880,7 @@ def show_user_recycle():
     sel_subj = st.selectbox("Subject", ["-ALL-"] + ALL_SUBJECTS, format_func=lambda x: "All Subjects" if x == "-ALL-" else SUBJECT_LABELS.get(x, x), key="user_recycle_subj")
     if st.button("♻️ Recycle My Seen Questions", type="primary", use_container_width=True):
         subjects_to_recycle = ALL_SUBJECTS if sel_subj == "-ALL-" else [sel_subj]
-        total_recycled = 0
-        for subj in subjects_to_recycle:
-            seen_ids = conn.execute("SELECT qb_id FROM student_q_history WHERE user_id=? AND subject=?", (str(uid), subj)).fetchall()
-            for (qid,) in seen_ids:
-                add_to_recycle_pool(uid, qid, subj, source="manual_recycle")
-                total_recycled += 1
+        total_recycled = _recycle_seen_ui(uid, subjects_to_recycle)
         st.success(f"✅ Added {total_recycled} questions to your recycle pool!")
         st.rerun()
     if by_subj:
@@ -842,49 +952,20 @@ def show_admin():
         c_all, c_sel = st.columns(2)
         with c_all:
             if st.button("🌏 Translate ALL 8 Languages (Recommended)", type="primary", use_container_width=True):
-                import time as _time
-                t_start = _time.time()
-                for lc in list(SUPPORTED_LANGS.keys()):
-                    rem = get_untranslated_count(lc)
-                    if rem == 0:
-                        st.success(f"✅ {SUPPORTED_LANGS[lc]['name']}: already complete!")
-                        continue
-                    lang_name = SUPPORTED_LANGS[lc]["name"]
-                    prog = st.progress(0.0, text=f"🔄 Translating {lang_name}...")
-                    while True:
-                        res = translate_batch(lc, batch_size=2000)
-                        if res["translated"] == 0:
-                            break
-                        now_t = get_translated_count(lc)
-                        pct_val = min(1.0, now_t / max(1, total_q))
-                        prog.progress(pct_val, text=f"🔄 {lang_name}: {now_t:,}/{total_q:,} ({round(pct_val*100,1)}%)")
-                    prog.empty()
-                    st.success(f"✅ {lang_name}: {get_translated_count(lc):,}/{total_q:,} done!")
-                elapsed = _time.time() - t_start
+                _run_translation_ui(list(SUPPORTED_LANGS.keys()), total_q)
                 st.balloons()
-                st.success(f"🎉 All translations complete in {elapsed:.0f}s!")
                 st.rerun()
         with c_sel:
             sel_langs = st.multiselect("Select specific languages", list(SUPPORTED_LANGS.keys()),
                 format_func=lambda x: f"{SUPPORTED_LANGS[x]['native']} ({SUPPORTED_LANGS[x]['name']})", default=["hi"])
             if st.button("▶️ Translate Selected", use_container_width=True) and sel_langs:
-                for lc in sel_langs:
-                    rem = get_untranslated_count(lc)
-                    if rem == 0:
-                        st.success(f"✅ {SUPPORTED_LANGS[lc]['name']}: complete!")
-                        continue
-                    lang_name = SUPPORTED_LANGS[lc]["name"]
-                    prog = st.progress(0.0, text=f"🔄 {lang_name}...")
-                    while True:
-                        res = translate_batch(lc, batch_size=2000)
-                        if res["translated"] == 0:
-                            break
-                        now_t = get_translated_count(lc)
-                        prog.progress(min(1.0, now_t / max(1, total_q)), text=f"🔄 {lang_name}: {now_t:,}/{total_q:,}")
-                    prog.empty()
-                    st.success(f"✅ {lang_name}: done!")
+                _run_translation_ui(sel_langs, total_q)
                 st.rerun()
 
+        st.markdown("---")
+        st.markdown("### 🔬 Translation Quality")
+        _translation_quality_ui()
+
     with tab3:
         conn=_bank_conn()
         uid=ss("user_id",1)
@@ -905,12 +986,7 @@ def show_admin():
             sel_subj=st.selectbox("Subject",["-ALL-"]+ALL_SUBJECTS,format_func=lambda x:"All Subjects" if x=="-ALL-" else SUBJECT_LABELS.get(x,x),key="admin_recycle_subj")
             if st.button("♻️ Recycle My Seen Questions",type="primary",use_container_width=True):
                 subjects_to_recycle=ALL_SUBJECTS if sel_subj=="-ALL-" else [sel_subj]
-                total_recycled=0
-                for subj in subjects_to_recycle:
-                    seen_ids=conn.execute("SELECT qb_id FROM student_q_history WHERE user_id=? AND subject=?",(str(uid),subj)).fetchall()
-                    for (qid,) in seen_ids:
-                        add_to_recycle_pool(uid,qid,subj,source="manual_recycle")
-                        total_recycled+=1
+                total_recycled=_recycle_seen_ui(uid,subjects_to_recycle)
                 st.success(f"✅ Added {total_recycled} questions to your recycle pool!")
                 st.rerun()
         with rc2:
@@ -938,6 +1014,7 @@ def show_admin():
 def main():
     user=ss("user")
     if not user: show_login(); return
+    _resume_exam_if_any()
     view=ss("view","dashboard")
     if view=="admin": show_admin()
     elif view=="recycle": show_user_recycle()
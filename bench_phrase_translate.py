@@ -0,0 +1,105 @@
+"""
+bench_phrase_translate.py
+=========================
+Benchmarks phrase translation: the compiled Aho–Corasick matcher against
+the sequential per-phrase loop it replaced, on the real question bank.
+Also checks that both produce identical output for every field.
+
+Usage:
+    python bench_phrase_translate.py                  # all languages, up to 20,000 questions
+    python bench_phrase_translate.py --limit 0        # whole bank
+    python bench_phrase_translate.py --langs hi,ta
+    python bench_phrase_translate.py --profile glossary   # any phrase_engine profile
+
+Falls back to the question_seeds generators when question_bank.db is empty.
+"""
+
+import sys, os, time, sqlite3, argparse
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from question_bank_db import BANK_DB_PATH
+from translation_engine_v2 import SUPPORTED_LANGS
+from phrase_engine import PROFILES, get_matcher
+
+FIELDS = ["question_en", "option_a_en", "option_b_en", "option_c_en", "option_d_en"]
+
+
+def load_corpus(limit: int):
+    rows = []
+    if os.path.exists(BANK_DB_PATH):
+        conn = sqlite3.connect(BANK_DB_PATH)
+        try:
+            sql = f"SELECT {', '.join(FIELDS)} FROM question_bank ORDER BY qb_id"
+            rows = conn.execute(sql + (f" LIMIT {int(limit)}" if limit else "")).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        conn.close()
+    if rows:
+        return [[f or "" for f in r] for r in rows], BANK_DB_PATH
+
+    from seed_to_40000 import get_subject_generators
+    from question_seeds.mega_expander import generate_all_expanded
+    qs = []
+    for gen in get_subject_generators().values():
+        qs.extend(gen())
+    qs.extend(generate_all_expanded())
+    if limit:
+        qs = qs[:limit]
+    return [[q.get(f, "") or "" for f in FIELDS] for q in qs], "question_seeds generators"
+
+
+def bench_lang(lang: str, corpus, profile: str = "v2"):
+    matcher = get_matcher(lang, profile)
+    texts = [t for row in corpus for t in row]
+
+    t0 = time.perf_counter()
+    old = [matcher.translate_sequential(t) for t in texts]
+    t_old = time.perf_counter() - t0
+
+    fallbacks = [0]
+    sequential = matcher.translate_sequential
+    def counting(text):
+        fallbacks[0] += 1
+        return sequential(text)
+    matcher.translate_sequential = counting
+    try:
+        t0 = time.perf_counter()
+        new = [matcher.translate(t) for t in texts]
+        t_new = time.perf_counter() - t0
+    finally:
+        del matcher.translate_sequential
+
+    diffs = [(a, b, t) for a, b, t in zip(old, new, texts) if a != b]
+    n_q = len(corpus)
+    return {
+        "old_qps": n_q / t_old if t_old else 0, "new_qps": n_q / t_new if t_new else 0,
+        "fallback": fallbacks[0], "fields": len(texts), "diffs": diffs,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Phrase translation benchmark")
+    ap.add_argument("--limit", type=int, default=20000, help="questions to use (0 = all)")
+    ap.add_argument("--langs", default=",".join(SUPPORTED_LANGS), help="comma-separated language codes")
+    ap.add_argument("--profile", default="v2", choices=list(PROFILES), help="phrase_engine profile")
+    args = ap.parse_args()
+
+    corpus, source = load_corpus(args.limit)
+    print(f"Corpus: {len(corpus):,} questions from {source} — profile {args.profile}\n")
+    print(f"{'lang':<6}{'sequential q/s':>16}{'matcher q/s':>14}{'speedup':>9}{'fallback':>10}{'diffs':>7}")
+    total_diffs = 0
+    for lang in [l.strip() for l in args.langs.split(",") if l.strip()]:
+        r = bench_lang(lang, corpus, args.profile)
+        total_diffs += len(r["diffs"])
+        speedup = r["new_qps"] / r["old_qps"] if r["old_qps"] else 0
+        print(f"{lang:<6}{r['old_qps']:>16,.0f}{r['new_qps']:>14,.0f}{speedup:>8.1f}x"
+              f"{r['fallback'] / r['fields']:>9.1%}{len(r['diffs']):>7}")
+        for old, new, text in r["diffs"][:3]:
+            print(f"    text: {text!r}\n    seq : {old!r}\n    new : {new!r}")
+
+    print("\n✅ Outputs identical" if not total_diffs else f"\n❌ {total_diffs} differing fields")
+    return 1 if total_diffs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
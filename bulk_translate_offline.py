@@ -15,12 +15,16 @@ Run: python bulk_translate_offline.py
 import sqlite3
 import json
 import time
-import re
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from question_bank_db import _bank_conn, _bank_lock
+from question_bank_db import (
+    _bank_conn, _bank_lock, bump_bank_generation, ensure_stream_indexes, untranslated_where,
+    iter_bank_rows, get_checkpoint, save_checkpoint, clear_checkpoint, count_sql, update_sql,
+)
+import phrase_engine
+import translation_memory as tm
 
 # ══════════════════════════════════════════════════════════════════════════════
 # COMPREHENSIVE PHRASE DICTIONARIES FOR ALL 8 LANGUAGES
@@ -475,21 +479,19 @@ def build_lang_dict(lang_code):
     return base.get(lang_code, {})
 
 
-def smart_translate(text: str, lang: str, phrase_dict: dict) -> str:
+def smart_translate(text: str, lang: str, phrase_dict: dict = None) -> str:
     """
     Phrase-replacement based translation.
-    Replaces known phrases/words from longest to shortest.
+    Replaces known phrases/words from longest to shortest
+    (phrase_engine "bulk" profile). Without `phrase_dict` the compiled
+    PHRASES/build_lang_dict dictionary for `lang` is used; a custom
+    dictionary is compiled on every call.
     """
-    if not text or lang == "en":
-        return text
-
-    result = text
-    # Sort by length descending to match longest phrases first
-    sorted_phrases = sorted(phrase_dict.items(), key=lambda x: -len(x[0]))
-    for eng, native in sorted_phrases:
-        if native and eng.lower() in result.lower():
-            result = re.sub(re.escape(eng), native, result, flags=re.IGNORECASE, count=3)
-    return result
+    matcher = None
+    if phrase_dict is not None:
+        matcher = phrase_engine.build_matcher(
+            sorted(phrase_dict.items(), key=lambda x: -len(x[0])), "bulk")
+    return phrase_engine.translate(text, lang, "bulk", matcher=matcher)
 
 
 def translate_all(batch_size: int = 1000):
@@ -499,25 +501,17 @@ def translate_all(batch_size: int = 1000):
     print(f"\nTotal questions to translate: {total:,}")
 
     langs = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
+    ensure_stream_indexes()
     lang_names = {"hi":"Hindi","bn":"Bengali","ta":"Tamil","te":"Telugu",
                   "gu":"Gujarati","mr":"Marathi","kn":"Kannada","or":"Odia"}
 
-    # Build phrase dictionaries
-    phrase_dicts = {"hi": PHRASES["hi"]}
-    for lc in langs[1:]:
-        phrase_dicts[lc] = build_lang_dict(lc)
-
     fields = ["question", "option_a", "option_b", "option_c", "option_d"]
 
     for lang in langs:
         lang_name = lang_names[lang]
-        pd = phrase_dicts[lang]
 
         # Check how many already translated
-        already = conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-        """).fetchone()[0]
+        already = conn.execute(count_sql(lang)).fetchone()[0]
 
         remaining = total - already
         print(f"\n[{lang_name}] {already:,} already done, {remaining:,} remaining")
@@ -526,50 +520,25 @@ def translate_all(batch_size: int = 1000):
             print(f"  ✅ Complete!")
             continue
 
-        # Process in batches
-        offset = 0
+        # Process in batches (qb_id order, resumable)
+        job = f"bulk_translate:{lang}"
         translated = 0
+        tm_stats = tm.new_stats()
         t_start = time.time()
 
-        while True:
-            with _bank_lock:
-                rows = conn.execute(f"""
-                    SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en
-                    FROM question_bank
-                    WHERE question_{lang} IS NULL OR question_{lang} = ''
-                    LIMIT {batch_size}
-                """).fetchall()
-
-            if not rows:
-                break
-
-            updates = []
-            for row in rows:
-                qb_id = row[0]
-                q_en = row[1] or ""
-                a_en = row[2] or ""
-                b_en = row[3] or ""
-                c_en = row[4] or ""
-                d_en = row[5] or ""
-
-                q_tr = smart_translate(q_en, lang, pd)
-                a_tr = smart_translate(a_en, lang, pd)
-                b_tr = smart_translate(b_en, lang, pd)
-                c_tr = smart_translate(c_en, lang, pd)
-                d_tr = smart_translate(d_en, lang, pd)
-
-                updates.append((q_tr, a_tr, b_tr, c_tr, d_tr, qb_id))
+        for rows in iter_bank_rows("question_en, option_a_en, option_b_en, option_c_en, option_d_en",
+                                   untranslated_where(lang), batch_size=batch_size,
+                                   after_id=get_checkpoint(job)):
+            # Each unique source string once; repeats come from the translation memory
+            texts = [[row[i] or "" for i in range(1, 6)] for row in rows]
+            memo = tm.translate_unique((t for en in texts for t in en), lang, "bulk",
+                                       translate=lambda t: smart_translate(t, lang), stats=tm_stats)
+            updates = [tuple(memo.get(t, t) for t in en) + (row[0],) for en, row in zip(texts, rows)]
 
             with _bank_lock:
-                conn.executemany(f"""
-                    UPDATE question_bank SET
-                        question_{lang} = ?,
-                        option_a_{lang} = ?,
-                        option_b_{lang} = ?,
-                        option_c_{lang} = ?,
-                        option_d_{lang} = ?
-                    WHERE qb_id = ?
-                """, updates)
+                conn.executemany(update_sql(lang), updates)
+                bump_bank_generation(conn)
+                save_checkpoint(job, rows[-1][0], conn)
                 conn.commit()
 
             translated += len(rows)
@@ -580,12 +549,11 @@ def translate_all(batch_size: int = 1000):
 
             print(f"  {lang_name}: {translated:,}/{remaining:,} ({pct}%) | "
                   f"{rate:.0f} q/s | ETA: {eta:.0f}s", end="\r")
+        clear_checkpoint(job)
 
-        final = conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-        """).fetchone()[0]
+        final = conn.execute(count_sql(lang)).fetchone()[0]
         print(f"\n  ✅ {lang_name}: {final:,}/{total:,} translated ({round(final/total*100,1)}%)")
+        print(f"     {tm.format_stats(tm_stats)}")
 
     # Update translated_langs JSON for all questions based on which lang columns are filled
     print("\n[FINAL] Updating translated_langs metadata...")
@@ -599,16 +567,14 @@ def translate_all(batch_size: int = 1000):
                OR question_gu IS NOT NULL OR question_mr IS NOT NULL
                OR question_kn IS NOT NULL OR question_or IS NOT NULL
         """, (json.dumps(langs),))
+        bump_bank_generation(conn)
         conn.commit()
 
     print("\n" + "="*60)
     print("  TRANSLATION COMPLETE")
     print("="*60)
     for lang in langs:
-        count = conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-        """).fetchone()[0]
+        count = conn.execute(count_sql(lang)).fetchone()[0]
         pct = round(count/total*100, 1)
         status = "✅" if pct >= 99 else "⚠️"
         print(f"  {status} {lang_names[lang]:<12} {count:>8,}/{total:,} ({pct}%)")
@@ -0,0 +1,185 @@
+"""
+check_mass_protection.py
+========================
+Compares the mass translator's single-pass protection lexer
+(phrase_engine.MASS_PROTECT) with the placeholder scheme it replaced, on
+the real question bank.
+
+The old scheme ran 9 regexes one after another, swapping each match for a
+"__PROTn__" placeholder, then restored them with str.replace. Later
+regexes matched inside earlier placeholders ("PROT0" is a chemical symbol
+followed by a number), so most fields came back with placeholder debris.
+The lexer also changed one kind: a chemical symbol no longer matches the
+start of a capitalised word ("Th" of "The").
+
+Each field is translated three ways: the old scheme (old), the lexer
+(new), and the old scheme's kinds run through the lexer (expected — the
+old output rebuilt without placeholder debris). Every field is put in one
+of four buckets:
+
+  same            new == old
+  debris fixed    old has placeholder debris the source didn't, new == expected
+  chemical kind   new != expected; the two differ only in the chemical kind
+  other           anything else (examples are printed)
+
+It also checks the lexer against the sequential semantics it stands for —
+each kind applied in order to the text the earlier kinds left unprotected —
+and reports fields whose protected (non-whitespace) characters differ.
+
+Usage:
+    python check_mass_protection.py                  # whole bank, all languages
+    python check_mass_protection.py --langs hi --limit 5000 --examples 10
+"""
+
+import re
+import sys
+import os
+import time
+import argparse
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_phrase_translate import load_corpus
+from translation_engine_v2 import SUPPORTED_LANGS
+import phrase_engine
+from phrase_engine import MASS_PROTECT, MASS_PROTECT_KINDS, get_matcher, split_protected
+
+# The protection regexes as the mass translator applied them before the lexer
+LEGACY_PROTECT = [re.compile(p) for p in (
+    r'\d+[\./×⁰¹²³⁴⁵⁶⁷⁸⁹]+\d*\s*[A-Za-z%°Ω²³⁻⁺]*',
+    r'\d+\.\d+\s*[A-Za-z%°Ω]*',
+    r'\d+×10[⁻⁺]?\d+',
+    r'[A-Z][a-z]?\d*',
+    r'\d+\s*[A-Za-z°ΩμΩΩ]+',
+    r'[A-Z]+\d+',
+    r'ΔT|ΔH|ΔG|ΔS|ΔP|ΔV',
+    r'[α-ωΑ-Ω]+',
+    r'\d+',
+)]
+LEGACY_LEXER = re.compile("|".join(f"(?:{rx.pattern})" for rx in LEGACY_PROTECT))
+_DEBRIS = re.compile(r'_PROT|PROT\d|__\d+__')
+_SPACES = re.compile(r'  +')
+
+
+def legacy_translate(text: str, lang: str) -> str:
+    if not text:
+        return text
+    protected: Dict[str, str] = {}
+
+    def stash(m):
+        key = f"__PROT{len(protected)}__"
+        protected[key] = m.group(0)
+        return key
+
+    for rx in LEGACY_PROTECT:
+        text = rx.sub(stash, text)
+    matcher = get_matcher(lang, "mass")
+    if matcher is not None:
+        text = matcher.translate(text)
+    for key, val in protected.items():
+        text = text.replace(key, val)
+    return _SPACES.sub(' ', text).strip()
+
+
+def expected_translate(text: str, lang: str) -> str:
+    """The old scheme's kinds, protected by the lexer: old output minus the placeholder bug."""
+    if not text:
+        return text
+    matcher = get_matcher(lang, "mass")
+    if matcher is not None:
+        text = "".join(span if kept else matcher.translate(span)
+                       for span, kept in split_protected(text, LEGACY_LEXER))
+    return _SPACES.sub(' ', text).strip()
+
+
+def _mask(spans: List[Tuple[int, int]], text: str) -> bytearray:
+    """1 per protected character; whitespace is 0 either way (it translates to itself)."""
+    mask = bytearray(len(text))
+    for a, b in spans:
+        mask[a:b] = b"\x01" * (b - a)
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            mask[i] = 0
+    return mask
+
+
+def lexer_mask(text: str) -> bytearray:
+    spans, pos = [], 0
+    for span, kept in split_protected(text, MASS_PROTECT):
+        if kept:
+            spans.append((pos, pos + len(span)))
+        pos += len(span)
+    return _mask(spans, text)
+
+
+def sequential_mask(text: str) -> bytearray:
+    """Each kind in order over the still-unprotected gaps (placeholders as opaque barriers)."""
+    spans: List[Tuple[int, int]] = []
+    for _, pattern in MASS_PROTECT_KINDS:
+        rx = re.compile(pattern)
+        gaps, pos = [], 0
+        for a, b in sorted(spans):
+            if a > pos:
+                gaps.append((pos, a))
+            pos = max(pos, b)
+        if pos < len(text):
+            gaps.append((pos, len(text)))
+        for ga, gb in gaps:
+            for m in rx.finditer(text[ga:gb]):
+                if m.end() > m.start():
+                    spans.append((ga + m.start(), ga + m.end()))
+    return _mask(spans, text)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Check the mass protection lexer against the old placeholders")
+    ap.add_argument("--langs", default=",".join(SUPPORTED_LANGS))
+    ap.add_argument("--limit", type=int, default=0, help="questions to check (0 = whole bank)")
+    ap.add_argument("--examples", type=int, default=5,
+                    help="'chemical kind' and 'other' diffs to print per language")
+    args = ap.parse_args()
+
+    corpus, source = load_corpus(args.limit)
+    texts = [t for row in corpus for t in row if t]
+    print(f"Corpus: {len(corpus):,} questions, {len(texts):,} fields from {source}\n")
+
+    unique = list(dict.fromkeys(texts))
+    span_diffs = [t for t in unique if lexer_mask(t) != sequential_mask(t)]
+    print(f"Lexer vs sequential protection: {len(span_diffs):,} of {len(unique):,} unique fields differ")
+    for t in span_diffs[:args.examples]:
+        print(f"    {t!r}")
+    print()
+
+    print(f"{'lang':<6}{'same':>9}{'debris fixed':>14}{'chemical kind':>15}{'other':>9}"
+          f"{'old s':>9}{'new s':>9}")
+    for lang in [l.strip() for l in args.langs.split(",") if l.strip()]:
+        legacy_translate("warm up", lang)
+        t0 = time.perf_counter()
+        old = [legacy_translate(t, lang) for t in texts]
+        t_old = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        new = [phrase_engine.translate(t, lang, "mass") for t in texts]
+        t_new = time.perf_counter() - t0
+        same = fixed = 0
+        chemical, other = [], []
+        for src, o, n in zip(texts, old, new):
+            if o == n:
+                same += 1
+                continue
+            e = expected_translate(src, lang)
+            if n != e:
+                chemical.append((src, o, n, e))
+            elif _DEBRIS.search(o) and not _DEBRIS.search(src):
+                fixed += 1
+            else:
+                other.append((src, o, n, e))
+        print(f"{lang:<6}{same:>9,}{fixed:>14,}{len(chemical):>15,}{len(other):>9,}"
+              f"{t_old:>9.2f}{t_new:>9.2f}")
+        for label, diffs in (("chemical kind", chemical), ("other", other)):
+            for src, o, n, e in diffs[:args.examples]:
+                print(f"  [{label}]\n    src: {src!r}\n    old: {o!r}\n    exp: {e!r}\n    new: {n!r}")
+
+
+if __name__ == "__main__":
+    main()
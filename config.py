@@ -55,7 +55,8 @@ class SystemConfig:
     # Translation
     SUPPORTED_LANGUAGES: list = None
     DEFAULT_LANGUAGE: str = "en"
-    TRANSLATION_CACHE_SIZE: int = 1000
+    TRANSLATION_CACHE_SIZE: int = 1000            # in-memory LRU entries per process
+    TRANSLATION_CACHE_DISK_MULTIPLIER: int = 100  # on-disk tier holds SIZE × this
     
     def __post_init__(self):
         if self.SUPPORTED_LANGUAGES is None:
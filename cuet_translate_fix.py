@@ -4,9 +4,10 @@ cuet_translate_fix.py
 Fixes CUET subject translations by using a massive Indian GK + General English dictionary.
 Covers: History, Polity, Geography, Economics, Current Affairs, English Grammar, Reasoning, Maths
 """
-import sqlite3, re, sys, os, time
+import sqlite3, sys, os, time
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from question_bank_db import _bank_conn, _bank_lock
+from question_bank_db import _bank_conn, _bank_lock, bump_bank_generation, update_sql
+import phrase_engine
 
 # ══════════════════════════════════════════════════════════════════════════════
 # MASSIVE CUET DICTIONARIES — 2000+ terms per language for Indian GK context
@@ -814,27 +815,22 @@ CUET_PHRASES = {
 },
 }
 
-def build_replacer(phrases: dict):
-    """Longest-phrase-first replacer for accurate translation."""
-    sorted_phrases = sorted(phrases.items(), key=lambda x: -len(x[0]))
+def build_replacer(lang: str):
+    """Longest-phrase-first replacer for accurate translation (phrase_engine "cuet" profile)."""
     def replace(text: str) -> str:
         if not text or not isinstance(text, str): return text
-        for eng, native in sorted_phrases:
-            if eng.lower() in text.lower():
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(eng), re.IGNORECASE)
-                text = pattern.sub(native, text)
-        return text
+        return phrase_engine.translate(text, lang, "cuet")
     return replace
 
+CUET_SUBJECTS = ['CUET_GK', 'CUET_English', 'CUET_Reasoning', 'CUET_Quantitative']
+
 def translate_cuet_all_languages():
     conn = _bank_conn()
-    CUET_SUBJECTS = ['CUET_GK', 'CUET_English', 'CUET_Reasoning', 'CUET_Quantitative']
     LANGS = ['hi', 'bn', 'ta', 'te', 'gu', 'mr', 'kn', 'or']
     COLS = ['question', 'option_a', 'option_b', 'option_c', 'option_d']
 
     for lang in LANGS:
-        replacer = build_replacer(CUET_PHRASES.get(lang, {}))
+        replacer = build_replacer(lang)
         print(f"\n🔄 Re-translating CUET → {lang}...")
         for subj in CUET_SUBJECTS:
             # Get all rows for this subject
@@ -850,27 +846,19 @@ def translate_cuet_all_languages():
                 updates.append((*translated, qb_id))
 
             with _bank_lock:
-                conn.executemany(
-                    f'''UPDATE question_bank SET
-                        question_{lang}=?, option_a_{lang}=?, option_b_{lang}=?,
-                        option_c_{lang}=?, option_d_{lang}=?
-                        WHERE qb_id=?''',
-                    updates
-                )
+                conn.executemany(update_sql(lang), updates)
+                bump_bank_generation(conn)
             conn.commit()
             print(f"  ✅ {subj}: {len(rows):,} rows updated")
 
-    # Final check
+    # Final check — one pass over the CUET rows (also refreshes the admin panel's stats)
+    from translation_quality import analyze
     print("\n📊 Translation coverage after fix:")
-    for lang in LANGS:
-        for subj in CUET_SUBJECTS:
-            total = conn.execute('SELECT COUNT(*) FROM question_bank WHERE subject=?', (subj,)).fetchone()[0]
-            same = conn.execute(
-                f'SELECT COUNT(*) FROM question_bank WHERE subject=? AND question_{lang}=question_en',
-                (subj,)
-            ).fetchone()[0]
-            pct_translated = round((total - same) / total * 100, 1) if total > 0 else 0
-            print(f"  {subj} [{lang}]: {pct_translated}% actually translated ({total-same}/{total})")
+    for st in analyze(LANGS, CUET_SUBJECTS)["stats"]:
+        changed = st["covered"] - st["untouched"]
+        print(f"  {st['subject']} [{st['lang']}]: {changed / st['total'] * 100 if st['total'] else 0:.1f}% "
+              f"actually translated ({changed}/{st['total']}), "
+              f"{st['latin_ratio'] * 100:.1f}% of words still English")
 
 if __name__ == '__main__':
     print("🌐 CUET Translation Fix — Applying comprehensive Indian GK dictionary...")
@@ -0,0 +1,104 @@
+"""
+exam_components — Custom Streamlit components for the exam UI
+===============================================================
+Static HTML/JS components (no npm build step) talking the Streamlit
+component protocol directly via postMessage.
+
+  question_palette — whole sidebar palette rendered client-side from one
+                     compact state payload; returns the clicked index.
+  question_navigator — question card + answer/review/nav buttons over a
+                     prefetched window of questions; answers and moves stay
+                     in the browser and come back as batched change sets.
+"""
+
+import os
+from typing import Dict, Iterable, Optional, Sequence
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+
+_palette_component = components.declare_component(
+    "question_palette", path=os.path.join(_FRONTEND, "palette")
+)
+
+_navigator_component = components.declare_component(
+    "question_navigator", path=os.path.join(_FRONTEND, "navigator")
+)
+
+
+def encode_bitset(indices: Iterable[int], size: int) -> str:
+    """Pack a set of question indices into a hex string (bit i of the number = index i)."""
+    bits = 0
+    for i in indices:
+        if 0 <= i < size:
+            bits |= 1 << i
+    return format(bits, "x")
+
+
+def palette_payload(total: int, current: int, answered: Iterable[int],
+                    review: Iterable[int], visited: Iterable[int],
+                    sections: Sequence[Dict]) -> Dict:
+    """
+    Build the compact palette state. `sections` is a list of
+    {"label", "color", "idx": [question indices]} in display order.
+    """
+    return {
+        "n": total,
+        "cur": current,
+        "ans": encode_bitset(answered, total),
+        "rev": encode_bitset(review, total),
+        "vis": encode_bitset(visited, total),
+        "sec": [[s["label"], s["color"], list(s["idx"])] for s in sections],
+    }
+
+
+def question_palette(payload: Dict, key: str = "question_palette") -> Optional[int]:
+    """
+    Render the palette. Returns the clicked question index once per click,
+    otherwise None.
+    """
+    clicked = _palette_component(state=payload, key=key, default=None)
+    if not clicked:
+        return None
+    seen_key = f"_{key}_seq"
+    if st.session_state.get(seen_key) == clicked.get("seq"):
+        return None
+    st.session_state[seen_key] = clicked.get("seq")
+    return clicked.get("idx")
+
+
+def _unseen_event(key: str, value: Optional[Dict]) -> Optional[Dict]:
+    if not value:
+        return None
+    seen_key = f"_{key}_seq"
+    if st.session_state.get(seen_key) == value.get("seq"):
+        return None
+    st.session_state[seen_key] = value.get("seq")
+    return value
+
+
+def navigator_event(key: str = "question_navigator") -> Optional[Dict]:
+    """
+    Return the navigator's latest change set if it has not been handled yet.
+    Call this at the top of the page so the rest of the run (palette, timer,
+    submit) already sees the synced answers.
+    """
+    return _unseen_event(key, st.session_state.get(key))
+
+
+def question_navigator(payload: Dict, key: str = "question_navigator") -> Optional[Dict]:
+    """
+    Render the navigator. `payload` keys:
+      sid, total, cur, ack, batch, sync_secs,
+      items: [{"i", "q", "o": [4 options], "s", "sc", "d", "dbg", "dfc", "rec"}],
+      state: {idx: {"a": answer|None, "r": 0|1, "v": 0|1}} for the window.
+    Returns an unhandled change set {"seq", "sent", "cur", "changes": [[idx, a, r, v]],
+    "need"?, "submit"?} once, otherwise None.
+    """
+    return _unseen_event(key, _navigator_component(payload=payload, key=key, default=None))
+
+
+__all__ = ["question_palette", "palette_payload", "encode_bitset",
+           "question_navigator", "navigator_event"]
@@ -5,13 +5,20 @@ Generates 100,000 genuinely unique questions across all 8 subjects.
 Every question has different numbers, different wording, different context.
 Covers full NEET / JEE / CUET syllabus.
 
+Subjects are generated in parallel (generation_runner); the output is the
+same as a serial run.
+
 Run: python generate_100k.py
+     python generate_100k.py --workers 1      # serial, in this process
+     python generate_100k.py --bulk-load      # drop indexes during the load (app must be stopped)
 """
 
-import sys, os, math, random, time, itertools, sqlite3
+import sys, os, math, random, time, itertools, sqlite3, argparse
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from question_bank_db import _bank_conn, _bank_lock, init_bank
+from question_bank_db import _bank_conn, init_bank, bulk_load_mode
+from generation_runner import run_generators, insert_questions, format_timings
+from question_templates import install_builtin_templates
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 def q(subject, exam_type, topic, subtopic, difficulty, question,
@@ -34,150 +41,59 @@ def shuffle_opts(correct_val, wrong1, wrong2, wrong3):
     idx = opts.index(str(correct_val))
     return opts[0], opts[1], opts[2], opts[3], "ABCD"[idx]
 
-def insert_batch(conn, questions):
-    inserted = 0
-    with _bank_lock:
-        conn.execute("BEGIN")
-        for q in questions:
-            try:
-                conn.execute("""
-                    INSERT OR IGNORE INTO question_bank
-                    (subject,exam_type,topic,subtopic,difficulty,
-                     question_en,option_a_en,option_b_en,option_c_en,option_d_en,
-                     correct_answer,marks_correct,marks_wrong,explanation_en)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """, (
-                    q["subject"], q["exam_type"], q["topic"], q["subtopic"],
-                    q["difficulty"], q["question_en"],
-                    q["option_a_en"], q["option_b_en"],
-                    q["option_c_en"], q["option_d_en"],
-                    q["correct_answer"], q["marks_correct"],
-                    q["marks_wrong"], q["explanation_en"],
-                ))
-                if conn.execute("SELECT changes()").fetchone()[0]:
-                    inserted += 1
-            except: pass
-        conn.commit()
-    return inserted
+def _row(q):
+    return (q["subject"], q["exam_type"], q["topic"], q["subtopic"],
+            q["difficulty"], q["question_en"],
+            q["option_a_en"], q["option_b_en"],
+            q["option_c_en"], q["option_d_en"],
+            q["correct_answer"], q["marks_correct"],
+            q["marks_wrong"], q["explanation_en"])
+
+def insert_batch(conn, questions, loader=None):
+    """Chunked INSERT OR IGNORE of q() records (any iterable); returns rows added."""
+    stats = insert_questions(conn, questions, _row, loader=loader)
+    for err in stats["errors"][:5]:
+        print(f"  ⚠️  insert error: {err}")
+    if len(stats["errors"]) > 5:
+        print(f"  ⚠️  ... {len(stats['errors']) - 5} more insert errors")
+    return stats["inserted"]
 
 # ══════════════════════════════════════════════════════════════════════════════
 # PHYSICS  — target 15,000 unique
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_physics():
-    qs = []
     random.seed(42)
 
-    # ── Kinematics ──
-    for u in range(0, 80, 2):
-        for a_ in range(1, 15):
-            for t in range(1, 10):
-                v = u + a_*t
-                s = u*t + 0.5*a_*t*t
-                qs.append(q("Physics","NEET","Kinematics","Equations of Motion","medium",
-                    f"A body starts with initial velocity {u} m/s and acceleration {a_} m/s². "
-                    f"Velocity after {t} s is:",
-                    f"{v} m/s", f"{u+a_*(t+1)} m/s", f"{u+a_*(t-1)} m/s", f"{v+a_} m/s","A",
-                    f"v = u + at = {u} + {a_}×{t} = {v} m/s"))
-                if len(qs) % 500 == 0: print(f"  Physics: {len(qs)}...", end="\r")
-
-    for u in range(0, 60, 3):
-        for a_ in range(2, 12):
-            for t in range(1, 8):
-                s = round(u*t + 0.5*a_*t*t, 1)
-                qs.append(q("Physics","NEET","Kinematics","Distance","medium",
-                    f"Initial velocity {u} m/s, acceleration {a_} m/s². Distance in {t} s:",
-                    f"{s} m", f"{round(s*1.2,1)} m", f"{round(s*0.8,1)} m", f"{round(s+a_,1)} m","A",
-                    f"s = ut + ½at² = {u}×{t} + ½×{a_}×{t}² = {s} m"))
-
-    # Free fall
-    g = 9.8
-    for h in range(5, 200, 5):
-        t_fall = round(math.sqrt(2*h/g), 2)
-        v_final = round(math.sqrt(2*g*h), 2)
-        qs.append(q("Physics","NEET","Kinematics","Free Fall","medium",
-            f"An object is dropped from height {h} m. Time to reach ground (g=9.8 m/s²):",
-            f"{t_fall} s", f"{round(t_fall*1.2,2)} s", f"{round(t_fall*0.8,2)} s",
-            f"{round(t_fall+0.5,2)} s","A", f"t = √(2h/g) = √(2×{h}/9.8) = {t_fall} s"))
-
-    # Projectile range
-    for u in range(10, 60, 5):
-        for ang in [30, 45, 60]:
-            R = round(u*u * math.sin(math.radians(2*ang)) / 9.8, 1)
-            T = round(2*u*math.sin(math.radians(ang))/9.8, 2)
-            H = round(u*u*math.sin(math.radians(ang))**2/(2*9.8), 2)
-            qs.append(q("Physics","NEET","Kinematics","Projectile","hard",
-                f"Projectile launched at {u} m/s at {ang}° to horizontal. Range:",
-                f"{R} m", f"{round(R*0.75,1)} m", f"{round(R*1.25,1)} m", f"{round(R*0.5,1)} m","A",
-                f"R = u²sin2θ/g = {R} m"))
-            qs.append(q("Physics","NEET","Kinematics","Projectile","hard",
-                f"Projectile at {u} m/s at {ang}°. Time of flight:",
-                f"{T} s", f"{round(T*0.7,2)} s", f"{round(T*1.3,2)} s", f"{round(T*0.5,2)} s","A",
-                f"T = 2u sinθ/g = {T} s"))
-            qs.append(q("Physics","NEET","Kinematics","Projectile","hard",
-                f"Projectile at {u} m/s at {ang}°. Maximum height:",
-                f"{H} m", f"{round(H*0.6,2)} m", f"{round(H*1.4,2)} m", f"{round(H*2,2)} m","A",
-                f"H = u²sin²θ/2g = {H} m"))
-
-    # ── Laws of Motion ──
-    for m in range(1, 50, 2):
-        for a_ in range(1, 20, 2):
-            F = m*a_
-            qs.append(q("Physics","NEET","Laws of Motion","Newton's Second Law","medium",
-                f"A mass of {m} kg is given acceleration {a_} m/s². Net force required:",
-                f"{F} N", f"{F+m} N", f"{F-a_} N", f"{m+a_} N","A",
-                f"F = ma = {m}×{a_} = {F} N"))
-
-    for m in range(2, 30, 2):
-        for mu in [0.1, 0.2, 0.3, 0.4, 0.5]:
-            f = round(mu*m*9.8, 2)
-            qs.append(q("Physics","NEET","Laws of Motion","Friction","medium",
-                f"Mass {m} kg on surface with μ = {mu}. Friction force (g=9.8):",
-                f"{f} N", f"{round(f*1.3,2)} N", f"{round(f*0.7,2)} N", f"{round(mu*m*10,2)} N","A",
-                f"f = μmg = {mu}×{m}×9.8 = {f} N"))
+    # Kinematics, Laws of Motion, work done and kinetic energy are parametric
+    # templates (question_templates.BUILTIN_TEMPLATES), rendered when drawn.
 
     # ── Work, Energy, Power ──
-    for F_ in range(5, 100, 5):
-        for d in range(1, 30, 3):
-            W = F_*d
-            qs.append(q("Physics","NEET","Work Energy","Work Done","medium",
-                f"Force {F_} N applied over displacement {d} m (parallel). Work done:",
-                f"{W} J", f"{W+F_} J", f"{W-d} J", f"{F_+d} J","A",
-                f"W = F×d = {F_}×{d} = {W} J"))
-
-    for m in range(1, 40, 3):
-        for v in range(2, 30, 3):
-            KE = round(0.5*m*v*v)
-            qs.append(q("Physics","NEET","Work Energy","Kinetic Energy","medium",
-                f"Mass {m} kg moving at {v} m/s. Kinetic energy:",
-                f"{KE} J", f"{m*v} J", f"{KE*2} J", f"{KE//2} J","A",
-                f"KE = ½mv² = ½×{m}×{v}² = {KE} J"))
-
     for m in range(1, 30, 2):
         for h in range(1, 25, 2):
             PE = round(m*9.8*h, 1)
-            qs.append(q("Physics","NEET","Work Energy","Potential Energy","medium",
+            yield q("Physics","NEET","Work Energy","Potential Energy","medium",
                 f"Mass {m} kg at height {h} m. Gravitational PE (g=9.8):",
                 f"{PE} J", f"{round(PE*1.2,1)} J", f"{m*h} J", f"{round(PE*0.5,1)} J","A",
-                f"PE = mgh = {m}×9.8×{h} = {PE} J"))
+                f"PE = mgh = {m}×9.8×{h} = {PE} J")
 
     for W in range(100, 5000, 200):
         for t in range(1, 30, 3):
             P = round(W/t, 1)
-            qs.append(q("Physics","NEET","Work Energy","Power","medium",
+            yield q("Physics","NEET","Work Energy","Power","medium",
                 f"{W} J of work done in {t} s. Power:",
                 f"{P} W", f"{W*t} W", f"{round(P*2,1)} W", f"{round(P*0.5,1)} W","A",
-                f"P = W/t = {W}/{t} = {P} W"))
+                f"P = W/t = {W}/{t} = {P} W")
 
     # ── Waves & Sound ──
     for v_ in [300, 320, 340, 360, 380]:
         for f_ in range(100, 1000, 50):
             lam = round(v_/f_, 3)
-            qs.append(q("Physics","NEET","Waves","Wave Speed","medium",
+            yield q("Physics","NEET","Waves","Wave Speed","medium",
                 f"Sound speed {v_} m/s, frequency {f_} Hz. Wavelength:",
                 f"{lam} m", f"{round(lam*2,3)} m", f"{round(lam*0.5,3)} m",
                 f"{round(v_*f_/1000,3)} m","A",
-                f"λ = v/f = {v_}/{f_} = {lam} m"))
+                f"λ = v/f = {v_}/{f_} = {lam} m")
 
     # ── Electrostatics ──
     k = 9e9
@@ -185,62 +101,62 @@ def gen_physics():
         for q2 in [1e-6, 2e-6, 5e-6]:
             for r in [0.1, 0.2, 0.5, 1.0]:
                 F_ = round(k*q1*q2/r**2, 4)
-                qs.append(q("Physics","NEET","Electrostatics","Coulomb's Law","hard",
+                yield q("Physics","NEET","Electrostatics","Coulomb's Law","hard",
                     f"Two charges {q1*1e6:.0f}μC and {q2*1e6:.0f}μC separated by {r} m. Force:",
                     f"{F_} N", f"{round(F_*2,4)} N", f"{round(F_*0.5,4)} N",
                     f"{round(F_*4,4)} N","A",
-                    f"F = kq₁q₂/r² = 9×10⁹×{q1*1e6:.0f}×10⁻⁶×{q2*1e6:.0f}×10⁻⁶/{r}² = {F_} N"))
+                    f"F = kq₁q₂/r² = 9×10⁹×{q1*1e6:.0f}×10⁻⁶×{q2*1e6:.0f}×10⁻⁶/{r}² = {F_} N")
 
     # Electric field
     for Q_ in [1e-6, 2e-6, 5e-6, 10e-6]:
         for r in [0.1, 0.2, 0.5, 1.0, 2.0]:
             E = round(k*Q_/r**2)
-            qs.append(q("Physics","NEET","Electrostatics","Electric Field","hard",
+            yield q("Physics","NEET","Electrostatics","Electric Field","hard",
                 f"Charge {Q_*1e6:.0f}μC. Electric field at distance {r} m:",
                 f"{E} N/C", f"{E*2} N/C", f"{E//2} N/C", f"{E*4} N/C","A",
-                f"E = kQ/r² = 9×10⁹×{Q_*1e6:.0f}×10⁻⁶/{r}² = {E} N/C"))
+                f"E = kQ/r² = 9×10⁹×{Q_*1e6:.0f}×10⁻⁶/{r}² = {E} N/C")
 
     # ── Current Electricity ──
     for V in range(1, 50, 2):
         for R_ in range(1, 50, 3):
             I = round(V/R_, 3)
-            qs.append(q("Physics","NEET","Current Electricity","Ohm's Law","medium",
+            yield q("Physics","NEET","Current Electricity","Ohm's Law","medium",
                 f"Voltage {V} V across resistance {R_} Ω. Current:",
                 f"{I} A", f"{round(I*2,3)} A", f"{round(I*0.5,3)} A", f"{V*R_} A","A",
-                f"I = V/R = {V}/{R_} = {I} A"))
+                f"I = V/R = {V}/{R_} = {I} A")
 
     for V in range(2, 50, 3):
         for I in range(1, 20, 2):
             R_ = round(V/I, 2)
             P_ = round(V*I)
-            qs.append(q("Physics","NEET","Current Electricity","Power","medium",
+            yield q("Physics","NEET","Current Electricity","Power","medium",
                 f"Voltage {V} V, current {I} A. Power dissipated:",
                 f"{P_} W", f"{V+I} W", f"{V*I*2} W", f"{V//I} W","A",
-                f"P = VI = {V}×{I} = {P_} W"))
+                f"P = VI = {V}×{I} = {P_} W")
 
     # Series/Parallel resistors
     for r1 in range(2, 20, 3):
         for r2 in range(2, 20, 3):
             Rs = r1+r2
             Rp = round(r1*r2/(r1+r2), 2)
-            qs.append(q("Physics","NEET","Current Electricity","Resistors","medium",
+            yield q("Physics","NEET","Current Electricity","Resistors","medium",
                 f"Resistors {r1}Ω and {r2}Ω in series. Equivalent resistance:",
                 f"{Rs} Ω", f"{Rp} Ω", f"{r1*r2} Ω", f"{r1+r2+2} Ω","A",
-                f"R_series = R₁+R₂ = {r1}+{r2} = {Rs} Ω"))
-            qs.append(q("Physics","NEET","Current Electricity","Resistors","medium",
+                f"R_series = R₁+R₂ = {r1}+{r2} = {Rs} Ω")
+            yield q("Physics","NEET","Current Electricity","Resistors","medium",
                 f"Resistors {r1}Ω and {r2}Ω in parallel. Equivalent resistance:",
                 f"{Rp} Ω", f"{Rs} Ω", f"{r1*r2} Ω", f"{abs(r1-r2)} Ω","A",
-                f"R_parallel = R₁R₂/(R₁+R₂) = {r1}×{r2}/({r1}+{r2}) = {Rp} Ω"))
+                f"R_parallel = R₁R₂/(R₁+R₂) = {r1}×{r2}/({r1}+{r2}) = {Rp} Ω")
 
     # ── Magnetism ──
     for B in [0.1, 0.2, 0.5, 1.0, 2.0]:
         for I_ in range(1, 15, 2):
             for L in range(1, 10, 2):
                 F_ = round(B*I_*L, 3)
-                qs.append(q("Physics","NEET","Magnetism","Force on Conductor","hard",
+                yield q("Physics","NEET","Magnetism","Force on Conductor","hard",
                     f"Current {I_} A in conductor of length {L} m in field {B} T. Force:",
                     f"{F_} N", f"{round(F_*2,3)} N", f"{round(B*I_,3)} N",
-                    f"{round(B*L,3)} N","A", f"F = BIL = {B}×{I_}×{L} = {F_} N"))
+                    f"{round(B*L,3)} N","A", f"F = BIL = {B}×{I_}×{L} = {F_} N")
 
     # ── Optics ──
     optics_context = [
@@ -253,10 +169,10 @@ def gen_physics():
                 v_ = round(1/(1/f_ - 1/u_), 2) if (1/f_ - 1/u_) != 0 else None
                 if v_ and abs(v_) < 500:
                     m_ = round(-v_/u_, 3)
-                    qs.append(q("Physics","NEET","Optics","Lens Formula","hard",
+                    yield q("Physics","NEET","Optics","Lens Formula","hard",
                         f"Convex lens f={f_} cm, object at u={u_} cm. Image distance:",
                         f"{v_} cm", f"{round(v_*1.3,2)} cm", f"{round(v_*0.7,2)} cm",
-                        f"{-v_} cm","A", f"1/v = 1/f + 1/u = 1/{f_} + 1/({u_}), v = {v_} cm"))
+                        f"{-v_} cm","A", f"1/v = 1/f + 1/u = 1/{f_} + 1/({u_}), v = {v_} cm")
             except: pass
 
     # Snell's law
@@ -267,28 +183,28 @@ def gen_physics():
                     sin2 = round(n1*math.sin(math.radians(theta1))/n2, 4)
                     if abs(sin2) <= 1:
                         theta2 = round(math.degrees(math.asin(abs(sin2))), 1)
-                        qs.append(q("Physics","NEET","Optics","Snell's Law","hard",
+                        yield q("Physics","NEET","Optics","Snell's Law","hard",
                             f"Light from medium n₁={n1} to n₂={n2}, angle of incidence={theta1}°. Refraction angle:",
                             f"{theta2}°", f"{theta1}°", f"{90-theta2}°", f"{theta2+5}°","A",
-                            f"n₁sinθ₁ = n₂sinθ₂ → θ₂ = {theta2}°"))
+                            f"n₁sinθ₁ = n₂sinθ₂ → θ₂ = {theta2}°")
 
     # ── Thermodynamics ──
     for T1 in range(300, 600, 25):
         for T2 in range(200, T1-50, 25):
             eta = round((1 - T2/T1)*100, 1)
-            qs.append(q("Physics","NEET","Thermodynamics","Carnot Engine","hard",
+            yield q("Physics","NEET","Thermodynamics","Carnot Engine","hard",
                 f"Carnot engine: hot reservoir {T1} K, cold reservoir {T2} K. Efficiency:",
                 f"{eta}%", f"{round(eta*0.8,1)}%", f"{round(eta*1.2,1)}%",
-                f"{100-eta}%","A", f"η = (1-T₂/T₁)×100 = (1-{T2}/{T1})×100 = {eta}%"))
+                f"{100-eta}%","A", f"η = (1-T₂/T₁)×100 = (1-{T2}/{T1})×100 = {eta}%")
 
     for n_ in range(1,6):
         for R_ in [8.314]:
             for dT in range(10, 200, 10):
                 W = round(n_*R_*dT, 2)
-                qs.append(q("Physics","NEET","Thermodynamics","Ideal Gas","medium",
+                yield q("Physics","NEET","Thermodynamics","Ideal Gas","medium",
                     f"{n_} mol ideal gas expands at constant pressure. ΔT={dT} K. Work done:",
                     f"{W} J", f"{W*2} J", f"{W//2} J", f"{round(W*1.5,2)} J","A",
-                    f"W = nRΔT = {n_}×8.314×{dT} = {W} J"))
+                    f"W = nRΔT = {n_}×8.314×{dT} = {W} J")
 
     # ── Nuclear Physics ──
     particles = ["alpha","beta","gamma"]
@@ -301,31 +217,31 @@ def gen_physics():
     for name, sym, Z, A in nuclei:
         Z_, A_ = int(Z), int(A)
         # Alpha decay
-        qs.append(q("Physics","NEET","Nuclear Physics","Alpha Decay","hard",
+        yield q("Physics","NEET","Nuclear Physics","Alpha Decay","hard",
             f"{name} ({sym}-{A}) undergoes alpha decay. New atomic number:",
             f"{Z_-2}", f"{Z_-1}", f"{Z_+2}", f"{Z_}","A",
-            f"Alpha decay: Z decreases by 2 → {Z_}-2 = {Z_-2}"))
-        qs.append(q("Physics","NEET","Nuclear Physics","Alpha Decay","hard",
+            f"Alpha decay: Z decreases by 2 → {Z_}-2 = {Z_-2}")
+        yield q("Physics","NEET","Nuclear Physics","Alpha Decay","hard",
             f"{name} ({sym}-{A}) undergoes alpha decay. New mass number:",
             f"{A_-4}", f"{A_-2}", f"{A_+4}", f"{A_}","A",
-            f"Alpha decay: A decreases by 4 → {A_}-4 = {A_-4}"))
+            f"Alpha decay: A decreases by 4 → {A_}-4 = {A_-4}")
         # Beta decay
-        qs.append(q("Physics","NEET","Nuclear Physics","Beta Decay","hard",
+        yield q("Physics","NEET","Nuclear Physics","Beta Decay","hard",
             f"{name} ({sym}-{A}) undergoes beta⁻ decay. New atomic number:",
             f"{Z_+1}", f"{Z_-1}", f"{Z_}", f"{Z_+2}","A",
-            f"Beta⁻ decay: Z increases by 1 → {Z_}+1 = {Z_+1}"))
+            f"Beta⁻ decay: Z increases by 1 → {Z_}+1 = {Z_+1}")
 
     # Half life
     for t_half in [5, 10, 20, 30, 50, 100, 200]:
         for n_halves in [1, 2, 3, 4]:
             remaining = round(100 * (0.5)**n_halves, 2)
             time_elapsed = t_half * n_halves
-            qs.append(q("Physics","NEET","Nuclear Physics","Half Life","medium",
+            yield q("Physics","NEET","Nuclear Physics","Half Life","medium",
                 f"Radioactive sample, half-life {t_half} years. After {time_elapsed} years, "
                 f"fraction remaining of initial 100g:",
                 f"{remaining} g", f"{100-remaining} g", f"{remaining*2} g",
                 f"{remaining/2} g","A",
-                f"After {n_halves} half-lives: 100×(½)^{n_halves} = {remaining} g"))
+                f"After {n_halves} half-lives: 100×(½)^{n_halves} = {remaining} g")
 
     # ── Semiconductor ──
     semi_qs = [
@@ -341,8 +257,8 @@ def gen_physics():
         ("In a common emitter transistor amplifier, current gain β is:","IC/IB","IE/IC","IB/IC","IE/IB","A","β = IC/IB for common emitter configuration"),
     ]
     for item in semi_qs:
-        qs.append(q("Physics","NEET","Semiconductors",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Physics","NEET","Semiconductors",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Electromagnetic Induction ──
     for B_ in [0.1, 0.2, 0.5, 1.0, 2.0]:
@@ -350,14 +266,12 @@ def gen_physics():
             for dt in [0.01, 0.02, 0.05, 0.1, 0.5]:
                 emf = round(B_*A_/dt, 3)
                 if 0.001 < emf < 1000:
-                    qs.append(q("Physics","NEET","Electromagnetic Induction","Faraday's Law","hard",
+                    yield q("Physics","NEET","Electromagnetic Induction","Faraday's Law","hard",
                         f"Magnetic field {B_} T, area {A_} m², field reduced to 0 in {dt} s. Induced EMF:",
                         f"{emf} V", f"{round(emf*2,3)} V", f"{round(emf*0.5,3)} V",
                         f"{round(B_*A_*dt,3)} V","A",
-                        f"EMF = ΔΦ/Δt = B×A/dt = {B_}×{A_}/{dt} = {emf} V"))
+                        f"EMF = ΔΦ/Δt = B×A/dt = {B_}×{A_}/{dt} = {emf} V")
 
-    print(f"  Physics generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -365,7 +279,6 @@ def gen_physics():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_chemistry():
-    qs = []
     random.seed(43)
 
     # ── Mole Concept ──
@@ -379,18 +292,18 @@ def gen_chemistry():
     for name, sym, mw in elements:
         for mass in [14, 28, 32, 48, 56, 64, 80, 96, 112]:
             moles = round(mass/mw, 3)
-            qs.append(q("Chemistry","NEET","Mole Concept","Moles from Mass","medium",
+            yield q("Chemistry","NEET","Mole Concept","Moles from Mass","medium",
                 f"Moles in {mass} g of {name} ({sym}, M={mw}):",
                 f"{moles} mol", f"{round(moles*2,3)} mol", f"{round(moles*0.5,3)} mol",
-                f"{mass*mw} mol","A", f"moles = mass/M = {mass}/{mw} = {moles} mol"))
+                f"{mass*mw} mol","A", f"moles = mass/M = {mass}/{mw} = {moles} mol")
             atoms = round(moles * 6.022e23, 3)
-            qs.append(q("Chemistry","NEET","Mole Concept","Avogadro Number","medium",
+            yield q("Chemistry","NEET","Mole Concept","Avogadro Number","medium",
                 f"Number of atoms in {mass} g of {name} (M={mw}):",
                 f"{moles:.3f}×6.022×10²³",
                 f"{round(moles*2,3):.3f}×6.022×10²³",
                 f"{round(moles*0.5,3):.3f}×6.022×10²³",
                 f"{round(moles*3,3):.3f}×6.022×10²³","A",
-                f"n = {mass}/{mw} = {moles} mol; atoms = n×Nₐ"))
+                f"n = {mass}/{mw} = {moles} mol; atoms = n×Nₐ")
 
     # Molarity
     for solute_g in range(10, 200, 10):
@@ -398,11 +311,11 @@ def gen_chemistry():
             for mw in [40, 58.5, 98, 36.5, 180, 342]:
                 M = round((solute_g/mw)/V_L, 3)
                 if 0.01 < M < 20:
-                    qs.append(q("Chemistry","NEET","Mole Concept","Molarity","medium",
+                    yield q("Chemistry","NEET","Mole Concept","Molarity","medium",
                         f"{solute_g} g of compound (MW={mw}) in {V_L} L. Molarity:",
                         f"{M} M", f"{round(M*2,3)} M", f"{round(M*0.5,3)} M",
                         f"{round(solute_g*mw,3)} M","A",
-                        f"M = (mass/MW)/V = ({solute_g}/{mw})/{V_L} = {M} M"))
+                        f"M = (mass/MW)/V = ({solute_g}/{mw})/{V_L} = {M} M")
 
     # ── Atomic Structure ──
     atomic_configs = [
@@ -420,26 +333,26 @@ def gen_chemistry():
                           "Cl":18,"Ar":22,"K":20,"Ca":20}
         n = neutrons_common.get(sym, Z)
         A = Z + n
-        qs.append(q("Chemistry","NEET","Atomic Structure","Atomic Number","medium",
+        yield q("Chemistry","NEET","Atomic Structure","Atomic Number","medium",
             f"Atomic number of {name} ({sym}):",
             f"{Z}", f"{Z+1}", f"{Z-1}", f"{A}","A",
-            f"Atomic number of {name} = {Z}"))
-        qs.append(q("Chemistry","NEET","Atomic Structure","Electron Config","medium",
+            f"Atomic number of {name} = {Z}")
+        yield q("Chemistry","NEET","Atomic Structure","Electron Config","medium",
             f"Number of electrons in {name} ({sym}) atom:",
             f"{e}", f"{e+1}", f"{e-1}", f"{e+2}","A",
-            f"{name} has {e} electrons (same as atomic number)"))
-        qs.append(q("Chemistry","NEET","Atomic Structure","Neutrons","medium",
+            f"{name} has {e} electrons (same as atomic number)")
+        yield q("Chemistry","NEET","Atomic Structure","Neutrons","medium",
             f"Number of neutrons in most common isotope of {name} ({sym}-{A}):",
             f"{n}", f"{n+1}", f"{n-1}", f"{Z}","A",
-            f"Neutrons = Mass number - Atomic number = {A} - {Z} = {n}"))
+            f"Neutrons = Mass number - Atomic number = {A} - {Z} = {n}")
 
     # Quantum numbers
     for n_ in range(1,6):
         max_e = 2*n_*n_
-        qs.append(q("Chemistry","NEET","Atomic Structure","Quantum Numbers","hard",
+        yield q("Chemistry","NEET","Atomic Structure","Quantum Numbers","hard",
             f"Maximum electrons in principal quantum shell n={n_}:",
             f"{max_e}", f"{n_*2}", f"{n_*n_}", f"{n_*4}","A",
-            f"Max electrons = 2n² = 2×{n_}² = {max_e}"))
+            f"Max electrons = 2n² = 2×{n_}² = {max_e}")
 
     # Wavelength using Rydberg
     rydberg = 1.097e7
@@ -448,11 +361,11 @@ def gen_chemistry():
         inv_lam = round(rydberg*(1/n1**2 - 1/n2**2), 2)
         lam_nm = round(1/(inv_lam)*1e9, 1)
         series = {1:"Lyman",2:"Balmer",3:"Paschen",4:"Brackett"}.get(n1,"Unknown")
-        qs.append(q("Chemistry","NEET","Atomic Structure","Spectral Lines","hard",
+        yield q("Chemistry","NEET","Atomic Structure","Spectral Lines","hard",
             f"Hydrogen atom: transition from n={n2} to n={n1} ({series} series). Wavelength:",
             f"≈{lam_nm} nm", f"≈{round(lam_nm*0.7,1)} nm",
             f"≈{round(lam_nm*1.3,1)} nm", f"≈{round(lam_nm*2,1)} nm","A",
-            f"1/λ = R(1/n₁²-1/n₂²) = {inv_lam:.2e} m⁻¹ → λ ≈ {lam_nm} nm"))
+            f"1/λ = R(1/n₁²-1/n₂²) = {inv_lam:.2e} m⁻¹ → λ ≈ {lam_nm} nm")
 
     # ── Chemical Bonding ──
     bond_qs = [
@@ -470,9 +383,9 @@ def gen_chemistry():
         ("SF₆","covalent; octahedral","S forms 6 bonds; sp³d² hybridized"),
     ]
     for compound, bond_type, reason in bond_qs:
-        qs.append(q("Chemistry","NEET","Chemical Bonding","Bond Type","medium",
+        yield q("Chemistry","NEET","Chemical Bonding","Bond Type","medium",
             f"Type of bond in {compound}:",
-            bond_type, "metallic", "hydrogen bond", "van der Waals","A", reason))
+            bond_type, "metallic", "hydrogen bond", "van der Waals","A", reason)
 
     # Hybridization
     hybridization_data = [
@@ -492,11 +405,11 @@ def gen_chemistry():
         ("PH₃","sp³","3 bond pairs, 1 lone pair"),
     ]
     for mol, hyb, reason in hybridization_data:
-        qs.append(q("Chemistry","NEET","Chemical Bonding","Hybridization","hard",
+        yield q("Chemistry","NEET","Chemical Bonding","Hybridization","hard",
             f"Hybridization of central atom in {mol}:",
             hyb, "sp" if hyb!="sp" else "sp²",
             "sp³" if hyb!="sp³" else "sp²",
-            "sp³d" if hyb!="sp³d" else "sp","A", reason))
+            "sp³d" if hyb!="sp³d" else "sp","A", reason)
 
     # ── Equilibrium ──
     for Kc in [0.01, 0.1, 1, 10, 100, 1000]:
@@ -504,36 +417,36 @@ def gen_chemistry():
             favor = "products"
         else:
             favor = "reactants"
-        qs.append(q("Chemistry","NEET","Chemical Equilibrium","Kc Interpretation","medium",
+        yield q("Chemistry","NEET","Chemical Equilibrium","Kc Interpretation","medium",
             f"If Kc = {Kc}, the equilibrium favors:",
             favor, "reactants" if favor=="products" else "products",
             "neither", "catalyst","A",
-            f"Kc = {Kc} {'> 1 → products favored' if Kc>1 else '< 1 → reactants favored'}"))
+            f"Kc = {Kc} {'> 1 → products favored' if Kc>1 else '< 1 → reactants favored'}")
 
     # pH calculations
     for H_conc_exp in range(-1, -15, -1):
         pH = -H_conc_exp
         H_conc = f"10⁻{abs(H_conc_exp)}"
         nature = "acidic" if pH < 7 else ("neutral" if pH == 7 else "basic")
-        qs.append(q("Chemistry","NEET","Ionic Equilibrium","pH","medium",
+        yield q("Chemistry","NEET","Ionic Equilibrium","pH","medium",
             f"[H⁺] = {H_conc} M. pH of solution:",
             f"{pH}", f"{14-pH}", f"{pH+1}", f"{pH-1}","A",
-            f"pH = -log[H⁺] = -log(10^{H_conc_exp}) = {pH}"))
-        qs.append(q("Chemistry","NEET","Ionic Equilibrium","Nature of Solution","medium",
+            f"pH = -log[H⁺] = -log(10^{H_conc_exp}) = {pH}")
+        yield q("Chemistry","NEET","Ionic Equilibrium","Nature of Solution","medium",
             f"Solution with pH = {pH}. Nature:",
             nature, "acidic" if nature!="acidic" else "basic",
             "neutral" if nature!="neutral" else "acidic",
             "basic" if nature!="basic" else "neutral","A",
-            f"pH {pH}: {'< 7 → acidic' if pH<7 else ('= 7 → neutral' if pH==7 else '> 7 → basic')}"))
+            f"pH {pH}: {'< 7 → acidic' if pH<7 else ('= 7 → neutral' if pH==7 else '> 7 → basic')}")
 
     # ── Electrochemistry ──
     for EMF in [1.10, 1.23, 0.76, 1.56, 0.34, 2.05, 0.80, 1.33]:
         n_e = random.choice([1,2,3,4])
         G = round(-n_e * 96500 * EMF)
-        qs.append(q("Chemistry","NEET","Electrochemistry","Gibbs Energy","hard",
+        yield q("Chemistry","NEET","Electrochemistry","Gibbs Energy","hard",
             f"Cell EMF = {EMF} V, n = {n_e}. ΔG (J):",
             f"{G}", f"{-G}", f"{round(G/2)}", f"{round(G*2)}","A",
-            f"ΔG = -nFE = -{n_e}×96500×{EMF} = {G} J"))
+            f"ΔG = -nFE = -{n_e}×96500×{EMF} = {G} J")
 
     # ── Organic Chemistry ──
     IUPAC_names = [
@@ -556,11 +469,11 @@ def gen_chemistry():
         ("CH₃NH₂","Methylamine","primary amine"),
     ]
     for formula, name, reason in IUPAC_names:
-        qs.append(q("Chemistry","NEET","Organic Chemistry","IUPAC Nomenclature","medium",
+        yield q("Chemistry","NEET","Organic Chemistry","IUPAC Nomenclature","medium",
             f"IUPAC name of {formula}:",
             name, "Ethane" if name!="Ethane" else "Propane",
             "Butanol" if name!="Butanol" else "Methanol",
-            "Propanone" if name!="Propanone" else "Butanone","A", reason))
+            "Propanone" if name!="Propanone" else "Butanone","A", reason)
 
     # Reaction types
     reaction_data = [
@@ -582,11 +495,11 @@ def gen_chemistry():
          "Acid + alcohol → ester + water"),
     ]
     for rxn, rxn_type, reason in reaction_data:
-        qs.append(q("Chemistry","NEET","Organic Chemistry","Reaction Types","hard",
+        yield q("Chemistry","NEET","Organic Chemistry","Reaction Types","hard",
             f"Type of reaction: {rxn}",
             rxn_type, "Free radical addition",
             "Electrophilic elimination", "Nucleophilic substitution" if "Nucleophilic" not in rxn_type else "Electrophilic addition",
-            "A", reason))
+            "A", reason)
 
     # ── Thermochemistry ──
     bond_energies = [
@@ -597,14 +510,12 @@ def gen_chemistry():
         ("H-F",565),("H-Cl",431),("H-Br",366),
     ]
     for bond, BE in bond_energies:
-        qs.append(q("Chemistry","NEET","Thermochemistry","Bond Energy","hard",
+        yield q("Chemistry","NEET","Thermochemistry","Bond Energy","hard",
             f"Bond dissociation energy of {bond} bond:",
             f"{BE} kJ/mol",
             f"{BE+50} kJ/mol", f"{BE-50} kJ/mol", f"{round(BE*0.7)} kJ/mol","A",
-            f"{bond} bond energy = {BE} kJ/mol"))
+            f"{bond} bond energy = {BE} kJ/mol")
 
-    print(f"  Chemistry generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -612,7 +523,6 @@ def gen_chemistry():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_biology():
-    qs = []
     random.seed(44)
 
     # ── Cell Biology ──
@@ -634,8 +544,8 @@ def gen_biology():
         ("Osmosis is movement of:","Water through semipermeable membrane","Solute through membrane","Ions against gradient","Large molecules","A","Osmosis: water moves from low to high solute concentration"),
     ]
     for item in cell_facts:
-        qs.append(q("Biology","NEET","Cell Biology",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Cell Biology",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Mitosis stages
     mitosis_events = [
@@ -649,8 +559,8 @@ def gen_biology():
         ("Crossing over (genetic recombination) occurs in:","Prophase I of Meiosis","Anaphase I","Metaphase II","Telophase II","A","Crossing over in Prophase I at chiasmata"),
     ]
     for item in mitosis_events:
-        qs.append(q("Biology","NEET","Cell Biology",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Cell Biology",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Genetics ──
     # Mendel's laws with different traits
@@ -667,19 +577,19 @@ def gen_biology():
         ("Drosophila","Red eye (W)","white (w)","WW×ww","3:1","F2 of Ww×Ww gives 3:1"),
     ]
     for organism, dominant, recessive, cross, ratio, explanation in genetic_traits:
-        qs.append(q("Biology","NEET","Genetics","Monohybrid Cross","medium",
+        yield q("Biology","NEET","Genetics","Monohybrid Cross","medium",
             f"In {organism}, {dominant} is dominant over {recessive}. "
             f"Cross: {cross}. Phenotypic ratio in F2:",
-            ratio, "1:2:1", "1:1", "2:1","A", explanation))
+            ratio, "1:2:1", "1:1", "2:1","A", explanation)
 
     # Dihybrid
     for trait1, trait2 in [("Round,Yellow","Wrinkled,Green"),
                             ("Tall,Purple","Dwarf,White"),
                             ("Black,Rough","Brown,Smooth")]:
-        qs.append(q("Biology","NEET","Genetics","Dihybrid Cross","hard",
+        yield q("Biology","NEET","Genetics","Dihybrid Cross","hard",
             f"Dihybrid cross AaBb × AaBb ({trait1} vs {trait2}). F2 phenotypic ratio:",
             "9:3:3:1", "3:1", "1:2:1:2:1", "9:3:4","A",
-            "Dihybrid F2 always 9:3:3:1 for independent assortment"))
+            "Dihybrid F2 always 9:3:3:1 for independent assortment")
 
     # Blood groups
     blood_group_qs = [
@@ -690,8 +600,8 @@ def gen_biology():
         ("Rh factor positive means:","Rh antigen present on RBCs","Rh antibody present","Rh gene absent","No Rh antigen","A","Rh+ individuals have Rh(D) antigen on red blood cells"),
     ]
     for item in blood_group_qs:
-        qs.append(q("Biology","NEET","Genetics",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Genetics",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # DNA / Molecular Biology
     dna_qs = [
@@ -712,8 +622,8 @@ def gen_biology():
         ("Restriction enzymes cut DNA at:","Specific palindromic sequences","Random sites","Only at promoters","Only at introns","A","Restriction enzymes recognize specific palindromic sequences"),
     ]
     for item in dna_qs:
-        qs.append(q("Biology","NEET","Molecular Biology",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Molecular Biology",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Human Physiology ──
     physiology_qs = [
@@ -737,8 +647,8 @@ def gen_biology():
         ("Platelets are involved in:","Blood clotting","Oxygen transport","Antibody production","Phagocytosis","A","Platelets (thrombocytes) initiate coagulation cascade"),
     ]
     for item in physiology_qs:
-        qs.append(q("Biology","NEET","Human Physiology",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Human Physiology",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Evolution ──
     evolution_qs = [
@@ -754,8 +664,8 @@ def gen_biology():
         ("First life forms on Earth were:","Prokaryotes (bacteria-like)","Eukaryotes","Multicellular animals","Fungi","A","First life: simple prokaryotes ~3.5 billion years ago"),
     ]
     for item in evolution_qs:
-        qs.append(q("Biology","NEET","Evolution",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Evolution",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Plant Biology
     plant_qs = [
@@ -771,8 +681,8 @@ def gen_biology():
         ("Tallest plant cells in stem cross section:","Collenchyma","Parenchyma","Sclerenchyma","Xylem fiber","A","Collenchyma cells are elongated for flexible support"),
     ]
     for item in plant_qs:
-        qs.append(q("Biology","NEET","Plant Biology",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Biology","NEET","Plant Biology",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Ecology
     for producer, consumer1, consumer2, consumer3 in [
@@ -785,16 +695,14 @@ def gen_biology():
         ("Corn","Rabbit","Fox","Lion"),
         ("Seaweed","Sea urchin","Starfish","Otter"),
     ]:
-        qs.append(q("Biology","NEET","Ecology","Food Chain","medium",
+        yield q("Biology","NEET","Ecology","Food Chain","medium",
             f"Identify the correct food chain:",
             f"{producer}→{consumer1}→{consumer2}→{consumer3}",
             f"{consumer1}→{producer}→{consumer2}→{consumer3}",
             f"{consumer3}→{consumer2}→{consumer1}→{producer}",
             f"{producer}→{consumer2}→{consumer1}→{consumer3}","A",
-            f"Correct order: producer → primary → secondary → tertiary consumer"))
+            f"Correct order: producer → primary → secondary → tertiary consumer")
 
-    print(f"  Biology generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -802,7 +710,6 @@ def gen_biology():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_mathematics():
-    qs = []
     random.seed(45)
 
     # ── Algebra ──
@@ -816,20 +723,20 @@ def gen_mathematics():
                 r1 = round((-b_ + math.sqrt(disc))/(2*a_), 2)
                 r2 = round((-b_ - math.sqrt(disc))/(2*a_), 2)
                 s_ = round(r1+r2, 2); p_ = round(r1*r2, 2)
-                qs.append(q("Mathematics","NEET","Algebra","Quadratic Equations","medium",
+                yield q("Mathematics","NEET","Algebra","Quadratic Equations","medium",
                     f"Sum of roots of {a_}x² + {b_}x + {c_} = 0:",
                     f"{round(-b_/a_,2)}",
                     f"{round(c_/a_,2)}",
                     f"{round(b_/a_,2)}",
                     f"{round(-c_/a_,2)}","A",
-                    f"Sum = -b/a = -({b_})/{a_} = {round(-b_/a_,2)}"))
-                qs.append(q("Mathematics","NEET","Algebra","Quadratic Equations","medium",
+                    f"Sum = -b/a = -({b_})/{a_} = {round(-b_/a_,2)}")
+                yield q("Mathematics","NEET","Algebra","Quadratic Equations","medium",
                     f"Product of roots of {a_}x² + {b_}x + {c_} = 0:",
                     f"{round(c_/a_,2)}",
                     f"{round(-b_/a_,2)}",
                     f"{round(-c_/a_,2)}",
                     f"{round(b_/a_,2)}","A",
-                    f"Product = c/a = {c_}/{a_} = {round(c_/a_,2)}"))
+                    f"Product = c/a = {c_}/{a_} = {round(c_/a_,2)}")
 
     # AP/GP
     for a_ in range(1, 20):
@@ -837,33 +744,33 @@ def gen_mathematics():
             n_ = random.choice(range(5, 20))
             an = a_ + (n_-1)*d_
             Sn = n_*(2*a_ + (n_-1)*d_)//2
-            qs.append(q("Mathematics","NEET","Sequences","AP nth Term","medium",
+            yield q("Mathematics","NEET","Sequences","AP nth Term","medium",
                 f"AP: a={a_}, d={d_}. {n_}th term:",
                 f"{an}", f"{an+d_}", f"{an-d_}", f"{a_*n_}","A",
-                f"aₙ = a + (n-1)d = {a_} + {n_-1}×{d_} = {an}"))
-            qs.append(q("Mathematics","NEET","Sequences","AP Sum","medium",
+                f"aₙ = a + (n-1)d = {a_} + {n_-1}×{d_} = {an}")
+            yield q("Mathematics","NEET","Sequences","AP Sum","medium",
                 f"AP: a={a_}, d={d_}. Sum of first {n_} terms:",
                 f"{Sn}", f"{Sn+n_}", f"{Sn-n_}", f"{n_*an}","A",
-                f"Sₙ = n(2a+(n-1)d)/2 = {n_}(2×{a_}+{n_-1}×{d_})/2 = {Sn}"))
+                f"Sₙ = n(2a+(n-1)d)/2 = {n_}(2×{a_}+{n_-1}×{d_})/2 = {Sn}")
 
     for a_ in range(1, 10):
         for r_ in [2, 3, 0.5, 0.25]:
             n_ = random.choice([3,4,5,6])
             gn = round(a_ * r_**(n_-1), 4)
             Sgn = round(a_*(r_**n_ - 1)/(r_-1), 4) if r_ != 1 else a_*n_
-            qs.append(q("Mathematics","NEET","Sequences","GP nth Term","medium",
+            yield q("Mathematics","NEET","Sequences","GP nth Term","medium",
                 f"GP: a={a_}, r={r_}. {n_}th term:",
                 f"{gn}", f"{round(gn*r_,4)}", f"{round(gn/r_,4)}", f"{a_*n_}","A",
-                f"aₙ = a×r^(n-1) = {a_}×{r_}^{n_-1} = {gn}"))
+                f"aₙ = a×r^(n-1) = {a_}×{r_}^{n_-1} = {gn}")
 
     # Logarithms
     for base in [2, 3, 5, 10]:
         for val in [base**e for e in range(1, 7)]:
             log_val = round(math.log(val, base))
-            qs.append(q("Mathematics","NEET","Algebra","Logarithms","medium",
+            yield q("Mathematics","NEET","Algebra","Logarithms","medium",
                 f"log_{base}({val}) = ?",
                 f"{log_val}", f"{log_val+1}", f"{log_val-1}", f"{base}","A",
-                f"log_{base}({val}) = {log_val} since {base}^{log_val} = {val}"))
+                f"log_{base}({val}) = {log_val} since {base}^{log_val} = {val}")
 
     # ── Trigonometry ──
     trig_values = [
@@ -875,52 +782,52 @@ def gen_mathematics():
         (45, "tan", 1, "1"), (60, "tan", round(math.sqrt(3),4), "√3"),
     ]
     for angle, fn, val, val_str in trig_values:
-        qs.append(q("Mathematics","NEET","Trigonometry","Standard Values","medium",
+        yield q("Mathematics","NEET","Trigonometry","Standard Values","medium",
             f"{fn}({angle}°) = ?",
             val_str,
             "0" if val_str!="0" else "1",
             "√3/2" if val_str!="√3/2" else "1/2",
             "1/√2" if val_str!="1/√2" else "√3","A",
-            f"{fn}({angle}°) = {val_str}"))
+            f"{fn}({angle}°) = {val_str}")
 
     # Identities
     for A in [0, 30, 45, 60, 90]:
         rad = math.radians(A)
         sin2 = round(math.sin(rad)**2, 4)
         cos2 = round(math.cos(rad)**2, 4)
-        qs.append(q("Mathematics","NEET","Trigonometry","Identities","medium",
+        yield q("Mathematics","NEET","Trigonometry","Identities","medium",
             f"sin²({A}°) + cos²({A}°) = ?",
             "1", "0", "2", f"sin({A}°)","A",
-            f"sin²θ + cos²θ = 1 always"))
+            f"sin²θ + cos²θ = 1 always")
         if A not in [90]:
             sin2A = round(math.sin(2*rad), 4)
-            qs.append(q("Mathematics","NEET","Trigonometry","Double Angle","medium",
+            yield q("Mathematics","NEET","Trigonometry","Double Angle","medium",
                 f"sin(2×{A}°) = 2sin({A}°)cos({A}°) = ?",
                 f"{sin2A}", f"{round(sin2A+0.5,4)}", f"{round(sin2A-0.3,4)}",
                 f"{round(sin2A*2,4)}","A",
-                f"sin(2×{A}°) = {sin2A}"))
+                f"sin(2×{A}°) = {sin2A}")
 
     # ── Calculus ──
     # Derivatives
     for n_ in range(1, 12):
-        qs.append(q("Mathematics","JEE","Calculus","Differentiation","medium",
+        yield q("Mathematics","JEE","Calculus","Differentiation","medium",
             f"d/dx (x^{n_}) = ?",
             f"{n_}x^{n_-1}" if n_-1 != 0 else f"{n_}",
             f"{n_+1}x^{n_}",
             f"x^{n_+1}/({n_+1})",
             f"x^{n_-1}","A",
-            f"Power rule: d/dx(xⁿ) = nxⁿ⁻¹"))
+            f"Power rule: d/dx(xⁿ) = nxⁿ⁻¹")
 
     # Integration
     for n_ in range(0, 10):
         if n_ != -1:
-            qs.append(q("Mathematics","JEE","Calculus","Integration","medium",
+            yield q("Mathematics","JEE","Calculus","Integration","medium",
                 f"∫ x^{n_} dx = ?",
                 f"x^{n_+1}/({n_+1}) + C",
                 f"x^{n_-1}/({n_-1}) + C" if n_>1 else f"{n_}x^{n_+1} + C",
                 f"({n_}+1)x^{n_+2} + C",
                 f"x^{n_+1} + C","A",
-                f"∫xⁿ dx = xⁿ⁺¹/(n+1) + C"))
+                f"∫xⁿ dx = xⁿ⁺¹/(n+1) + C")
 
     # Limits
     limits_qs = [
@@ -931,19 +838,19 @@ def gen_mathematics():
         ("lim x→0 (log(1+x))/x", "1", "0", "log e", "1/log e","A","lim(ln(1+x)/x) = 1 as x→0"),
     ]
     for item in limits_qs:
-        qs.append(q("Mathematics","JEE","Calculus",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Mathematics","JEE","Calculus",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Probability ──
     for n_total in range(4, 15):
         for n_favor in range(1, n_total):
             p = round(n_favor/n_total, 4)
             q_val = round(1-p, 4)
-            qs.append(q("Mathematics","NEET","Probability","Basic Probability","medium",
+            yield q("Mathematics","NEET","Probability","Basic Probability","medium",
                 f"Bag has {n_total} balls. {n_favor} are red. Probability of drawing red:",
                 f"{n_favor}/{n_total}", f"{n_total-n_favor}/{n_total}",
                 f"{n_favor}/{n_total+1}", f"1/{n_favor}","A",
-                f"P = favorable/total = {n_favor}/{n_total}"))
+                f"P = favorable/total = {n_favor}/{n_total}")
 
     # Dice/coin problems
     dice_qs = [
@@ -957,33 +864,31 @@ def gen_mathematics():
         ("Two dice. Probability of getting doubles:","6/36 = 1/6","1/36","2/6","1/12","A","6 doubles out of 36 outcomes"),
     ]
     for item in dice_qs:
-        qs.append(q("Mathematics","NEET","Probability",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("Mathematics","NEET","Probability",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Coordinate Geometry ──
     for x1,y1,x2,y2 in [(0,0,3,4),(1,2,4,6),(0,0,5,12),(-1,-2,2,2),(3,4,6,8),
                          (1,1,4,5),(0,3,4,0),(2,2,5,6),(0,0,8,6),(1,3,4,7)]:
         dist = round(math.sqrt((x2-x1)**2 + (y2-y1)**2), 2)
         mx = (x1+x2)/2; my = (y1+y2)/2
-        qs.append(q("Mathematics","NEET","Coordinate Geometry","Distance Formula","medium",
+        yield q("Mathematics","NEET","Coordinate Geometry","Distance Formula","medium",
             f"Distance between ({x1},{y1}) and ({x2},{y2}):",
             f"{dist}", f"{dist+1}", f"{dist*2}", f"{abs(x2-x1)+abs(y2-y1)}","A",
-            f"d = √((x₂-x₁)²+(y₂-y₁)²) = √({(x2-x1)**2}+{(y2-y1)**2}) = {dist}"))
-        qs.append(q("Mathematics","NEET","Coordinate Geometry","Midpoint","medium",
+            f"d = √((x₂-x₁)²+(y₂-y₁)²) = √({(x2-x1)**2}+{(y2-y1)**2}) = {dist}")
+        yield q("Mathematics","NEET","Coordinate Geometry","Midpoint","medium",
             f"Midpoint of ({x1},{y1}) and ({x2},{y2}):",
             f"({mx},{my})", f"({x1+x2},{y1+y2})", f"({x2-x1},{y2-y1})", f"({x1},{y2})","A",
-            f"Midpoint = ((x₁+x₂)/2,(y₁+y₂)/2) = ({mx},{my})"))
+            f"Midpoint = ((x₁+x₂)/2,(y₁+y₂)/2) = ({mx},{my})")
 
     # Matrices
     for a,b,c,d in [(1,2,3,4),(2,3,1,5),(1,0,0,1),(2,1,4,3),(3,2,1,4)]:
         det = a*d - b*c
-        qs.append(q("Mathematics","JEE","Matrices","Determinant","medium",
+        yield q("Mathematics","JEE","Matrices","Determinant","medium",
             f"|{a} {b}; {c} {d}| (2×2 determinant) = ?",
             f"{det}", f"{det+1}", f"{a*d}", f"{b*c}","A",
-            f"det = ad-bc = {a}×{d} - {b}×{c} = {det}"))
+            f"det = ad-bc = {a}×{d} - {b}×{c} = {det}")
 
-    print(f"  Mathematics generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -991,7 +896,6 @@ def gen_mathematics():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_cuet_gk():
-    qs = []
     random.seed(46)
 
     # ── Indian History ──
@@ -1018,8 +922,8 @@ def gen_cuet_gk():
         ("Chauri Chaura incident led to withdrawal of:","Non-Cooperation Movement","Quit India Movement","Civil Disobedience","Khilafat Movement","A","Gandhi suspended NCM after Chauri Chaura violence (Feb 1922)"),
     ]
     for item in history_qs:
-        qs.append(q("CUET_GK","CUET_GT","History",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_GK","CUET_GT","History",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Indian Polity ──
     polity_qs = [
@@ -1040,8 +944,8 @@ def gen_cuet_gk():
         ("National Emergency under Article 352 can be imposed on grounds of:","War, external aggression, armed rebellion","Financial crisis","Political instability","Natural disaster","A","Art 352: National Emergency on grounds of war/external aggression/armed rebellion"),
     ]
     for item in polity_qs:
-        qs.append(q("CUET_GK","CUET_GT","Polity",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_GK","CUET_GT","Polity",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Indian Geography ──
     geo_qs = [
@@ -1062,8 +966,8 @@ def gen_cuet_gk():
         ("River Brahmaputra enters India from:","Arunachal Pradesh (from China/Tibet)","Assam","Bangladesh","Nagaland","A","Brahmaputra enters NE India through Arunachal Pradesh"),
     ]
     for item in geo_qs:
-        qs.append(q("CUET_GK","CUET_GT","Geography",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_GK","CUET_GT","Geography",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # ── Awards and Honours ──
     awards_qs = [
@@ -1079,8 +983,8 @@ def gen_cuet_gk():
         ("Sahitya Akademi Award is for:","Outstanding literary work","Best film","Scientific research","Social service","A","Sahitya Akademi recognizes outstanding literary works"),
     ]
     for item in awards_qs:
-        qs.append(q("CUET_GK","CUET_GT","Awards",item[0][:30],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_GK","CUET_GT","Awards",item[0][:30],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Parametric: capitals, currencies, GK facts
     countries_data = [
@@ -1101,23 +1005,21 @@ def gen_cuet_gk():
         ("Malaysia","Kuala Lumpur","Ringgit (MYR)"),("Thailand","Bangkok","Thai Baht (THB)"),
     ]
     for country, capital, currency in countries_data:
-        qs.append(q("CUET_GK","CUET_GT","Geography","World Capitals","easy",
+        yield q("CUET_GK","CUET_GT","Geography","World Capitals","easy",
             f"Capital of {country}:",
             capital,
             f"{'London' if capital!='London' else 'Paris'}",
             f"{'New York' if capital!='New York' else 'Washington D.C.'}",
             f"{'Sydney' if capital!='Sydney' else 'Melbourne'}","A",
-            f"Capital of {country} is {capital}"))
-        qs.append(q("CUET_GK","CUET_GT","Economy","World Currencies","easy",
+            f"Capital of {country} is {capital}")
+        yield q("CUET_GK","CUET_GT","Economy","World Currencies","easy",
             f"Currency of {country}:",
             currency,
             f"US Dollar" if currency!="US Dollar (USD)" else "Euro",
             f"Euro" if "Euro" not in currency else "Pound Sterling",
             f"Yen" if "Yen" not in currency else "Rupee","A",
-            f"Currency of {country} is {currency}"))
+            f"Currency of {country} is {currency}")
 
-    print(f"  CUET_GK generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1125,7 +1027,6 @@ def gen_cuet_gk():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_cuet_english():
-    qs = []
     random.seed(47)
 
     # Vocabulary: synonyms
@@ -1162,9 +1063,9 @@ def gen_cuet_english():
         ("Feasible","Possible","Impossible","Unlikely","Impractical","A","Feasible = possible and practical to do easily"),
     ]
     for item in synonyms:
-        qs.append(q("CUET_English","CUET_GT","Vocabulary","Synonyms","medium",
+        yield q("CUET_English","CUET_GT","Vocabulary","Synonyms","medium",
             f"Synonym of '{item[0]}':",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Antonyms
     antonyms = [
@@ -1190,9 +1091,9 @@ def gen_cuet_english():
         ("Brave","Cowardly","Courageous","Bold","Fearless","A","Antonym of Brave is Cowardly/Timid"),
     ]
     for item in antonyms:
-        qs.append(q("CUET_English","CUET_GT","Vocabulary","Antonyms","medium",
+        yield q("CUET_English","CUET_GT","Vocabulary","Antonyms","medium",
             f"Antonym of '{item[0]}':",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Grammar: fill in the blank
     grammar_qs = [
@@ -1218,8 +1119,8 @@ def gen_cuet_english():
         ("The jury ___ reached a verdict.","has","have","are","were","A","'Jury' as a unit: singular - has reached"),
     ]
     for item in grammar_qs:
-        qs.append(q("CUET_English","CUET_GT","Grammar","Fill in the Blank","medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_English","CUET_GT","Grammar","Fill in the Blank","medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Idioms and Phrases
     idioms = [
@@ -1240,9 +1141,9 @@ def gen_cuet_english():
         ("Pull someone's leg","To joke/tease someone","To physically pull","To help someone","To injure someone","A","'Pull someone's leg' = tease or joke with someone"),
     ]
     for item in idioms:
-        qs.append(q("CUET_English","CUET_GT","Vocabulary","Idioms and Phrases","medium",
+        yield q("CUET_English","CUET_GT","Vocabulary","Idioms and Phrases","medium",
             f"Meaning of '{item[0]}':",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Error spotting - sentences
     error_qs = [
@@ -1253,12 +1154,10 @@ def gen_cuet_english():
         ("I am knowing him for years.","'am knowing' should be 'have known'","No error","'years' should be 'year'","'for' should be 'since'","A","Know is a stative verb; present perfect: have known"),
     ]
     for item in error_qs:
-        qs.append(q("CUET_English","CUET_GT","Grammar","Error Spotting","hard",
+        yield q("CUET_English","CUET_GT","Grammar","Error Spotting","hard",
             f"Find the error: '{item[0]}'",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
 
-    print(f"  CUET_English generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1266,7 +1165,6 @@ def gen_cuet_english():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_cuet_reasoning():
-    qs = []
     random.seed(48)
 
     # Number series
@@ -1292,22 +1190,22 @@ def gen_cuet_reasoning():
 
             if all(v > 0 for v in series) and 0 < next_val < 100000:
                 shown = ", ".join(str(v) for v in series)
-                qs.append(q("CUET_Reasoning","CUET_GT","Number Series","Next Term","medium",
+                yield q("CUET_Reasoning","CUET_GT","Number Series","Next Term","medium",
                     f"Find next: {shown}, ?",
                     f"{next_val}",
                     f"{next_val + step if stype=='add' else next_val + 1}",
                     f"{next_val - step if stype=='add' else next_val - 1}",
                     f"{series[-1]}","A",
-                    f"Pattern: {'add '+str(step) if stype=='add' else 'multiply by '+str(step) if stype=='mult' else 'subtract '+str(step)}; next = {next_val}"))
+                    f"Pattern: {'add '+str(step) if stype=='add' else 'multiply by '+str(step) if stype=='mult' else 'subtract '+str(step)}; next = {next_val}")
 
     # Square/cube series
     for base in range(2, 12):
         squares = [i*i for i in range(base, base+6)]
         shown = ", ".join(str(v) for v in squares[:5])
-        qs.append(q("CUET_Reasoning","CUET_GT","Number Series","Square Series","hard",
+        yield q("CUET_Reasoning","CUET_GT","Number Series","Square Series","hard",
             f"Find next: {shown}, ?",
             f"{squares[5]}", f"{squares[5]+5}", f"{squares[4]+5}", f"{squares[5]-2}","A",
-            f"Series of squares: {base}²,{base+1}²,...; next = {base+5}² = {squares[5]}"))
+            f"Series of squares: {base}²,{base+1}²,...; next = {base+5}² = {squares[5]}")
 
     # Coding-Decoding
     code_pairs = [
@@ -1321,20 +1219,20 @@ def gen_cuet_reasoning():
         ("HOME","IPNF","Each letter +1","H+1=I, O+1=P, M+1=N, E+1=F"),
     ]
     for word, code, pattern, explanation in code_pairs:
-        qs.append(q("CUET_Reasoning","CUET_GT","Coding","Letter Coding","medium",
+        yield q("CUET_Reasoning","CUET_GT","Coding","Letter Coding","medium",
             f"If {word} is coded as {code}, find the code for the next word using the same pattern:",
             f"Next letter of each letter",
             f"Previous letter of each letter",
             f"Reverse the word",
-            f"Skip alternate letters","A", explanation))
+            f"Skip alternate letters","A", explanation)
 
         # Create a reverse question
-        qs.append(q("CUET_Reasoning","CUET_GT","Coding","Decoding","medium",
+        yield q("CUET_Reasoning","CUET_GT","Coding","Decoding","medium",
             f"In a code: {word} = {code}. What does '{code}' decode to?",
             word,
             word[::-1],
             word[1:]+word[0],
-            word[:-1],"A", f"Reverse the +1 coding: {code} → {word}"))
+            word[:-1],"A", f"Reverse the +1 coding: {code} → {word}")
 
     # Blood Relations
     blood_qs = [
@@ -1348,8 +1246,8 @@ def gen_cuet_reasoning():
         ("If P+Q means P is the father of Q; P-Q means P is the mother of Q; P×Q means P is the brother of Q; P÷Q means P is the sister of Q, then A+B-C means:","A is the grandfather of C","A is the father of C","A is the uncle of C","A is the son of C","A","A+B: A is father of B; B-C: B is mother of C → A is grandfather of C"),
     ]
     for item in blood_qs:
-        qs.append(q("CUET_Reasoning","CUET_GT","Blood Relations",item[0][:40],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_Reasoning","CUET_GT","Blood Relations",item[0][:40],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Direction Sense
     directions_qs = [
@@ -1363,8 +1261,8 @@ def gen_cuet_reasoning():
         ("A walks 20 m North, turns right, walks 10 m, turns right, walks 20 m. How far from start?","10 m","20 m","0 m","30 m","A","Returns to same latitude; 10 m East of start"),
     ]
     for item in directions_qs:
-        qs.append(q("CUET_Reasoning","CUET_GT","Direction Sense",item[0][:40],"medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_Reasoning","CUET_GT","Direction Sense",item[0][:40],"medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Syllogism
     syllogism_qs = [
@@ -1380,8 +1278,8 @@ def gen_cuet_reasoning():
          "True (Valid)","False","Uncertain","Cannot determine","A","All mangoes→fruits; no fruit→vegetable; ∴ no mango→vegetable"),
     ]
     for item in syllogism_qs:
-        qs.append(q("CUET_Reasoning","CUET_GT","Syllogism",item[0][:40],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield q("CUET_Reasoning","CUET_GT","Syllogism",item[0][:40],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Calendar problems
     for year in range(2000, 2030):
@@ -1389,14 +1287,12 @@ def gen_cuet_reasoning():
             m_num, m_name, m_days = month
             import calendar
             day_name = calendar.day_name[calendar.weekday(year, m_num, 1)]
-            qs.append(q("CUET_Reasoning","CUET_GT","Calendar","Day of Week","medium",
+            yield q("CUET_Reasoning","CUET_GT","Calendar","Day of Week","medium",
                 f"If 1st {m_name} {year} falls on {day_name}, how many Sundays in {m_name} {year}?",
                 f"{4 if day_name not in ['Sunday','Saturday','Friday'] else 5}",
                 f"3", f"6", f"2","A",
-                f"1st {m_name} {year} = {day_name}; 31-day month has 4 or 5 Sundays"))
+                f"1st {m_name} {year} = {day_name}; 31-day month has 4 or 5 Sundays")
 
-    print(f"  CUET_Reasoning generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1404,33 +1300,32 @@ def gen_cuet_reasoning():
 # ══════════════════════════════════════════════════════════════════════════════
 
 def gen_cuet_quantitative():
-    qs = []
     random.seed(49)
 
     # Percentage
     for val in range(10, 500, 10):
         for pct in range(5, 100, 5):
             result = round(pct * val / 100, 2)
-            qs.append(q("CUET_Quantitative","CUET_GT","Percentages","Basic Percentage","easy",
+            yield q("CUET_Quantitative","CUET_GT","Percentages","Basic Percentage","easy",
                 f"{pct}% of {val} = ?",
                 f"{result}", f"{val*pct}", f"{round(result*2,2)}", f"{round(result/2,2)}","A",
-                f"{pct}% of {val} = {pct}×{val}/100 = {result}"))
+                f"{pct}% of {val} = {pct}×{val}/100 = {result}")
 
     # Percentage increase/decrease
     for original in range(100, 1000, 50):
         for pct in [5, 10, 15, 20, 25, 30, 40, 50]:
             new_val = original * (1 + pct/100)
-            qs.append(q("CUET_Quantitative","CUET_GT","Percentages","Percentage Increase","medium",
+            yield q("CUET_Quantitative","CUET_GT","Percentages","Percentage Increase","medium",
                 f"A number {original} is increased by {pct}%. New value:",
                 f"{new_val}", f"{original + pct}", f"{original * pct / 100}",
                 f"{original * pct}","A",
-                f"New = {original} × (1+{pct}/100) = {original} × {1+pct/100} = {new_val}"))
+                f"New = {original} × (1+{pct}/100) = {original} × {1+pct/100} = {new_val}")
             dec_val = original * (1 - pct/100)
-            qs.append(q("CUET_Quantitative","CUET_GT","Percentages","Percentage Decrease","medium",
+            yield q("CUET_Quantitative","CUET_GT","Percentages","Percentage Decrease","medium",
                 f"A number {original} is decreased by {pct}%. New value:",
                 f"{dec_val}", f"{original - pct}", f"{original * pct / 100}",
                 f"{original / pct}","A",
-                f"New = {original} × (1-{pct}/100) = {dec_val}"))
+                f"New = {original} × (1-{pct}/100) = {dec_val}")
 
     # Simple Interest
     for P in range(500, 10001, 500):
@@ -1438,15 +1333,15 @@ def gen_cuet_quantitative():
             for T in range(1, 6):
                 SI = round(P*R*T/100)
                 A = P + SI
-                qs.append(q("CUET_Quantitative","CUET_GT","Simple Interest","SI Calculation","medium",
+                yield q("CUET_Quantitative","CUET_GT","Simple Interest","SI Calculation","medium",
                     f"Principal ₹{P}, Rate {R}% p.a., Time {T} year(s). Simple Interest:",
                     f"₹{SI}", f"₹{A}", f"₹{SI*2}", f"₹{P*R//100}","A",
-                    f"SI = PRT/100 = {P}×{R}×{T}/100 = ₹{SI}"))
+                    f"SI = PRT/100 = {P}×{R}×{T}/100 = ₹{SI}")
                 if P <= 5000:
-                    qs.append(q("CUET_Quantitative","CUET_GT","Simple Interest","Amount","medium",
+                    yield q("CUET_Quantitative","CUET_GT","Simple Interest","Amount","medium",
                         f"Principal ₹{P}, Rate {R}%, Time {T} yr. Amount:",
                         f"₹{A}", f"₹{SI}", f"₹{P+R}", f"₹{P*T}","A",
-                        f"A = P+SI = {P}+{SI} = ₹{A}"))
+                        f"A = P+SI = {P}+{SI} = ₹{A}")
 
     # Compound Interest
     for P in [1000, 2000, 5000, 10000]:
@@ -1454,116 +1349,126 @@ def gen_cuet_quantitative():
             for T in [1, 2, 3]:
                 CI_A = round(P * (1+R/100)**T, 2)
                 CI = round(CI_A - P, 2)
-                qs.append(q("CUET_Quantitative","CUET_GT","Compound Interest","CI Calculation","hard",
+                yield q("CUET_Quantitative","CUET_GT","Compound Interest","CI Calculation","hard",
                     f"Principal ₹{P}, Rate {R}% compounded annually, Time {T} year(s). Compound Interest:",
                     f"₹{CI}", f"₹{round(P*R*T/100,2)}", f"₹{CI*2}", f"₹{CI+100}","A",
-                    f"A = P(1+R/100)^T = {P}×{(1+R/100):.2f}^{T} = ₹{CI_A}; CI = ₹{CI}"))
+                    f"A = P(1+R/100)^T = {P}×{(1+R/100):.2f}^{T} = ₹{CI_A}; CI = ₹{CI}")
 
     # Profit and Loss
     for CP in range(100, 2001, 100):
         for pct in [5, 10, 15, 20, 25, 30, 40, 50]:
             SP = CP * (1 + pct/100)
             profit = SP - CP
-            qs.append(q("CUET_Quantitative","CUET_GT","Profit/Loss","Profit Calculation","medium",
+            yield q("CUET_Quantitative","CUET_GT","Profit/Loss","Profit Calculation","medium",
                 f"CP = ₹{CP}, Profit = {pct}%. Selling price:",
                 f"₹{SP}", f"₹{CP + pct}", f"₹{CP*pct}", f"₹{SP+10}","A",
-                f"SP = CP×(1+{pct}/100) = {CP}×{1+pct/100} = ₹{SP}"))
+                f"SP = CP×(1+{pct}/100) = {CP}×{1+pct/100} = ₹{SP}")
             loss_SP = CP * (1 - pct/100)
-            qs.append(q("CUET_Quantitative","CUET_GT","Profit/Loss","Loss Calculation","medium",
+            yield q("CUET_Quantitative","CUET_GT","Profit/Loss","Loss Calculation","medium",
                 f"CP = ₹{CP}, Loss = {pct}%. Selling price:",
                 f"₹{loss_SP}", f"₹{CP - pct}", f"₹{CP*pct/100}", f"₹{loss_SP+10}","A",
-                f"SP = CP×(1-{pct}/100) = {CP}×{1-pct/100} = ₹{loss_SP}"))
+                f"SP = CP×(1-{pct}/100) = {CP}×{1-pct/100} = ₹{loss_SP}")
 
     # Ratio and Proportion
     for a,b in [(1,2),(2,3),(3,4),(1,3),(2,5),(3,5),(4,5),(1,4),(3,7),(5,7)]:
         total = random.choice([10,12,15,20,24,25,30,35,40,42,50])
         part_a = round(total * a / (a+b))
         part_b = total - part_a
-        qs.append(q("CUET_Quantitative","CUET_GT","Ratio","Division in Ratio","medium",
+        yield q("CUET_Quantitative","CUET_GT","Ratio","Division in Ratio","medium",
             f"Divide {total} in ratio {a}:{b}. Larger share:",
             f"{max(part_a,part_b)}", f"{min(part_a,part_b)}", f"{total//2}", f"{total}","A",
-            f"Parts: {total}×{a}/{a+b}={part_a} and {total}×{b}/{a+b}={part_b}; larger={max(part_a,part_b)}"))
+            f"Parts: {total}×{a}/{a+b}={part_a} and {total}×{b}/{a+b}={part_b}; larger={max(part_a,part_b)}")
 
     # Speed Distance Time
     for speed in range(20, 200, 10):
         for time in range(1, 10):
             dist = speed * time
-            qs.append(q("CUET_Quantitative","CUET_GT","Speed/Distance","Basic SDT","easy",
+            yield q("CUET_Quantitative","CUET_GT","Speed/Distance","Basic SDT","easy",
                 f"Speed {speed} km/h for {time} hour(s). Distance covered:",
                 f"{dist} km", f"{speed+time} km", f"{dist*2} km", f"{dist//2} km","A",
-                f"Distance = Speed × Time = {speed} × {time} = {dist} km"))
+                f"Distance = Speed × Time = {speed} × {time} = {dist} km")
 
     for dist in range(100, 1000, 50):
         for speed in range(20, 120, 10):
             time_hr = round(dist/speed, 2)
-            qs.append(q("CUET_Quantitative","CUET_GT","Speed/Distance","Time Calculation","medium",
+            yield q("CUET_Quantitative","CUET_GT","Speed/Distance","Time Calculation","medium",
                 f"Distance {dist} km at speed {speed} km/h. Time taken:",
                 f"{time_hr} hours", f"{dist*speed} hours", f"{dist+speed} hours",
                 f"{round(time_hr/2,2)} hours","A",
-                f"Time = Distance/Speed = {dist}/{speed} = {time_hr} hours"))
+                f"Time = Distance/Speed = {dist}/{speed} = {time_hr} hours")
 
     # Ages
     for current_age in range(10, 50, 5):
         for years_ago in range(5, 20, 5):
             past_age = current_age - years_ago
             if past_age > 0:
-                qs.append(q("CUET_Quantitative","CUET_GT","Ages","Age Problems","medium",
+                yield q("CUET_Quantitative","CUET_GT","Ages","Age Problems","medium",
                     f"A person is {current_age} years old now. Age {years_ago} years ago:",
                     f"{past_age}", f"{current_age + years_ago}", f"{current_age * years_ago}",
                     f"{current_age - years_ago + 1}","A",
-                    f"Age {years_ago} years ago = {current_age} - {years_ago} = {past_age}"))
+                    f"Age {years_ago} years ago = {current_age} - {years_ago} = {past_age}")
 
     for A_now in range(20, 60, 5):
         for B_now in range(15, 55, 5):
             if A_now != B_now:
                 for yrs in range(5, 20, 5):
                     A_then = A_now + yrs; B_then = B_now + yrs
-                    qs.append(q("CUET_Quantitative","CUET_GT","Ages","Future Age","easy",
+                    yield q("CUET_Quantitative","CUET_GT","Ages","Future Age","easy",
                         f"A is {A_now} years, B is {B_now} years. Sum of ages after {yrs} years:",
                         f"{A_then + B_then}", f"{A_now + B_now}", f"{A_now + B_now + yrs}",
                         f"{A_then + B_then + yrs}","A",
-                        f"A after {yrs}yrs = {A_then}; B after {yrs}yrs = {B_then}; sum = {A_then+B_then}"))
+                        f"A after {yrs}yrs = {A_then}; B after {yrs}yrs = {B_then}; sum = {A_then+B_then}")
 
     # Mensuration
     for r in range(1, 20):
         area_circle = round(math.pi * r * r, 2)
         circum = round(2 * math.pi * r, 2)
-        qs.append(q("CUET_Quantitative","CUET_GT","Mensuration","Circle","medium",
+        yield q("CUET_Quantitative","CUET_GT","Mensuration","Circle","medium",
             f"Circle with radius {r} cm. Area (π=3.14):",
             f"{round(3.14*r*r,2)} cm²", f"{round(2*3.14*r,2)} cm²",
             f"{r*r} cm²", f"{2*r} cm²","A",
-            f"Area = πr² = 3.14×{r}² = {round(3.14*r*r,2)} cm²"))
-        qs.append(q("CUET_Quantitative","CUET_GT","Mensuration","Circumference","medium",
+            f"Area = πr² = 3.14×{r}² = {round(3.14*r*r,2)} cm²")
+        yield q("CUET_Quantitative","CUET_GT","Mensuration","Circumference","medium",
             f"Circle with radius {r} cm. Circumference (π=3.14):",
             f"{round(2*3.14*r,2)} cm", f"{round(3.14*r*r,2)} cm²",
             f"{r*r} cm", f"{3.14*r} cm","A",
-            f"Circumference = 2πr = 2×3.14×{r} = {round(2*3.14*r,2)} cm"))
+            f"Circumference = 2πr = 2×3.14×{r} = {round(2*3.14*r,2)} cm")
 
     for l,b in [(a,b) for a in range(2,20,2) for b in range(2,20,2) if a!=b]:
         area_rect = l*b
         perim = 2*(l+b)
-        qs.append(q("CUET_Quantitative","CUET_GT","Mensuration","Rectangle","easy",
+        yield q("CUET_Quantitative","CUET_GT","Mensuration","Rectangle","easy",
             f"Rectangle: length {l} cm, breadth {b} cm. Area:",
             f"{area_rect} cm²", f"{perim} cm", f"{l+b} cm²", f"{l*b*2} cm²","A",
-            f"Area = l×b = {l}×{b} = {area_rect} cm²"))
+            f"Area = l×b = {l}×{b} = {area_rect} cm²")
 
     for s in range(2, 25):
         area_sq = s*s
         perim_sq = 4*s
-        qs.append(q("CUET_Quantitative","CUET_GT","Mensuration","Square","easy",
+        yield q("CUET_Quantitative","CUET_GT","Mensuration","Square","easy",
             f"Square with side {s} cm. Area:",
             f"{area_sq} cm²", f"{perim_sq} cm", f"{s*2} cm²", f"{s*3} cm²","A",
-            f"Area = s² = {s}² = {area_sq} cm²"))
+            f"Area = s² = {s}² = {area_sq} cm²")
 
-    print(f"  CUET_Quantitative generated: {len(qs)}")
-    return qs
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # MAIN
 # ══════════════════════════════════════════════════════════════════════════════
 
-def main():
+GENERATORS = [
+    ("Physics",          gen_physics),
+    ("Chemistry",        gen_chemistry),
+    ("Biology",          gen_biology),
+    ("Mathematics",      gen_mathematics),
+    ("CUET_GK",          gen_cuet_gk),
+    ("CUET_English",     gen_cuet_english),
+    ("CUET_Reasoning",   gen_cuet_reasoning),
+    ("CUET_Quantitative",gen_cuet_quantitative),
+]
+
+
+def main(workers=None, bulk_load=False):
     print("=" * 65)
     print("  GENERATING 100,000 UNIQUE QUESTIONS")
     print("=" * 65)
@@ -1571,51 +1476,44 @@ def main():
     init_bank()
     conn = _bank_conn()
 
-    generators = [
-        ("Physics",          gen_physics),
-        ("Chemistry",        gen_chemistry),
-        ("Biology",          gen_biology),
-        ("Mathematics",      gen_mathematics),
-        ("CUET_GK",          gen_cuet_gk),
-        ("CUET_English",     gen_cuet_english),
-        ("CUET_Reasoning",   gen_cuet_reasoning),
-        ("CUET_Quantitative",gen_cuet_quantitative),
-    ]
+    loader = None
 
-    total_inserted = 0
-    for subject, gen_fn in generators:
+    def write(subject, unique_qs):
         before = conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?", (subject,)).fetchone()[0]
-        print(f"\n[{subject}] Generating...")
-        questions = gen_fn()
-
-        # Dedup within batch by question text
-        seen_texts = set()
-        unique_qs = []
-        for q_item in questions:
-            txt = q_item.get("question_en","").strip().lower()
-            if txt and txt not in seen_texts:
-                seen_texts.add(txt)
-                unique_qs.append(q_item)
-
-        print(f"  Generated {len(unique_qs)} unique questions, inserting...")
-        inserted = insert_batch(conn, unique_qs)
-        after = conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?", (subject,)).fetchone()[0]
+        print(f"\n[{subject}] Generating and inserting...")
+        inserted = insert_batch(conn, unique_qs, loader)
+        after = before + inserted
         print(f"  [{subject}] Before: {before:,} → After: {after:,} (+{inserted:,} new)")
-        total_inserted += inserted
+        return inserted
+
+    t0 = time.time()
+    if bulk_load:
+        with bulk_load_mode(conn) as loader:
+            timings = run_generators(GENERATORS, write, workers)
+    else:
+        timings = run_generators(GENERATORS, write, workers)
+    total_inserted = sum(t["inserted"] for t in timings.values())
+    templates = install_builtin_templates()
 
     print("\n" + "=" * 65)
     print("  FINAL RESULTS")
     print("=" * 65)
     grand_total = 0
-    for subject, _ in generators:
+    for subject, _ in GENERATORS:
         count = conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?", (subject,)).fetchone()[0]
         grand_total += count
         print(f"  {subject:<25} {count:>8,}")
     print("=" * 65)
     print(f"  GRAND TOTAL: {grand_total:,} questions")
     print(f"  New questions added: {total_inserted:,}")
+    print(f"  Parametric templates: {len(templates)} (rows created when drawn)")
+    print(format_timings(timings, time.time() - t0))
     print("\n  Run app: streamlit run bank_exam_app.py")
 
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description="Generate the parametric question bank")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores; 1 = serial)")
+    ap.add_argument("--bulk-load", action="store_true", help="defer indexes, relax durability, lock the DB")
+    args = ap.parse_args()
+    main(args.workers, args.bulk_load)
@@ -0,0 +1,194 @@
+"""
+generation_runner.py — Parallel, deterministic question generation
+===================================================================
+The seed generators (generate_100k.gen_physics, ...) are pure CPU work and
+each seeds its own RNG (random.seed(42), 43, ...) before it starts, so its
+output depends only on its own code — not on which process runs it or what
+ran before it. That makes them safe to run side by side in a process pool.
+
+  workers (process pool)   — run one generator each and dedup its output by
+                             question text
+  writer  (calling process) — receives the results in task order as they
+                             complete and writes them, so it is the only DB
+                             writer and qb_ids come out exactly as in a
+                             serial run
+
+Generators are iterators. With workers=1 nothing is materialized: records
+flow generator → dedup → insert_questions, which writes chunks of
+CHUNK_SIZE rows with one executemany each, so peak memory is one chunk plus
+the dedup set. Pool workers have to send back a whole generator's output.
+
+A generator is split no further than the function: its random stream is
+sequential, so starting a later section elsewhere would change its numbers.
+
+Usage:
+    from generation_runner import run_generators, insert_questions
+    timings = run_generators([("Physics", gen_physics), ...],
+                             write=lambda name, qs: insert_questions(conn, qs, to_row)["inserted"])
+"""
+
+import os
+import time
+import sqlite3
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from question_bank_db import _bank_lock, bump_bank_generation, question_key, BulkLoad
+
+Task = Tuple[str, Callable[[], Iterable[Dict]]]
+
+CHUNK_SIZE = 2000
+INSERT_SQL = """
+    INSERT OR IGNORE INTO question_bank
+    (subject,exam_type,topic,subtopic,difficulty,
+     question_en,option_a_en,option_b_en,option_c_en,option_d_en,
+     correct_answer,marks_correct,marks_wrong,explanation_en)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+
+def _new_counts() -> Dict:
+    return {"generated": 0, "unique": 0, "gen_secs": 0.0}
+
+
+def unique_questions(questions: Iterable[Dict], text_key: Optional[str] = "question_en",
+                     counts: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    First occurrence of each question text (case/space-insensitive), order
+    kept; text_key=None passes everything through. `counts` gets generated,
+    unique and the seconds spent inside the generator.
+    """
+    counts = counts if counts is not None else _new_counts()
+    seen = set()
+    it = iter(questions)
+    while True:
+        t0 = time.perf_counter()
+        try:
+            q_item = next(it)
+        except StopIteration:
+            counts["gen_secs"] += time.perf_counter() - t0
+            return
+        counts["generated"] += 1
+        if text_key:
+            txt = q_item.get(text_key, "").strip().lower()
+            if not txt or txt in seen:
+                counts["gen_secs"] += time.perf_counter() - t0
+                continue
+            seen.add(txt)
+        counts["unique"] += 1
+        counts["gen_secs"] += time.perf_counter() - t0
+        yield q_item
+
+
+def insert_questions(conn, records: Iterable[Dict], to_row: Callable[[Dict], tuple],
+                     chunk_size: int = CHUNK_SIZE, loader: Optional[BulkLoad] = None,
+                     sql: str = INSERT_SQL) -> Dict:
+    """
+    Write `records` (to_row gives the `sql` parameters; subject and
+    question_en first and sixth, as in INSERT_SQL) in chunks: one
+    transaction and one executemany per chunk. New rows are counted from
+    conn.total_changes. A chunk that fails is redone row by row so only the
+    bad rows are skipped. Inside bulk_load_mode pass its `loader`, which
+    drops duplicates before they reach SQLite. Returns {"rows", "inserted",
+    "errors": [messages]}.
+    """
+    stats = {"rows": 0, "inserted": 0, "errors": []}
+    it = iter(records)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            return stats
+        params = []
+        pending = set()
+        for rec in chunk:
+            try:
+                p = to_row(rec)
+                if loader is not None and not loader.keep(p[0], p[5], pending):
+                    continue
+            except Exception as e:
+                stats["errors"].append(f"{str(rec)[:80]}: {e!r}")
+                continue
+            params.append(p)
+        stats["rows"] += len(chunk)
+        if not params:
+            continue
+        with _bank_lock:
+            before = conn.total_changes
+            try:
+                conn.execute("BEGIN")
+                conn.executemany(sql, params)
+            except (sqlite3.Error, ValueError):
+                conn.rollback()
+                before = conn.total_changes
+                conn.execute("BEGIN")
+                for p in params:
+                    try:
+                        conn.execute(sql, p)
+                    except (sqlite3.Error, ValueError) as e:
+                        stats["errors"].append(f"{str(p[5])[:80]!r}: {e}")
+                        pending.discard(question_key(p[0], p[5]))
+            inserted = conn.total_changes - before
+            if inserted:
+                bump_bank_generation(conn)
+            conn.commit()
+            if loader is not None:
+                loader.keys |= pending
+        stats["inserted"] += inserted
+
+
+def _generate(task: Task, text_key: Optional[str]) -> Tuple[str, List[Dict], Dict]:
+    """Worker: run one generator → (name, unique questions, counts)."""
+    name, gen_fn = task
+    counts = _new_counts()
+    unique = list(unique_questions(gen_fn(), text_key, counts))
+    return name, unique, counts
+
+
+def run_generators(tasks: List[Task], write: Callable[[str, Iterable[Dict]], int],
+                   workers: Optional[int] = None,
+                   text_key: Optional[str] = "question_en") -> Dict[str, Dict]:
+    """
+    Run `tasks` (name, module-level generator function) and pass each one's
+    deduplicated output to write(name, questions) in task order, in this
+    process. With workers=1 everything runs inline and write() gets a lazy
+    iterator. Returns {name: {"generated", "unique", "inserted", "gen_secs",
+    "write_secs"}}; inserted is write()'s return value.
+    """
+    workers = min(len(tasks), workers or os.cpu_count() or 1)
+    timings: Dict[str, Dict] = {}
+
+    def consume(name, questions, counts):
+        t0 = time.perf_counter()
+        inserted = write(name, questions)
+        secs = time.perf_counter() - t0
+        if workers <= 1:
+            secs -= counts["gen_secs"]     # generation ran inside write()
+        timings[name] = {"generated": counts["generated"], "unique": counts["unique"],
+                         "inserted": inserted, "gen_secs": counts["gen_secs"], "write_secs": secs}
+
+    if workers <= 1:
+        for name, gen_fn in tasks:
+            counts = _new_counts()
+            consume(name, unique_questions(gen_fn(), text_key, counts), counts)
+        return timings
+    # spawn: don't fork a process that may hold an open SQLite connection
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [pool.submit(_generate, task, text_key) for task in tasks]
+        # in order: task i is written while the ones after it are still generating
+        for fut in futures:
+            consume(*fut.result())
+    return timings
+
+
+def format_timings(timings: Dict[str, Dict], wall: float) -> str:
+    w = max([22] + [len(name) + 2 for name in timings])
+    lines = [f"  {'generator':<{w}}{'generated':>10}{'unique':>9}{'new':>9}{'gen s':>8}{'write s':>9}"]
+    for name, t in timings.items():
+        lines.append(f"  {name:<{w}}{t['generated']:>10,}{t['unique']:>9,}{t['inserted']:>9,}"
+                     f"{t['gen_secs']:>8.2f}{t['write_secs']:>9.2f}")
+    cpu = sum(t["gen_secs"] for t in timings.values())
+    lines.append(f"  wall {wall:.1f}s · generation CPU {cpu:.1f}s")
+    return "\n".join(lines)
@@ -12,12 +12,18 @@ Usage:
 """
 
 import sqlite3
-import re
 import sys
 import time
 import argparse
 from typing import Dict, List, Tuple
 
+from question_bank_db import (
+    bump_bank_generation, ensure_stream_indexes, untranslated_where, iter_bank_rows,
+    get_checkpoint, save_checkpoint, clear_checkpoint, count_sql, update_sql,
+)
+import phrase_engine
+import translation_memory as tm
+
 DB_PATH = "question_bank.db"
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1357,196 +1363,116 @@ def build_sorted_phrases(lang: str):
 def translate_text(text: str, lang: str, sorted_phrases=None) -> str:
     """
     Translate text using phrase dictionary + number/unit preservation.
-    Numbers, formulas, symbols are preserved.
+    Numbers, formulas, symbols are preserved (phrase_engine "mass" profile).
+    Without `sorted_phrases` the compiled PHRASES dictionary is used; a
+    custom (english, native) list, longest first as build_sorted_phrases
+    returns it, is compiled on every call.
     """
-    if not text or lang == "en":
-        return text
-
-    if sorted_phrases is None:
-        sorted_phrases = build_sorted_phrases(lang)
-
-    result = text
-
-    # Protect numbers, formulas, and special tokens
-    # Replace them with placeholders to avoid mangling
-    protected = {}
-    counter = [0]
-
-    def protect(m):
-        key = f"__PROT{counter[0]}__"
-        protected[key] = m.group(0)
-        counter[0] += 1
-        return key
-
-    # Protect: numbers with units, scientific notation, formulas, symbols, URLs
-    protect_patterns = [
-        r'\d+[\./×⁰¹²³⁴⁵⁶⁷⁸⁹]+\d*\s*[A-Za-z%°Ω²³⁻⁺]*',  # numbers with superscript
-        r'\d+\.\d+\s*[A-Za-z%°Ω]*',   # decimals
-        r'\d+×10[⁻⁺]?\d+',            # scientific notation
-        r'[A-Z][a-z]?\d*',             # chemical symbols like O2, CO2, H2O
-        r'\d+\s*[A-Za-z°ΩμΩΩ]+',      # numbers with units
-        r'[A-Z]+\d+',                   # things like DNA, RNA, ATP, CO2
-        r'ΔT|ΔH|ΔG|ΔS|ΔP|ΔV',        # delta notation
-        r'[α-ωΑ-Ω]+',                  # Greek letters
-        r'\d+',                         # bare numbers
-    ]
-
-    for pat in protect_patterns:
-        result = re.sub(pat, protect, result)
-
-    # Now do phrase substitution (case-insensitive)
-    lower_result = result.lower()
-    new_result = result
-    offset = 0
-
-    # Build a list of substitutions to apply
-    substitutions = []
-    used_ranges = set()
-
-    for phrase, translation in sorted_phrases:
-        if not phrase.strip() or not translation.strip():
-            continue
-        start = 0
-        while True:
-            idx = lower_result.find(phrase.lower(), start)
-            if idx == -1:
-                break
-            end = idx + len(phrase)
-            # Check no overlap with already-used ranges
-            overlap = any(
-                not (end <= r[0] or idx >= r[1])
-                for r in used_ranges
-            )
-            if not overlap:
-                used_ranges.add((idx, end))
-                substitutions.append((idx, end, translation))
-            start = end
-
-    # Sort substitutions by position
-    substitutions.sort(key=lambda x: x[0])
-
-    # Apply substitutions in order
-    if substitutions:
-        parts = []
-        prev = 0
-        for idx, end, translation in substitutions:
-            parts.append(result[prev:idx])
-            parts.append(translation)
-            prev = end
-        parts.append(result[prev:])
-        new_result = "".join(parts)
-
-    # Restore protected tokens
-    for key, val in protected.items():
-        new_result = new_result.replace(key, val)
-
-    # Clean up extra spaces
-    new_result = re.sub(r'  +', ' ', new_result).strip()
-
-    return new_result
+    matcher = None
+    if sorted_phrases is not None:
+        matcher = phrase_engine.build_matcher(sorted_phrases, "mass")
+    return phrase_engine.translate(text, lang, "mass", matcher=matcher)
 
 
 def translate_all_to_db(lang: str, batch_size: int = 2000, force: bool = False):
     """
     Translate all untranslated questions for `lang` into the DB.
+    Streams rows in qb_id order and checkpoints each batch, so an
+    interrupted run resumes where it stopped.
     """
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute("PRAGMA cache_size=10000")
+    ensure_stream_indexes(conn)
+    conn.commit()
 
     total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
 
     if force:
         where = "1=1"
     else:
-        where = f"(question_{lang} IS NULL OR question_{lang} = '')"
+        where = untranslated_where(lang)
 
-    remaining = conn.execute(f"SELECT COUNT(*) FROM question_bank WHERE {where}").fetchone()[0]
+    job = f"mass_translate:{lang}" + (":force" if force else "")
+    start_id = get_checkpoint(job, conn)
+    remaining = conn.execute(f"SELECT COUNT(*) FROM question_bank WHERE qb_id > ? AND {where}",
+                             (start_id,)).fetchone()[0]
 
-    print(f"  [{lang}] Total: {total:,} | Need translation: {remaining:,}")
+    print(f"  [{lang}] Total: {total:,} | Need translation: {remaining:,}"
+          + (f" | Resuming after qb_id {start_id:,}" if start_id else ""))
 
     if remaining == 0:
         print(f"  [{lang}] ✅ Already fully translated!")
+        clear_checkpoint(job, conn)
+        conn.commit()
         conn.close()
         return 0
 
-    sorted_phrases = build_sorted_phrases(lang)
     fields = ["question", "option_a", "option_b", "option_c", "option_d", "explanation"]
     translated_count = 0
-    offset = 0
-
-    while True:
-        rows = conn.execute(
-            f"""SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en, explanation_en
-                FROM question_bank WHERE {where} LIMIT ? OFFSET ?""",
-            (batch_size, offset)
-        ).fetchall()
-
-        if not rows:
-            break
 
-        batch_data = []
-        for row in rows:
-            d = dict(row)
-            qb_id = d["qb_id"]
-            translated = {f"{f}_{lang}": translate_text(d.get(f"{f}_en", "") or "", lang, sorted_phrases)
-                          for f in fields}
-            translated["qb_id"] = qb_id
-            batch_data.append(translated)
-
-        # Bulk update
-        if batch_data:
-            set_clause = ", ".join([f"{f}_{lang}=?" for f in fields])
-            conn.executemany(
-                f"UPDATE question_bank SET {set_clause} WHERE qb_id=?",
-                [
-                    [d[f"{f}_{lang}"] for f in fields] + [d["qb_id"]]
-                    for d in batch_data
-                ]
-            )
-            conn.commit()
-            translated_count += len(batch_data)
+    tm_stats = tm.new_stats()
+
+    for rows in iter_bank_rows(", ".join(f"{f}_en" for f in fields), where,
+                               batch_size=batch_size, after_id=start_id, conn=conn):
+        # Each unique source string once per batch; repeats come from the translation memory
+        texts = [[row[f"{f}_en"] or "" for f in fields] for row in rows]
+        memo = tm.translate_unique((t for row in texts for t in row), lang, "mass",
+                                   translate=lambda t: translate_text(t, lang),
+                                   conn=conn, stats=tm_stats)
+        conn.executemany(
+            update_sql(lang, fields),
+            [[memo.get(t, t) for t in en] + [row["qb_id"]] for en, row in zip(texts, rows)]
+        )
+        bump_bank_generation(conn)
+        save_checkpoint(job, rows[-1]["qb_id"], conn)
+        conn.commit()
+        translated_count += len(rows)
 
-        offset += len(rows)
         pct = min(100, (translated_count / remaining * 100)) if remaining > 0 else 100
         print(f"  [{lang}] {translated_count:,}/{remaining:,} ({pct:.1f}%) done", end="\r", flush=True)
 
-        if len(rows) < batch_size:
-            break
-
+    clear_checkpoint(job, conn)
+    conn.commit()
     print(f"  [{lang}] ✅ {translated_count:,} questions translated!          ")
+    print(f"  [{lang}] {tm.format_stats(tm_stats)}")
     conn.close()
     return translated_count
 
 
-def update_translated_langs_field():
-    """Update the translated_langs JSON field for all rows."""
+def update_translated_langs_field(batch_size: int = 5000):
+    """Update the translated_langs JSON field for all rows (qb_id ranges, resumable)."""
     conn = sqlite3.connect(DB_PATH)
     conn.execute("PRAGMA journal_mode=WAL")
-    import json
 
-    all_langs = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
     print("\n🔄 Updating translated_langs field...")
 
-    # Build a case expression to set translated_langs based on which fields are populated
-    conn.execute("""
-        UPDATE question_bank
-        SET translated_langs = (
-            SELECT json_group_array(lang)
-            FROM (
-                SELECT 'hi' as lang WHERE question_hi IS NOT NULL AND question_hi != '' UNION ALL
-                SELECT 'bn' WHERE question_bn IS NOT NULL AND question_bn != '' UNION ALL
-                SELECT 'ta' WHERE question_ta IS NOT NULL AND question_ta != '' UNION ALL
-                SELECT 'te' WHERE question_te IS NOT NULL AND question_te != '' UNION ALL
-                SELECT 'gu' WHERE question_gu IS NOT NULL AND question_gu != '' UNION ALL
-                SELECT 'mr' WHERE question_mr IS NOT NULL AND question_mr != '' UNION ALL
-                SELECT 'kn' WHERE question_kn IS NOT NULL AND question_kn != '' UNION ALL
-                SELECT 'or' WHERE question_or IS NOT NULL AND question_or != ''
+    # Set translated_langs based on which fields are populated, one qb_id range per transaction
+    job = "update_translated_langs"
+    for rows in iter_bank_rows(batch_size=batch_size, after_id=get_checkpoint(job, conn), conn=conn):
+        conn.execute("""
+            UPDATE question_bank
+            SET translated_langs = (
+                SELECT json_group_array(lang)
+                FROM (
+                    SELECT 'hi' as lang WHERE question_hi IS NOT NULL AND question_hi != '' UNION ALL
+                    SELECT 'bn' WHERE question_bn IS NOT NULL AND question_bn != '' UNION ALL
+                    SELECT 'ta' WHERE question_ta IS NOT NULL AND question_ta != '' UNION ALL
+                    SELECT 'te' WHERE question_te IS NOT NULL AND question_te != '' UNION ALL
+                    SELECT 'gu' WHERE question_gu IS NOT NULL AND question_gu != '' UNION ALL
+                    SELECT 'mr' WHERE question_mr IS NOT NULL AND question_mr != '' UNION ALL
+                    SELECT 'kn' WHERE question_kn IS NOT NULL AND question_kn != '' UNION ALL
+                    SELECT 'or' WHERE question_or IS NOT NULL AND question_or != ''
+                )
             )
-        )
-    """)
+            WHERE qb_id BETWEEN ? AND ?
+        """, (rows[0][0], rows[-1][0]))
+        save_checkpoint(job, rows[-1][0], conn)
+        conn.commit()
+    bump_bank_generation(conn)
+    clear_checkpoint(job, conn)
     conn.commit()
     print("✅ translated_langs field updated!")
     conn.close()
@@ -1561,7 +1487,7 @@ def verify_translations():
     langs = {"hi": "Hindi", "bn": "Bengali", "ta": "Tamil", "te": "Telugu",
              "gu": "Gujarati", "mr": "Marathi", "kn": "Kannada", "or": "Odia"}
     for lc, name in langs.items():
-        done = conn.execute(f"SELECT COUNT(*) FROM question_bank WHERE question_{lc} IS NOT NULL AND question_{lc} != ''").fetchone()[0]
+        done = conn.execute(count_sql(lc)).fetchone()[0]
         pct = done / total * 100
         bar = "█" * int(pct / 5) + "░" * (20 - int(pct / 5))
         status = "✅" if pct >= 99 else ("⚠️" if pct >= 50 else "❌")
@@ -0,0 +1 @@
+# Phrase dictionary sources (compiled by phrase_store.py)
@@ -0,0 +1,259 @@
+"""
+phrase_dicts/v2.py — Phrase dictionaries used by translation_engine_v2
+=======================================================================
+Kept out of translation_engine_v2 so the app does not parse them at import.
+phrase_store compiles them into per-language artifacts; this module is only
+imported when an artifact is missing or out of date.
+"""
+
+from typing import Dict, List, Tuple
+
+# ══════════════════════════════════════════════════════════════════════════════
+# COMPREHENSIVE PHRASE DICTIONARIES — all 8 Indian languages
+# Covers Physics, Chemistry, Biology, Maths, GK question patterns
+# ══════════════════════════════════════════════════════════════════════════════
+PHRASE_DICT: Dict[str, Dict[str, str]] = {
+"hi": {
+  "What is the formula for":"किसका सूत्र है","Which of the following is NOT correct":"निम्न में से कौन सा सही नहीं है",
+  "Which of the following is correct":"निम्न में से कौन सा सही है","Which of the following":"निम्न में से",
+  "None of the above":"उपरोक्त में से कोई नहीं","All of the above":"उपरोक्त सभी",
+  "Find the value of":"का मान ज्ञात कीजिए","Calculate the":"की गणना कीजिए","Determine the":"निर्धारित कीजिए",
+  "What is the":"क्या है","What is":"क्या है","Who is":"कौन है","Which is":"कौन सा है",
+  "When was":"कब था","Where is":"कहाँ है","How many":"कितने","The value of":"का मान",
+  "is equal to":"के बराबर है","is defined as":"को परिभाषित किया जाता है","is called":"कहलाता है",
+  "is known as":"के नाम से जाना जाता है","is given by":"द्वारा दिया गया है","is correct":"सही है",
+  "Find the":"ज्ञात कीजिए","The correct answer is":"सही उत्तर है","distance covered":"तय की गई दूरी",
+  "starts from rest":"विराम से प्रारम्भ होता है","The unit of":"की इकाई","SI unit of":"SI इकाई",
+  "acceleration due to gravity":"गुरुत्वीय त्वरण","centripetal force":"अभिकेन्द्रीय बल",
+  "angular momentum":"कोणीय संवेग","moment of inertia":"जड़त्व आघूर्ण",
+  "conservation of momentum":"संवेग संरक्षण","conservation of energy":"ऊर्जा संरक्षण",
+  "kinetic energy":"गतिज ऊर्जा","potential energy":"स्थितिज ऊर्जा","work done":"किया गया कार्य",
+  "electric field":"विद्युत क्षेत्र","magnetic field":"चुंबकीय क्षेत्र",
+  "initial velocity":"प्रारम्भिक वेग","final velocity":"अंतिम वेग",
+  "uniform acceleration":"समान त्वरण","time of flight":"उड़ान का समय","maximum height":"अधिकतम ऊँचाई",
+  "horizontal component":"क्षैतिज घटक","vertical component":"ऊर्ध्वाधर घटक",
+  "cell membrane":"कोशिका झिल्ली","cell division":"कोशिका विभाजन","cell wall":"कोशिका भित्ति",
+  "photosynthesis":"प्रकाश संश्लेषण","cellular respiration":"कोशिकीय श्वसन",
+  "natural selection":"प्राकृतिक चयन","blood group":"रक्त समूह",
+  "periodic table":"आवर्त सारणी","atomic number":"परमाणु क्रमांक","atomic mass":"परमाणु द्रव्यमान",
+  "molar mass":"मोलर द्रव्यमान","oxidation state":"ऑक्सीकरण अवस्था","chemical bond":"रासायनिक बंध",
+  "simple interest":"साधारण ब्याज","compound interest":"चक्रवृद्धि ब्याज",
+  "profit and loss":"लाभ और हानि","time and work":"समय और कार्य",
+  "velocity":"वेग","acceleration":"त्वरण","force":"बल","mass":"द्रव्यमान","weight":"भार",
+  "energy":"ऊर्जा","power":"शक्ति","work":"कार्य","momentum":"संवेग","pressure":"दाब",
+  "temperature":"तापमान","heat":"ऊष्मा","current":"धारा","voltage":"वोल्टेज",
+  "resistance":"प्रतिरोध","wavelength":"तरंगदैर्ध्य","frequency":"आवृत्ति","amplitude":"आयाम",
+  "displacement":"विस्थापन","distance":"दूरी","speed":"चाल","gravity":"गुरुत्वाकर्षण",
+  "friction":"घर्षण","photon":"फोटोन","electron":"इलेक्ट्रॉन","proton":"प्रोटॉन",
+  "neutron":"न्यूट्रॉन","nucleus":"नाभिक","atom":"परमाणु","molecule":"अणु","ion":"आयन",
+  "charge":"आवेश","capacitor":"संधारित्र","conductor":"चालक","insulator":"कुचालक",
+  "semiconductor":"अर्धचालक","lens":"लेंस","mirror":"दर्पण","reflection":"परावर्तन",
+  "refraction":"अपवर्तन","element":"तत्व","compound":"यौगिक","mixture":"मिश्रण",
+  "solution":"विलयन","acid":"अम्ल","base":"क्षार","salt":"लवण","oxidation":"ऑक्सीकरण",
+  "reduction":"अपचयन","catalyst":"उत्प्रेरक","reaction":"अभिक्रिया","bond":"बंध",
+  "orbital":"कक्षक","valence":"संयोजकता","mole":"मोल","concentration":"सांद्रता",
+  "solubility":"विलेयता","entropy":"एन्ट्रॉपी","enthalpy":"एन्थैल्पी",
+  "equilibrium":"साम्यावस्था","polymer":"बहुलक","isomer":"समावयवी",
+  "cell":"कोशिका","membrane":"झिल्ली","enzyme":"एंजाइम","protein":"प्रोटीन",
+  "gene":"जीन","chromosome":"गुणसूत्र","mitosis":"समसूत्री विभाजन",
+  "meiosis":"अर्धसूत्री विभाजन","respiration":"श्वसन","digestion":"पाचन",
+  "evolution":"विकास","mutation":"उत्परिवर्तन","DNA":"डीएनए","RNA":"आरएनए",
+  "derivative":"अवकलज","integral":"समाकल","matrix":"आव्यूह","vector":"सदिश",
+  "scalar":"अदिश","probability":"प्रायिकता","trigonometry":"त्रिकोणमिति",
+  "logarithm":"लघुगणक","equation":"समीकरण","function":"फलन","limit":"सीमा",
+  "percentage":"प्रतिशत","profit":"लाभ","loss":"हानि","ratio":"अनुपात",
+  "average":"औसत","area":"क्षेत्रफल","volume":"आयतन","perimeter":"परिमाप",
+  "maximum":"अधिकतम","minimum":"न्यूनतम","increase":"वृद्धि","decrease":"कमी",
+  "equal":"बराबर","greater":"अधिक","less":"कम","zero":"शून्य",
+  "positive":"धनात्मक","negative":"ऋणात्मक","horizontal":"क्षैतिज","vertical":"ऊर्ध्वाधर",
+  "correct":"सही","incorrect":"गलत","total":"कुल","approximately":"लगभग",
+  "first":"पहला","second":"दूसरा","third":"तीसरा",
+  "A body":"एक पिंड","A particle":"एक कण","A ball":"एक गेंद","An object":"एक वस्तु",
+  "and":"और","or":"या","not":"नहीं","only":"केवल","is":"है","are":"हैं",
+},
+"bn": {
+  "What is the formula for":"কীসের সূত্র","Which of the following is correct":"নিচের কোনটি সঠিক",
+  "Which of the following":"নিচের কোনটি","None of the above":"উপরের কোনটি নয়",
+  "All of the above":"উপরের সবগুলো","Find the value of":"মান নির্ণয় কর","What is":"কী হল",
+  "How many":"কতগুলো","is equal to":"এর সমান","is called":"বলা হয়",
+  "acceleration due to gravity":"মহাকর্ষীয় ত্বরণ","kinetic energy":"গতিশক্তি",
+  "potential energy":"স্থিতিশক্তি","electric field":"তড়িৎ ক্ষেত্র","magnetic field":"চৌম্বক ক্ষেত্র",
+  "initial velocity":"প্রারম্ভিক বেগ","final velocity":"চূড়ান্ত বেগ",
+  "simple interest":"সরল সুদ","compound interest":"চক্রবৃদ্ধি সুদ",
+  "photosynthesis":"সালোকসংশ্লেষণ","cell membrane":"কোষ ঝিল্লি","periodic table":"পর্যায় সারণী",
+  "velocity":"বেগ","acceleration":"ত্বরণ","force":"বল","mass":"ভর","weight":"ওজন",
+  "energy":"শক্তি","power":"ক্ষমতা","work":"কাজ","momentum":"ভরবেগ","pressure":"চাপ",
+  "temperature":"তাপমাত্রা","heat":"তাপ","current":"তড়িৎ প্রবাহ","voltage":"ভোল্টেজ",
+  "resistance":"রোধ","wavelength":"তরঙ্গদৈর্ঘ্য","frequency":"কম্পাঙ্ক","displacement":"সরণ",
+  "distance":"দূরত্ব","electron":"ইলেকট্রন","proton":"প্রোটন","neutron":"নিউট্রন",
+  "nucleus":"নিউক্লিয়াস","atom":"পরমাণু","molecule":"অণু","cell":"কোষ",
+  "enzyme":"এনজাইম","protein":"প্রোটিন","gene":"জিন","chromosome":"ক্রোমোজোম",
+  "DNA":"ডিএনএ","RNA":"আরএনএ","element":"মৌল","compound":"যৌগ","acid":"অ্যাসিড",
+  "base":"ক্ষার","catalyst":"অনুঘটক","equation":"সমীকরণ","probability":"সম্ভাবনা",
+  "percentage":"শতাংশ","profit":"লাভ","loss":"ক্ষতি","ratio":"অনুপাত","average":"গড়",
+  "area":"ক্ষেত্রফল","volume":"আয়তন","maximum":"সর্বোচ্চ","minimum":"সর্বনিম্ন",
+  "correct":"সঠিক","total":"মোট","first":"প্রথম","second":"দ্বিতীয়",
+  "and":"এবং","or":"বা","not":"নয়","is":"হয়","are":"হয়",
+},
+"ta": {
+  "What is the formula for":"சூத்திரம் என்ன","Which of the following is correct":"எது சரியானது",
+  "Which of the following":"பின்வருவனவற்றில்","None of the above":"எதுவும் இல்லை",
+  "All of the above":"அனைத்தும்","Find the value of":"மதிப்பு காண்க","What is":"என்ன",
+  "How many":"எத்தனை","is equal to":"சமம்","is called":"அழைக்கப்படுகிறது",
+  "acceleration due to gravity":"புவியீர்ப்பு முடுக்கம்","kinetic energy":"இயக்க ஆற்றல்",
+  "potential energy":"நிலை ஆற்றல்","electric field":"மின் புலம்","magnetic field":"காந்தப் புலம்",
+  "initial velocity":"தொடக்க திசைவேகம்","final velocity":"இறுதி திசைவேகம்",
+  "simple interest":"தனி வட்டி","compound interest":"கூட்டு வட்டி",
+  "photosynthesis":"ஒளிச்சேர்க்கை","cell membrane":"செல் சவ்வு","periodic table":"தனிம வரிசை அட்டவணை",
+  "velocity":"திசைவேகம்","acceleration":"முடுக்கம்","force":"விசை","mass":"நிறை","weight":"எடை",
+  "energy":"ஆற்றல்","power":"திறன்","work":"வேலை","momentum":"உந்தம்","pressure":"அழுத்தம்",
+  "temperature":"வெப்பநிலை","heat":"வெப்பம்","current":"மின்னோட்டம்","voltage":"மின்னழுத்தம்",
+  "resistance":"மின்தடை","wavelength":"அலை நீளம்","frequency":"அலைவெண்",
+  "displacement":"இடப்பெயர்ச்சி","distance":"தூரம்","electron":"எலக்ட்ரான்",
+  "proton":"புரோட்டான்","neutron":"நியூட்ரான்","nucleus":"கரு","atom":"அணு",
+  "molecule":"மூலக்கூறு","cell":"செல்","enzyme":"நொதி","protein":"புரதம்",
+  "gene":"மரபணு","chromosome":"நிறமூர்த்தம்","DNA":"டிஎன்ஏ","RNA":"ஆர்என்ஏ",
+  "element":"தனிமம்","compound":"சேர்மம்","acid":"அமிலம்","base":"காரம்",
+  "catalyst":"வினையூக்கி","equation":"சமன்பாடு","probability":"நிகழ்தகவு",
+  "percentage":"சதவீதம்","profit":"இலாபம்","loss":"நஷ்டம்","ratio":"விகிதம்",
+  "average":"சராசரி","area":"பரப்பளவு","volume":"கனவளவு",
+  "maximum":"அதிகபட்சம்","minimum":"குறைந்தபட்சம்",
+  "correct":"சரி","total":"மொத்தம்","first":"முதல்","second":"இரண்டாவது",
+  "and":"மற்றும்","or":"அல்லது","not":"இல்லை","is":"ஆகும்",
+},
+"te": {
+  "What is the formula for":"సూత్రం ఏమిటి","Which of the following is correct":"ఏది సరైనది",
+  "Which of the following":"కింది వాటిలో","None of the above":"పై వాటిలో ఏదీ కాదు",
+  "All of the above":"పై అన్నీ","Find the value of":"విలువ కనుగొనండి","What is":"ఏమిటి",
+  "How many":"ఎన్ని","is equal to":"కి సమానం","is called":"అని పిలుస్తారు",
+  "acceleration due to gravity":"గురుత్వాకర్షణ త్వరణం","kinetic energy":"గతిజ శక్తి",
+  "potential energy":"స్థితిజ శక్తి","electric field":"విద్యుత్ క్షేత్రం","magnetic field":"అయస్కాంత క్షేత్రం",
+  "initial velocity":"ప్రారంభ వేగం","final velocity":"చివరి వేగం",
+  "simple interest":"సాధారణ వడ్డీ","compound interest":"చక్రవడ్డీ",
+  "photosynthesis":"కిరణజన్య సంయోగక్రియ","cell membrane":"కణ త్వచం","periodic table":"ఆవర్తన పట్టిక",
+  "velocity":"వేగం","acceleration":"త్వరణం","force":"బలం","mass":"ద్రవ్యరాశి","weight":"బరువు",
+  "energy":"శక్తి","power":"శక్తి","work":"పని","momentum":"ద్రవ్యవేగం","pressure":"పీడనం",
+  "temperature":"ఉష్ణోగ్రత","heat":"వేడి","current":"విద్యుత్ ప్రవాహం","voltage":"వోల్టేజ్",
+  "resistance":"నిరోధం","wavelength":"తరంగ దైర్ఘ్యం","frequency":"పౌనఃపున్యం",
+  "displacement":"స్థానభ్రంశం","distance":"దూరం","electron":"ఎలక్ట్రాన్",
+  "proton":"ప్రోటాన్","neutron":"న్యూట్రాన్","nucleus":"కేంద్రకం","atom":"పరమాణువు",
+  "molecule":"అణువు","cell":"కణం","enzyme":"ఎంజైమ్","protein":"ప్రోటీన్",
+  "gene":"జన్యువు","chromosome":"క్రోమోజోమ్","DNA":"డీఎన్ఏ","RNA":"ఆర్ఎన్ఏ",
+  "element":"మూలకం","compound":"సమ్మేళనం","acid":"ఆమ్లం","base":"క్షారం",
+  "catalyst":"ఉత్ప్రేరకం","equation":"సమీకరణం","probability":"సంభావ్యత",
+  "percentage":"శాతం","profit":"లాభం","loss":"నష్టం","ratio":"నిష్పత్తి",
+  "average":"సగటు","area":"వైశాల్యం","volume":"ఘనపరిమాణం",
+  "maximum":"గరిష్ట","minimum":"కనిష్ట",
+  "correct":"సరైన","total":"మొత్తం","first":"మొదటి","second":"రెండవ",
+  "and":"మరియు","or":"లేదా","not":"కాదు","is":"అయి ఉంటుంది",
+},
+"gu": {
+  "What is the formula for":"સૂત્ર શું છે","Which of the following is correct":"કઈ સાચી છે",
+  "Which of the following":"નીચેનામાંથી","None of the above":"કોઈ નહીં","All of the above":"ઉપરોક્ત સૌ",
+  "Find the value of":"મૂલ્ય શોધો","What is":"શું છે","How many":"કેટલા","is equal to":"ની બરાબર",
+  "is called":"કહેવાય છે",
+  "acceleration due to gravity":"ગુરુત્વાકર્ષણ પ્રવેગ","kinetic energy":"ગતિ ઊર્જા",
+  "potential energy":"સ્થિતિ ઊર્જા","electric field":"વિદ્યુત ક્ષેત્ર","magnetic field":"ચુંબકીય ક્ષેત્ર",
+  "initial velocity":"પ્રારંભિક વેગ","final velocity":"અંતિમ વેગ",
+  "simple interest":"સાદો વ્યાજ","compound interest":"ચક્રવૃદ્ધિ વ્યાજ",
+  "photosynthesis":"પ્રકાશ સંશ્લેષણ","cell membrane":"કોષ પટલ","periodic table":"આવર્ત કોષ્ટક",
+  "velocity":"વેગ","acceleration":"પ્રવેગ","force":"બળ","mass":"દ્રવ્યમાન","weight":"વજન",
+  "energy":"ઊર્જા","power":"શક્તિ","work":"કાર્ય","momentum":"વેગમાન","pressure":"દબાણ",
+  "temperature":"તાપમાન","heat":"ઉષ્મા","current":"વિદ્યુત પ્રવાહ","voltage":"વોલ્ટેજ",
+  "resistance":"અવરોધ","wavelength":"તરંગલંબાઈ","frequency":"આવૃત્તિ",
+  "displacement":"સ્થાનાંતર","distance":"અંતર","electron":"ઇલેક્ટ્રોન",
+  "proton":"પ્રોટોન","neutron":"ન્યૂટ્રોન","nucleus":"ન્યૂક્લિયસ","atom":"પરમાણુ",
+  "molecule":"અણુ","cell":"કોષ","enzyme":"ઉત્સેચક","protein":"પ્રોટીન",
+  "gene":"જનીન","chromosome":"રંગસૂત્ર","DNA":"ડીએનએ","RNA":"આરએનએ",
+  "element":"તત્વ","compound":"સંયોજન","acid":"એસિડ","base":"ક્ષાર",
+  "catalyst":"ઉત્પ્રેરક","equation":"સમીકરણ","probability":"સંભાવના",
+  "percentage":"ટકાવારી","profit":"નફો","loss":"નુકસાન","ratio":"ગુણોત્તર",
+  "average":"સરેરાશ","area":"ક્ષેત્રફળ","volume":"કદ",
+  "maximum":"મહત્તમ","minimum":"લઘુત્તમ",
+  "correct":"સાચો","total":"કુલ","first":"પ્રથમ","second":"બીજો",
+  "and":"અને","or":"અથવા","not":"નહીં","is":"છે",
+},
+"mr": {
+  "What is the formula for":"सूत्र काय आहे","Which of the following is correct":"कोणते बरोबर आहे",
+  "Which of the following":"खालीलपैकी","None of the above":"कोणतेही नाही","All of the above":"वरील सर्व",
+  "Find the value of":"मूल्य शोधा","What is":"काय आहे","How many":"किती","is equal to":"समान आहे",
+  "is called":"म्हणतात",
+  "acceleration due to gravity":"गुरुत्वीय प्रवेग","kinetic energy":"गतिज ऊर्जा",
+  "potential energy":"स्थितिज ऊर्जा","electric field":"विद्युत क्षेत्र","magnetic field":"चुंबकीय क्षेत्र",
+  "initial velocity":"प्रारंभिक वेग","final velocity":"अंतिम वेग",
+  "simple interest":"साधे व्याज","compound interest":"चक्रवाढ व्याज",
+  "photosynthesis":"प्रकाशसंश्लेषण","cell membrane":"पेशी पडदा","periodic table":"आवर्त सारणी",
+  "velocity":"वेग","acceleration":"प्रवेग","force":"बल","mass":"वस्तुमान","weight":"वजन",
+  "energy":"ऊर्जा","power":"शक्ती","work":"काम","momentum":"संवेग","pressure":"दाब",
+  "temperature":"तापमान","heat":"उष्णता","current":"विद्युत प्रवाह","voltage":"व्होल्टेज",
+  "resistance":"प्रतिरोध","wavelength":"तरंगलांबी","frequency":"वारंवारता",
+  "displacement":"विस्थापन","distance":"अंतर","electron":"इलेक्ट्रॉन",
+  "proton":"प्रोटॉन","neutron":"न्यूट्रॉन","nucleus":"केंद्रक","atom":"अणू",
+  "molecule":"रेणू","cell":"पेशी","enzyme":"एन्झाइम","protein":"प्रथिने",
+  "gene":"जनुक","chromosome":"गुणसूत्र","DNA":"डीएनए","RNA":"आरएनए",
+  "element":"मूलद्रव्य","compound":"संयुग","acid":"आम्ल","base":"आधार",
+  "catalyst":"उत्प्रेरक","equation":"समीकरण","probability":"संभाव्यता",
+  "percentage":"टक्केवारी","profit":"नफा","loss":"तोटा","ratio":"गुणोत्तर",
+  "average":"सरासरी","area":"क्षेत्रफळ","volume":"आयतन",
+  "maximum":"कमाल","minimum":"किमान",
+  "correct":"बरोबर","total":"एकूण","first":"पहिला","second":"दुसरा",
+  "and":"आणि","or":"किंवा","not":"नाही","is":"आहे",
+},
+"kn": {
+  "What is the formula for":"ಸೂತ್ರ ಏನು","Which of the following is correct":"ಯಾವುದು ಸರಿ",
+  "Which of the following":"ಕೆಳಗಿನ ಯಾವುದು","None of the above":"ಯಾವುದೂ ಇಲ್ಲ","All of the above":"ಎಲ್ಲವೂ",
+  "Find the value of":"ಮೌಲ್ಯ ಕಂಡುಹಿಡಿ","What is":"ಏನು","How many":"ಎಷ್ಟು","is equal to":"ಸಮ",
+  "is called":"ಎಂದು ಕರೆಯುತ್ತಾರೆ",
+  "acceleration due to gravity":"ಗುರುತ್ವ ತ್ವರಣ","kinetic energy":"ಚಲನ ಶಕ್ತಿ",
+  "potential energy":"ಸ್ಥಿತಿಜ ಶಕ್ತಿ","electric field":"ವಿದ್ಯುತ್ ಕ್ಷೇತ್ರ","magnetic field":"ಕಾಂತ ಕ್ಷೇತ್ರ",
+  "initial velocity":"ಆರಂಭಿಕ ವೇಗ","final velocity":"ಅಂತಿಮ ವೇಗ",
+  "simple interest":"ಸರಳ ಬಡ್ಡಿ","compound interest":"ಚಕ್ರಬಡ್ಡಿ",
+  "photosynthesis":"ದ್ಯುತಿಸಂಶ್ಲೇಷಣೆ","cell membrane":"ಜೀವಕೋಶ ಪೊರೆ","periodic table":"ಆವರ್ತ ಕೋಷ್ಟಕ",
+  "velocity":"ವೇಗ","acceleration":"ತ್ವರಣ","force":"ಬಲ","mass":"ದ್ರವ್ಯರಾಶಿ","weight":"ತೂಕ",
+  "energy":"ಶಕ್ತಿ","power":"ಸಾಮರ್ಥ್ಯ","work":"ಕೆಲಸ","momentum":"ಆವೇಗ","pressure":"ಒತ್ತಡ",
+  "temperature":"ತಾಪಮಾನ","heat":"ಶಾಖ","current":"ವಿದ್ಯುತ್ ಪ್ರವಾಹ","voltage":"ವೋಲ್ಟೇಜ್",
+  "resistance":"ರೋಧ","wavelength":"ತರಂಗ ದೈರ್ಘ್ಯ","frequency":"ಆವೃತ್ತಿ",
+  "displacement":"ಸ್ಥಾನಾಂತರ","distance":"ದೂರ","electron":"ಎಲೆಕ್ಟ್ರಾನ್",
+  "proton":"ಪ್ರೋಟಾನ್","neutron":"ನ್ಯೂಟ್ರಾನ್","nucleus":"ನ್ಯೂಕ್ಲಿಯಸ್","atom":"ಪರಮಾಣು",
+  "molecule":"ಅಣು","cell":"ಜೀವಕೋಶ","enzyme":"ಕಿಣ್ವ","protein":"ಪ್ರೋಟೀನ್",
+  "gene":"ಜೀನ್","chromosome":"ಕ್ರೋಮೋಸೋಮ್","DNA":"ಡಿಎನ್ಎ","RNA":"ಆರ್ಎನ್ಎ",
+  "element":"ಮೂಲವಸ್ತು","compound":"ಸಂಯುಕ್ತ","acid":"ಆಮ್ಲ","base":"ಕ್ಷಾರ",
+  "catalyst":"ವೇಗವರ್ಧಕ","equation":"ಸಮೀಕರಣ","probability":"ಸಂಭಾವ್ಯತೆ",
+  "percentage":"ಶೇಕಡಾ","profit":"ಲಾಭ","loss":"ನಷ್ಟ","ratio":"ಅನುಪಾತ",
+  "average":"ಸರಾಸರಿ","area":"ವಿಸ್ತೀರ್ಣ","volume":"ಘನಗಾತ್ರ",
+  "maximum":"ಗರಿಷ್ಠ","minimum":"ಕನಿಷ್ಠ",
+  "correct":"ಸರಿ","total":"ಒಟ್ಟು","first":"ಮೊದಲ","second":"ಎರಡನೇ",
+  "and":"ಮತ್ತು","or":"ಅಥವಾ","not":"ಇಲ್ಲ","is":"ಆಗಿದೆ",
+},
+"or": {
+  "What is the formula for":"ସୂତ୍ର କ'ଣ","Which of the following is correct":"କେଉଁଟି ସଠିକ",
+  "Which of the following":"ନିମ୍ନ ମଧ୍ୟରୁ","None of the above":"କୌଣସି ନୁହେଁ","All of the above":"ସମସ୍ତ",
+  "Find the value of":"ର ମୂଲ୍ୟ ଖୋଜ","What is":"କ'ଣ","How many":"କେତେ","is equal to":"ସମାନ",
+  "is called":"କୁ କୁହାଯାଏ",
+  "acceleration due to gravity":"ଗୁରୁତ୍ୱୀୟ ତ୍ୱରଣ","kinetic energy":"ଗତି ଶକ୍ତି",
+  "potential energy":"ସ୍ଥିତିଜ ଶକ୍ତି","electric field":"ବୈଦ୍ୟୁତିକ କ୍ଷେତ୍ର","magnetic field":"ଚୁମ୍ବକ କ୍ଷେତ୍ର",
+  "initial velocity":"ପ୍ରାରମ୍ଭ ବେଗ","final velocity":"ଅନ୍ତିମ ବେଗ",
+  "simple interest":"ସରଳ ସୁଧ","compound interest":"ଚକ୍ରବୃଦ୍ଧି ସୁଧ",
+  "photosynthesis":"ସଂଶ୍ଳେଷଣ","cell membrane":"କୋଷ ଝିଲ୍ଲି","periodic table":"ଆବର୍ତ ସାରଣୀ",
+  "velocity":"ବେଗ","acceleration":"ତ୍ୱରଣ","force":"ବଳ","mass":"ଭର","weight":"ଓଜନ",
+  "energy":"ଶକ୍ତି","power":"ଶକ୍ତି","work":"କାର୍ଯ୍ୟ","momentum":"ସଂବେଗ","pressure":"ଚାପ",
+  "temperature":"ତାପମାତ୍ରା","heat":"ଉତ୍ତାପ","current":"ବିଦ୍ୟୁତ ପ୍ରବାହ","voltage":"ଭୋଲ୍ଟେଜ",
+  "resistance":"ପ୍ରତିରୋଧ","wavelength":"ତରଙ୍ଗ ଦୈର୍ଘ୍ୟ","frequency":"ଆବୃତ୍ତି",
+  "displacement":"ସ୍ଥାନଚ୍ୟୁତି","distance":"ଦୂରତ୍ୱ","electron":"ଇଲେକ୍ଟ୍ରନ",
+  "proton":"ପ୍ରୋଟନ","neutron":"ନ୍ୟୁଟ୍ରନ","nucleus":"ନ୍ୟୁକ୍ଲିୟସ","atom":"ପରମାଣୁ",
+  "molecule":"ଅଣୁ","cell":"କୋଷ","enzyme":"ଏନଜାଇମ","protein":"ପ୍ରୋଟିନ",
+  "gene":"ଜିନ","chromosome":"ଗୁଣସୂତ୍ର","DNA":"ଡିଏନଏ","RNA":"ଆରଏନଏ",
+  "element":"ମୂଳ ଧାତୁ","compound":"ଯୌଗିକ","acid":"ଅମ୍ଳ","base":"କ୍ଷାର",
+  "catalyst":"ଉତ୍ପ୍ରେରକ","equation":"ସମୀକରଣ","probability":"ସମ୍ଭାବ୍ୟତା",
+  "percentage":"ଶତାଂଶ","profit":"ଲାଭ","loss":"କ୍ଷତି","ratio":"ଅନୁପାତ",
+  "average":"ହାରାହାରି","area":"କ୍ଷେତ୍ରଫଳ","volume":"ଘନଫଳ",
+  "maximum":"ସର୍ବୋଚ୍ଚ","minimum":"ସର୍ବନିମ୍ନ",
+  "correct":"ଠିକ","total":"ମୋଟ","first":"ପ୍ରଥମ","second":"ଦ୍ୱିତୀୟ",
+  "and":"ଏବଂ","or":"ବା","not":"ନୁହେଁ","is":"ଅଟେ",
+},
+}
+
+
+def sorted_phrases(lang: str) -> List[Tuple[str, str]]:
+    """Longest-first for greedy matching (ties keep dictionary order)."""
+    return sorted(PHRASE_DICT.get(lang, {}).items(), key=lambda x: -len(x[0]))
@@ -0,0 +1,129 @@
+"""
+phrase_engine.py — Unified offline phrase translation
+======================================================
+Every offline translator (translation_engine_v2, bulk_translate_offline,
+cuet_translate_fix, mass_translate_offline, apply_all_translations) used
+to carry its own phrase loop: sort the dictionary on every call, compile
+one regex per phrase, lowercase the text once per phrase. They differ only
+in which dictionary they use and in a few rules, so each one is now a
+profile here and all of them share one compiled matcher per
+(dictionary, language), loaded from phrase_store artifacts.
+
+A profile says:
+  source          phrase_store dictionary source
+  mode            PhraseMatcher mode ("regex", "word" or "scan")
+  max_per_phrase  replacement cap per phrase (None = unlimited)
+  protect         lexer whose matches are kept verbatim: the text is split
+                  into protected and translatable spans in one pass and
+                  only the translatable spans are phrase-translated
+  cleanup         collapse runs of spaces (collapse) and strip the result
+
+Usage:
+    from phrase_engine import translate
+    translate("What is the speed of light?", "hi")            # v2 profile
+    translate(text, "ta", profile="mass")
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import phrase_store
+from phrase_matcher import PhraseMatcher
+
+# Numbers with units, scientific notation, formulas, symbols — kept verbatim
+# by the mass translator. One alternation, so at each position the first
+# kind that matches wins (the order the translator used to apply them in).
+MASS_PROTECT_KINDS: List[Tuple[str, str]] = [
+    ("number_sup", r'\d+[\./×⁰¹²³⁴⁵⁶⁷⁸⁹]+\d*\s*[A-Za-z%°Ω²³⁻⁺]*'),  # numbers with superscript
+    ("decimal",    r'\d+\.\d+\s*[A-Za-z%°Ω]*'),      # decimals
+    ("scientific", r'\d+×10[⁻⁺]?\d+'),               # scientific notation
+    ("chemical",   r'[A-Z][a-z]?\d*(?![a-z])'),       # chemical symbols like O2, CO2, H2O (not "The")
+    ("unit",       r'\d+\s*[A-Za-z°ΩμΩΩ]+'),         # numbers with units
+    ("acronym",    r'[A-Z]+\d+'),                      # things like DNA, RNA, ATP, CO2
+    ("delta",      r'ΔT|ΔH|ΔG|ΔS|ΔP|ΔV'),           # delta notation
+    ("greek",      r'[α-ωΑ-Ω]+'),                     # Greek letters
+    ("number",     r'\d+'),                            # bare numbers
+]
+MASS_PROTECT = re.compile("|".join(f"(?:{p})" for _, p in MASS_PROTECT_KINDS))
+
+PROFILES: Dict[str, Dict] = {
+    "v2":       {"source": "v2",       "mode": "regex", "max_per_phrase": 5},
+    "bulk":     {"source": "bulk",     "mode": "regex", "max_per_phrase": 3},
+    "cuet":     {"source": "cuet",     "mode": "regex", "max_per_phrase": None},
+    "glossary": {"source": "glossary", "mode": "word",  "max_per_phrase": None, "strip": True},
+    "mass":     {"source": "mass",     "mode": "scan",  "max_per_phrase": None,
+                 "protect": MASS_PROTECT, "collapse": True, "strip": True},
+}
+
+_SPACES = re.compile(r'  +')
+
+_matchers: Dict[Tuple[str, str], PhraseMatcher] = {}
+_lock = threading.Lock()
+
+
+def build_matcher(entries, profile: str = "v2") -> PhraseMatcher:
+    """Matcher for an explicit (english, native) list with a profile's rules."""
+    p = PROFILES[profile]
+    return PhraseMatcher(entries, max_per_phrase=p["max_per_phrase"], mode=p["mode"])
+
+
+def get_matcher(lang: str, profile: str = "v2") -> Optional[PhraseMatcher]:
+    """Compiled matcher for a profile's dictionary in `lang` (None if there is none)."""
+    key = (profile, lang)
+    m = _matchers.get(key)
+    if m is None:
+        if lang not in phrase_store.LANGS:
+            return None
+        p = PROFILES[profile]
+        tables = phrase_store.load_tables(p["source"], lang)
+        with _lock:
+            m = _matchers.get(key)
+            if m is None:
+                m = _matchers[key] = PhraseMatcher.from_tables(
+                    tables, max_per_phrase=p["max_per_phrase"], mode=p["mode"])
+    return m
+
+
+def split_protected(text: str, lexer: "re.Pattern") -> List[Tuple[str, bool]]:
+    """Split text into (span, protected) pieces in one pass over it."""
+    spans: List[Tuple[str, bool]] = []
+    pos = 0
+    for m in lexer.finditer(text):
+        start, end = m.span()
+        if start == end:
+            continue
+        if start > pos:
+            spans.append((text[pos:start], False))
+        spans.append((text[start:end], True))
+        pos = end
+    if pos < len(text):
+        spans.append((text[pos:], False))
+    return spans
+
+
+def translate(text: str, lang: str, profile: str = "v2",
+              matcher: Optional[PhraseMatcher] = None) -> str:
+    """
+    Phrase-translate `text` into `lang` using one of PROFILES.
+    `matcher` overrides the compiled dictionary (e.g. an older version of it).
+    """
+    if not text or lang == "en":
+        return text
+    p = PROFILES[profile]
+    if matcher is None:
+        matcher = get_matcher(lang, profile)
+    if matcher is None and not p.get("protect"):
+        return text
+
+    if p.get("protect"):
+        if matcher is not None:
+            text = "".join(span if kept else matcher.translate(span)
+                           for span, kept in split_protected(text, p["protect"]))
+    elif matcher is not None:
+        text = matcher.translate(text)
+    if p.get("collapse"):
+        text = _SPACES.sub(' ', text)
+    if p.get("strip"):
+        text = text.strip()
+    return text
@@ -0,0 +1,273 @@
+"""
+phrase_matcher.py — Compiled multi-phrase replacement (Aho–Corasick)
+=====================================================================
+Offline phrase translation used to walk the whole phrase list for every
+field: lowercase the text, substring test, re.sub — once per phrase.
+PhraseMatcher compiles a language's phrase list once into an Aho–Corasick
+automaton and finds every occurrence of every phrase in one pass over
+the lowercased text. Phrases are applied in priority order (the order
+given — longest first).
+
+The translators differed in how a phrase replaces its occurrences; each
+is a mode, and output is identical to the per-phrase algorithm it
+replaces (translate_sequential below):
+  • "regex" — per phrase, at most `max_per_phrase` leftmost
+    non-overlapping occurrences, case-insensitively; an occurrence
+    overlapping text already replaced by a higher-priority phrase is
+    skipped.
+  • "word"  — the same, but an occurrence must sit on \\b word boundaries
+    of the text as rewritten so far.
+  • "scan"  — every occurrence is found in the original text with
+    str.find, resuming after each one whether it was used or not;
+    occurrences overlapping an earlier phrase's are dropped.
+
+In "regex"/"word" mode the sequential loop can also match a phrase that
+only appears *after* an earlier replacement (the inserted native text
+borders or contains it). Those native strings are found when the matcher
+is built; if one of them is selected for a text — or the text has
+characters where lowercasing and re.IGNORECASE disagree — that text goes
+through translate_sequential instead.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MODES = ("regex", "word", "scan")
+
+# Non-ASCII characters re.IGNORECASE matches against ASCII letters even though
+# str.lower() keeps them distinct (İ ı ~ i, K ~ k, ſ ~ s).
+_IGNORECASE_EXTRAS = frozenset("İıKſ")
+
+
+def _is_word(ch: Optional[str]) -> bool:
+    """re's \\w for str patterns."""
+    return ch is not None and (ch.isalnum() or ch == "_")
+
+
+class PhraseMatcher:
+    """Aho–Corasick matcher for one language's (english, native) phrase list."""
+
+    def __init__(self, phrases: Sequence[Tuple[str, str]], max_per_phrase: Optional[int] = 5,
+                 mode: str = "regex"):
+        # Priority = position in `phrases`; empty entries are skipped like before
+        self.entries: List[Tuple[str, str]] = [(e, n) for e, n in phrases if e and n]
+        self._build_automaton()
+        self._unsafe = self._find_unsafe_natives()
+        self._configure(max_per_phrase, mode)
+
+    def _configure(self, max_per_phrase: Optional[int], mode: str):
+        if mode not in MODES:
+            raise ValueError(f"unknown phrase matcher mode: {mode}")
+        self.max_per_phrase = max_per_phrase
+        self.mode = mode
+        self._regexes = None            # compiled on first sequential use
+        # the scan translator also skipped whitespace-only entries
+        self._skip = frozenset(p for p, (e, n) in enumerate(self.entries)
+                               if mode == "scan" and (not e.strip() or not n.strip()))
+        self._exact = all(len(e.lower()) == len(e) for e, _ in self.entries)
+
+    def to_tables(self) -> Dict:
+        """Plain builtins only — what phrase_store serializes (mode-independent)."""
+        return {"entries": self.entries, "delta": self._delta, "out": self._out,
+                "unsafe": sorted(self._unsafe)}
+
+    @classmethod
+    def from_tables(cls, tables: Dict, max_per_phrase: Optional[int] = 5,
+                    mode: str = "regex") -> "PhraseMatcher":
+        m = cls.__new__(cls)
+        m.entries = [tuple(e) for e in tables["entries"]]
+        m._delta = tables["delta"]
+        m._out = tables["out"]
+        m._unsafe = frozenset(tables["unsafe"])
+        m._configure(max_per_phrase, mode)
+        return m
+
+    # ── build ────────────────────────────────────────────────────────────────
+
+    def _build_automaton(self):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[Tuple[int, int]]] = [[]]   # state -> [(pattern length, priority)]
+        for prio, (eng, _) in enumerate(self.entries):
+            pat = eng.lower()
+            state = 0
+            for ch in pat:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append((len(pat), prio))
+
+        # BFS: failure links, merged outputs and a full transition table (DFA)
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            s = queue[head]; head += 1
+            out[s] = out[s] + out[fail[s]]
+            row = dict(delta[fail[s]])
+            for ch, t in goto[s].items():
+                fail[t] = delta[fail[s]].get(ch, 0) if s else 0
+                row[ch] = t
+                queue.append(t)
+            delta[s] = row
+        self._delta = delta
+        self._out = [tuple(o) for o in out]
+
+    def _find_unsafe_natives(self) -> frozenset:
+        """
+        Priorities whose native text could make some phrase match across or
+        inside it once inserted (so the one-pass result might differ).
+        """
+        pats = [e.lower() for e, _ in self.entries]
+        prefixes, suffixes = set(), set()
+        for p in pats:
+            for k in range(1, len(p) + 1):
+                prefixes.add(p[:k]); suffixes.add(p[-k:])
+        unsafe = set()
+        for prio, (_, native) in enumerate(self.entries):
+            n = native.lower()
+            if ("\\" in native                      # re.sub template escapes
+                    or any(n[-k:] in prefixes for k in range(1, len(n) + 1))
+                    or any(n[:k] in suffixes for k in range(1, len(n) + 1))
+                    or any(p in n or n in p for p in pats)):
+                unsafe.add(prio)
+        return frozenset(unsafe)
+
+    # ── translate ────────────────────────────────────────────────────────────
+
+    def find_all(self, low: str) -> List[Tuple[int, int, int]]:
+        """Every (start, end, priority) phrase occurrence in already-lowercased text."""
+        delta, outs = self._delta, self._out
+        hits = []
+        state = 0
+        for i, ch in enumerate(low):
+            state = delta[state].get(ch, 0)
+            if outs[state]:
+                end = i + 1
+                for length, prio in outs[state]:
+                    hits.append((end - length, end, prio))
+        return hits
+
+    def _select(self, hits: List[Tuple[int, int, int]], text: str) -> List[Tuple[int, int, int]]:
+        by_prio: Dict[int, List[Tuple[int, int]]] = {}
+        for start, end, prio in hits:
+            by_prio.setdefault(prio, []).append((start, end))
+        claimed_starts: List[int] = []
+        claimed: List[Tuple[int, int, int]] = []
+        entries = self.entries
+        cap = self.max_per_phrase
+        scan = self.mode == "scan"
+        word = self.mode == "word"
+        n = len(text)
+        for prio in sorted(by_prio):
+            if prio in self._skip:
+                continue
+            taken = []
+            last_end = -1
+            for start, end in sorted(by_prio[prio]):
+                if start < last_end:
+                    continue
+                if scan:
+                    last_end = end          # find() resumes past every occurrence
+                # overlap with a range claimed by a higher-priority phrase?
+                j = bisect_left(claimed_starts, end)
+                if j and claimed[j - 1][1] > start:
+                    continue
+                if word:
+                    # \b is checked against the rewritten text: a neighbour that
+                    # was replaced is now the edge of that phrase's native text
+                    k = bisect_left(claimed_starts, start)
+                    if k and claimed[k - 1][1] == start:
+                        before = entries[claimed[k - 1][2]][1][-1]
+                    else:
+                        before = text[start - 1] if start else None
+                    k = bisect_left(claimed_starts, end)
+                    if k < len(claimed) and claimed_starts[k] == end:
+                        after = entries[claimed[k][2]][1][0]
+                    else:
+                        after = text[end] if end < n else None
+                    if (_is_word(before) == _is_word(text[start])
+                            or _is_word(text[end - 1]) == _is_word(after)):
+                        continue
+                taken.append((start, end, prio))
+                last_end = end
+                if cap is not None and len(taken) >= cap:
+                    break
+            for t in taken:
+                j = bisect_left(claimed_starts, t[0])
+                claimed_starts.insert(j, t[0]); claimed.insert(j, t)
+        return claimed
+
+    def translate(self, text: str) -> str:
+        if not text or not self.entries:
+            return text
+        low = text.lower()
+        if (len(low) != len(text) or not self._exact
+                or (self.mode != "scan" and not _IGNORECASE_EXTRAS.isdisjoint(text))):
+            return self.translate_sequential(text)
+        hits = self.find_all(low)
+        if not hits:
+            return text
+        chosen = self._select(hits, text)
+        if self.mode != "scan" and any(prio in self._unsafe for _, _, prio in chosen):
+            return self.translate_sequential(text)
+        parts = []
+        pos = 0
+        for start, end, prio in chosen:
+            parts.append(text[pos:start]); parts.append(self.entries[prio][1])
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    def translate_sequential(self, text: str) -> str:
+        """Reference algorithm for this mode: one pass over the text per phrase."""
+        if not text:
+            return text
+        if self.mode == "scan":
+            return self._scan_sequential(text)
+        if self._regexes is None:
+            wrap = r"\b{}\b" if self.mode == "word" else "{}"
+            self._regexes = [re.compile(wrap.format(re.escape(e)), re.IGNORECASE)
+                             for e, _ in self.entries]
+        result = text
+        count = self.max_per_phrase or 0
+        gate = self.mode == "regex"
+        for (eng, native), rx in zip(self.entries, self._regexes):
+            if not gate or eng.lower() in result.lower():
+                result = rx.sub(native, result, count=count)
+        return result
+
+    def _scan_sequential(self, text: str) -> str:
+        lower = text.lower()
+        used_starts: List[int] = []
+        used_ends: List[int] = []       # parallel to used_starts; ranges never overlap
+        subs = []
+        for prio, (phrase, native) in enumerate(self.entries):
+            if prio in self._skip:
+                continue
+            pat = phrase.lower()
+            start = 0
+            while True:
+                idx = lower.find(pat, start)
+                if idx == -1:
+                    break
+                end = idx + len(phrase)
+                j = bisect_left(used_starts, end)
+                if not (j and used_ends[j - 1] > idx):
+                    used_starts.insert(j, idx); used_ends.insert(j, end)
+                    subs.append((idx, end, native))
+                start = end
+        if not subs:
+            return text
+        subs.sort(key=lambda s: s[0])
+        parts, prev = [], 0
+        for idx, end, native in subs:
+            parts.append(text[prev:idx]); parts.append(native)
+            prev = end
+        parts.append(text[prev:])
+        return "".join(parts)
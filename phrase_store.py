@@ -0,0 +1,198 @@
+"""
+phrase_store.py — Compiled phrase-dictionary artifacts
+=======================================================
+The phrase dictionaries are large Python literals. Parsing them, sorting
+them and building the Aho–Corasick tables used to happen at import (or on
+first use) in every process, including each Streamlit worker.
+
+This module compiles every (dictionary source, language) pair once into
+phrase_artifacts/<source>-<lang>.pkl:
+  • entries — the priority-ordered (english, native) list (longest first),
+  • matcher — PhraseMatcher tables (the automaton; phrase_engine picks
+    the replacement mode per profile).
+Artifacts hold plain builtins only. At runtime a language is loaded the
+first time it is requested. An artifact whose fingerprint (dictionary
+source file + matcher code) no longer matches is rebuilt in-process and
+rewritten.
+
+Build all artifacts (run after editing a dictionary, or at deploy):
+    python phrase_store.py
+    python phrase_store.py v2 cuet --langs hi,ta
+"""
+
+import os
+import sys
+import time
+import pickle
+import hashlib
+import argparse
+import threading
+import importlib.util
+from typing import Callable, Dict, List, Optional, Tuple
+
+from phrase_matcher import PhraseMatcher
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTIFACT_DIR = os.path.join(BASE_DIR, "phrase_artifacts")
+FORMAT_VERSION = 2
+LANGS = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
+
+
+def _by_length(d: Dict[str, str]) -> List[Tuple[str, str]]:
+    return sorted(d.items(), key=lambda x: -len(x[0]))
+
+
+def _v2_entries(lang: str) -> List[Tuple[str, str]]:
+    from phrase_dicts.v2 import sorted_phrases
+    return sorted_phrases(lang)
+
+
+def _bulk_entries(lang: str) -> List[Tuple[str, str]]:
+    import bulk_translate_offline as b
+    return _by_length(b.PHRASES["hi"] if lang == "hi" else b.build_lang_dict(lang))
+
+
+def _cuet_entries(lang: str) -> List[Tuple[str, str]]:
+    from cuet_translate_fix import CUET_PHRASES
+    return _by_length(CUET_PHRASES.get(lang, {}))
+
+
+def _mass_entries(lang: str) -> List[Tuple[str, str]]:
+    from mass_translate_offline import build_sorted_phrases
+    return build_sorted_phrases(lang)
+
+
+def _glossary_entries(lang: str) -> List[Tuple[str, str]]:
+    from apply_all_translations import GLOSSARY
+    return _by_length(GLOSSARY.get(lang, {}))
+
+
+# source -> module holding the literal, entries(lang)
+SOURCES: Dict[str, Dict] = {
+    "v2":       {"module": "phrase_dicts.v2",        "entries": _v2_entries},
+    "bulk":     {"module": "bulk_translate_offline", "entries": _bulk_entries},
+    "cuet":     {"module": "cuet_translate_fix",     "entries": _cuet_entries},
+    "mass":     {"module": "mass_translate_offline", "entries": _mass_entries},
+    "glossary": {"module": "apply_all_translations", "entries": _glossary_entries},
+}
+
+_loaded: Dict[Tuple[str, str], Dict] = {}
+_fingerprints: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def _module_path(module: str) -> str:
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    spec = importlib.util.find_spec(module)   # locates without importing
+    return spec.origin
+
+
+def fingerprint(source: str) -> str:
+    fp = _fingerprints.get(source)
+    if fp is None:
+        spec = SOURCES[source]
+        h = hashlib.sha1(str(FORMAT_VERSION).encode())
+        for path in (_module_path(spec["module"]), _module_path("phrase_matcher")):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        fp = _fingerprints[source] = h.hexdigest()
+    return fp
+
+
+def artifact_path(source: str, lang: str) -> str:
+    return os.path.join(ARTIFACT_DIR, f"{source}-{lang}.pkl")
+
+
+def compile_artifact(source: str, lang: str) -> Dict:
+    spec = SOURCES[source]
+    entries = [(e, n) for e, n in spec["entries"](lang)]
+    matcher = PhraseMatcher(entries).to_tables()
+    return {"format": FORMAT_VERSION, "fingerprint": fingerprint(source),
+            "source": source, "lang": lang, "entries": entries, "matcher": matcher}
+
+
+def write_artifact(art: Dict) -> str:
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    path = artifact_path(art["source"], art["lang"])
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(art, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return path
+
+
+def _read_artifact(source: str, lang: str) -> Optional[Dict]:
+    try:
+        with open(artifact_path(source, lang), "rb") as f:
+            art = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if art.get("format") != FORMAT_VERSION or art.get("fingerprint") != fingerprint(source):
+        return None
+    return art
+
+
+def load_artifact(source: str, lang: str) -> Dict:
+    """Artifact for one language, loaded on first request (rebuilt if missing or stale)."""
+    key = (source, lang)
+    art = _loaded.get(key)
+    if art is not None:
+        return art
+    with _lock:
+        art = _loaded.get(key)
+        if art is None:
+            art = _read_artifact(source, lang)
+            if art is None:
+                art = compile_artifact(source, lang)
+                try:
+                    write_artifact(art)
+                except OSError as e:
+                    print(f"phrase_store: could not write {source}-{lang} artifact: {e}")
+            _loaded[key] = art
+    return art
+
+
+def load_entries(source: str, lang: str) -> List[Tuple[str, str]]:
+    return load_artifact(source, lang)["entries"]
+
+
+def load_tables(source: str, lang: str) -> Dict:
+    """PhraseMatcher tables for one language (see phrase_engine.get_matcher)."""
+    return load_artifact(source, lang)["matcher"]
+
+
+def build(sources: Optional[List[str]] = None, langs: Optional[List[str]] = None,
+          progress: Optional[Callable[[str, str, int], None]] = None) -> List[str]:
+    """Compile and write artifacts; returns the written paths."""
+    paths = []
+    for source in sources or list(SOURCES):
+        for lang in langs or LANGS:
+            path = write_artifact(compile_artifact(source, lang))
+            paths.append(path)
+            if progress:
+                progress(source, lang, os.path.getsize(path))
+    return paths
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compile phrase dictionaries into artifacts")
+    ap.add_argument("sources", nargs="*", help=f"any of {', '.join(SOURCES)} (default: all)")
+    ap.add_argument("--langs", default=",".join(LANGS), help="comma-separated language codes")
+    args = ap.parse_args()
+    unknown = [s for s in args.sources if s not in SOURCES]
+    if unknown:
+        ap.error(f"unknown source(s): {', '.join(unknown)}")
+    langs = [l.strip() for l in args.langs.split(",") if l.strip()]
+
+    t0 = time.time()
+    total = [0]
+    def report(source, lang, size):
+        total[0] += size
+        print(f"  {source:<9}{lang:<4}{size / 1024:>8.1f} KB")
+    paths = build(args.sources or None, langs, report)
+    print(f"✅ {len(paths)} artifacts, {total[0] / 1024:.0f} KB in {time.time() - t0:.1f}s → {ARTIFACT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
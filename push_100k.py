@@ -1,29 +1,24 @@
 """
 push_100k.py — Final push to 100,000 unique questions
 Run: python push_100k.py
+     python push_100k.py --workers 1      # serial, in this process
+     python push_100k.py --bulk-load      # drop indexes during the load (app must be stopped)
 """
-import sys, os, math, random
+import sys, os, math, random, time, argparse
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from question_bank_db import _bank_conn, _bank_lock, init_bank
-
-def ins(conn, qs):
-    n = 0
-    with _bank_lock:
-        conn.execute("BEGIN")
-        for q in qs:
-            try:
-                conn.execute(
-                    "INSERT OR IGNORE INTO question_bank "
-                    "(subject,exam_type,topic,subtopic,difficulty,question_en,"
-                    "option_a_en,option_b_en,option_c_en,option_d_en,correct_answer,"
-                    "marks_correct,marks_wrong,explanation_en) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
-                    (q["s"],q["e"],q["t"],q["st"],q["d"],q["q"],
-                     q["a"],q["b"],q["c"],q["dopt"],q["ans"],4.0,-1.0,q.get("exp","")))
-                if conn.execute("SELECT changes()").fetchone()[0]:
-                    n += 1
-            except: pass
-        conn.commit()
-    return n
+from question_bank_db import _bank_conn, init_bank, bulk_load_mode
+from generation_runner import run_generators, insert_questions, format_timings
+
+def _row(q):
+    return (q["s"],q["e"],q["t"],q["st"],q["d"],q["q"],
+            q["a"],q["b"],q["c"],q["dopt"],q["ans"],4.0,-1.0,q.get("exp",""))
+
+def ins(conn, qs, loader=None):
+    """Chunked INSERT OR IGNORE of mk() records (any iterable); returns rows added."""
+    stats = insert_questions(conn, qs, _row, loader=loader)
+    for err in stats["errors"][:5]:
+        print(f"  ⚠️  insert error: {err}")
+    return stats["inserted"]
 
 def mk(s,e,t,st,d,question,a,b,c,dopt,ans,exp=""):
     return {"s":s,"e":e,"t":t,"st":st,"d":d,"q":str(question).strip(),
@@ -32,28 +27,25 @@ def mk(s,e,t,st,d,question,a,b,c,dopt,ans,exp=""):
 def cur(conn, subj):
     return conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?",(subj,)).fetchone()[0]
 
-init_bank()
-conn = _bank_conn()
 alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PHYSICS — push to 15,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_physics():
-    qs = []
     # Waves — frequency, period, speed combinations
     for v in range(100, 2000, 50):
         for f in range(20, 500, 20):
             lam = round(v / f, 4)
             T = round(1 / f, 6)
-            qs.append(mk("Physics","NEET","Waves","Wave Equation","medium",
+            yield mk("Physics","NEET","Waves","Wave Equation","medium",
                 f"Wave speed {v} m/s, frequency {f} Hz. Wavelength:",
                 f"{lam} m", f"{round(lam*2,4)} m", f"{round(v*f)} m", f"{round(lam/2,4)} m","A",
-                f"λ = v/f = {v}/{f} = {lam} m"))
-            qs.append(mk("Physics","NEET","Waves","Time Period","medium",
+                f"λ = v/f = {v}/{f} = {lam} m")
+            yield mk("Physics","NEET","Waves","Time Period","medium",
                 f"Wave frequency {f} Hz. Time period:",
                 f"{T} s", f"{round(T*2,6)} s", f"{f} s", f"{round(1/T)} s","A",
-                f"T = 1/f = 1/{f} = {T} s"))
+                f"T = 1/f = 1/{f} = {T} s")
 
     # Doppler effect
     v_sound = 340
@@ -61,28 +53,28 @@ def push_physics():
         for f0 in range(200, 1000, 100):
             f_approach = round(f0 * v_sound / (v_sound - v_source))
             f_recede   = round(f0 * v_sound / (v_sound + v_source))
-            qs.append(mk("Physics","NEET","Waves","Doppler Effect","hard",
+            yield mk("Physics","NEET","Waves","Doppler Effect","hard",
                 f"Source frequency {f0} Hz moving toward observer at {v_source} m/s (v_sound=340). Observed frequency:",
                 f"{f_approach} Hz", f"{f_recede} Hz", f"{f0} Hz", f"{f0+v_source} Hz","A",
-                f"f' = f₀×v/(v-vₛ) = {f0}×340/{340-v_source} = {f_approach} Hz"))
-            qs.append(mk("Physics","NEET","Waves","Doppler Effect","hard",
+                f"f' = f₀×v/(v-vₛ) = {f0}×340/{340-v_source} = {f_approach} Hz")
+            yield mk("Physics","NEET","Waves","Doppler Effect","hard",
                 f"Source frequency {f0} Hz moving away from observer at {v_source} m/s. Observed frequency:",
                 f"{f_recede} Hz", f"{f_approach} Hz", f"{f0} Hz", f"{f0-v_source} Hz","A",
-                f"f' = f₀×v/(v+vₛ) = {f0}×340/{340+v_source} = {f_recede} Hz"))
+                f"f' = f₀×v/(v+vₛ) = {f0}×340/{340+v_source} = {f_recede} Hz")
 
     # Capacitors
     for C in [1e-6, 2e-6, 5e-6, 10e-6, 50e-6]:
         for V in range(5, 200, 10):
             Q = round(C * V * 1e6, 4)
             E = round(0.5 * C * V * V, 6)
-            qs.append(mk("Physics","NEET","Electrostatics","Capacitor Charge","medium",
+            yield mk("Physics","NEET","Electrostatics","Capacitor Charge","medium",
                 f"Capacitor C={C*1e6:.0f}μF, voltage {V} V. Charge stored:",
                 f"{Q} μC", f"{round(Q*2,4)} μC", f"{round(Q/2,4)} μC", f"{V} μC","A",
-                f"Q = CV = {C*1e6:.0f}×10⁻⁶×{V} = {Q}×10⁻⁶ C"))
-            qs.append(mk("Physics","NEET","Electrostatics","Capacitor Energy","hard",
+                f"Q = CV = {C*1e6:.0f}×10⁻⁶×{V} = {Q}×10⁻⁶ C")
+            yield mk("Physics","NEET","Electrostatics","Capacitor Energy","hard",
                 f"C={C*1e6:.0f}μF, V={V} V. Energy stored:",
                 f"{E} J", f"{round(E*2,6)} J", f"{round(C*V,6)} J", f"{round(E/2,6)} J","A",
-                f"E = ½CV² = ½×{C*1e6:.0f}×10⁻⁶×{V}² = {E} J"))
+                f"E = ½CV² = ½×{C*1e6:.0f}×10⁻⁶×{V}² = {E} J")
 
     # Transformer
     for Np in [100, 200, 500, 1000]:
@@ -91,10 +83,10 @@ def push_physics():
                 Vs = round(Vp * Ns / Np)
                 ratio = round(Ns/Np, 3)
                 t_type = "step-up" if Ns > Np else "step-down"
-                qs.append(mk("Physics","NEET","Electromagnetic Induction","Transformer","hard",
+                yield mk("Physics","NEET","Electromagnetic Induction","Transformer","hard",
                     f"Transformer: Np={Np} turns, Ns={Ns} turns, Vp={Vp} V. Secondary voltage:",
                     f"{Vs} V", f"{Vp} V", f"{round(Vs*2)} V", f"{round(Vp*Np/Ns)} V","A",
-                    f"Vs = Vp×Ns/Np = {Vp}×{Ns}/{Np} = {Vs} V ({t_type})"))
+                    f"Vs = Vp×Ns/Np = {Vp}×{Ns}/{Np} = {Vs} V ({t_type})")
 
     # Photoelectric effect
     h = 6.626e-34; c_light = 3e8
@@ -102,19 +94,19 @@ def push_physics():
         for phi_eV in [0.5, 1.0, 1.5, 2.0, 2.5]:
             if freq_eV > phi_eV:
                 KE_max = round(freq_eV - phi_eV, 2)
-                qs.append(mk("Physics","NEET","Dual Nature","Photoelectric Effect","hard",
+                yield mk("Physics","NEET","Dual Nature","Photoelectric Effect","hard",
                     f"Photon energy {freq_eV} eV, work function {phi_eV} eV. Max KE of ejected electron:",
                     f"{KE_max} eV", f"{freq_eV} eV", f"{phi_eV} eV", f"{round(KE_max/2,2)} eV","A",
-                    f"KE_max = hf - φ = {freq_eV} - {phi_eV} = {KE_max} eV"))
+                    f"KE_max = hf - φ = {freq_eV} - {phi_eV} = {KE_max} eV")
 
     # de Broglie wavelength
     mass_kg = 9.1e-31  # electron
     for v_ms in [1e5, 2e5, 5e5, 1e6, 2e6, 5e6]:
         lam = round(6.626e-34 / (mass_kg * v_ms) * 1e10, 4)
-        qs.append(mk("Physics","NEET","Dual Nature","de Broglie Wavelength","hard",
+        yield mk("Physics","NEET","Dual Nature","de Broglie Wavelength","hard",
             f"Electron (m=9.1×10⁻³¹ kg) moving at {v_ms:.0e} m/s. de Broglie wavelength (Å):",
             f"{lam} Å", f"{round(lam*2,4)} Å", f"{round(lam/2,4)} Å", f"{round(lam*0.7,4)} Å","A",
-            f"λ = h/mv = 6.626×10⁻³⁴/(9.1×10⁻³¹×{v_ms:.0e}) = {lam} Å"))
+            f"λ = h/mv = 6.626×10⁻³⁴/(9.1×10⁻³¹×{v_ms:.0e}) = {lam} Å")
 
     # Gravitation
     G = 6.674e-11; Me = 6e24; Re = 6.4e6
@@ -122,32 +114,28 @@ def push_physics():
         h_m = h_km * 1000
         r = Re + h_m
         g_h = round(G * Me / r**2, 4)
-        qs.append(mk("Physics","NEET","Gravitation","g at Height","hard",
+        yield mk("Physics","NEET","Gravitation","g at Height","hard",
             f"Value of g at height {h_km} km above Earth's surface (g₀≈9.8 m/s²):",
             f"{g_h} m/s²", f"9.8 m/s²", f"{round(g_h*2,4)} m/s²", f"{round(g_h/2,4)} m/s²","A",
-            f"g_h = GM/(R+h)² = {G}×{Me}/(({Re/1e6:.1f}+{h_km/1e3:.1f})×10⁶)² ≈ {g_h} m/s²"))
+            f"g_h = GM/(R+h)² = {G}×{Me}/(({Re/1e6:.1f}+{h_km/1e3:.1f})×10⁶)² ≈ {g_h} m/s²")
 
     # Orbital velocity and escape velocity
     for h_km in [0, 200, 400, 600, 800, 1000]:
         r = Re + h_km * 1000
         v_orb = round(math.sqrt(G * Me / r) / 1000, 3)
-        qs.append(mk("Physics","NEET","Gravitation","Orbital Velocity","hard",
+        yield mk("Physics","NEET","Gravitation","Orbital Velocity","hard",
             f"Orbital velocity of satellite at {h_km} km above Earth:",
             f"{v_orb} km/s", f"{round(v_orb*2,3)} km/s", f"{round(v_orb*0.7,3)} km/s",
             f"{round(v_orb*1.41,3)} km/s","A",
-            f"v = √(GM/r) = {v_orb} km/s"))
+            f"v = √(GM/r) = {v_orb} km/s")
 
-    return qs
 
-qs = push_physics()
-n = ins(conn, qs)
-print(f"Physics: +{n} new → Total: {cur(conn,'Physics'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CHEMISTRY — push to 13,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_chemistry():
-    qs = []
+    emitted = 0
 
     # Gas Law - combined (P1V1/T1 = P2V2/T2)
     for P1 in [1, 2, 3, 4, 5]:
@@ -158,23 +146,25 @@ def push_chemistry():
                         if P1 != P2 or T1 != T2:
                             V2 = round(P1 * V1 * T2 / (T1 * P2), 3)
                             if 0.1 < V2 < 200:
-                                qs.append(mk("Chemistry","NEET","Thermochemistry","Combined Gas Law","hard",
+                                yield mk("Chemistry","NEET","Thermochemistry","Combined Gas Law","hard",
                                     f"P₁={P1}atm, V₁={V1}L, T₁={T1}K → P₂={P2}atm, T₂={T2}K. V₂:",
                                     f"{V2} L", f"{round(V2*2,3)} L", f"{round(V1*T2/T1,3)} L",
                                     f"{round(P1*V1/P2,3)} L","A",
-                                    f"V₂=P₁V₁T₂/(P₂T₁)={P1}×{V1}×{T2}/({P2}×{T1})={V2} L"))
-                        if len(qs) > 15000: break
-                    if len(qs) > 15000: break
-                if len(qs) > 15000: break
+                                    f"V₂=P₁V₁T₂/(P₂T₁)={P1}×{V1}×{T2}/({P2}×{T1})={V2} L")
+                                emitted += 1
+                        if emitted > 15000: break
+                    if emitted > 15000: break
+                if emitted > 15000: break
 
     # Normality
     for n_eq in [1, 2, 3, 4]:
         for M in [0.1, 0.2, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0]:
             N = round(n_eq * M, 3)
-            qs.append(mk("Chemistry","NEET","Mole Concept","Normality","hard",
+            yield mk("Chemistry","NEET","Mole Concept","Normality","hard",
                 f"Molarity = {M} M, n-factor = {n_eq}. Normality:",
                 f"{N} N", f"{round(N/2,3)} N", f"{round(M,3)} N", f"{round(N*2,3)} N","A",
-                f"N = n-factor × M = {n_eq} × {M} = {N} N"))
+                f"N = n-factor × M = {n_eq} × {M} = {N} N")
+            emitted += 1
 
     # Redox reactions - oxidation numbers
     compounds_ox = [
@@ -200,9 +190,10 @@ def push_chemistry():
         ("Phosphorus in H₃PO₄","+5","+3","−3","+1","A","P is +5 in phosphoric acid"),
     ]
     for item in compounds_ox:
-        qs.append(mk("Chemistry","NEET","Electrochemistry","Oxidation States","hard",
+        yield mk("Chemistry","NEET","Electrochemistry","Oxidation States","hard",
             f"Oxidation number of {item[0]}:",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
+        emitted += 1
 
     # Colligative properties
     for i_factor in [1, 2, 3]:
@@ -211,16 +202,18 @@ def push_chemistry():
             delta_Tf = round(i_factor * Kf_water * molality, 4)
             Kb_water = 0.512
             delta_Tb = round(i_factor * Kb_water * molality, 4)
-            qs.append(mk("Chemistry","NEET","Mole Concept","Freezing Point Depression","hard",
+            yield mk("Chemistry","NEET","Mole Concept","Freezing Point Depression","hard",
                 f"i={i_factor}, m={molality} mol/kg, Kf=1.86 K·kg/mol. ΔTf:",
                 f"{delta_Tf} K", f"{round(delta_Tf*2,4)} K", f"{molality} K",
                 f"{round(Kf_water*molality,4)} K","A",
-                f"ΔTf = i×Kf×m = {i_factor}×1.86×{molality} = {delta_Tf} K"))
-            qs.append(mk("Chemistry","NEET","Mole Concept","Boiling Point Elevation","hard",
+                f"ΔTf = i×Kf×m = {i_factor}×1.86×{molality} = {delta_Tf} K")
+            emitted += 1
+            yield mk("Chemistry","NEET","Mole Concept","Boiling Point Elevation","hard",
                 f"i={i_factor}, m={molality} mol/kg, Kb=0.512. ΔTb:",
                 f"{delta_Tb} K", f"{round(delta_Tb*2,4)} K", f"{molality} K",
                 f"{round(Kb_water*molality,4)} K","A",
-                f"ΔTb = i×Kb×m = {i_factor}×0.512×{molality} = {delta_Tb} K"))
+                f"ΔTb = i×Kb×m = {i_factor}×0.512×{molality} = {delta_Tb} K")
+            emitted += 1
 
     # Organic — named reactions
     named_reactions = [
@@ -241,8 +234,9 @@ def push_chemistry():
         ("Ninhydrin test detects:","Amino acids","Proteins only","DNA","Lipids","A","Ninhydrin: purple color with α-amino acids"),
     ]
     for item in named_reactions:
-        qs.append(mk("Chemistry","NEET","Organic Chemistry","Named Reactions","hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield mk("Chemistry","NEET","Organic Chemistry","Named Reactions","hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
+        emitted += 1
 
     # Nuclear chemistry - more isotopes
     isotopes = [
@@ -258,28 +252,26 @@ def push_chemistry():
         ("Polonium-210","Po","84","210","126","Alpha emitter; extremely toxic","138.4 days"),
     ]
     for name, sym, Z, A, N, use, half_life in isotopes:
-        qs.append(mk("Chemistry","NEET","Nuclear Chemistry","Isotopes","hard",
+        yield mk("Chemistry","NEET","Nuclear Chemistry","Isotopes","hard",
             f"The isotope {name} ({sym}-{A}) has how many neutrons?",
             N, Z, str(int(A)-int(N)), str(int(N)+2),"A",
-            f"Neutrons = A-Z = {A}-{Z} = {N}"))
-        qs.append(mk("Chemistry","NEET","Nuclear Chemistry","Half Life","hard",
+            f"Neutrons = A-Z = {A}-{Z} = {N}")
+        emitted += 1
+        yield mk("Chemistry","NEET","Nuclear Chemistry","Half Life","hard",
             f"Half-life of {name} ({sym}-{A}):",
             half_life, "1 year" if half_life!="1 year" else "100 years",
             "1 million years" if "million" not in half_life else "1000 years",
             "Stable (no decay)" if half_life!="Stable (no decay)" else "8 days","A",
-            f"{name}: half-life = {half_life}; used for: {use}"))
+            f"{name}: half-life = {half_life}; used for: {use}")
+        emitted += 1
 
-    return qs
 
-qs = push_chemistry()
-n = ins(conn, qs)
-print(f"Chemistry: +{n} new → Total: {cur(conn,'Chemistry'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # BIOLOGY — push to 12,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_biology():
-    qs = []
+    emitted = 0
 
     # Genetics — massive parametric Mendelian crosses
     organisms = [
@@ -311,16 +303,17 @@ def push_biology():
         for dom, rec, D, r_ in trait_pairs:
             for cross_gen, ratio, exp in cross_types:
                 cross_actual = cross_gen.replace("A", D).replace("a", r_)
-                qs.append(mk("Biology","NEET","Genetics","Monohybrid Cross","medium",
+                yield mk("Biology","NEET","Genetics","Monohybrid Cross","medium",
                     f"In {org}, {dom} ({D}) is dominant over {rec} ({r_}). "
                     f"Cross: {cross_actual}. Phenotypic ratio:",
                     ratio,
                     "9:3:3:1" if ratio != "9:3:3:1" else "3:1",
                     "1:2:1" if ratio != "1:2:1" else "1:1",
-                    "2:1:1" if ratio != "2:1:1" else "3:1","A", exp))
-                if len(qs) >= 80000: break
-            if len(qs) >= 80000: break
-        if len(qs) >= 80000: break
+                    "2:1:1" if ratio != "2:1:1" else "3:1","A", exp)
+                emitted += 1
+                if emitted >= 80000: break
+            if emitted >= 80000: break
+        if emitted >= 80000: break
 
     # Chromosomal disorders
     disorders = [
@@ -334,14 +327,16 @@ def push_biology():
         ("Philadelphia chromosome (CML)","Translocation t(9;22)","Chronic myelogenous leukemia","Peter Nowell (1960)"),
     ]
     for disorder, chromosome, symptoms, discoverer in disorders:
-        qs.append(mk("Biology","NEET","Genetics","Chromosomal Disorders","hard",
+        yield mk("Biology","NEET","Genetics","Chromosomal Disorders","hard",
             f"Chromosome count in {disorder}:",
             chromosome, "46 (normal)", "45", "48","A",
-            f"{disorder}: {chromosome} chromosomes; symptoms: {symptoms}"))
-        qs.append(mk("Biology","NEET","Genetics","Chromosomal Disorders","hard",
+            f"{disorder}: {chromosome} chromosomes; symptoms: {symptoms}")
+        emitted += 1
+        yield mk("Biology","NEET","Genetics","Chromosomal Disorders","hard",
             f"Key symptoms of {disorder}:",
             symptoms, "No symptoms", "Only skeletal defects", "Vision loss only","A",
-            f"{disorder}: {symptoms}; discovered by {discoverer}"))
+            f"{disorder}: {symptoms}; discovered by {discoverer}")
+        emitted += 1
 
     # Microorganisms — types and roles
     micro_data = [
@@ -354,20 +349,22 @@ def push_biology():
         ("Viroid","Acellular","Naked RNA; no protein coat","Potato spindle tuber viroid","250-400 nt"),
     ]
     for organism, cell_type, key_feature, examples, size in micro_data:
-        qs.append(mk("Biology","NEET","Biochemistry","Microorganisms","medium",
+        yield mk("Biology","NEET","Biochemistry","Microorganisms","medium",
             f"{organism} is classified as:",
             cell_type,
             "Prokaryote" if cell_type != "Prokaryote" else "Eukaryote",
             "Acellular" if cell_type != "Acellular" else "Prokaryote",
             "Multicellular eukaryote","A",
-            f"{organism}: {cell_type}; {key_feature}. Examples: {examples}"))
-        qs.append(mk("Biology","NEET","Biochemistry","Microorganisms","medium",
+            f"{organism}: {cell_type}; {key_feature}. Examples: {examples}")
+        emitted += 1
+        yield mk("Biology","NEET","Biochemistry","Microorganisms","medium",
             f"Key structural feature of {organism}:",
             key_feature,
             "Has nucleus and cell wall always",
             "Only found in soil",
             "Always multicellular","A",
-            f"{organism}: {key_feature}; size: {size}"))
+            f"{organism}: {key_feature}; size: {size}")
+        emitted += 1
 
     # Plant hormones
     hormones_plant = [
@@ -378,32 +375,29 @@ def push_biology():
         ("Ethylene","Fruit ripening; leaf/flower/fruit abscission; senescence","Fruit ripening, epinasty"),
     ]
     for hormone, function, application in hormones_plant:
-        qs.append(mk("Biology","NEET","Plant Biology","Plant Hormones","medium",
+        yield mk("Biology","NEET","Plant Biology","Plant Hormones","medium",
             f"Primary function of {hormone}:",
             function,
             "Photosynthesis enhancement" if "photosynthesis" not in function.lower() else "Cell division",
             "Root hair formation only",
             "Pathogen defense only","A",
-            f"{hormone}: {function}. Application: {application}"))
-        qs.append(mk("Biology","NEET","Plant Biology","Plant Hormones","medium",
+            f"{hormone}: {function}. Application: {application}")
+        emitted += 1
+        yield mk("Biology","NEET","Plant Biology","Plant Hormones","medium",
             f"{hormone} is mainly involved in:",
             application,
             "Nitrogen fixation",
             "Water absorption",
             "Mineral transport","A",
-            f"Application of {hormone}: {application}"))
+            f"Application of {hormone}: {application}")
+        emitted += 1
 
-    return qs
 
-qs = push_biology()
-n = ins(conn, qs)
-print(f"Biology: +{n} new → Total: {cur(conn,'Biology'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MATHEMATICS — push to 13,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_mathematics():
-    qs = []
 
     # More integration formulas
     int_formulas = [
@@ -419,8 +413,8 @@ def push_mathematics():
         ("∫ 1/(1+x²) dx", "tan⁻¹(x) + C", "sin⁻¹(x) + C", "cot⁻¹(x) + C", "sec⁻¹(x) + C","A","Standard integral"),
     ]
     for item in int_formulas:
-        qs.append(mk("Mathematics","JEE","Calculus",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield mk("Mathematics","JEE","Calculus",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Definite integrals
     def_int = [
@@ -434,33 +428,33 @@ def push_mathematics():
         ("∫₀^(π/4) tan(x) dx", "ln√2 = ½ln2", "0", "1", "π/4","A","[-ln|cos(x)|]₀^(π/4) = ln√2"),
     ]
     for item in def_int:
-        qs.append(mk("Mathematics","JEE","Calculus",item[0][:30],"hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield mk("Mathematics","JEE","Calculus",item[0][:30],"hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Derivatives of composite functions
     for n_ in range(1, 8):
         for a_ in range(1, 8):
-            qs.append(mk("Mathematics","JEE","Calculus","Chain Rule","hard",
+            yield mk("Mathematics","JEE","Calculus","Chain Rule","hard",
                 f"d/dx [({a_}x+1)^{n_}] = ?",
                 f"{n_*a_}({a_}x+1)^{n_-1}",
                 f"{n_}({a_}x+1)^{n_-1}",
                 f"{n_*a_}({a_}x)^{n_-1}",
                 f"{a_}({a_}x+1)^{n_}","A",
-                f"Chain rule: n×{a_}×({a_}x+1)^(n-1) = {n_*a_}({a_}x+1)^{n_-1}"))
-            qs.append(mk("Mathematics","JEE","Calculus","Differentiation","medium",
+                f"Chain rule: n×{a_}×({a_}x+1)^(n-1) = {n_*a_}({a_}x+1)^{n_-1}")
+            yield mk("Mathematics","JEE","Calculus","Differentiation","medium",
                 f"d/dx [sin({a_}x)] = ?",
                 f"{a_}cos({a_}x)",
                 f"cos({a_}x)",
                 f"-{a_}cos({a_}x)",
                 f"{a_}sin({a_}x)","A",
-                f"d/dx[sin(ax)] = a·cos(ax) = {a_}cos({a_}x)"))
-            qs.append(mk("Mathematics","JEE","Calculus","Differentiation","medium",
+                f"d/dx[sin(ax)] = a·cos(ax) = {a_}cos({a_}x)")
+            yield mk("Mathematics","JEE","Calculus","Differentiation","medium",
                 f"d/dx [cos({a_}x)] = ?",
                 f"-{a_}sin({a_}x)",
                 f"{a_}sin({a_}x)",
                 f"-sin({a_}x)",
                 f"{a_}cos({a_}x)","A",
-                f"d/dx[cos(ax)] = -a·sin(ax) = -{a_}sin({a_}x)"))
+                f"d/dx[cos(ax)] = -a·sin(ax) = -{a_}sin({a_}x)")
 
     # Matrices — operations
     for a,b,c,d in [(1,2,3,4),(2,3,1,5),(3,1,2,4),(4,2,1,3),(1,3,4,2),(5,1,2,3),(2,4,3,1)]:
@@ -470,14 +464,14 @@ def push_mathematics():
         if det != 0:
             inv_a = round(d/det,3); inv_b = round(-b/det,3)
             inv_c = round(-c/det,3); inv_d = round(a/det,3)
-            qs.append(mk("Mathematics","JEE","Matrices","Matrix Trace","easy",
+            yield mk("Mathematics","JEE","Matrices","Matrix Trace","easy",
                 f"Matrix [[{a},{b}],[{c},{d}]]. Trace (sum of diagonal):",
                 f"{trace}", f"{det}", f"{a*d}", f"{b+c}","A",
-                f"Trace = a+d = {a}+{d} = {trace}"))
-            qs.append(mk("Mathematics","JEE","Matrices","Matrix Inverse","hard",
+                f"Trace = a+d = {a}+{d} = {trace}")
+            yield mk("Mathematics","JEE","Matrices","Matrix Inverse","hard",
                 f"If |A| = {det} for 2×2 matrix [[{a},{b}],[{c},{d}]], element (1,1) of A⁻¹:",
                 f"{inv_a}", f"{inv_d}", f"{a}", f"{round(a/det,3)}","A",
-                f"A⁻¹ = (1/det)×adjoint; (1,1) element = d/det = {d}/{det} = {inv_a}"))
+                f"A⁻¹ = (1/det)×adjoint; (1,1) element = d/det = {d}/{det} = {inv_a}")
 
     # Probability — conditional
     for P_A in [0.2, 0.3, 0.4, 0.5, 0.6]:
@@ -486,26 +480,21 @@ def push_mathematics():
                 if P_AB <= min(P_A, P_B):
                     P_A_given_B = round(P_AB / P_B, 4)
                     P_B_given_A = round(P_AB / P_A, 4)
-                    qs.append(mk("Mathematics","JEE","Probability","Conditional Probability","hard",
+                    yield mk("Mathematics","JEE","Probability","Conditional Probability","hard",
                         f"P(A)={P_A}, P(B)={P_B}, P(A∩B)={P_AB}. P(A|B):",
                         f"{P_A_given_B}", f"{P_A}", f"{P_AB}", f"{round(P_A_given_B*2,4)}","A",
-                        f"P(A|B) = P(A∩B)/P(B) = {P_AB}/{P_B} = {P_A_given_B}"))
-                    qs.append(mk("Mathematics","JEE","Probability","Conditional Probability","hard",
+                        f"P(A|B) = P(A∩B)/P(B) = {P_AB}/{P_B} = {P_A_given_B}")
+                    yield mk("Mathematics","JEE","Probability","Conditional Probability","hard",
                         f"P(A)={P_A}, P(B)={P_B}, P(A∩B)={P_AB}. P(B|A):",
                         f"{P_B_given_A}", f"{P_B}", f"{P_AB}", f"{round(P_B_given_A/2,4)}","A",
-                        f"P(B|A) = P(A∩B)/P(A) = {P_AB}/{P_A} = {P_B_given_A}"))
+                        f"P(B|A) = P(A∩B)/P(A) = {P_AB}/{P_A} = {P_B_given_A}")
 
-    return qs
 
-qs = push_mathematics()
-n = ins(conn, qs)
-print(f"Mathematics: +{n} new → Total: {cur(conn,'Mathematics'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUET GK — push to 12,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_gk():
-    qs = []
 
     # World Geography
     world_geo = [
@@ -526,8 +515,8 @@ def push_gk():
         ("Largest rainforest","Amazon Rainforest (South America)","Congo Rainforest","Southeast Asian rainforest","Daintree","A","Amazon covers ~5.5 million km²"),
     ]
     for item in world_geo:
-        qs.append(mk("CUET_GK","CUET_GT","Geography","World Geography","medium",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield mk("CUET_GK","CUET_GT","Geography","World Geography","medium",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Indian History — more detailed
     mughal_emperors = [
@@ -540,19 +529,19 @@ def push_gk():
         ("Bahadur Shah Zafar","1837–1857","Last Mughal emperor; exiled after 1857 revolt"),
     ]
     for emperor, reign, notable in mughal_emperors:
-        qs.append(mk("CUET_GK","CUET_GT","History","Mughal Empire","medium",
+        yield mk("CUET_GK","CUET_GT","History","Mughal Empire","medium",
             f"Mughal Emperor {emperor} ruled from:",
             reign,
             "1500–1525" if reign!="1500–1525" else "1526–1540",
             "1600–1620" if reign!="1600–1620" else "1556–1605",
             "1700–1720" if reign!="1700–1720" else "1658–1707","A",
-            f"{emperor}: {reign}; known for: {notable}"))
-        qs.append(mk("CUET_GK","CUET_GT","History","Mughal Empire","medium",
+            f"{emperor}: {reign}; known for: {notable}")
+        yield mk("CUET_GK","CUET_GT","History","Mughal Empire","medium",
             f"{emperor} is known for:",
             notable,
             "Building Qutub Minar" if notable!="Building Qutub Minar" else "Founding Mughal Empire",
             "Signing Magna Carta","Discovering America","A",
-            f"{emperor} ({reign}): {notable}"))
+            f"{emperor} ({reign}): {notable}")
 
     # Freedom fighters
     freedom_fighters = [
@@ -568,20 +557,20 @@ def push_gk():
         ("Sardar Vallabhbhai Patel","Integration of 562 princely states","Iron Man of India","Nadiad, Gujarat"),
     ]
     for fighter, contribution, title, birthplace in freedom_fighters:
-        qs.append(mk("CUET_GK","CUET_GT","History","Freedom Fighters","medium",
+        yield mk("CUET_GK","CUET_GT","History","Freedom Fighters","medium",
             f"Title/nickname of {fighter}:",
             title,
             "Father of the Nation" if title!="Father of the Nation" else "Iron Man of India",
             "Netaji" if title!="Netaji" else "Punjab Kesari",
             "Lokmanya" if title!="Lokmanya" else "Nightingale of India","A",
-            f"{fighter}: called '{title}'; contribution: {contribution}"))
-        qs.append(mk("CUET_GK","CUET_GT","History","Freedom Fighters","medium",
+            f"{fighter}: called '{title}'; contribution: {contribution}")
+        yield mk("CUET_GK","CUET_GT","History","Freedom Fighters","medium",
             f"Main contribution of {fighter}:",
             contribution,
             "Founded Indian National Congress" if contribution!="Founded Indian National Congress" else "Non-cooperation movement",
             "Wrote Indian Constitution",
             "Fought in World War I","A",
-            f"{fighter}: {contribution}; born in {birthplace}"))
+            f"{fighter}: {contribution}; born in {birthplace}")
 
     # Science and Technology - more
     inventions = [
@@ -607,30 +596,25 @@ def push_gk():
         ("Internet (ARPANET)","DARPA (US Department of Defense)","1969","USA"),
     ]
     for invention, inventor, year, country in inventions:
-        qs.append(mk("CUET_GK","CUET_GT","Science","Inventions","medium",
+        yield mk("CUET_GK","CUET_GT","Science","Inventions","medium",
             f"Inventor of {invention}:",
             inventor,
             "Thomas Edison" if inventor!="Thomas Edison" else "Bell",
             "Einstein" if inventor!="Einstein" else "Newton",
             "Newton" if inventor!="Newton" else "Darwin","A",
-            f"{invention} invented by {inventor} in {year} ({country})"))
-        qs.append(mk("CUET_GK","CUET_GT","Science","Inventions","medium",
+            f"{invention} invented by {inventor} in {year} ({country})")
+        yield mk("CUET_GK","CUET_GT","Science","Inventions","medium",
             f"{invention} was invented in:",
             year, str(int(year.split('/')[0])+10), str(int(year.split('/')[0])-20),
             str(int(year.split('/')[0])+25),"A",
-            f"{inventor} invented {invention} in {year}"))
+            f"{inventor} invented {invention} in {year}")
 
-    return qs
 
-qs = push_gk()
-n = ins(conn, qs)
-print(f"CUET_GK: +{n} new → Total: {cur(conn,'CUET_GK'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUET ENGLISH — push to 12,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_english():
-    qs = []
 
     # Sentence correction with many patterns
     correction_pairs = [
@@ -651,9 +635,9 @@ def push_english():
         ("Scarcely had he left when she arrived.","Scarcely had he left when she arrived. (Correct)","Scarcely he had left","Scarcely did he leave when","Scarcely has he left","A","'Scarcely had...when' is the correct structure"),
     ]
     for item in correction_pairs:
-        qs.append(mk("CUET_English","CUET_GT","Grammar","Sentence Correction","hard",
+        yield mk("CUET_English","CUET_GT","Grammar","Sentence Correction","hard",
             f"Correct the sentence: '{item[0]}'",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Word meanings in context
     context_vocab = [
@@ -674,9 +658,9 @@ def push_english():
         ("The ELOQUENT speaker moved the audience.", "well-spoken; persuasive; expressive","silent","ordinary","aggressive","A","Eloquent = fluent and persuasive in speaking"),
     ]
     for item in context_vocab:
-        qs.append(mk("CUET_English","CUET_GT","Vocabulary","Words in Context","medium",
+        yield mk("CUET_English","CUET_GT","Vocabulary","Words in Context","medium",
             f"Meaning of highlighted word: '{item[0]}'",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
 
     # Comprehension — short passages with 3 questions each
     passages = [
@@ -707,9 +691,9 @@ def push_english():
     ]
     for passage in passages:
         for q_tuple in passage["qs"]:
-            qs.append(mk("CUET_English","CUET_GT","Reading Comprehension","Passage Questions","medium",
+            yield mk("CUET_English","CUET_GT","Reading Comprehension","Passage Questions","medium",
                 f"Passage: '{passage['text'][:100]}...' Q: {q_tuple[0]}",
-                q_tuple[1],q_tuple[2],q_tuple[3],q_tuple[4],q_tuple[5],q_tuple[6]))
+                q_tuple[1],q_tuple[2],q_tuple[3],q_tuple[4],q_tuple[5],q_tuple[6])
 
     # Tenses — fill in the blanks
     tense_qs = [
@@ -727,20 +711,16 @@ def push_english():
         ("No sooner ___ he arrived than it started raining.","had","has","was","did","A","'No sooner had...than' = past perfect inversion"),
     ]
     for item in tense_qs:
-        qs.append(mk("CUET_English","CUET_GT","Grammar","Tenses","hard",
-            item[0],item[1],item[2],item[3],item[4],item[5],item[6]))
+        yield mk("CUET_English","CUET_GT","Grammar","Tenses","hard",
+            item[0],item[1],item[2],item[3],item[4],item[5],item[6])
 
-    return qs
 
-qs = push_english()
-n = ins(conn, qs)
-print(f"CUET_English: +{n} new → Total: {cur(conn,'CUET_English'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUET REASONING — push to 12,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_reasoning():
-    qs = []
+    emitted = 0
 
     # Analogy — large set
     analogies = [
@@ -761,34 +741,38 @@ def push_reasoning():
         ("January : Winter","July : Summer","April : Spring","October : Autumn","March : Transition","A","January is winter month; July is summer month"),
     ]
     for item in analogies:
-        qs.append(mk("CUET_Reasoning","CUET_GT","Analogies","Word Analogy","medium",
+        yield mk("CUET_Reasoning","CUET_GT","Analogies","Word Analogy","medium",
             f"Complete the analogy: {item[0]} :: ?",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
+        emitted += 1
 
     # Input-Output (letter/number operations)
     for input_num in range(10, 300, 7):
         doubled = input_num * 2
         halved = input_num // 2
         squared = input_num ** 2 if input_num < 50 else None
-        qs.append(mk("CUET_Reasoning","CUET_GT","Mathematical","Input-Output","medium",
+        yield mk("CUET_Reasoning","CUET_GT","Mathematical","Input-Output","medium",
             f"A machine doubles every input. Input: {input_num}. Output:",
             f"{doubled}", f"{input_num+2}", f"{halved}", f"{input_num*3}","A",
-            f"Output = input × 2 = {input_num} × 2 = {doubled}"))
-        qs.append(mk("CUET_Reasoning","CUET_GT","Mathematical","Input-Output","medium",
+            f"Output = input × 2 = {input_num} × 2 = {doubled}")
+        emitted += 1
+        yield mk("CUET_Reasoning","CUET_GT","Mathematical","Input-Output","medium",
             f"A machine adds 15 to each number. Input: {input_num}. Output:",
             f"{input_num+15}", f"{input_num-15}", f"{input_num*15}", f"{input_num+10}","A",
-            f"Output = {input_num} + 15 = {input_num+15}"))
+            f"Output = {input_num} + 15 = {input_num+15}")
+        emitted += 1
 
     # Ranking problems
     for total in range(5, 20):
         for rank_from_top in range(1, total+1):
             rank_from_bottom = total - rank_from_top + 1
-            qs.append(mk("CUET_Reasoning","CUET_GT","Arrangement","Ranking","medium",
+            yield mk("CUET_Reasoning","CUET_GT","Arrangement","Ranking","medium",
                 f"In a class of {total} students, a student ranks {rank_from_top} from top. "
                 f"Rank from bottom:",
                 f"{rank_from_bottom}", f"{rank_from_top}", f"{total-rank_from_top}",
                 f"{rank_from_bottom+1}","A",
-                f"Rank from bottom = total - rank from top + 1 = {total} - {rank_from_top} + 1 = {rank_from_bottom}"))
+                f"Rank from bottom = total - rank from top + 1 = {total} - {rank_from_top} + 1 = {rank_from_bottom}")
+            emitted += 1
 
     # Odd one out (logic-based)
     odd_one_sets = [
@@ -804,9 +788,10 @@ def push_reasoning():
         ("Rabi, Kharif, Zaid, Monsoon, Mixed cropping","Monsoon (season; others are types of crop seasons)","Rabi","Kharif","Zaid","A","Monsoon is a season; Rabi/Kharif/Zaid/Mixed are crop seasons"),
     ]
     for item in odd_one_sets:
-        qs.append(mk("CUET_Reasoning","CUET_GT","Analogies","Odd One Out","medium",
+        yield mk("CUET_Reasoning","CUET_GT","Analogies","Odd One Out","medium",
             f"Find the odd one out: {item[0]}",
-            item[1],item[2],item[3],item[4],item[5],item[6]))
+            item[1],item[2],item[3],item[4],item[5],item[6])
+        emitted += 1
 
     # Mathematical reasoning
     for a in range(2, 15):
@@ -815,26 +800,23 @@ def push_reasoning():
                 if a != b and b != c:
                     result_ab = a * b + c
                     result_bc = b * c + a
-                    qs.append(mk("CUET_Reasoning","CUET_GT","Mathematical","Mathematical Reasoning","hard",
+                    yield mk("CUET_Reasoning","CUET_GT","Mathematical","Mathematical Reasoning","hard",
                         f"If {a}★{b} = {result_ab} (using formula a★b = a×b+c where c={c}), "
                         f"then {b}★{c} = ?",
                         f"{result_bc}", f"{b*c}", f"{result_ab}", f"{a*b*c}","A",
-                        f"{b}★{c} = {b}×{c}+{a} = {b*c}+{a} = {result_bc}"))
-                if len(qs) > 30000: break
-            if len(qs) > 30000: break
-        if len(qs) > 30000: break
+                        f"{b}★{c} = {b}×{c}+{a} = {b*c}+{a} = {result_bc}")
+                    emitted += 1
+                if emitted > 30000: break
+            if emitted > 30000: break
+        if emitted > 30000: break
 
-    return qs
 
-qs = push_reasoning()
-n = ins(conn, qs)
-print(f"CUET_Reasoning: +{n} new → Total: {cur(conn,'CUET_Reasoning'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUET QUANTITATIVE — push to 12,000
 # ═══════════════════════════════════════════════════════════════════════════════
 def push_quantitative():
-    qs = []
+    emitted = 0
 
     # Number System — factors, HCF, LCM, remainders
     import math as _m
@@ -842,46 +824,52 @@ def push_quantitative():
         for b in range(15, 150, 6):
             g = _m.gcd(a, b)
             l = (a * b) // g
-            qs.append(mk("CUET_Quantitative","CUET_GT","Number System","LCM-HCF Relation","medium",
+            yield mk("CUET_Quantitative","CUET_GT","Number System","LCM-HCF Relation","medium",
                 f"HCF of {a} and {b} is {g}. LCM is:",
                 f"{l}", f"{a*b}", f"{g*2}", f"{l+g}","A",
-                f"LCM × HCF = a × b → LCM = {a}×{b}/{g} = {l}"))
-            qs.append(mk("CUET_Quantitative","CUET_GT","Number System","HCF","easy",
+                f"LCM × HCF = a × b → LCM = {a}×{b}/{g} = {l}")
+            emitted += 1
+            yield mk("CUET_Quantitative","CUET_GT","Number System","HCF","easy",
                 f"HCF of {a} and {b}:",
                 f"{g}", f"{l}", f"{a+b}", f"{abs(a-b)}","A",
-                f"HCF({a},{b}) = {g}"))
+                f"HCF({a},{b}) = {g}")
+            emitted += 1
 
     # Discount problems
     for MP in range(100, 2001, 100):
         for disc_pct in [5, 10, 15, 20, 25, 30, 40, 50]:
             SP = MP * (1 - disc_pct/100)
             discount_amt = MP - SP
-            qs.append(mk("CUET_Quantitative","CUET_GT","Discount","Selling Price after Discount","medium",
+            yield mk("CUET_Quantitative","CUET_GT","Discount","Selling Price after Discount","medium",
                 f"Marked price ₹{MP}, discount {disc_pct}%. Selling price:",
                 f"₹{SP}", f"₹{MP}", f"₹{discount_amt}", f"₹{SP+disc_pct}","A",
-                f"SP = MP×(1-d%) = {MP}×{1-disc_pct/100} = ₹{SP}"))
-            qs.append(mk("CUET_Quantitative","CUET_GT","Discount","Discount Amount","easy",
+                f"SP = MP×(1-d%) = {MP}×{1-disc_pct/100} = ₹{SP}")
+            emitted += 1
+            yield mk("CUET_Quantitative","CUET_GT","Discount","Discount Amount","easy",
                 f"Marked price ₹{MP}, discount {disc_pct}%. Discount amount:",
                 f"₹{discount_amt}", f"₹{SP}", f"₹{MP}", f"₹{disc_pct}","A",
-                f"Discount = MP×d% = {MP}×{disc_pct}/100 = ₹{discount_amt}"))
+                f"Discount = MP×d% = {MP}×{disc_pct}/100 = ₹{discount_amt}")
+            emitted += 1
 
     # Average problems
     for n_items in range(3, 12):
         for avg in range(10, 100, 5):
             total = n_items * avg
-            qs.append(mk("CUET_Quantitative","CUET_GT","Arithmetic","Averages","easy",
+            yield mk("CUET_Quantitative","CUET_GT","Arithmetic","Averages","easy",
                 f"Average of {n_items} numbers is {avg}. Their sum is:",
                 f"{total}", f"{avg}", f"{n_items+avg}", f"{total+n_items}","A",
-                f"Sum = n × avg = {n_items} × {avg} = {total}"))
+                f"Sum = n × avg = {n_items} × {avg} = {total}")
+            emitted += 1
         # New average when one number added
         for new_num in range(50, 200, 25):
             old_total = n_items * avg
             new_avg = round((old_total + new_num) / (n_items + 1), 2)
-            qs.append(mk("CUET_Quantitative","CUET_GT","Arithmetic","Averages","medium",
+            yield mk("CUET_Quantitative","CUET_GT","Arithmetic","Averages","medium",
                 f"Average of {n_items} numbers = {avg}. A new number {new_num} is added. New average:",
                 f"{new_avg}", f"{avg}", f"{round((old_total+new_num)/n_items,2)}",
                 f"{round(new_avg+5,2)}","A",
-                f"New avg = ({n_items}×{avg}+{new_num})/({n_items}+1) = {old_total+new_num}/{n_items+1} = {new_avg}"))
+                f"New avg = ({n_items}×{avg}+{new_num})/({n_items}+1) = {old_total+new_num}/{n_items+1} = {new_avg}")
+            emitted += 1
 
     # Trains
     for len1 in range(100, 500, 50):
@@ -893,64 +881,99 @@ def push_quantitative():
                     rel_speed_ms = round(rel_speed * 1000/3600, 2)
                     time_cross = round((len1 + len2) / rel_speed_ms, 2)
                     if time_cross < 100:
-                        qs.append(mk("CUET_Quantitative","CUET_GT","Speed/Distance","Trains Crossing","hard",
+                        yield mk("CUET_Quantitative","CUET_GT","Speed/Distance","Trains Crossing","hard",
                             f"Train A: {len1}m, {speed1}km/h. Train B: {len2}m, {speed2}km/h, opposite direction. "
                             f"Time to cross each other:",
                             f"{time_cross} s",
                             f"{round(time_cross*2,2)} s",
                             f"{round((len1+len2)/speed1,2)} s",
                             f"{round(time_cross*0.5,2)} s","A",
-                            f"Rel speed = {rel_speed}km/h = {rel_speed_ms}m/s; t = {len1+len2}/{rel_speed_ms} = {time_cross}s"))
-                    if len(qs) > 25000: break
-                if len(qs) > 25000: break
-            if len(qs) > 25000: break
-        if len(qs) > 25000: break
+                            f"Rel speed = {rel_speed}km/h = {rel_speed_ms}m/s; t = {len1+len2}/{rel_speed_ms} = {time_cross}s")
+                        emitted += 1
+                    if emitted > 25000: break
+                if emitted > 25000: break
+            if emitted > 25000: break
+        if emitted > 25000: break
 
     # Volume and Surface Area
     for r in range(1, 15):
         vol_sphere = round(4/3 * math.pi * r**3, 2)
         sa_sphere  = round(4 * math.pi * r**2, 2)
-        qs.append(mk("CUET_Quantitative","CUET_GT","Mensuration","Sphere Volume","medium",
+        yield mk("CUET_Quantitative","CUET_GT","Mensuration","Sphere Volume","medium",
             f"Sphere radius {r} cm. Volume (π=3.14):",
             f"{round(4/3*3.14*r**3,2)} cm³",
             f"{round(4*3.14*r**2,2)} cm²",
             f"{round(3.14*r**3,2)} cm³",
             f"{round(2*3.14*r**3,2)} cm³","A",
-            f"V = (4/3)πr³ = (4/3)×3.14×{r}³ = {round(4/3*3.14*r**3,2)} cm³"))
+            f"V = (4/3)πr³ = (4/3)×3.14×{r}³ = {round(4/3*3.14*r**3,2)} cm³")
+        emitted += 1
 
     for r in range(1, 12):
         for h in range(2, 15):
             vol_cyl = round(3.14 * r**2 * h, 2)
             csa_cyl = round(2 * 3.14 * r * h, 2)
             tsa_cyl = round(2 * 3.14 * r * (r + h), 2)
-            qs.append(mk("CUET_Quantitative","CUET_GT","Mensuration","Cylinder Volume","medium",
+            yield mk("CUET_Quantitative","CUET_GT","Mensuration","Cylinder Volume","medium",
                 f"Cylinder: r={r}cm, h={h}cm. Volume (π=3.14):",
                 f"{vol_cyl} cm³",
                 f"{csa_cyl} cm²",
                 f"{tsa_cyl} cm²",
                 f"{round(3.14*r*h,2)} cm³","A",
-                f"V = πr²h = 3.14×{r}²×{h} = {vol_cyl} cm³"))
+                f"V = πr²h = 3.14×{r}²×{h} = {vol_cyl} cm³")
+            emitted += 1
 
-    return qs
 
-qs = push_quantitative()
-n = ins(conn, qs)
-print(f"CUET_Quantitative: +{n} new → Total: {cur(conn,'CUET_Quantitative'):,}")
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# FINAL REPORT
+# MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
-print("\n" + "="*65)
-print("  FINAL QUESTION BANK TOTALS")
-print("="*65)
-grand = 0
-subjects = ["Physics","Chemistry","Biology","Mathematics","CUET_GK",
-            "CUET_English","CUET_Reasoning","CUET_Quantitative"]
-for s in subjects:
-    n = cur(conn, s)
-    grand += n
-    bar = "█" * (n // 1000)
-    status = "✅" if n >= 10000 else "⚠️ "
-    print(f"  {status} {s:<25} {n:>8,}  {bar}")
-print("="*65)
-print(f"  GRAND TOTAL: {grand:,}")
+PUSHERS = [
+    ("Physics",           push_physics),
+    ("Chemistry",         push_chemistry),
+    ("Biology",           push_biology),
+    ("Mathematics",       push_mathematics),
+    ("CUET_GK",           push_gk),
+    ("CUET_English",      push_english),
+    ("CUET_Reasoning",    push_reasoning),
+    ("CUET_Quantitative", push_quantitative),
+]
+
+def main(workers=None, bulk_load=False):
+    init_bank()
+    conn = _bank_conn()
+    loader = None
+
+    def write(subject, qs):
+        n = ins(conn, qs, loader)
+        print(f"{subject}: +{n} new → Total: {cur(conn, subject):,}")
+        return n
+
+    t0 = time.time()
+    # no text dedup in the runner: the unique index (or the bulk loader's copy of its key) decides
+    if bulk_load:
+        with bulk_load_mode(conn) as loader:
+            timings = run_generators(PUSHERS, write, workers, text_key=None)
+    else:
+        timings = run_generators(PUSHERS, write, workers, text_key=None)
+
+    print("\n" + "="*65)
+    print("  FINAL QUESTION BANK TOTALS")
+    print("="*65)
+    grand = 0
+    for s, _ in PUSHERS:
+        n = cur(conn, s)
+        grand += n
+        bar = "█" * (n // 1000)
+        status = "✅" if n >= 10000 else "⚠️ "
+        print(f"  {status} {s:<25} {n:>8,}  {bar}")
+    print("="*65)
+    print(f"  GRAND TOTAL: {grand:,}")
+    print(format_timings(timings, time.time() - t0))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Final push of parametric questions to 100,000")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores; 1 = serial)")
+    ap.add_argument("--bulk-load", action="store_true", help="defer indexes, relax durability, lock the DB")
+    args = ap.parse_args()
+    main(args.workers, args.bulk_load)
@@ -9,15 +9,22 @@ Tables:
   student_q_history   — tracks which questions each student has seen
   bank_exams          — exams created from the bank
   bank_exam_questions — which questions belong to each bank exam
+  bank_meta           — small key/value table (bank generation counter)
+  job_checkpoints     — resume position (last qb_id) of full-bank batch jobs
 """
 
 import sqlite3
 import threading
 import json
 import random
-from typing import List, Dict, Optional, Tuple
+import time
+import copy
+from contextlib import contextmanager
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from config import Config
+
 BANK_DB_PATH = "question_bank.db"
 _bank_lock = threading.Lock()
 _bank_local = threading.local()
@@ -85,7 +92,8 @@ def _bank_conn():
 
 
 def _make_conn(path: str):
-    conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    # room for every language's prepared statements (see PER-LANGUAGE COLUMNS)
+    conn = sqlite3.connect(path, check_same_thread=False, timeout=30, cached_statements=256)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
@@ -259,6 +267,14 @@ def init_bank():
 
     # Migrate: add explanation columns for each language if missing
     _migrate_add_explanation_columns(conn)
+    _migrate_session_columns(conn)
+    try:
+        with _bank_lock:
+            _ensure_bank_meta(conn)
+            conn.commit()
+    except Exception as e:
+        print(f"bank_meta init error: {e}")
+    ensure_stream_indexes()
 
 
 def _migrate_add_explanation_columns(conn):
@@ -279,9 +295,105 @@ def _migrate_add_explanation_columns(conn):
         pass
 
 
+def _migrate_session_columns(conn):
+    """Add the columns/indexes the durable exam session store needs (migration for old DBs)."""
+    try:
+        with _bank_lock:
+            for table, cols in [
+                ("bank_exam_sessions", [("exam_type", "TEXT"), ("started_epoch", "REAL"),
+                                        ("duration_secs", "INTEGER"), ("current_idx", "INTEGER DEFAULT 0")]),
+                ("bank_session_questions", [("from_recycle", "INTEGER DEFAULT 0")]),
+            ]:
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+                for col, decl in cols:
+                    if col not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {decl}")
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_br_session_q ON bank_responses(session_id, qb_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_bes_user_status ON bank_exam_sessions(user_id, status)")
+            conn.commit()
+    except Exception as e:
+        print(f"Session migration error: {e}")
+
+
+# ─── AGGREGATE READ CACHE ────────────────────────────────────────────────────
+# Stats/count reads are cached per process for Config.performance.CACHE_TTL_SECONDS
+# and tagged with the bank generation stored in bank_meta. Every writer bumps the
+# generation, so other processes (seeders, translation jobs) invalidate us too.
+
+_stats_cache: Dict[Any, Tuple[int, float, Any]] = {}   # key -> (generation, stored_at, value)
+_stats_cache_lock = threading.Lock()
+
+
+def _ensure_bank_meta(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS bank_meta (
+            key   TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+
+def get_bank_generation() -> int:
+    conn = _bank_conn()
+    try:
+        with _bank_lock:
+            row = conn.execute("SELECT value FROM bank_meta WHERE key='generation'").fetchone()
+        return row[0] if row else 0
+    except sqlite3.OperationalError:
+        return 0   # bank_meta not created yet
+
+
+def bump_bank_generation(conn=None):
+    """
+    Mark the bank as changed. Pass `conn` to bump inside the caller's open
+    transaction (caller holds the lock and commits); otherwise this commits itself.
+    """
+    sql = ("INSERT INTO bank_meta (key, value) VALUES ('generation', 1) "
+           "ON CONFLICT(key) DO UPDATE SET value = value + 1")
+    if conn is not None:
+        _ensure_bank_meta(conn)
+        conn.execute(sql)
+    else:
+        conn = _bank_conn()
+        with _bank_lock:
+            try:
+                _ensure_bank_meta(conn)
+                conn.execute(sql)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"bump_bank_generation error: {e}")
+    invalidate_stats_cache()
+
+
+def invalidate_stats_cache():
+    with _stats_cache_lock:
+        _stats_cache.clear()
+
+
+def cached_bank_read(key: Any, loader: Callable[[], Any]) -> Any:
+    """Return loader() through the generation + TTL cache (a copy, callers may mutate it)."""
+    if not Config.performance.CACHE_QUESTIONS:
+        return loader()
+    gen = get_bank_generation()
+    now = time.time()
+    with _stats_cache_lock:
+        hit = _stats_cache.get(key)
+    if hit and hit[0] == gen and now - hit[1] < Config.performance.CACHE_TTL_SECONDS:
+        return copy.deepcopy(hit[2])
+    value = loader()
+    with _stats_cache_lock:
+        _stats_cache[key] = (gen, now, value)
+    return copy.deepcopy(value)
+
+
 # ─── BANK STATISTICS ─────────────────────────────────────────────────────────
 
 def get_bank_stats() -> Dict:
+    return cached_bank_read("bank_stats", _load_bank_stats)
+
+
+def _load_bank_stats() -> Dict:
     conn = _bank_conn()
     with _bank_lock:
         total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
@@ -299,6 +411,10 @@ def get_bank_stats() -> Dict:
 
 
 def get_subject_count(subject: str) -> int:
+    return cached_bank_read(("subject_count", subject), lambda: _load_subject_count(subject))
+
+
+def _load_subject_count(subject: str) -> int:
     conn = _bank_conn()
     with _bank_lock:
         return conn.execute(
@@ -308,39 +424,174 @@ def get_subject_count(subject: str) -> int:
 
 # ─── QUESTION INSERTION ───────────────────────────────────────────────────────
 
-def bulk_insert_questions(questions: List[Dict]) -> int:
-    """Insert a batch of questions. Returns count inserted."""
+def bulk_insert_questions(questions: List[Dict], loader: "Optional[BulkLoad]" = None) -> int:
+    """
+    Insert a batch of questions. Returns count inserted. Pass the active
+    `loader` during bulk_load_mode (the unique index is gone then).
+    """
     conn = _bank_conn()
+    pending: set = set()
     inserted = 0
     with _bank_lock:
+        before = conn.total_changes
         conn.execute("BEGIN")
         try:
-            for q in questions:
-                conn.execute("""
-                    INSERT OR IGNORE INTO question_bank
-                        (subject, exam_type, topic, subtopic, difficulty,
-                         question_en, option_a_en, option_b_en, option_c_en, option_d_en,
-                         correct_answer, marks_correct, marks_wrong, explanation_en)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """, (
-                    q["subject"], q["exam_type"], q.get("topic", ""),
-                    q.get("subtopic", ""), q.get("difficulty", "medium"),
-                    q["question_en"],
-                    q["option_a_en"], q["option_b_en"],
-                    q["option_c_en"], q["option_d_en"],
-                    q["correct_answer"],
-                    q.get("marks_correct", 4.0),
-                    q.get("marks_wrong", -1.0),
-                    q.get("explanation_en", ""),
-                ))
-                inserted += 1
+            rows = [(
+                q["subject"], q["exam_type"], q.get("topic", ""),
+                q.get("subtopic", ""), q.get("difficulty", "medium"),
+                q["question_en"],
+                q["option_a_en"], q["option_b_en"],
+                q["option_c_en"], q["option_d_en"],
+                q["correct_answer"],
+                q.get("marks_correct", 4.0),
+                q.get("marks_wrong", -1.0),
+                q.get("explanation_en", ""),
+            ) for q in questions if loader is None or loader.keep(q["subject"], q["question_en"], pending)]
+            conn.executemany("""
+                INSERT OR IGNORE INTO question_bank
+                    (subject, exam_type, topic, subtopic, difficulty,
+                     question_en, option_a_en, option_b_en, option_c_en, option_d_en,
+                     correct_answer, marks_correct, marks_wrong, explanation_en)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            """, rows)
+            inserted = conn.total_changes - before
+            bump_bank_generation(conn)
             conn.commit()
+            if loader is not None:
+                loader.keys |= pending
         except Exception as e:
             conn.rollback()
             print(f"Bulk insert error: {e}")
     return inserted
 
 
+# ─── BULK LOAD MODE ───────────────────────────────────────────────────────────
+# Seeding 100k rows one chunk at a time still updates every question_bank
+# index per row, the functional unique index included. In bulk-load mode the
+# indexes are dropped up front and recreated from their saved SQL at the end
+# (one sorted build each), durability and locking are relaxed for the
+# duration, and duplicates are caught in memory instead of by the unique
+# index: BulkLoad.keep() mirrors its (subject, LOWER(TRIM(question_en))) key,
+# so every writer used inside the block must filter through it.
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def question_key(subject: str, text: str) -> Tuple[str, str]:
+    """The unique index's key: SQLite's TRIM strips spaces only, LOWER folds ASCII only."""
+    return subject, (text or "").strip(" ").translate(_ASCII_LOWER)
+
+
+class BulkLoad:
+    """State of one bulk_load_mode block: dedup keys and phase timings."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.keys: set = set()
+        self.duplicates = 0
+        self.phases: List[Tuple[str, float]] = []
+
+    def load_keys(self):
+        """Add the key of every question already in the bank."""
+        for subject, text in self.conn.execute("SELECT subject, question_en FROM question_bank"):
+            self.keys.add(question_key(subject, text))
+
+    def keep(self, subject: str, text: str, pending: Optional[set] = None) -> bool:
+        """
+        True the first time a (subject, text) key is seen; counts the rest as
+        duplicates. A writer passes `pending` to collect the new keys of a
+        transaction and adds them to `keys` only once it commits, so rows
+        rolled back are not skipped when written again.
+        """
+        key = question_key(subject, text)
+        if key in self.keys or (pending is not None and key in pending):
+            self.duplicates += 1
+            return False
+        (self.keys if pending is None else pending).add(key)
+        return True
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - t0))
+
+    def report(self) -> str:
+        lines = ["  Bulk load phases:"]
+        lines += [f"    {name:<48}{secs:>8.2f}s" for name, secs in self.phases]
+        lines.append(f"    {'total':<48}{sum(s for _, s in self.phases):>8.2f}s"
+                     f"   ({self.duplicates:,} duplicates skipped in memory)")
+        return "\n".join(lines)
+
+
+@contextmanager
+def bulk_load_mode(conn=None, cache_mb: int = 512, verbose: bool = True):
+    """
+    Load-many-rows mode for the seed scripts:
+
+        with bulk_load_mode() as loader:
+            bulk_insert_questions(qs, loader=loader)
+
+    Drops question_bank's indexes, sets synchronous=OFF, a `cache_mb` page
+    cache and exclusive locking (other processes can't use the bank until
+    the block ends), then rebuilds the indexes and runs ANALYZE. Prints the
+    phase timings unless verbose=False.
+    """
+    conn = conn or _bank_conn()
+    loader = BulkLoad(conn)
+    with loader.phase("prepare (pragmas, drop indexes, existing keys)"):
+        with _bank_lock:
+            conn.commit()
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(f"PRAGMA cache_size=-{int(cache_mb) * 1024}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+            indexes = conn.execute(
+                "SELECT name, sql FROM sqlite_master "
+                "WHERE type='index' AND tbl_name='question_bank' AND sql IS NOT NULL").fetchall()
+            try:
+                for name, _ in indexes:
+                    conn.execute(f'DROP INDEX IF EXISTS "{name}"')
+                conn.commit()
+                loader.load_keys()
+            except Exception:
+                conn.rollback()
+                raise
+    try:
+        with loader.phase("load"):
+            yield loader
+    finally:
+        with loader.phase(f"rebuild {len(indexes)} indexes"):
+            with _bank_lock:
+                conn.commit()
+                for name, sql in indexes:
+                    try:
+                        conn.execute(sql)
+                    except sqlite3.IntegrityError:
+                        # a writer skipped loader.keep(): keep the first copy, as INSERT OR IGNORE would
+                        n = conn.execute("""
+                            DELETE FROM question_bank WHERE qb_id NOT IN (
+                                SELECT MIN(qb_id) FROM question_bank
+                                GROUP BY subject, LOWER(TRIM(question_en)))
+                        """).rowcount
+                        print(f"  ⚠️  {name}: removed {n:,} duplicate rows written outside the loader")
+                        conn.execute(sql)
+                conn.commit()
+        with loader.phase("analyze"):
+            with _bank_lock:
+                conn.execute("ANALYZE")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA cache_size=-32000")
+                conn.execute("PRAGMA temp_store=DEFAULT")
+                conn.execute("PRAGMA locking_mode=NORMAL")
+                conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()   # releases the exclusive lock
+                conn.commit()
+        if verbose:
+            print(loader.report())
+
+
 # ─── EXAM CREATION FROM BANK ──────────────────────────────────────────────────
 
 def get_questions_for_exam(
@@ -354,7 +605,11 @@ def get_questions_for_exam(
     Pull `count` UNIQUE questions for `subject` that this user hasn't seen.
     Guarantees: no duplicate qb_ids, no duplicate question texts within result.
     difficulty_mix = {"medium": 0.3, "hard": 0.4, "very_hard": 0.3}
+    Parametric template instances are drawn alongside stored rows, in
+    proportion to how many of each there are; a drawn instance is stored
+    as a question_bank row (question_templates.materialize).
     """
+    import question_templates
     conn = _bank_conn()
     exclude_ids = list(exclude_ids or [])
 
@@ -387,8 +642,18 @@ def get_questions_for_exam(
             seen_texts.add(txt)
         return True
 
+    by_difficulty = get_bank_stats()["by_subject"].get(subject, {})
+    drawn_keys = set()      # template instances drawn here aren't in the history yet
     for diff, ratio in difficulty_mix.items():
         needed = max(1, round(count * ratio))
+        n_templated = question_templates.template_count(subject, diff)
+        if n_templated:
+            share = n_templated / (n_templated + by_difficulty.get(diff, 0))
+            want = sum(random.random() < share for _ in range(needed))
+            keys = question_templates.pick(user_id, subject, want, difficulty=diff)
+            drawn_keys.update(keys)
+            for d in question_templates.materialize(keys):
+                _try_add(d)
         with _bank_lock:
             rows = conn.execute("""
                 SELECT * FROM question_bank
@@ -420,6 +685,12 @@ def get_questions_for_exam(
                 break
             _try_add(d)
 
+    if len(result) < count:
+        keys = question_templates.pick(user_id, subject, count - len(result) + len(drawn_keys))
+        keys = [k for k in keys if k not in drawn_keys][:count - len(result)]
+        for d in question_templates.materialize(keys):
+            _try_add(d)
+
     random.shuffle(result)
     return result[:count]
 
@@ -449,20 +720,98 @@ def get_user_seen_count(user_id: int, subject: str) -> int:
         ).fetchone()[0]
 
 
+# ─── PER-LANGUAGE COLUMNS ─────────────────────────────────────────────────────
+# Every translated language has its own column family (question_<lang>,
+# option_a_<lang>, ...). Column names can't be bound as parameters, so the
+# statements touching them are built here, once per language and shape: the
+# language and field names are checked first, every value is a ? parameter.
+# The SQL text for a given (language, shape) is then always identical, so
+# sqlite3's per-connection statement cache reuses the prepared statement
+# instead of compiling a new one per call.
+
+TRANSLATED_LANGS = [l for l in SUPPORTED_LANGUAGES if l != "en"]
+TRANSLATION_FIELDS = ("question", "option_a", "option_b", "option_c", "option_d")
+_LANG_FIELDS = TRANSLATION_FIELDS + ("explanation",)
+_lang_sql: Dict[tuple, str] = {}
+
+
+def _check_lang(lang: str, fields=()):
+    if lang not in TRANSLATED_LANGS:
+        raise ValueError(f"unsupported language: {lang!r}")
+    for f in fields:
+        if f not in _LANG_FIELDS:
+            raise ValueError(f"unknown translation field: {f!r}")
+
+
+def lang_columns(lang: str, fields=TRANSLATION_FIELDS) -> List[str]:
+    """["question_hi", "option_a_hi", ...] for a supported language."""
+    _check_lang(lang, fields)
+    return [f"{f}_{lang}" for f in fields]
+
+
+def untranslated_where(lang: str) -> str:
+    """Predicate for rows missing `lang` — written exactly like the partial index, so it is used."""
+    _check_lang(lang)
+    return f"(question_{lang} IS NULL OR question_{lang} = '')"
+
+
+def translated_where(lang: str) -> str:
+    _check_lang(lang)
+    return f"(question_{lang} IS NOT NULL AND question_{lang} != '')"
+
+
+def count_sql(lang: str, translated: bool = True) -> str:
+    """COUNT(*) of rows that have (or, translated=False, are missing) `lang`."""
+    key = ("count", lang, translated)
+    sql = _lang_sql.get(key)
+    if sql is None:
+        where = translated_where(lang) if translated else untranslated_where(lang)
+        sql = _lang_sql[key] = f"SELECT COUNT(*) FROM question_bank WHERE {where}"
+    return sql
+
+
+def untranslated_sql(lang: str, by_subject: bool = False) -> str:
+    """
+    qb_id + the English fields of rows missing `lang`. Parameters:
+    (limit,) or, with by_subject=True, (subject, limit).
+    """
+    key = ("missing", lang, by_subject)
+    sql = _lang_sql.get(key)
+    if sql is None:
+        sql = _lang_sql[key] = (
+            f"SELECT qb_id, {', '.join(f'{f}_en' for f in TRANSLATION_FIELDS)} "
+            f"FROM question_bank WHERE {untranslated_where(lang)}"
+            + (" AND subject = ?" if by_subject else "") + " LIMIT ?")
+    return sql
+
+
+def update_sql(lang: str, fields=TRANSLATION_FIELDS, with_langs: bool = False,
+               if_missing: bool = False) -> str:
+    """
+    UPDATE of `fields` for `lang` by qb_id. Parameters: one value per field,
+    then translated_langs if with_langs, then qb_id. if_missing=True leaves
+    rows that already have a translation alone.
+    """
+    fields = tuple(fields)
+    key = ("update", lang, fields, with_langs, if_missing)
+    sql = _lang_sql.get(key)
+    if sql is None:
+        sets = [f"{c}=?" for c in lang_columns(lang, fields)]
+        if with_langs:
+            sets.append("translated_langs=?")
+        sql = _lang_sql[key] = (
+            f"UPDATE question_bank SET {', '.join(sets)} WHERE qb_id=?"
+            + (f" AND {untranslated_where(lang)}" if if_missing else ""))
+    return sql
+
+
 # ─── TRANSLATION ──────────────────────────────────────────────────────────────
 
 def save_translation(qb_id: int, lang: str, translations: Dict):
     """Save translated fields for a question."""
     conn = _bank_conn()
-    fields = {
-        f"question_{lang}": translations.get("question", ""),
-        f"option_a_{lang}": translations.get("option_a", ""),
-        f"option_b_{lang}": translations.get("option_b", ""),
-        f"option_c_{lang}": translations.get("option_c", ""),
-        f"option_d_{lang}": translations.get("option_d", ""),
-    }
-    set_clause = ", ".join(f"{k}=?" for k in fields)
-    vals = list(fields.values())
+    sql = update_sql(lang, with_langs=True)
+    vals = [translations.get(f, "") for f in TRANSLATION_FIELDS]
 
     with _bank_lock:
         try:
@@ -477,10 +826,8 @@ def save_translation(qb_id: int, lang: str, translations: Dict):
             if lang not in langs:
                 langs.append(lang)
 
-            conn.execute(
-                f"UPDATE question_bank SET {set_clause}, translated_langs=? WHERE qb_id=?",
-                vals + [json.dumps(langs), qb_id]
-            )
+            conn.execute(sql, vals + [json.dumps(langs), qb_id])
+            bump_bank_generation(conn)
             if not in_transaction:
                 conn.commit()
         except Exception as e:
@@ -522,24 +869,16 @@ def get_question_in_lang(qb_id: int, lang: str) -> Optional[Dict]:
 def questions_needing_translation(lang: str, limit: int = 100, subject: str = None) -> List[Dict]:
     """Return questions that haven't been translated to `lang` yet."""
     conn = _bank_conn()
+    key = ("needing", lang, bool(subject))
+    sql = _lang_sql.get(key)
+    if sql is None:
+        sql = _lang_sql[key] = (
+            "SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en, "
+            f"subject, topic FROM question_bank WHERE {untranslated_where(lang)}"
+            + (" AND subject = ?" if subject else "") + " LIMIT ?")
+    params = (subject, limit) if subject else (limit,)
     with _bank_lock:
-        if subject:
-            rows = conn.execute(f"""
-                SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en,
-                       subject, topic
-                FROM question_bank
-                WHERE (question_{lang} IS NULL OR question_{lang} = '')
-                  AND subject = ?
-                LIMIT ?
-            """, (subject, limit)).fetchall()
-        else:
-            rows = conn.execute(f"""
-                SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en,
-                       subject, topic
-                FROM question_bank
-                WHERE question_{lang} IS NULL OR question_{lang} = ''
-                LIMIT ?
-            """, (limit,)).fetchall()
+        rows = conn.execute(sql, params).fetchall()
     return [dict(r) for r in rows]
 
 
@@ -547,20 +886,14 @@ def count_untranslated(lang: str) -> int:
     """Count questions not yet translated to lang."""
     conn = _bank_conn()
     with _bank_lock:
-        return conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NULL OR question_{lang} = ''
-        """).fetchone()[0]
+        return conn.execute(count_sql(lang, translated=False)).fetchone()[0]
 
 
 def count_translated(lang: str) -> int:
     """Count questions translated to lang."""
     conn = _bank_conn()
     with _bank_lock:
-        return conn.execute(f"""
-            SELECT COUNT(*) FROM question_bank
-            WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-        """).fetchone()[0]
+        return conn.execute(count_sql(lang)).fetchone()[0]
 
 
 def bulk_save_translations(translations_batch: list):
@@ -571,25 +904,20 @@ def bulk_save_translations(translations_batch: list):
     conn = _bank_conn()
     if not translations_batch:
         return 0
-    # Group by language
+    # Group by language: one prepared UPDATE per language
     by_lang = {}
     for item in translations_batch:
         qb_id, lang, q, a, b, c, d = item
-        by_lang.setdefault(lang, []).append((qb_id, q, a, b, c, d))
+        by_lang.setdefault(lang, []).append((q, a, b, c, d, qb_id))
 
     count = 0
     with _bank_lock:
         conn.execute("BEGIN")
         try:
             for lang, items in by_lang.items():
-                for qb_id, q, a, b, c, d in items:
-                    conn.execute(f"""
-                        UPDATE question_bank SET
-                            question_{lang}=?, option_a_{lang}=?, option_b_{lang}=?,
-                            option_c_{lang}=?, option_d_{lang}=?
-                        WHERE qb_id=?
-                    """, (q, a, b, c, d, qb_id))
-                    count += 1
+                conn.executemany(update_sql(lang), items)
+                count += len(items)
+            bump_bank_generation(conn)
             conn.commit()
         except Exception as e:
             conn.rollback()
@@ -597,6 +925,123 @@ def bulk_save_translations(translations_batch: list):
     return count
 
 
+# ─── STREAMING ROW SOURCE ─────────────────────────────────────────────────────
+# Full-bank batch jobs walk question_bank in qb_id order (qb_id > last seen id)
+# rather than LIMIT/OFFSET or re-querying "the first N untranslated rows", so
+# every row is read once no matter how the job's own writes change the filter.
+# A job can record its position in job_checkpoints inside the same transaction
+# as its writes and resume from there after an interruption.
+
+def _ensure_job_checkpoints(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_checkpoints (
+            job        TEXT PRIMARY KEY,
+            last_id    INTEGER NOT NULL,
+            updated_at TEXT DEFAULT (datetime('now'))
+        )
+    """)
+
+
+def ensure_stream_indexes(conn=None):
+    """
+    Checkpoint table plus one partial index per language holding only the
+    qb_ids still untranslated (it shrinks as translation proceeds).
+    Pass `conn` to run on the caller's connection; the caller commits.
+    """
+    def create(c):
+        _ensure_job_checkpoints(c)
+        for lang in TRANSLATED_LANGS:
+            c.execute(f"CREATE INDEX IF NOT EXISTS idx_qb_untranslated_{lang} "
+                      f"ON question_bank(qb_id) WHERE {untranslated_where(lang)}")
+    if conn is not None:
+        create(conn)
+        return
+    conn = _bank_conn()
+    with _bank_lock:
+        try:
+            create(conn)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"ensure_stream_indexes error: {e}")
+
+
+def iter_bank_rows(columns: str = "", where: str = "1=1", params: tuple = (),
+                   batch_size: int = 1000, after_id: int = 0, conn=None):
+    """
+    Yield question_bank rows in qb_id order, one list of up to `batch_size`
+    rows at a time. Each row is (qb_id, <columns>...). Pass `conn` to read
+    through the caller's own connection (no _bank_lock); the caller may write
+    between batches.
+    """
+    cols = "qb_id" + (f", {columns}" if columns else "")
+    sql = (f"SELECT {cols} FROM question_bank WHERE qb_id > ? AND ({where}) "
+           f"ORDER BY qb_id LIMIT ?")
+    own = conn is None
+    if own:
+        conn = _bank_conn()
+    last_id = after_id
+    while True:
+        if own:
+            with _bank_lock:
+                rows = conn.execute(sql, (last_id, *params, batch_size)).fetchall()
+        else:
+            rows = conn.execute(sql, (last_id, *params, batch_size)).fetchall()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield rows
+        if len(rows) < batch_size:
+            return
+
+
+def get_checkpoint(job: str, conn=None) -> int:
+    """Last qb_id `job` finished (0 = start from the beginning)."""
+    sql = "SELECT last_id FROM job_checkpoints WHERE job=?"
+    try:
+        if conn is not None:
+            row = conn.execute(sql, (job,)).fetchone()
+        else:
+            conn = _bank_conn()
+            with _bank_lock:
+                row = conn.execute(sql, (job,)).fetchone()
+    except sqlite3.OperationalError:
+        return 0   # job_checkpoints not created yet
+    return row[0] if row else 0
+
+
+def save_checkpoint(job: str, last_id: int, conn=None):
+    """
+    Record that `job` is done up to `last_id`. Pass `conn` to save inside the
+    caller's open transaction with the batch it covers (caller commits).
+    """
+    _checkpoint_write("""
+        INSERT INTO job_checkpoints (job, last_id, updated_at) VALUES (?, ?, datetime('now'))
+        ON CONFLICT(job) DO UPDATE SET last_id=excluded.last_id, updated_at=excluded.updated_at
+    """, (job, last_id), conn)
+
+
+def clear_checkpoint(job: str, conn=None):
+    """Forget `job`'s position once it has run to completion."""
+    _checkpoint_write("DELETE FROM job_checkpoints WHERE job=?", (job,), conn)
+
+
+def _checkpoint_write(sql: str, params: tuple, conn=None):
+    if conn is not None:
+        _ensure_job_checkpoints(conn)
+        conn.execute(sql, params)
+        return
+    conn = _bank_conn()
+    with _bank_lock:
+        try:
+            _ensure_job_checkpoints(conn)
+            conn.execute(sql, params)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"job checkpoint error: {e}")
+
+
 # ─── RECYCLING SYSTEM ─────────────────────────────────────────────────────────
 
 def init_recycling_tables():
@@ -769,6 +1214,115 @@ def add_to_recycle_pool(user_id: int, qb_id: int, subject: str,
             return False
 
 
+
+def add_many_to_recycle_pool(user_id: int, items: List[Tuple[int, str]],
+                             source: str = "deleted_exam") -> int:
+    """
+    Add (qb_id, subject) pairs to this user's recycle pool in one transaction.
+    Returns how many were newly added.
+    """
+    if not items:
+        return 0
+    conn = _bank_conn()
+    uid = str(user_id)
+    with _bank_lock:
+        conn.execute("BEGIN")
+        try:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO exam_recycle_pool
+                    (user_id, qb_id, subject, source, is_available)
+                VALUES (?,?,?,?,1)
+            """, [(uid, qb_id, subject, source) for qb_id, subject in items])
+            added = conn.total_changes - before
+            conn.commit()
+            return added
+        except Exception as e:
+            conn.rollback()
+            print(f"add_many_to_recycle_pool error: {e}")
+            return 0
+
+
+_RECYCLE_SEEN_SQL = """
+    INSERT OR IGNORE INTO exam_recycle_pool (user_id, qb_id, subject, source, is_available)
+    SELECT ?, qb_id, subject, ?, 1 FROM student_q_history
+    WHERE user_id=? AND subject=?
+"""
+
+
+def recycle_seen_questions(user_id: int, subjects: Optional[List[str]] = None,
+                           source: str = "manual_recycle") -> Dict[str, int]:
+    """
+    Copy everything this user has seen into their recycle pool — one
+    INSERT OR IGNORE ... SELECT per subject, all in a single transaction.
+    `subjects=None` means every subject in their history.
+    Returns {subject: newly added count}.
+    """
+    conn = _bank_conn()
+    uid = str(user_id)
+    added = {}
+    with _bank_lock:
+        if subjects is None:
+            subjects = [r[0] for r in conn.execute(
+                "SELECT DISTINCT subject FROM student_q_history WHERE user_id=?", (uid,)
+            ).fetchall()]
+        conn.execute("BEGIN")
+        try:
+            for subj in subjects:
+                before = conn.total_changes
+                conn.execute(_RECYCLE_SEEN_SQL, (uid, source, uid, subj))
+                added[subj] = conn.total_changes - before
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"recycle_seen_questions error: {e}")
+            return {}
+    return added
+
+
+def recycle_seen_questions_iter(user_id: int, subjects: Optional[List[str]] = None,
+                                source: str = "manual_recycle", chunk_size: int = 5000):
+    """
+    Streaming variant of recycle_seen_questions for very large histories.
+    Walks student_q_history by history_id in chunks, one short transaction
+    per chunk, so the lock is released between chunks. Yields
+    (subject, done, total, added) after each chunk.
+    """
+    conn = _bank_conn()
+    uid = str(user_id)
+    with _bank_lock:
+        totals = dict(conn.execute(
+            "SELECT subject, COUNT(*) FROM student_q_history WHERE user_id=? GROUP BY subject", (uid,)
+        ).fetchall())
+    for subj in (subjects if subjects is not None else list(totals)):
+        total = totals.get(subj, 0)
+        done = added = 0
+        last_id = 0
+        while True:
+            with _bank_lock:
+                row = conn.execute("""
+                    SELECT MAX(history_id), COUNT(*) FROM (
+                        SELECT history_id FROM student_q_history
+                        WHERE user_id=? AND subject=? AND history_id>?
+                        ORDER BY history_id LIMIT ?)
+                """, (uid, subj, last_id, chunk_size)).fetchone()
+                if not row[1]:
+                    break
+                conn.execute("BEGIN")
+                try:
+                    before = conn.total_changes
+                    conn.execute(_RECYCLE_SEEN_SQL + " AND history_id>? AND history_id<=?",
+                                 (uid, source, uid, subj, last_id, row[0]))
+                    added += conn.total_changes - before
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    print(f"recycle_seen_questions_iter error: {e}")
+                    return
+            last_id = row[0]; done += row[1]
+            yield subj, done, total, added
+
+
 def get_recycle_stats(user_id: int) -> Dict:
     """Get recycling statistics for a user."""
     conn = _bank_conn()
@@ -824,3 +1378,285 @@ def get_questions_smart(subject: str, count: int, user_id: int,
         random.shuffle(qs)
 
     return qs[:count]
+
+
+# ─── BATCHED BACKGROUND WRITER ────────────────────────────────────────────────
+
+class _BatchWriter:
+    """
+    One long-lived daemon thread that coalesces keyed writes and commits them
+    in small batches. Later puts for the same key replace earlier ones, so a
+    burst of clicks on one question costs a single row write. A batch that
+    keeps failing is retried max_retries times, then written key by key so
+    only the keys that still fail are logged and dropped.
+    """
+
+    def __init__(self, name: str, write_fn, max_batch: int = 500, max_delay: float = 0.05,
+                 max_retries: int = 3, retry_delay: float = 0.5):
+        self.name = name
+        self._write_fn = write_fn          # write_fn(conn, [(key, value), ...]) inside a transaction
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._pending: Dict = {}
+        self._tries: Dict = {}             # key -> failed attempts of the value queued for it
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def put(self, key, value):
+        with self._cond:
+            self._pending.pop(key, None)   # re-insert so the newest write goes last
+            self._pending[key] = value
+            self._tries.pop(key, None)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far is committed. Returns False on timeout."""
+        deadline = time.time() + timeout
+        with self._cond:
+            while self._pending or self._in_flight:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._cond.notify_all()
+                self._cond.wait(remaining)
+        return True
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Give rapid follow-up writes a moment to coalesce
+                if len(self._pending) < self._max_batch:
+                    self._cond.wait(self._max_delay)
+                keys = list(self._pending)[:self._max_batch]
+                batch = [(k, self._pending.pop(k)) for k in keys]
+                self._in_flight = len(batch)
+            try:
+                self._commit(batch)
+                with self._cond:
+                    for k, _ in batch:
+                        self._tries.pop(k, None)
+            except Exception as e:
+                with self._cond:
+                    tries = 1 + max(self._tries.pop(k, 0) for k, _ in batch)
+                if tries < self._max_retries:
+                    print(f"{self.name} write error (try {tries}/{self._max_retries}): {e}")
+                    with self._cond:
+                        for k, v in batch:    # keep newer writes queued meanwhile
+                            if k not in self._pending:
+                                self._pending[k] = v
+                                self._tries[k] = tries
+                    time.sleep(self._retry_delay)
+                else:
+                    self._commit_each(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def _commit(self, batch):
+        conn = _bank_conn()
+        with _bank_lock:
+            conn.execute("BEGIN")
+            try:
+                self._write_fn(conn, batch)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _commit_each(self, batch):
+        """Redo a batch that keeps failing one key at a time; drop the keys that still fail."""
+        for k, v in batch:
+            try:
+                self._commit([(k, v)])
+            except Exception as e:
+                print(f"{self.name}: dropped write for {k!r} after {self._max_retries} tries: {e}")
+
+
+# ─── DURABLE EXAM SESSIONS ────────────────────────────────────────────────────
+# The live exam lives in bank_exam_sessions / bank_session_questions /
+# bank_responses so a worker restart, redeploy or reconnect to another replica
+# can resume it. Small deltas go through _session_writer; only session creation
+# and close are synchronous.
+
+def _write_session_deltas(conn, batch):
+    responses, positions = [], []
+    for key, value in batch:
+        if key[0] == "resp":
+            responses.append(value)
+        else:
+            positions.append(value)
+    if responses:
+        conn.executemany("""
+            INSERT OR REPLACE INTO bank_responses
+                (session_id, qb_id, selected_answer, marked_review, is_visited, answered_at)
+            VALUES (?,?,?,?,?,?)
+        """, responses)
+    if positions:
+        conn.executemany("""
+            UPDATE bank_exam_sessions SET current_idx=?, language=?
+            WHERE session_id=? AND status='in_progress'
+        """, positions)
+
+
+_session_writer = _BatchWriter("bank-session-writer", _write_session_deltas)
+
+
+def _get_or_create_bank_exam(conn, exam_type: str, subjects: List[str],
+                             q_per_subject: int, duration_mins: int) -> int:
+    row = conn.execute(
+        "SELECT bank_exam_id FROM bank_exams WHERE exam_name=? AND exam_type=?",
+        (exam_type, exam_type)
+    ).fetchone()
+    if row:
+        return row[0]
+    cur = conn.execute("""
+        INSERT INTO bank_exams (exam_name, exam_type, subjects, q_per_subject, duration_mins)
+        VALUES (?,?,?,?,?)
+    """, (exam_type, exam_type, json.dumps(subjects), q_per_subject, duration_mins))
+    return cur.lastrowid
+
+
+def create_exam_session(user_id: int, exam_type: str, language: str,
+                        questions: List[Dict], duration_secs: int,
+                        started_epoch: float = None) -> Optional[int]:
+    """
+    Persist a freshly drawn exam. Any older in-progress session of this user
+    is marked 'abandoned'. Returns the new session_id (None on failure).
+    """
+    conn = _bank_conn()
+    started_epoch = started_epoch or time.time()
+    subjects = list(dict.fromkeys(q.get("_subject", q.get("subject", "")) for q in questions))
+    with _bank_lock:
+        conn.execute("BEGIN")
+        try:
+            conn.execute("""
+                UPDATE bank_exam_sessions SET status='abandoned', end_time=CURRENT_TIMESTAMP
+                WHERE user_id=? AND status='in_progress'
+            """, (user_id,))
+            bank_exam_id = _get_or_create_bank_exam(
+                conn, exam_type, subjects, len(questions), duration_secs // 60)
+            cur = conn.execute("""
+                INSERT INTO bank_exam_sessions
+                    (bank_exam_id, user_id, language, status, exam_type,
+                     started_epoch, duration_secs, current_idx)
+                VALUES (?,?,?,'in_progress',?,?,?,0)
+            """, (bank_exam_id, user_id, language, exam_type, started_epoch, duration_secs))
+            sid = cur.lastrowid
+            conn.executemany("""
+                INSERT OR IGNORE INTO bank_session_questions (session_id, qb_id, seq_num, from_recycle)
+                VALUES (?,?,?,?)
+            """, [(sid, q["qb_id"], seq, 1 if q.get("_from_recycle") else 0)
+                  for seq, q in enumerate(questions)])
+            conn.commit()
+            return sid
+        except Exception as e:
+            conn.rollback()
+            print(f"create_exam_session error: {e}")
+            return None
+
+
+def record_session_response(session_id: int, qb_id: int, selected_answer: Optional[str],
+                            marked_review: bool = False, is_visited: bool = True):
+    """Queue the full state of one question. Non-blocking; latest state per question wins."""
+    if not session_id:
+        return
+    _session_writer.put(
+        ("resp", session_id, qb_id),
+        (session_id, qb_id, selected_answer, 1 if marked_review else 0,
+         1 if is_visited else 0, datetime.now().isoformat()),
+    )
+
+
+def record_session_position(session_id: int, current_idx: int, language: str):
+    """Queue the current question index / language of a session. Non-blocking."""
+    if not session_id:
+        return
+    _session_writer.put(("pos", session_id), (current_idx, language, session_id))
+
+
+def flush_session_writes(timeout: float = 5.0) -> bool:
+    """Wait until queued session deltas are committed."""
+    return _session_writer.flush(timeout)
+
+
+def load_active_session(user_id: int) -> Optional[Dict]:
+    """
+    Return this user's in-progress exam (questions in original order, responses,
+    review/visited qb_ids) or None. Uses the (user_id, status) and session_id indexes.
+    """
+    conn = _bank_conn()
+    with _bank_lock:
+        sess = conn.execute("""
+            SELECT * FROM bank_exam_sessions
+            WHERE user_id=? AND status='in_progress'
+            ORDER BY session_id DESC LIMIT 1
+        """, (user_id,)).fetchone()
+        if not sess:
+            return None
+        sid = sess["session_id"]
+        q_rows = conn.execute("""
+            SELECT qb.*, sq.from_recycle AS _sq_from_recycle
+            FROM bank_session_questions sq
+            JOIN question_bank qb ON qb.qb_id = sq.qb_id
+            WHERE sq.session_id=?
+            ORDER BY sq.seq_num
+        """, (sid,)).fetchall()
+        r_rows = conn.execute("""
+            SELECT qb_id, selected_answer, marked_review, is_visited
+            FROM bank_responses WHERE session_id=?
+        """, (sid,)).fetchall()
+
+    questions = []
+    for r in q_rows:
+        d = dict(r)
+        if d.pop("_sq_from_recycle", 0):
+            d["_from_recycle"] = True
+        d["_subject"] = d.get("subject", "")
+        questions.append(d)
+    return {
+        "session_id": sid,
+        "exam_type": sess["exam_type"],
+        "language": sess["language"] or "en",
+        "started_epoch": sess["started_epoch"] or time.time(),
+        "duration_secs": sess["duration_secs"] or 0,
+        "current_idx": sess["current_idx"] or 0,
+        "questions": questions,
+        "responses": {r["qb_id"]: r["selected_answer"] for r in r_rows if r["selected_answer"]},
+        "review_qb_ids": {r["qb_id"] for r in r_rows if r["marked_review"]},
+        "visited_qb_ids": {r["qb_id"] for r in r_rows if r["is_visited"]},
+    }
+
+
+def close_exam_session(session_id: int, status: str, total_score: float = 0,
+                       correct: int = 0, wrong: int = 0, unattempted: int = 0):
+    """Flush pending deltas, then mark the session submitted/deleted with its final score."""
+    if not session_id:
+        return
+    flush_session_writes()
+    conn = _bank_conn()
+    with _bank_lock:
+        conn.execute("BEGIN")
+        try:
+            conn.execute("""
+                UPDATE bank_exam_sessions
+                SET status=?, end_time=CURRENT_TIMESTAMP, total_score=?,
+                    correct_count=?, wrong_count=?, unattempted=?
+                WHERE session_id=? AND status='in_progress'
+            """, (status, total_score, correct, wrong, unattempted, session_id))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"close_exam_session error: {e}")
@@ -0,0 +1,351 @@
+"""
+question_registry.py — Every question generator in one place
+=============================================================
+Questions come from six families of generators, each with its own record
+shape and insert path:
+
+  seed_multilingual   generate_*_multilingual   q/options in all 8 languages
+  seeds               question_seeds/*_questions.generate_all_*
+  question_expander   question_seeds/question_expander.expand_*
+  mega_expander       question_seeds/mega_expander.expand_*
+  generate_100k       gen_*                     q() records
+  push_100k           push_*                    mk() short-key records
+
+REGISTRY lists them all as GeneratorSpec entries declaring the subject,
+the expected yield and the topics covered. produce() turns any family's
+output into one canonical record: a dict keyed by RECORD_COLUMNS, the
+question_bank columns a generator can fill.
+
+rebuild() runs the whole registry (or part of it) through
+generation_runner: generators in a process pool, one writer in this
+process, one dedup set shared by every generator and the bank (the unique
+index's key, see question_bank_db.question_key), chunked executemany
+inserts. Every generator gets a fixed random seed, so the same registry
+gives the same bank: run it against an empty file with --db to rebuild.
+The multilingual family goes first so its translated copies win over
+English-only duplicates.
+Afterwards it installs the parametric templates (question_templates) that
+replace generate_100k's kinematics, laws-of-motion and energy loops; their
+rows are created only when an exam draws them.
+
+Usage:
+    python question_registry.py --list
+    python question_registry.py                          # everything into question_bank.db
+    python question_registry.py --db fresh.db --bulk-load
+    python question_registry.py --only push_100k,mega_expander:Physics --workers 1
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import functools
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import question_bank_db
+from question_bank_db import (
+    _bank_conn, init_bank, bulk_load_mode, BulkLoad, lang_columns, TRANSLATED_LANGS,
+)
+from generation_runner import run_generators, insert_questions, format_timings
+from question_templates import install_builtin_templates
+import generate_100k
+import push_100k
+import seed_multilingual
+from question_seeds import (
+    physics_questions, chemistry_questions, maths_questions, biology_cuet_questions,
+    question_expander, mega_expander,
+)
+
+# ── canonical record ──────────────────────────────────────────────────────────
+# subject and question_en first and sixth: insert_questions' loader reads them there
+BASE_COLUMNS = (
+    "subject", "exam_type", "topic", "subtopic", "difficulty",
+    "question_en", "option_a_en", "option_b_en", "option_c_en", "option_d_en",
+    "correct_answer", "marks_correct", "marks_wrong", "explanation_en",
+)
+RECORD_COLUMNS = BASE_COLUMNS + ("translated_langs",) + tuple(
+    c for lang in TRANSLATED_LANGS for c in lang_columns(lang))
+INSERT_SQL = (f"INSERT OR IGNORE INTO question_bank ({', '.join(RECORD_COLUMNS)}) "
+              f"VALUES ({', '.join('?' * len(RECORD_COLUMNS))})")
+
+_DEFAULTS = {"topic": "", "subtopic": "", "difficulty": "medium", "explanation_en": "",
+             "marks_correct": 4.0, "marks_wrong": -1.0, "translated_langs": "[]"}
+# push_100k.mk() keys
+_SHORT_KEYS = {"s": "subject", "e": "exam_type", "t": "topic", "st": "subtopic", "d": "difficulty",
+               "q": "question_en", "a": "option_a_en", "b": "option_b_en", "c": "option_c_en",
+               "dopt": "option_d_en", "ans": "correct_answer", "exp": "explanation_en"}
+_TEXT_COLUMNS = ("question_en", "option_a_en", "option_b_en", "option_c_en", "option_d_en")
+
+
+def canonical(rec: Dict) -> Dict:
+    """Any family's record → {column: value} over RECORD_COLUMNS (missing translations None)."""
+    if "question_en" not in rec:
+        rec = {_SHORT_KEYS.get(k, k): v for k, v in rec.items()}
+    out = {c: rec.get(c, _DEFAULTS.get(c)) for c in RECORD_COLUMNS}
+    for c in _TEXT_COLUMNS:
+        out[c] = str(out[c])
+    out["question_en"] = out["question_en"].strip()
+    return out
+
+
+def to_row(rec: Dict) -> tuple:
+    return tuple(rec[c] for c in RECORD_COLUMNS)
+
+
+# ── registry ──────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    family: str
+    subject: str
+    fn: Callable[[], Iterable[Dict]]    # module-level, so a spawned worker can import it
+    est_yield: int                      # records per run, before any dedup
+    topics: Tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return f"{self.family}:{self.subject}"
+
+
+REGISTRY: List[GeneratorSpec] = [
+    # seed_multilingual
+    GeneratorSpec("seed_multilingual", "Physics", seed_multilingual.generate_physics_multilingual, 130,
+                  ("Laws of Motion", "Kinematics", "Current Electricity", "Work, Energy and Power",
+                   "Concepts")),
+    GeneratorSpec("seed_multilingual", "Chemistry", seed_multilingual.generate_chemistry_multilingual, 110,
+                  ("Mole Concept", "Ionic Equilibrium", "Periodicity", "Chemical Reactions")),
+    GeneratorSpec("seed_multilingual", "Mathematics", seed_multilingual.generate_maths_multilingual, 80,
+                  ("Algebra", "Sequences and Series", "Geometry")),
+    GeneratorSpec("seed_multilingual", "Biology", seed_multilingual.generate_biology_multilingual, 20,
+                  ("Genetics", "Ecology")),
+    GeneratorSpec("seed_multilingual", "CUET_GK", seed_multilingual.generate_cuet_gk_multilingual, 200,
+                  ("General Knowledge", "History")),
+    GeneratorSpec("seed_multilingual", "CUET_English", seed_multilingual.generate_cuet_english_multilingual, 240,
+                  ("Vocabulary", "Grammar")),
+    GeneratorSpec("seed_multilingual", "CUET_Reasoning", seed_multilingual.generate_cuet_reasoning_multilingual, 240,
+                  ("Number Series", "Analogies")),
+    GeneratorSpec("seed_multilingual", "CUET_Quantitative", seed_multilingual.generate_cuet_quant_multilingual, 520,
+                  ("Percentages", "Simple Interest")),
+    # seeds
+    GeneratorSpec("seeds", "Physics", physics_questions.generate_all_physics_questions, 610,
+                  ("Kinematics", "Laws of Motion", "Work, Energy and Power", "Gravitation",
+                   "Thermal Properties", "Thermodynamics", "Electrostatics", "Current Electricity",
+                   "Ray Optics", "Wave Optics", "Dual Nature", "Atoms", "Nuclei",
+                   "Semiconductor Electronics", "Magnetism", "Waves", "Electromagnetic Induction",
+                   "Alternating Current", "Oscillations", "Modern Physics", "Rotational Motion",
+                   "Electromagnetic Waves", "Mechanics", "Fluid Mechanics")),
+    GeneratorSpec("seeds", "Chemistry", chemistry_questions.generate_all_chemistry_questions, 300,
+                  ("Atomic Structure", "Chemical Bonding", "States of Matter",
+                   "Chemical Equilibrium", "Electrochemistry", "Organic Chemistry",
+                   "Inorganic Chemistry", "Thermodynamics", "Chemical Kinetics", "Solutions",
+                   "Stoichiometry", "Coordination Chemistry", "Spectroscopy", "Ionic Equilibrium")),
+    GeneratorSpec("seeds", "Mathematics", maths_questions.generate_all_maths_questions, 420,
+                  ("Algebra", "Calculus", "Trigonometry", "Coordinate Geometry", "Statistics",
+                   "Probability", "Matrices", "Vectors")),
+    GeneratorSpec("seeds", "Biology", biology_cuet_questions.generate_all_biology_questions, 120,
+                  ("Cell Biology", "Genetics", "Molecular Biology", "Ecology", "Human Physiology",
+                   "Plant Biology", "Evolution", "Biotechnology", "Human Disease", "Biochemistry")),
+    GeneratorSpec("seeds", "CUET_GK", biology_cuet_questions.generate_all_gk_questions, 90,
+                  ("History", "Geography", "Science", "Polity", "Economy", "Awards", "Culture")),
+    GeneratorSpec("seeds", "CUET_English", biology_cuet_questions.generate_all_english_questions, 80,
+                  ("Grammar", "Vocabulary", "Reading")),
+    GeneratorSpec("seeds", "CUET_Reasoning", biology_cuet_questions.generate_all_reasoning_questions, 70,
+                  ("Reasoning",)),
+    GeneratorSpec("seeds", "CUET_Quantitative", biology_cuet_questions.generate_all_quantitative_questions, 70,
+                  ("Arithmetic", "Geometry")),
+    # question_expander
+    GeneratorSpec("question_expander", "Physics", question_expander.expand_physics, 170,
+                  ("Oscillations", "Waves", "Rotational Motion", "Fluid Mechanics", "Modern Physics",
+                   "Electromagnetic Induction", "Thermodynamics", "Optics")),
+    GeneratorSpec("question_expander", "Chemistry", question_expander.expand_chemistry, 130,
+                  ("Inorganic Chemistry", "Physical Chemistry", "Organic Chemistry")),
+    GeneratorSpec("question_expander", "Mathematics", question_expander.expand_mathematics, 150,
+                  ("Algebra", "Calculus", "Matrices and Determinants", "Statistics",
+                   "Coordinate Geometry", "Trigonometry")),
+    GeneratorSpec("question_expander", "Biology", question_expander.expand_biology, 60,
+                  ("Plant Biology", "Human Physiology", "Genetics", "Ecology")),
+    GeneratorSpec("question_expander", "CUET_GK", question_expander.expand_gk, 100,
+                  ("Geography", "Polity", "Sports", "Science")),
+    GeneratorSpec("question_expander", "CUET_English", question_expander.expand_english, 110,
+                  ("Vocabulary", "Grammar")),
+    GeneratorSpec("question_expander", "CUET_Reasoning", question_expander.expand_reasoning, 60,
+                  ("Reasoning",)),
+    GeneratorSpec("question_expander", "CUET_Quantitative", question_expander.expand_quantitative, 80,
+                  ("Arithmetic", "Geometry", "Data Interpretation")),
+    # mega_expander
+    GeneratorSpec("mega_expander", "Physics", mega_expander.expand_physics, 160,
+                  ("Projectile Motion", "Circular Motion", "Gravitation", "Fluid Mechanics",
+                   "Oscillations", "Waves", "Electromagnetic Induction", "AC Circuits",
+                   "Modern Physics", "Nuclear Physics", "Semiconductors", "Communication")),
+    GeneratorSpec("mega_expander", "Chemistry", mega_expander.expand_chemistry, 80,
+                  ("Chemical Kinetics", "Electrochemistry", "Solutions", "Organic", "Coordination",
+                   "Mole Concept", "Thermodynamics", "p-Block", "d-Block", "Metallurgy")),
+    GeneratorSpec("mega_expander", "Mathematics", mega_expander.expand_mathematics, 110,
+                  ("Calculus", "Vectors", "3D Geometry", "Probability", "Permutations",
+                   "Combinations", "Sequences", "Complex Numbers")),
+    GeneratorSpec("mega_expander", "Biology", mega_expander.expand_biology, 80,
+                  ("Genetics", "Molecular Biology", "Ecology", "Human Physiology", "Plant Biology",
+                   "Biotechnology")),
+    GeneratorSpec("mega_expander", "CUET_GK", mega_expander.expand_cuet_gk, 80,
+                  ("History", "Geography", "Polity", "Science", "Economy")),
+    GeneratorSpec("mega_expander", "CUET_English", mega_expander.expand_cuet_english, 100,
+                  ("Vocabulary", "Grammar", "Reading Comprehension")),
+    GeneratorSpec("mega_expander", "CUET_Reasoning", mega_expander.expand_cuet_reasoning, 60,
+                  ("Series", "Analogies", "Coding", "Syllogism", "Arrangement", "Mathematical",
+                   "Blood Relations", "Direction Sense")),
+    GeneratorSpec("mega_expander", "CUET_Quantitative", mega_expander.expand_cuet_quantitative, 110,
+                  ("Percentages", "Profit/Loss", "Discount", "Interest", "Ratio", "Ages",
+                   "Speed/Distance", "Pipes", "Geometry", "Mensuration", "Number System")),
+    # generate_100k
+    GeneratorSpec("generate_100k", "Physics", generate_100k.gen_physics, 1_900,
+                  ("Work Energy", "Waves", "Electrostatics", "Current Electricity", "Magnetism",
+                   "Optics", "Thermodynamics", "Nuclear Physics", "Semiconductors",
+                   "Electromagnetic Induction")),
+    GeneratorSpec("generate_100k", "Chemistry", generate_100k.gen_chemistry, 1_000,
+                  ("Mole Concept", "Atomic Structure", "Chemical Bonding", "Chemical Equilibrium",
+                   "Ionic Equilibrium", "Electrochemistry", "Organic Chemistry", "Thermochemistry")),
+    GeneratorSpec("generate_100k", "Biology", generate_100k.gen_biology, 100,
+                  ("Cell Biology", "Genetics", "Molecular Biology", "Human Physiology", "Evolution",
+                   "Plant Biology", "Ecology")),
+    GeneratorSpec("generate_100k", "Mathematics", generate_100k.gen_mathematics, 890,
+                  ("Algebra", "Sequences", "Trigonometry", "Calculus", "Probability",
+                   "Coordinate Geometry", "Matrices")),
+    GeneratorSpec("generate_100k", "CUET_GK", generate_100k.gen_cuet_gk, 120,
+                  ("History", "Polity", "Geography", "Awards", "Economy")),
+    GeneratorSpec("generate_100k", "CUET_English", generate_100k.gen_cuet_english, 90,
+                  ("Vocabulary", "Grammar")),
+    GeneratorSpec("generate_100k", "CUET_Reasoning", generate_100k.gen_cuet_reasoning, 270,
+                  ("Number Series", "Coding", "Blood Relations", "Direction Sense", "Syllogism",
+                   "Calendar")),
+    GeneratorSpec("generate_100k", "CUET_Quantitative", generate_100k.gen_cuet_quantitative, 3_600,
+                  ("Percentages", "Simple Interest", "Compound Interest", "Profit/Loss", "Ratio",
+                   "Speed/Distance", "Ages", "Mensuration")),
+    # push_100k
+    GeneratorSpec("push_100k", "Physics", push_100k.push_physics, 2_300,
+                  ("Waves", "Electrostatics", "Electromagnetic Induction", "Dual Nature",
+                   "Gravitation")),
+    GeneratorSpec("push_100k", "Chemistry", push_100k.push_chemistry, 8_600,
+                  ("Thermochemistry", "Mole Concept", "Electrochemistry", "Organic Chemistry",
+                   "Nuclear Chemistry")),
+    GeneratorSpec("push_100k", "Biology", push_100k.push_biology, 2_000,
+                  ("Genetics", "Biochemistry", "Plant Biology")),
+    GeneratorSpec("push_100k", "Mathematics", push_100k.push_mathematics, 370,
+                  ("Calculus", "Matrices", "Probability")),
+    GeneratorSpec("push_100k", "CUET_GK", push_100k.push_gk, 90,
+                  ("Geography", "History", "Science")),
+    GeneratorSpec("push_100k", "CUET_English", push_100k.push_english, 50,
+                  ("Grammar", "Vocabulary", "Reading Comprehension")),
+    GeneratorSpec("push_100k", "CUET_Reasoning", push_100k.push_reasoning, 2_200,
+                  ("Analogies", "Mathematical", "Arrangement")),
+    GeneratorSpec("push_100k", "CUET_Quantitative", push_100k.push_quantitative, 4_600,
+                  ("Number System", "Discount", "Arithmetic", "Speed/Distance", "Mensuration")),
+]
+_BY_NAME = {spec.name: spec for spec in REGISTRY}
+
+
+def select(only: Optional[Iterable[str]] = None) -> List[GeneratorSpec]:
+    """Registry entries matching `only` (families or family:subject names), in registry order."""
+    if not only:
+        return list(REGISTRY)
+    wanted = set(only)
+    unknown = wanted - set(_BY_NAME) - {s.family for s in REGISTRY}
+    if unknown:
+        raise ValueError(f"unknown generators: {', '.join(sorted(unknown))}")
+    return [s for s in REGISTRY if s.name in wanted or s.family in wanted]
+
+
+def produce(name: str) -> Iterator[Dict]:
+    """Run one registered generator with its own fixed seed → canonical records."""
+    spec = _BY_NAME[name]
+    random.seed(name)       # generators that don't seed themselves repeat too
+    for rec in spec.fn():
+        yield canonical(rec)
+
+
+# ── rebuild ───────────────────────────────────────────────────────────────────
+
+def rebuild(only: Optional[Iterable[str]] = None, workers: Optional[int] = None,
+            bulk_load: bool = False) -> Dict[str, Dict]:
+    """
+    Run the selected generators into the bank (INSERT OR IGNORE, so existing
+    questions stay) and print per-generator timings plus any drift from the
+    declared yield and topics. Returns generation_runner's timings.
+    """
+    specs = select(only)
+    init_bank()
+    conn = _bank_conn()
+    tasks = [(spec.name, functools.partial(produce, spec.name)) for spec in specs]
+    topics_seen: Dict[str, set] = {}
+    dedup = None
+
+    def write(name, records):
+        seen = topics_seen[name] = set()
+
+        def tap():
+            for rec in records:
+                seen.add(rec["topic"])
+                yield rec
+
+        stats = insert_questions(conn, tap(), to_row, loader=dedup, sql=INSERT_SQL)
+        for err in stats["errors"][:5]:
+            print(f"  ⚠️  {name}: insert error: {err}")
+        return stats["inserted"]
+
+    t0 = time.time()
+    # text_key=None: the shared dedup set below is the only dedup, keyed like the unique index
+    if bulk_load:
+        with bulk_load_mode(conn) as dedup:
+            timings = run_generators(tasks, write, workers, text_key=None)
+    else:
+        dedup = BulkLoad(conn)
+        dedup.load_keys()
+        timings = run_generators(tasks, write, workers, text_key=None)
+
+    print(format_timings(timings, time.time() - t0))
+    print(f"  {dedup.duplicates:,} duplicates dropped (within or across generators, or already in the bank)")
+    print(f"  {len(install_builtin_templates())} parametric templates installed (rows created when drawn)")
+    for spec in specs:
+        t = timings[spec.name]
+        if abs(t["generated"] - spec.est_yield) > max(10, spec.est_yield // 4):
+            print(f"  ⚠️  {spec.name}: generated {t['generated']:,}, declared ~{spec.est_yield:,}")
+        missing = set(spec.topics) - topics_seen[spec.name]
+        extra = topics_seen[spec.name] - set(spec.topics)
+        if missing or extra:
+            print(f"  ⚠️  {spec.name}: topics missing {sorted(missing)}, undeclared {sorted(extra)}")
+    return timings
+
+
+def print_registry():
+    print(f"  {'generator':<34}{'est':>8}  topics")
+    by_subject: Dict[str, int] = {}
+    for spec in REGISTRY:
+        by_subject[spec.subject] = by_subject.get(spec.subject, 0) + spec.est_yield
+        print(f"  {spec.name:<34}{spec.est_yield:>8,}  {len(spec.topics)}")
+    print()
+    for subject, n in by_subject.items():
+        print(f"  {subject:<34}{n:>8,}")
+    print(f"  {'total (before dedup)':<34}{sum(by_subject.values()):>8,}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Rebuild the question bank from every registered generator")
+    ap.add_argument("--list", action="store_true", help="show the registry and exit")
+    ap.add_argument("--only", default="", help="comma-separated families or family:subject names")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores; 1 = serial)")
+    ap.add_argument("--bulk-load", action="store_true", help="defer indexes, relax durability, lock the DB")
+    ap.add_argument("--db", default="", help="bank file to write (default: question_bank.db)")
+    args = ap.parse_args()
+    if args.list:
+        print_registry()
+        return
+    if args.db:
+        question_bank_db.BANK_DB_PATH = args.db     # before the first _bank_conn()
+    rebuild([n.strip() for n in args.only.split(",") if n.strip()], args.workers, args.bulk_load)
+
+
+if __name__ == "__main__":
+    main()
@@ -255,7 +255,6 @@ def expand_physics() -> List[Dict]:
     # Lens formula
     for u, f_lens in [(-30, 20), (-40, 10), (-20, 30), (-60, 15), (-100, 25),
                        (-50, 50), (-25, 100), (-15, 30), (-80, 20), (-45, 15)]:
-        v = 1 / (1/f_lens + 1/u)  # 1/v = 1/f - 1/u → wait, 1/v - 1/u = 1/f
         # 1/v = 1/f + 1/u
         try:
             v = 1 / (1/f_lens - 1/abs(u)) if u < 0 else 1/(1/f_lens - 1/u)
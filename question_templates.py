@@ -0,0 +1,768 @@
+"""
+question_templates.py — Lazy parametric question templates
+===========================================================
+Most of generate_100k is nested loops over numeric ranges, each iteration
+stored as a fully rendered question_bank row (plus its translated copies).
+Here a family like that is ONE row:
+
+  question_templates       stem / option / explanation text with {expr}
+                           fields, derived values, the parameter domain
+  question_template_i18n   the same texts translated, once per language
+  template_instances       instance key → question_bank row, for the
+                           instances an exam has drawn
+  template_seen            instances a student has seen outside an exam
+
+An instance is (template_id, parameter tuple). The domain is the product
+of the parameter value lists, last parameter fastest — the loop order — so
+each tuple has a fixed position, its index, and every instance a stable
+key "<template_id>:<index>" that maps back to the same parameters. pick()
+draws unseen keys, render() builds the question text (in any translated
+language) on demand.
+
+get_questions_for_exam draws from templates and stored rows alike. Only a
+drawn instance becomes a question_bank row (materialize()), so sessions,
+answers, history and recycling work on qb_ids as before, and the bank
+holds the instances someone was given rather than every loop iteration.
+
+{expr} fields and derived values are small arithmetic expressions over the
+parameters (round, abs, min, max and the usual math functions), checked
+and compiled once per template; rendering formats them like an f-string.
+A template's domain and formulas define what its keys mean, so they can't
+be changed in place — register a new name instead.
+
+Usage:
+    from question_templates import install_builtin_templates, pick, render, materialize
+    install_builtin_templates()
+    keys = pick(user_id, "Physics", 20)
+    questions = [render(k, "hi") for k in keys]     # or materialize(keys) for bank rows
+
+    python question_templates.py                  # install, check, time it
+    python question_templates.py --translate hi,ta
+"""
+
+import os
+import re
+import sys
+import ast
+import json
+import math
+import time
+import random
+import bisect
+import sqlite3
+import argparse
+import threading
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from question_bank_db import (
+    _bank_conn, _bank_lock, _ensure_bank_meta, bump_bank_generation, init_bank, TRANSLATED_LANGS,
+)
+
+# ── safe expressions ──────────────────────────────────────────────────────────
+
+_FUNCS = {
+    "round": round, "abs": abs, "min": min, "max": max, "int": int, "float": float,
+    "sqrt": math.sqrt, "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "radians": math.radians, "degrees": math.degrees, "log": math.log,
+    "log10": math.log10, "exp": math.exp, "pi": math.pi,
+}
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+if sys.version_info < (3, 8):
+    _ALLOWED_NODES += (ast.Num,)
+
+
+def _compile_expr(expr: str, names: Sequence[str]):
+    """Compile an arithmetic expression over `names`; ValueError for anything else."""
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"bad expression {expr!r}: {e}")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"{type(node).__name__} not allowed in {expr!r}")
+        if isinstance(node, ast.Name) and node.id not in names and node.id not in _FUNCS:
+            raise ValueError(f"unknown name {node.id!r} in {expr!r}")
+        if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name) and node.func.id in _FUNCS):
+            raise ValueError(f"only {', '.join(sorted(_FUNCS))} can be called in {expr!r}")
+    return compile(tree, "<template>", "eval")
+
+
+def _compile_text(text: str, names: Sequence[str]) -> List[tuple]:
+    """'Mass {m} kg, {round(f*1.3,2)} N' → [(literal, code or None, format spec), ...]."""
+    parts = []
+    for literal, field, spec, conv in Formatter().parse(text):
+        if conv:
+            raise ValueError(f"!{conv} conversions are not supported in {text!r}")
+        parts.append((literal, _compile_expr(field, names) if field is not None else None, spec or ""))
+    return parts
+
+
+def _render_text(parts: List[tuple], env: Dict) -> str:
+    out = []
+    for literal, code, spec in parts:
+        out.append(literal)
+        if code is not None:
+            out.append(format(eval(code, _GLOBALS, env), spec))
+    return "".join(out)
+
+
+_GLOBALS = {"__builtins__": {}, **_FUNCS}
+
+
+# ── templates ─────────────────────────────────────────────────────────────────
+
+class Template:
+    """One parametric family, compiled. Built from a question_templates row."""
+
+    def __init__(self, row: Dict, translations: Optional[Dict[str, Dict]] = None):
+        self.template_id = row["template_id"]
+        self.name = row["name"]
+        self.meta = {k: row[k] for k in ("subject", "exam_type", "topic", "subtopic", "difficulty",
+                                          "correct_answer", "marks_correct", "marks_wrong")}
+        self.domain: List[Tuple[str, list]] = [(n, list(v)) for n, v in json.loads(row["domain"])]
+        self.size = 1
+        for _, values in self.domain:
+            self.size *= len(values)
+        names = [n for n, _ in self.domain]
+        self.derived = []
+        for name, expr in json.loads(row["derived"]):
+            self.derived.append((name, _compile_expr(expr, names)))
+            names.append(name)
+        self.texts = {"en": self._compile_texts(row["stem_en"], json.loads(row["options_en"]),
+                                                row["explanation_en"] or "", names)}
+        for lang, tr in (translations or {}).items():
+            try:
+                self.texts[lang] = self._compile_texts(tr["stem"], json.loads(tr["options"]),
+                                                       tr["explanation"] or "", names)
+            except ValueError as e:
+                print(f"template {self.name} [{lang}]: {e} — using English")
+
+    @staticmethod
+    def _compile_texts(stem: str, options: List[str], explanation: str, names) -> Dict:
+        if len(options) != 4:
+            raise ValueError(f"a template needs 4 options, got {len(options)}")
+        return {"stem": _compile_text(stem, names),
+                "options": [_compile_text(o, names) for o in options],
+                "explanation": _compile_text(explanation, names)}
+
+    def params(self, index: int) -> Tuple:
+        """Parameter tuple at `index` (mixed radix, last parameter fastest)."""
+        if not 0 <= index < self.size:
+            raise IndexError(f"{self.name}: index {index} outside 0..{self.size - 1}")
+        out = []
+        for _, values in reversed(self.domain):
+            index, i = divmod(index, len(values))
+            out.append(values[i])
+        return tuple(reversed(out))
+
+    def index(self, params: Sequence) -> int:
+        """Inverse of params(); ValueError if a value isn't in its domain."""
+        index = 0
+        for (name, values), v in zip(self.domain, params):
+            try:
+                index = index * len(values) + values.index(v)
+            except ValueError:
+                raise ValueError(f"{self.name}: {name}={v!r} is not in the domain")
+        return index
+
+    def env(self, index: int) -> Dict:
+        env = dict(zip((n for n, _ in self.domain), self.params(index)))
+        for name, code in self.derived:
+            env[name] = eval(code, _GLOBALS, env)
+        return env
+
+    def render_texts(self, env: Dict, lang: str = "en") -> Tuple[str, List[str], str]:
+        t = self.texts.get(lang) or self.texts["en"]
+        return (_render_text(t["stem"], env).strip(),
+                [_render_text(o, env) for o in t["options"]],
+                _render_text(t["explanation"], env))
+
+
+def instance_key(template_id: int, index: int) -> str:
+    return f"{template_id}:{index}"
+
+
+def parse_key(key: str) -> Tuple[int, int]:
+    tid, _, index = key.partition(":")
+    return int(tid), int(index)
+
+
+# ── storage ───────────────────────────────────────────────────────────────────
+
+def ensure_template_tables(conn=None):
+    conn = conn or _bank_conn()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS question_templates (
+            template_id     INTEGER PRIMARY KEY AUTOINCREMENT,
+            name            TEXT NOT NULL UNIQUE,
+            subject         TEXT NOT NULL,
+            exam_type       TEXT NOT NULL,
+            topic           TEXT,
+            subtopic        TEXT,
+            difficulty      TEXT DEFAULT 'medium',
+            domain          TEXT NOT NULL,
+            derived         TEXT NOT NULL DEFAULT '[]',
+            stem_en         TEXT NOT NULL,
+            options_en      TEXT NOT NULL,
+            explanation_en  TEXT DEFAULT '',
+            correct_answer  TEXT NOT NULL DEFAULT 'A',
+            marks_correct   REAL DEFAULT 4.0,
+            marks_wrong     REAL DEFAULT -1.0,
+            size            INTEGER NOT NULL,
+            created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS question_template_i18n (
+            template_id     INTEGER NOT NULL,
+            lang            TEXT NOT NULL,
+            stem            TEXT NOT NULL,
+            options         TEXT NOT NULL,
+            explanation     TEXT DEFAULT '',
+            translated_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (template_id, lang)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS template_seen (
+            user_id         INTEGER NOT NULL,
+            instance_key    TEXT NOT NULL,
+            subject         TEXT NOT NULL,
+            seen_at         TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, instance_key)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_template_seen_subject ON template_seen(user_id, subject)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS template_instances (
+            instance_key    TEXT PRIMARY KEY,
+            qb_id           INTEGER NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_template_instances_qb ON template_instances(qb_id)")
+    _ensure_bank_meta(conn)
+
+
+def _bump_template_generation(conn):
+    """Mark the templates as changed, inside the caller's transaction."""
+    conn.execute("INSERT INTO bank_meta (key, value) VALUES ('templates', 1) "
+                 "ON CONFLICT(key) DO UPDATE SET value = value + 1")
+
+
+def _template_generation(conn) -> int:
+    try:
+        row = conn.execute("SELECT value FROM bank_meta WHERE key='templates'").fetchone()
+    except sqlite3.OperationalError:
+        return 0        # bank_meta not created yet
+    return row[0] if row else 0
+
+
+def save_template(spec: Dict) -> int:
+    """
+    Insert a template (see BUILTIN_TEMPLATES for the shape); returns its
+    template_id. Re-saving an identical spec is a no-op; a different domain
+    or different formulas under the same name raise ValueError.
+    """
+    domain = [[name, list(values)] for name, values in spec["domain"]]
+    derived = [list(d) for d in spec.get("derived", [])]
+    row = {
+        "name": spec["name"], "subject": spec["subject"], "exam_type": spec["exam_type"],
+        "topic": spec.get("topic", ""), "subtopic": spec.get("subtopic", ""),
+        "difficulty": spec.get("difficulty", "medium"),
+        "domain": json.dumps(domain), "derived": json.dumps(derived),
+        "stem_en": spec["stem"], "options_en": json.dumps(list(spec["options"]), ensure_ascii=False),
+        "explanation_en": spec.get("explanation", ""),
+        "correct_answer": spec.get("correct", "A"),
+        "marks_correct": spec.get("marks_correct", 4.0), "marks_wrong": spec.get("marks_wrong", -1.0),
+        "template_id": None,
+    }
+    row["size"] = Template(row).size          # compiles everything: bad specs fail here
+    conn = _bank_conn()
+    with _bank_lock:
+        ensure_template_tables(conn)
+        old = conn.execute("SELECT template_id, domain, derived, stem_en, options_en, explanation_en, "
+                           "correct_answer FROM question_templates WHERE name=?", (spec["name"],)).fetchone()
+        if old is not None:
+            if tuple(old)[1:] != (row["domain"], row["derived"], row["stem_en"], row["options_en"],
+                                  row["explanation_en"], row["correct_answer"]):
+                raise ValueError(f"template {spec['name']!r} already exists with a different definition; "
+                                 f"its instance keys would change meaning — use a new name")
+            return old[0]
+        cols = [c for c in row if c != "template_id"]
+        cur = conn.execute(f"INSERT INTO question_templates ({', '.join(cols)}) "
+                           f"VALUES ({', '.join('?' * len(cols))})", [row[c] for c in cols])
+        _bump_template_generation(conn)
+        conn.commit()
+        return cur.lastrowid
+
+
+_cache_lock = threading.Lock()
+_cache: Dict = {"generation": None, "templates": {}, "by_subject": {}}
+
+
+def _load_templates() -> Dict[int, Template]:
+    conn = _bank_conn()
+    with _bank_lock:
+        ensure_template_tables(conn)
+        rows = [dict(r) for r in conn.execute("SELECT * FROM question_templates ORDER BY template_id")]
+        trs = conn.execute("SELECT template_id, lang, stem, options, explanation FROM question_template_i18n")
+        translations: Dict[int, Dict] = {}
+        for tid, lang, stem, options, explanation in trs:
+            translations.setdefault(tid, {})[lang] = {"stem": stem, "options": options,
+                                                      "explanation": explanation}
+    return {r["template_id"]: Template(r, translations.get(r["template_id"])) for r in rows}
+
+
+def get_templates() -> Dict[int, Template]:
+    """Compiled templates by id, reloaded when a template or translation is saved."""
+    conn = _bank_conn()
+    with _bank_lock:
+        gen = _template_generation(conn)
+    with _cache_lock:
+        if _cache["generation"] == gen:
+            return _cache["templates"]
+    templates = _load_templates()
+    by_subject: Dict[str, Tuple[List[Template], List[int]]] = {}
+    for t in templates.values():
+        ts, cum = by_subject.setdefault(t.meta["subject"], ([], []))
+        ts.append(t)
+        cum.append((cum[-1] if cum else 0) + t.size)
+    with _cache_lock:
+        _cache.update(generation=gen, templates=templates, by_subject=by_subject)
+    return templates
+
+
+def template_count(subject: str, difficulty: Optional[str] = None) -> int:
+    """Instances available for `subject` (and `difficulty`) across all its templates."""
+    get_templates()
+    templates, _ = _cache["by_subject"].get(subject, ([], []))
+    return sum(t.size for t in templates if difficulty is None or t.meta["difficulty"] == difficulty)
+
+
+# ── selection, rendering, seen-tracking ───────────────────────────────────────
+
+def _seen_indices(user_id: int, subject: str, ids) -> Dict[int, List[int]]:
+    """{template_id: sorted indices} of `ids`' instances the user has seen — marked
+    with mark_seen() or drawn into an exam (student_q_history)."""
+    conn = _bank_conn()
+    with _bank_lock:        # tables exist: get_templates() created them
+        rows = conn.execute("""
+            SELECT instance_key FROM template_seen WHERE user_id=? AND subject=?
+            UNION ALL
+            SELECT ti.instance_key FROM template_instances ti
+            JOIN student_q_history h ON h.qb_id = ti.qb_id
+            WHERE h.user_id=? AND h.subject=?
+        """, (user_id, subject, user_id, subject)).fetchall()
+    seen: Dict[int, set] = {}
+    for (key,) in rows:
+        tid, index = parse_key(key)
+        if tid in ids:
+            seen.setdefault(tid, set()).add(index)
+    return {tid: sorted(v) for tid, v in seen.items()}
+
+
+def pick(user_id: int, subject: str, count: int, rng: Optional[random.Random] = None,
+         difficulty: Optional[str] = None) -> List[str]:
+    """
+    Up to `count` distinct instance keys of `subject` (and `difficulty`, if
+    given) that `user_id` hasn't seen, uniform over the unseen instances.
+    Fewer come back only when the unseen instances run out.
+
+    While most instances are unseen, keys are drawn at random and redrawn on
+    a hit. Once the unseen share is small (or the draws run out), ranks are
+    sampled among the unseen instances and mapped to indices through each
+    template's sorted seen indices — no instance list is built.
+    """
+    rng = rng or random
+    get_templates()
+    templates, cum = _cache["by_subject"].get(subject, ([], []))
+    if difficulty:
+        templates = [t for t in templates if t.meta["difficulty"] == difficulty]
+        cum = []
+        for t in templates:
+            cum.append((cum[-1] if cum else 0) + t.size)
+    if not templates or count <= 0:
+        return []
+    total = cum[-1]
+    seen = _seen_indices(user_id, subject, {t.template_id for t in templates})
+    unseen = total - sum(len(v) for v in seen.values())
+    out: List[str] = []
+    if unseen >= 2 * count and 2 * unseen >= total:
+        seen_keys = {instance_key(tid, i) for tid, v in seen.items() for i in v}
+        for _ in range(count * 20):
+            if len(out) >= count:
+                return out
+            i = rng.randrange(total)
+            k = bisect.bisect_right(cum, i)
+            key = instance_key(templates[k].template_id, i - (cum[k - 1] if k else 0))
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            out.append(key)
+        for key in out:         # drawn keys count as seen for the rest
+            tid, index = parse_key(key)
+            bisect.insort(seen.setdefault(tid, []), index)
+        unseen -= len(out)
+
+    # per template: d[j] = seen[j] - j, so unseen rank r sits at index r + bisect_right(d, r)
+    gaps, ucum = [], []
+    for t in templates:
+        s = seen.get(t.template_id, [])
+        gaps.append([v - j for j, v in enumerate(s)])
+        ucum.append((ucum[-1] if ucum else 0) + t.size - len(s))
+    for r in rng.sample(range(unseen), min(count - len(out), unseen)):
+        k = bisect.bisect_right(ucum, r)
+        r -= ucum[k - 1] if k else 0
+        out.append(instance_key(templates[k].template_id, r + bisect.bisect_right(gaps[k], r)))
+    return out
+
+
+def render(key: str, lang: str = "en") -> Optional[Dict]:
+    """
+    The question for an instance key, shaped like a question_bank row
+    (question_en, option_a_en, ..., plus question_<lang>, ... when lang
+    isn't English; untranslated templates fall back to English).
+    """
+    tid, index = parse_key(key)
+    t = get_templates().get(tid)
+    if t is None:
+        return None
+    env = t.env(index)
+    stem, options, explanation = t.render_texts(env)
+    q = {"instance_key": key, "template_id": tid, **t.meta,
+         "question_en": stem, "explanation_en": explanation}
+    for letter, text in zip("abcd", options):
+        q[f"option_{letter}_en"] = text
+    if lang != "en":
+        stem, options, explanation = t.render_texts(env, lang)
+        q[f"question_{lang}"] = stem
+        q[f"explanation_{lang}"] = explanation
+        for letter, text in zip("abcd", options):
+            q[f"option_{letter}_{lang}"] = text
+    return q
+
+
+def materialize(keys: List[str]) -> List[Dict]:
+    """
+    question_bank rows (as dicts, in key order) for instance keys. An
+    instance not stored yet is rendered — English plus every language its
+    template is translated into — and inserted; one whose text is already
+    in the bank maps to that row. Unknown keys are skipped.
+    """
+    templates = get_templates()
+    keys = [k for k in dict.fromkeys(keys) if parse_key(k)[0] in templates]
+    if not keys:
+        return []
+    conn = _bank_conn()
+    marks = ",".join("?" * len(keys))
+    with _bank_lock:
+        qb_ids = dict(conn.execute(
+            f"SELECT instance_key, qb_id FROM template_instances WHERE instance_key IN ({marks})", keys))
+    new = [(k, _bank_row(k, templates[parse_key(k)[0]])) for k in keys if k not in qb_ids]
+    with _bank_lock:
+        if new:
+            try:
+                conn.execute("BEGIN")
+                inserted = False
+                for key, row in new:
+                    cols = list(row)
+                    cur = conn.execute(f"INSERT OR IGNORE INTO question_bank ({', '.join(cols)}) "
+                                       f"VALUES ({', '.join('?' * len(cols))})", [row[c] for c in cols])
+                    inserted = inserted or cur.rowcount > 0
+                    qb_id = conn.execute(
+                        "SELECT qb_id FROM question_bank WHERE subject=? AND LOWER(TRIM(question_en))=?",
+                        (row["subject"], row["question_en"].strip().lower())).fetchone()[0]
+                    conn.execute("INSERT OR IGNORE INTO template_instances (instance_key, qb_id) VALUES (?,?)",
+                                 (key, qb_id))
+                    qb_ids[key] = qb_id
+                if inserted:
+                    bump_bank_generation(conn)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"template materialize error: {e}")
+                return []
+        ids = [qb_ids[k] for k in keys]
+        rows = {r["qb_id"]: dict(r) for r in conn.execute(
+            f"SELECT * FROM question_bank WHERE qb_id IN ({','.join('?' * len(ids))})", ids)}
+    return [rows[i] for i in ids if i in rows]
+
+
+def _bank_row(key: str, t: Template) -> Dict:
+    q = render(key)
+    row = {c: q[c] for c in ("subject", "exam_type", "topic", "subtopic", "difficulty", "question_en",
+                             "option_a_en", "option_b_en", "option_c_en", "option_d_en",
+                             "correct_answer", "marks_correct", "marks_wrong", "explanation_en")}
+    langs = [l for l in TRANSLATED_LANGS if l in t.texts]
+    for lang in langs:
+        q = render(key, lang)
+        for f in ("question", "option_a", "option_b", "option_c", "option_d", "explanation"):
+            row[f"{f}_{lang}"] = q[f"{f}_{lang}"]
+    row["translated_langs"] = json.dumps(langs)
+    return row
+
+
+def mark_seen(user_id: int, keys: List[str]):
+    """Record that `user_id` has seen these instances (exam draws are tracked through student_q_history)."""
+    templates = get_templates()
+    rows = []
+    for key in keys:
+        t = templates.get(parse_key(key)[0])
+        if t is not None:
+            rows.append((user_id, key, t.meta["subject"]))
+    conn = _bank_conn()
+    with _bank_lock:
+        try:
+            conn.executemany("INSERT OR IGNORE INTO template_seen (user_id, instance_key, subject) "
+                             "VALUES (?,?,?)", rows)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"template mark_seen error: {e}")
+
+
+def get_template_seen_count(user_id: int, subject: str) -> int:
+    conn = _bank_conn()
+    with _bank_lock:
+        ensure_template_tables(conn)
+        return conn.execute("SELECT COUNT(*) FROM template_seen WHERE user_id=? AND subject=?",
+                            (user_id, subject)).fetchone()[0]
+
+
+# ── translation ───────────────────────────────────────────────────────────────
+
+_FIELD = re.compile(r"(\{[^{}]*\})")
+
+
+def _translate_text(text: str, lang: str, translate: Callable[[str, str], str]) -> str:
+    """Translate the literal parts of a template text; {expr} fields stay as they are."""
+    out = []
+    for part in _FIELD.split(text):
+        if not part or _FIELD.fullmatch(part) or not part.strip():
+            out.append(part)
+            continue
+        core = part.strip()
+        lead, trail = part[:len(part) - len(part.lstrip())], part[len(part.rstrip()):]
+        # braces the translator adds are literal text, not fields
+        out.append(lead + translate(core, lang).replace("{", "{{").replace("}", "}}") + trail)
+    return "".join(out)
+
+
+def translate_templates(lang: str, translate: Optional[Callable[[str, str], str]] = None,
+                        force: bool = False) -> int:
+    """
+    Translate every template (or only the untranslated ones) into `lang`,
+    once per template however many instances it has. `translate(text, lang)`
+    defaults to the offline phrase engine. Returns templates translated.
+    """
+    if lang not in TRANSLATED_LANGS:
+        raise ValueError(f"unsupported language {lang!r}")
+    if translate is None:
+        import phrase_engine
+        translate = phrase_engine.translate
+    conn = _bank_conn()
+    with _bank_lock:
+        ensure_template_tables(conn)
+        sql = "SELECT template_id, stem_en, options_en, explanation_en FROM question_templates"
+        if not force:
+            sql += " WHERE template_id NOT IN (SELECT template_id FROM question_template_i18n WHERE lang=?)"
+        rows = conn.execute(sql, () if force else (lang,)).fetchall()
+    out = []
+    for tid, stem, options, explanation in rows:
+        out.append((tid, lang, _translate_text(stem, lang, translate),
+                    json.dumps([_translate_text(o, lang, translate) for o in json.loads(options)],
+                               ensure_ascii=False),
+                    _translate_text(explanation or "", lang, translate)))
+    if not out:
+        return 0
+    with _bank_lock:
+        try:
+            conn.executemany("INSERT OR REPLACE INTO question_template_i18n "
+                             "(template_id, lang, stem, options, explanation) VALUES (?,?,?,?,?)", out)
+            _bump_template_generation(conn)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"template translation save error: {e}")
+            return 0
+    return len(out)
+
+
+# ── built-in templates ────────────────────────────────────────────────────────
+# Ported from generate_100k.gen_physics loops, one template each; they
+# render exactly the rows those loops stored, and gen_physics no longer
+# generates them.
+
+BUILTIN_TEMPLATES = [
+    {"name": "physics.kinematics.velocity", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Kinematics", "subtopic": "Equations of Motion", "difficulty": "medium",
+     "domain": [("u", range(0, 80, 2)), ("a_", range(1, 15)), ("t", range(1, 10))],
+     "derived": [("v", "u + a_*t")],
+     "stem": "A body starts with initial velocity {u} m/s and acceleration {a_} m/s². "
+             "Velocity after {t} s is:",
+     "options": ["{v} m/s", "{u+a_*(t+1)} m/s", "{u+a_*(t-1)} m/s", "{v+a_} m/s"],
+     "explanation": "v = u + at = {u} + {a_}×{t} = {v} m/s"},
+    {"name": "physics.kinematics.distance", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Kinematics", "subtopic": "Distance", "difficulty": "medium",
+     "domain": [("u", range(0, 60, 3)), ("a_", range(2, 12)), ("t", range(1, 8))],
+     "derived": [("s", "round(u*t + 0.5*a_*t*t, 1)")],
+     "stem": "Initial velocity {u} m/s, acceleration {a_} m/s². Distance in {t} s:",
+     "options": ["{s} m", "{round(s*1.2,1)} m", "{round(s*0.8,1)} m", "{round(s+a_,1)} m"],
+     "explanation": "s = ut + ½at² = {u}×{t} + ½×{a_}×{t}² = {s} m"},
+    {"name": "physics.kinematics.free_fall", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Kinematics", "subtopic": "Free Fall", "difficulty": "medium",
+     "domain": [("h", range(5, 200, 5))],
+     "derived": [("t_fall", "round(sqrt(2*h/9.8), 2)")],
+     "stem": "An object is dropped from height {h} m. Time to reach ground (g=9.8 m/s²):",
+     "options": ["{t_fall} s", "{round(t_fall*1.2,2)} s", "{round(t_fall*0.8,2)} s",
+                 "{round(t_fall+0.5,2)} s"],
+     "explanation": "t = √(2h/g) = √(2×{h}/9.8) = {t_fall} s"},
+    {"name": "physics.kinematics.projectile_range", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Kinematics", "subtopic": "Projectile", "difficulty": "hard",
+     "domain": [("u", range(10, 60, 5)), ("ang", [30, 45, 60])],
+     "derived": [("R", "round(u*u * sin(radians(2*ang)) / 9.8, 1)")],
+     "stem": "Projectile launched at {u} m/s at {ang}° to horizontal. Range:",
+     "options": ["{R} m", "{round(R*0.75,1)} m", "{round(R*1.25,1)} m", "{round(R*0.5,1)} m"],
+     "explanation": "R = u²sin2θ/g = {R} m"},
+    {"name": "physics.kinematics.projectile_time", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Kinematics", "subtopic": "Projectile", "difficulty": "hard",
+     "domain": [("u", range(10, 60, 5)), ("ang", [30, 45, 60])],
+     "derived": [("T", "round(2*u*sin(radians(ang))/9.8, 2)")],
+     "stem": "Projectile at {u} m/s at {ang}°. Time of flight:",
+     "options": ["{T} s", "{round(T*0.7,2)} s", "{round(T*1.3,2)} s", "{round(T*0.5,2)} s"],
+     "explanation": "T = 2u sinθ/g = {T} s"},
+    {"name": "physics.kinematics.projectile_height", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Kinematics", "subtopic": "Projectile", "difficulty": "hard",
+     "domain": [("u", range(10, 60, 5)), ("ang", [30, 45, 60])],
+     "derived": [("H", "round(u*u*sin(radians(ang))**2/(2*9.8), 2)")],
+     "stem": "Projectile at {u} m/s at {ang}°. Maximum height:",
+     "options": ["{H} m", "{round(H*0.6,2)} m", "{round(H*1.4,2)} m", "{round(H*2,2)} m"],
+     "explanation": "H = u²sin²θ/2g = {H} m"},
+    {"name": "physics.laws_of_motion.second_law", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Laws of Motion", "subtopic": "Newton's Second Law", "difficulty": "medium",
+     "domain": [("m", range(1, 50, 2)), ("a_", range(1, 20, 2))],
+     "derived": [("F", "m*a_")],
+     "stem": "A mass of {m} kg is given acceleration {a_} m/s². Net force required:",
+     "options": ["{F} N", "{F+m} N", "{F-a_} N", "{m+a_} N"],
+     "explanation": "F = ma = {m}×{a_} = {F} N"},
+    {"name": "physics.laws_of_motion.friction", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Laws of Motion", "subtopic": "Friction", "difficulty": "medium",
+     "domain": [("m", range(2, 30, 2)), ("mu", [0.1, 0.2, 0.3, 0.4, 0.5])],
+     "derived": [("f", "round(mu*m*9.8, 2)")],
+     "stem": "Mass {m} kg on surface with μ = {mu}. Friction force (g=9.8):",
+     "options": ["{f} N", "{round(f*1.3,2)} N", "{round(f*0.7,2)} N", "{round(mu*m*10,2)} N"],
+     "explanation": "f = μmg = {mu}×{m}×9.8 = {f} N"},
+    {"name": "physics.work_energy.work_done", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Work Energy", "subtopic": "Work Done", "difficulty": "medium",
+     "domain": [("F_", range(5, 100, 5)), ("d", range(1, 30, 3))],
+     "derived": [("W", "F_*d")],
+     "stem": "Force {F_} N applied over displacement {d} m (parallel). Work done:",
+     "options": ["{W} J", "{W+F_} J", "{W-d} J", "{F_+d} J"],
+     "explanation": "W = F×d = {F_}×{d} = {W} J"},
+    {"name": "physics.work_energy.kinetic_energy", "subject": "Physics", "exam_type": "NEET",
+     "topic": "Work Energy", "subtopic": "Kinetic Energy", "difficulty": "medium",
+     "domain": [("m", range(1, 40, 3)), ("v", range(2, 30, 3))],
+     "derived": [("KE", "round(0.5*m*v*v)")],
+     "stem": "Mass {m} kg moving at {v} m/s. Kinetic energy:",
+     "options": ["{KE} J", "{m*v} J", "{KE*2} J", "{KE//2} J"],
+     "explanation": "KE = ½mv² = ½×{m}×{v}² = {KE} J"},
+]
+
+
+def install_builtin_templates() -> List[int]:
+    return [save_template(spec) for spec in BUILTIN_TEMPLATES]
+
+
+def check_builtin_templates() -> Dict:
+    """
+    Render every instance of the built-in templates and check that each
+    has its own question text (the bank's unique key), so every instance
+    can become its own row when drawn. Returns counts, the instances
+    already stored, and the text size of the templates vs the rows they
+    stand for.
+    """
+    names = {s["name"] for s in BUILTIN_TEMPLATES}
+    instances = unique = row_bytes = 0
+    texts: Dict[tuple, str] = {}
+    collisions = []
+    builtins = [t for t in get_templates().values() if t.name in names]
+    ids = {t.template_id for t in builtins}
+    for t in builtins:
+        for i in range(t.size):
+            key = instance_key(t.template_id, i)
+            q = render(key)
+            fields = (q["question_en"], q["option_a_en"], q["option_b_en"], q["option_c_en"],
+                      q["option_d_en"], q["explanation_en"])
+            instances += 1
+            row_bytes += sum(len(x.encode()) for x in fields)
+            text = (q["subject"], q["question_en"].strip().lower())
+            if text not in texts:
+                texts[text] = key
+                unique += 1
+            elif len(collisions) < 5:
+                collisions.append((t.name, i, texts[text]))
+    conn = _bank_conn()
+    with _bank_lock:
+        stored = sum(1 for (key,) in conn.execute("SELECT instance_key FROM template_instances")
+                     if parse_key(key)[0] in ids)
+        tpl_bytes = conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(CAST(domain AS BLOB)) + LENGTH(CAST(derived AS BLOB)) "
+            "+ LENGTH(CAST(stem_en AS BLOB)) + LENGTH(CAST(options_en AS BLOB)) "
+            "+ LENGTH(CAST(explanation_en AS BLOB))), 0) FROM question_templates WHERE name IN (%s)"
+            % ",".join("?" * len(names)), tuple(names)).fetchone()[0]
+    return {"templates": len(names), "instances": instances, "unique": unique,
+            "collisions": collisions, "stored": stored, "row_bytes": row_bytes,
+            "template_bytes": tpl_bytes}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parametric question templates")
+    ap.add_argument("--translate", default="", help="comma-separated languages to translate the templates into")
+    ap.add_argument("--force", action="store_true", help="re-translate templates that already have a translation")
+    args = ap.parse_args()
+
+    init_bank()
+    ids = install_builtin_templates()
+    print(f"✅ {len(ids)} built-in templates installed")
+    for lang in [l.strip() for l in args.translate.split(",") if l.strip()]:
+        t0 = time.perf_counter()
+        n = translate_templates(lang, force=args.force)
+        print(f"[{lang}] {n} templates translated in {time.perf_counter() - t0:.2f}s")
+
+    res = check_builtin_templates()
+    print(f"\n{res['instances']:,} instances from {res['templates']} template rows; "
+          f"{res['unique']:,} distinct questions, {res['stored']:,} drawn into the bank so far")
+    for name, i, other in res["collisions"]:
+        print(f"  ⚠️  {name}:{i} renders the same question as {other}")
+    print(f"English text: {res['row_bytes']:,} bytes as rows, {res['template_bytes']:,} bytes as templates "
+          f"(×{res['row_bytes'] / max(res['template_bytes'], 1):,.0f}; each stored row also carries "
+          f"{len(TRANSLATED_LANGS)} translated copies)")
+
+    rng = random.Random(0)
+    user_id = -1        # no real student: nothing is marked seen
+    t0 = time.perf_counter()
+    for _ in range(200):
+        keys = pick(user_id, "Physics", 25, rng)
+    t_pick = (time.perf_counter() - t0) / 200
+    langs = ["en"] + [l for l in TRANSLATED_LANGS if l in args.translate.split(",")]
+    t0 = time.perf_counter()
+    n = 0
+    for _ in range(40):
+        for key in keys:
+            render(key, langs[n % len(langs)])
+            n += 1
+    t_render = (time.perf_counter() - t0) / n
+    print(f"pick 25: {t_pick * 1000:.3f} ms · render: {t_render * 1e6:.0f} µs per question")
+
+
+if __name__ == "__main__":
+    main()
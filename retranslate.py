@@ -0,0 +1,376 @@
+"""
+retranslate.py — Incremental re-translation after a dictionary edit
+====================================================================
+Editing one entry in CUET_PHRASES or GLOSSARY used to mean rerunning a
+whole translator over every row of a subject in all 8 languages. This
+module re-translates only the rows and languages a dictionary change can
+affect:
+
+  phrase_dict_versions — versioned snapshots of each (source, lang)
+                         dictionary as last applied to the bank
+  phrase_postings      — inverted index: lowercased English phrase → the
+                         qb_ids whose English text contains it (sorted
+                         uint32 array), per dictionary source
+
+A run diffs the current dictionary against the last snapshot, collects the
+qb_ids of every added/removed/changed phrase from the index and rewrites
+only those rows. A stored translation is replaced only if it is exactly
+what the previous dictionary version produced (so rows translated by
+another engine or fixed by hand are left alone) unless --force is given.
+The new dictionary version is then snapshotted.
+
+Usage:
+    python retranslate.py cuet --baseline           # record the dictionaries the bank was built with
+    python retranslate.py cuet --dry-run            # how many rows would change, per language
+    python retranslate.py glossary --langs hi,ta
+    python retranslate.py mass --reindex            # rebuild the phrase index from scratch
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import phrase_engine
+import phrase_store
+from cuet_translate_fix import CUET_SUBJECTS
+from phrase_matcher import PhraseMatcher
+from question_bank_db import (_bank_conn, _bank_lock, bump_bank_generation, iter_bank_rows,
+                              lang_columns, update_sql)
+
+FIELDS = ["question", "option_a", "option_b", "option_c", "option_d"]
+
+# Which rows/columns each source's translator writes
+SCOPES: Dict[str, Dict] = {
+    "v2":       {"fields": FIELDS},
+    "bulk":     {"fields": FIELDS},
+    "cuet":     {"fields": FIELDS, "subjects": CUET_SUBJECTS},
+    "glossary": {"fields": FIELDS},
+    "mass":     {"fields": FIELDS + ["explanation"]},
+}
+INDEX_FIELDS = FIELDS + ["explanation"]
+_ID_CHUNK = 500
+
+
+def _ensure_tables(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS phrase_dict_versions (
+            source     TEXT NOT NULL,
+            lang       TEXT NOT NULL,
+            version    INTEGER NOT NULL,
+            digest     TEXT NOT NULL,
+            entries    TEXT NOT NULL,
+            created_at TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (source, lang, version)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS phrase_postings (
+            source TEXT NOT NULL,
+            phrase TEXT NOT NULL,
+            qb_ids BLOB NOT NULL,
+            PRIMARY KEY (source, phrase)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS phrase_index_state (
+            source       TEXT PRIMARY KEY,
+            indexed_upto INTEGER NOT NULL
+        )
+    """)
+
+
+def _execute(fn: Callable):
+    """Run fn(conn) under the bank lock in one transaction."""
+    conn = _bank_conn()
+    with _bank_lock:
+        try:
+            _ensure_tables(conn)
+            result = fn(conn)
+            conn.commit()
+            return result
+        except Exception:
+            conn.rollback()
+            raise
+
+
+# ─── DICTIONARY VERSIONS ──────────────────────────────────────────────────────
+
+def _digest(entries: List[Tuple[str, str]]) -> str:
+    return hashlib.sha1(json.dumps(entries, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def latest_version(source: str, lang: str) -> Optional[Dict]:
+    def read(conn):
+        return conn.execute("""
+            SELECT version, digest, entries FROM phrase_dict_versions
+            WHERE source=? AND lang=? ORDER BY version DESC LIMIT 1
+        """, (source, lang)).fetchone()
+    row = _execute(read)
+    if not row:
+        return None
+    return {"version": row[0], "digest": row[1], "entries": [tuple(e) for e in json.loads(row[2])]}
+
+
+def snapshot(source: str, lang: str, conn=None) -> int:
+    """Record the current dictionary as applied; returns its version (unchanged if identical)."""
+    entries = [tuple(e) for e in phrase_store.load_entries(source, lang)]
+    digest = _digest(entries)
+
+    def write(c):
+        row = c.execute("""
+            SELECT version, digest FROM phrase_dict_versions
+            WHERE source=? AND lang=? ORDER BY version DESC LIMIT 1
+        """, (source, lang)).fetchone()
+        if row and row[1] == digest:
+            return row[0]
+        version = (row[0] if row else 0) + 1
+        c.execute("""
+            INSERT INTO phrase_dict_versions (source, lang, version, digest, entries)
+            VALUES (?, ?, ?, ?, ?)
+        """, (source, lang, version, digest, json.dumps(entries, ensure_ascii=False)))
+        return version
+
+    if conn is not None:
+        _ensure_tables(conn)
+        return write(conn)
+    return _execute(write)
+
+
+def changed_phrases(old: List[Tuple[str, str]], new: List[Tuple[str, str]]) -> Set[str]:
+    """Lowercased English phrases added, removed or given a different translation."""
+    before, after = dict(old), dict(new)
+    return {e.lower() for e in set(before) | set(after)
+            if e and before.get(e) != after.get(e)}
+
+
+# ─── PHRASE → QUESTION INDEX ──────────────────────────────────────────────────
+
+def _vocabulary(source: str) -> List[str]:
+    vocab = set()
+    for lang in phrase_store.LANGS:
+        vocab.update(e.lower() for e, _ in phrase_store.load_entries(source, lang) if e)
+    return sorted(vocab)
+
+
+def _scan(phrases: List[str], after_id: int = 0,
+          upto: Optional[int] = None) -> Tuple[Dict[str, array], int]:
+    """One keyset pass over (after_id, upto]: qb_ids containing each phrase (case-insensitive)."""
+    matcher = PhraseMatcher([(p, p) for p in phrases], max_per_phrase=None)
+    postings = {p: array("I") for p in phrases}
+    last_id = after_id
+    columns = ", ".join(f"{f}_en" for f in INDEX_FIELDS)
+    where, params = ("qb_id <= ?", (upto,)) if upto is not None else ("1=1", ())
+    for rows in iter_bank_rows(columns, where, params, batch_size=2000, after_id=after_id):
+        for row in rows:
+            low = "\n".join(t for t in row[1:] if t).lower()
+            for prio in {prio for _, _, prio in matcher.find_all(low)}:
+                postings[phrases[prio]].append(row[0])
+        last_id = rows[-1][0]
+    return postings, last_id
+
+
+def _merge_postings(conn, source: str, postings: Dict[str, array]):
+    for phrase, ids in postings.items():
+        row = conn.execute("SELECT qb_ids FROM phrase_postings WHERE source=? AND phrase=?",
+                           (source, phrase)).fetchone()
+        if row and ids:
+            old = array("I"); old.frombytes(row[0])
+            ids = array("I", sorted(set(old) | set(ids)))
+        elif row:
+            continue
+        conn.execute("INSERT OR REPLACE INTO phrase_postings (source, phrase, qb_ids) VALUES (?, ?, ?)",
+                     (source, phrase, ids.tobytes()))
+
+
+def build_index(source: str, rebuild: bool = False, phrases: Optional[Iterable[str]] = None) -> Dict:
+    """
+    Bring the phrase index for `source` up to date: index rows added since the
+    last run, and scan the whole bank once for any phrase not indexed yet.
+    """
+    wanted = sorted(set(phrases)) if phrases is not None else _vocabulary(source)
+
+    def state(conn):
+        if rebuild:
+            conn.execute("DELETE FROM phrase_postings WHERE source=?", (source,))
+            conn.execute("DELETE FROM phrase_index_state WHERE source=?", (source,))
+        row = conn.execute("SELECT indexed_upto FROM phrase_index_state WHERE source=?",
+                           (source,)).fetchone()
+        known = {r[0] for r in conn.execute("SELECT phrase FROM phrase_postings WHERE source=?", (source,))}
+        return (row[0] if row else 0), known
+    upto, known = _execute(state)
+
+    t0 = time.time()
+    new_phrases = [p for p in wanted if p not in known]
+    if new_phrases and upto:
+        # unseen phrases: the already-indexed part of the bank, once
+        postings, _ = _scan(new_phrases, upto=upto)
+        _execute(lambda c: _merge_postings(c, source, postings))
+    scanned = len(new_phrases)
+    all_phrases = sorted(known | set(wanted))
+    # rows added since the last run, for every indexed phrase
+    postings, last_id = _scan(all_phrases, after_id=upto)
+
+    def commit(conn):
+        _merge_postings(conn, source, {p: ids for p, ids in postings.items() if ids or p not in known})
+        conn.execute("INSERT OR REPLACE INTO phrase_index_state (source, indexed_upto) VALUES (?, ?)",
+                     (source, max(upto, last_id)))
+    _execute(commit)
+    return {"phrases": len(all_phrases), "new_phrases": scanned,
+            "indexed_upto": max(upto, last_id), "elapsed": time.time() - t0}
+
+
+def rows_for(source: str, phrases: Iterable[str]) -> Set[int]:
+    """qb_ids whose English text contains any of `phrases` (index is updated first)."""
+    phrases = sorted(set(phrases))
+    if not phrases:
+        return set()
+    build_index(source, phrases=phrases)
+
+    def read(conn):
+        ids: Set[int] = set()
+        for i in range(0, len(phrases), _ID_CHUNK):
+            part = phrases[i:i + _ID_CHUNK]
+            for (blob,) in conn.execute(
+                    f"SELECT qb_ids FROM phrase_postings WHERE source=? "
+                    f"AND phrase IN ({','.join('?' * len(part))})", (source, *part)):
+                a = array("I"); a.frombytes(blob)
+                ids.update(a)
+        return ids
+    return _execute(read)
+
+
+# ─── RE-TRANSLATION ───────────────────────────────────────────────────────────
+
+def _scoped(source: str, ids: Set[int]) -> List[int]:
+    subjects = SCOPES[source].get("subjects")
+    if not subjects or not ids:
+        return sorted(ids)
+    ids = sorted(ids)
+
+    def read(conn):
+        keep = []
+        for i in range(0, len(ids), _ID_CHUNK):
+            part = ids[i:i + _ID_CHUNK]
+            keep.extend(r[0] for r in conn.execute(
+                f"SELECT qb_id FROM question_bank WHERE qb_id IN ({','.join('?' * len(part))}) "
+                f"AND subject IN ({','.join('?' * len(subjects))})", (*part, *subjects)))
+        return sorted(keep)
+    return _execute(read)
+
+
+def plan(source: str, langs: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """
+    Per language: {"version", "phrases" (changed), "rows" (qb_ids in scope)}.
+    "version" is None when no baseline has been recorded for that language.
+    """
+    out = {}
+    for lang in langs or phrase_store.LANGS:
+        base = latest_version(source, lang)
+        if base is None:
+            out[lang] = {"version": None, "phrases": set(), "rows": []}
+            continue
+        changed = changed_phrases(base["entries"], phrase_store.load_entries(source, lang))
+        out[lang] = {"version": base["version"], "phrases": changed,
+                     "rows": _scoped(source, rows_for(source, changed)), "old": base["entries"]}
+    return out
+
+
+def retranslate(source: str, langs: Optional[List[str]] = None, dry_run: bool = False,
+                force: bool = False, progress: Optional[Callable[[str, int, int], None]] = None) -> Dict:
+    """
+    Re-translate the rows a dictionary change affects. Returns per language
+    {"phrases", "rows", "updated", "skipped"} (updated/skipped only when applied).
+    """
+    report = {}
+    fields = SCOPES[source]["fields"]
+    for lang, p in plan(source, langs).items():
+        r = {"phrases": len(p["phrases"]), "rows": len(p["rows"]), "baseline": p["version"] is not None}
+        report[lang] = r
+        if dry_run or p["version"] is None:
+            continue
+        if not p["rows"]:
+            snapshot(source, lang)
+            r.update(updated=0, skipped=0)
+            continue
+        old_matcher = phrase_engine.build_matcher(p["old"], source)
+        cols = ", ".join([f"{f}_en" for f in fields] + lang_columns(lang, fields))
+        updated = skipped = 0
+        ids = p["rows"]
+        for i in range(0, len(ids), _ID_CHUNK):
+            part = ids[i:i + _ID_CHUNK]
+            n = len(fields)
+
+            def apply(conn):
+                nonlocal updated, skipped
+                rows = conn.execute(f"SELECT qb_id, {cols} FROM question_bank "
+                                    f"WHERE qb_id IN ({','.join('?' * len(part))})", part).fetchall()
+                changes = []
+                for row in rows:
+                    en, cur = row[1:1 + n], row[1 + n:]
+                    vals = list(cur)
+                    for k in range(n):
+                        if not en[k] or not cur[k]:
+                            continue        # untranslated fields are left to the full jobs
+                        if not force and cur[k] != phrase_engine.translate(en[k], lang, source, old_matcher):
+                            continue
+                        vals[k] = phrase_engine.translate(en[k], lang, source)
+                    if vals != list(cur):
+                        changes.append(vals + [row[0]])
+                    else:
+                        skipped += 1
+                if changes:
+                    conn.executemany(update_sql(lang, fields), changes)
+                    bump_bank_generation(conn)
+                updated += len(changes)
+            _execute(apply)
+            if progress:
+                progress(lang, min(i + _ID_CHUNK, len(ids)), len(ids))
+        snapshot(source, lang)
+        r.update(updated=updated, skipped=skipped)
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Re-translate only the rows a dictionary edit affects")
+    ap.add_argument("source", choices=list(SCOPES), help="dictionary source")
+    ap.add_argument("--langs", default=",".join(phrase_store.LANGS), help="comma-separated language codes")
+    ap.add_argument("--dry-run", action="store_true", help="only report what would be re-translated")
+    ap.add_argument("--force", action="store_true", help="overwrite affected rows even if another engine wrote them")
+    ap.add_argument("--baseline", action="store_true", help="record the current dictionaries as applied")
+    ap.add_argument("--reindex", action="store_true", help="rebuild the phrase index from scratch")
+    args = ap.parse_args()
+    langs = [l.strip() for l in args.langs.split(",") if l.strip()]
+
+    if args.reindex:
+        info = build_index(args.source, rebuild=True)
+        print(f"✅ Indexed {info['phrases']:,} phrases up to qb_id {info['indexed_upto']:,} "
+              f"in {info['elapsed']:.1f}s")
+    if args.baseline:
+        for lang in langs:
+            print(f"  {args.source}-{lang}: version {snapshot(args.source, lang)}")
+        return
+    if args.reindex and not args.dry_run:
+        return
+
+    t0 = time.time()
+    report = retranslate(args.source, langs, dry_run=args.dry_run, force=args.force)
+    print(f"{'lang':<6}{'phrases':>9}{'rows':>9}{'updated':>9}{'skipped':>9}")
+    for lang, r in report.items():
+        if not r["baseline"]:
+            print(f"{lang:<6}  no baseline — run with --baseline first")
+            continue
+        print(f"{lang:<6}{r['phrases']:>9,}{r['rows']:>9,}{r.get('updated', '-'):>9}{r.get('skipped', '-'):>9}")
+    total = sum(r["rows"] for r in report.values())
+    verb = "would be checked" if args.dry_run else "checked"
+    print(f"\n{'🔎' if args.dry_run else '✅'} {total:,} row-languages {verb} in {time.time() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ import random
 import time
 from typing import List, Dict
 
+from question_bank_db import bump_bank_generation, count_sql, bulk_load_mode
+
 DB_PATH = "question_bank.db"
 
 LANGS = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
@@ -30,8 +32,10 @@ def _conn():
     c.row_factory = sqlite3.Row
     return c
 
-def bulk_insert(records: List[Dict], subject: str) -> int:
-    conn = _conn()
+def bulk_insert(records: List[Dict], subject: str, conn=None, loader=None) -> int:
+    """INSERT OR IGNORE `records` in one executemany; returns rows added.
+    Pass bulk_load_mode's `loader` (and its connection) during a bulk load."""
+    conn = conn or _conn()
     cols = ["subject", "exam_type", "topic", "difficulty",
             "question_en", "option_a_en", "option_b_en", "option_c_en", "option_d_en",
             "correct_answer", "marks_correct", "marks_wrong", "translated_langs"]
@@ -42,14 +46,19 @@ def bulk_insert(records: List[Dict], subject: str) -> int:
     placeholders = ",".join(["?"] * len(cols))
     col_str = ",".join(cols)
 
+    pending = set()
     inserted = 0
+    before = conn.total_changes
     conn.execute("BEGIN")
     try:
-        for r in records:
-            vals = [r.get(c) for c in cols]
-            conn.execute(f"INSERT OR IGNORE INTO question_bank ({col_str}) VALUES ({placeholders})", vals)
-            inserted += 1
+        conn.executemany(f"INSERT OR IGNORE INTO question_bank ({col_str}) VALUES ({placeholders})",
+                         [[r.get(c) for c in cols] for r in records
+                          if loader is None or loader.keep(r["subject"], r["question_en"], pending)])
+        inserted = conn.total_changes - before
+        bump_bank_generation(conn)
         conn.commit()
+        if loader is not None:
+            loader.keys |= pending
     except Exception as e:
         conn.rollback()
         print(f"  Insert error: {e}")
@@ -205,7 +214,7 @@ def generate_physics_multilingual() -> List[Dict]:
     for m, g, h in cases5:
         PE = m * g * h
         opts = [str(PE), str(m*g), str(m*h), str(g*h)]
-        opts = list(set([str(PE)] + [o for o in opts if o != str(PE)]))[:4]
+        opts = list(dict.fromkeys([str(PE)] + [o for o in opts if o != str(PE)]))[:4]
         while len(opts) < 4: opts.append(str(PE + random.randint(10,100)))
         random.shuffle(opts)
         correct = ["A","B","C","D"][opts.index(str(PE))]
@@ -884,7 +893,7 @@ def generate_cuet_quant_multilingual() -> List[Dict]:
 # MAIN SEEDER
 # ══════════════════════════════════════════════════════════════════════════════
 
-def main():
+def main(bulk_load=False):
     conn = _conn()
     total_start = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
     print(f"\n{'='*60}")
@@ -904,16 +913,24 @@ def main():
     ]
 
     total_added = 0
-    for subject, gen_fn in generators:
-        before = conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?", (subject,)).fetchone()[0]
-        print(f"[{subject}] Generating...", end=" ", flush=True)
-        t0 = time.time()
-        records = gen_fn()
-        added = bulk_insert(records, subject)
-        after = conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?", (subject,)).fetchone()[0]
-        new = after - before
-        total_added += new
-        print(f"{new:,} new questions added → {after:,} total ({time.time()-t0:.1f}s)")
+
+    def seed(loader=None):
+        nonlocal total_added
+        for subject, gen_fn in generators:
+            before = conn.execute("SELECT COUNT(*) FROM question_bank WHERE subject=?", (subject,)).fetchone()[0]
+            print(f"[{subject}] Generating...", end=" ", flush=True)
+            t0 = time.time()
+            records = gen_fn()
+            new = bulk_insert(records, subject, conn, loader)
+            after = before + new
+            total_added += new
+            print(f"{new:,} new questions added → {after:,} total ({time.time()-t0:.1f}s)")
+
+    if bulk_load:
+        with bulk_load_mode(conn) as loader:
+            seed(loader)
+    else:
+        seed()
 
     final_total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
     print(f"\n{'='*60}")
@@ -931,10 +948,13 @@ def main():
     # Verify translations
     print("\n  Translation coverage (all questions should have all languages):")
     for lang in LANGS:
-        count = conn.execute(f"SELECT COUNT(*) FROM question_bank WHERE question_{lang} IS NOT NULL AND question_{lang}!=''").fetchone()[0]
+        count = conn.execute(count_sql(lang)).fetchone()[0]
         pct = round(count / final_total * 100, 1) if final_total else 0
         status = "✅" if pct >= 90 else "⚠️"
         print(f"  {status} {lang}: {count:,} / {final_total:,} ({pct}%)")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    ap = argparse.ArgumentParser(description="Seed multilingual parametric questions")
+    ap.add_argument("--bulk-load", action="store_true", help="defer indexes, relax durability, lock the DB")
+    main(ap.parse_args().bulk_load)
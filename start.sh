@@ -5,6 +5,7 @@ echo "  CBT Exam Portal v15 — Starting..."
 echo " ============================================"
 echo ""
 pip install streamlit --quiet 2>/dev/null
+python phrase_store.py >/dev/null 2>&1
 echo " Starting CBT Portal..."
 echo " Open browser to: http://localhost:8501"
 echo ""
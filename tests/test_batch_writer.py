@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import question_bank_db
+
+
+@pytest.fixture
+def bank(tmp_path, monkeypatch):
+    monkeypatch.setattr(question_bank_db, "BANK_DB_PATH", str(tmp_path / "bank.db"))
+    question_bank_db._bank_local.conn = None
+    conn = question_bank_db._bank_conn()
+    conn.execute("CREATE TABLE kv (k INTEGER PRIMARY KEY, v TEXT)")
+    conn.commit()
+    yield conn
+    conn.close()
+    question_bank_db._bank_local.conn = None
+
+
+def _write(conn, batch):
+    conn.executemany("INSERT OR REPLACE INTO kv (k, v) VALUES (?, ?)", [(k, v) for k, v in batch])
+
+
+def test_bad_value_is_dropped_and_the_rest_written(bank):
+    writer = question_bank_db._BatchWriter("test-writer", _write, retry_delay=0.01)
+    for k in range(5):
+        writer.put(k, object() if k == 2 else f"v{k}")
+
+    assert writer.flush(timeout=5)
+    assert [tuple(r) for r in bank.execute("SELECT k, v FROM kv ORDER BY k")] == \
+        [(0, "v0"), (1, "v1"), (3, "v3"), (4, "v4")]
+
+    writer.put(2, "v2")               # the writer keeps going after a drop
+    assert writer.flush(timeout=5)
+    assert bank.execute("SELECT v FROM kv WHERE k=2").fetchone()[0] == "v2"
@@ -0,0 +1,72 @@
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import question_bank_db
+import question_templates as qt
+
+
+@pytest.fixture
+def bank(tmp_path, monkeypatch):
+    monkeypatch.setattr(question_bank_db, "BANK_DB_PATH", str(tmp_path / "bank.db"))
+    question_bank_db._bank_local.conn = None
+    question_bank_db.invalidate_stats_cache()
+    qt._cache.update(generation=None, templates={}, by_subject={})
+    question_bank_db.init_bank()
+    yield
+    question_bank_db._bank_local.conn.close()
+    question_bank_db._bank_local.conn = None
+
+
+def _template(name, difficulty, size):
+    return {"name": name, "subject": "Physics", "exam_type": "NEET", "difficulty": difficulty,
+            "domain": [("n", range(size))], "stem": name + " {n}",
+            "options": ["{n}", "{n+1}", "{n+2}", "{n+3}"]}
+
+
+def test_pick_returns_count_when_few_unseen_remain(bank):
+    tid = qt.save_template(_template("t.big", "medium", 1000))
+    qt.mark_seen(1, [qt.instance_key(tid, i) for i in range(950)])
+
+    keys = qt.pick(1, "Physics", 25, random.Random(0))
+    assert len(keys) == len(set(keys)) == 25
+    assert all(qt.parse_key(k)[1] >= 950 for k in keys)
+
+    assert sorted(qt.pick(1, "Physics", 80, random.Random(0))) == \
+        sorted(qt.instance_key(tid, i) for i in range(950, 1000))
+
+
+def test_pick_by_difficulty_ignores_other_templates_seen(bank):
+    medium = qt.save_template(_template("t.medium", "medium", 100))
+    hard = qt.save_template(_template("t.hard", "hard", 90))
+    qt.mark_seen(1, [qt.instance_key(medium, i) for i in range(100)])
+
+    keys = qt.pick(1, "Physics", 25, random.Random(0), difficulty="hard")
+    assert len(set(keys)) == 25
+    assert {qt.parse_key(k)[0] for k in keys} == {hard}
+    assert qt.pick(1, "Physics", 25, random.Random(0), difficulty="medium") == []
+
+
+def test_pick_skips_instances_drawn_into_an_exam(bank):
+    tid = qt.save_template(_template("t.small", "medium", 30))
+    rows = qt.materialize([qt.instance_key(tid, i) for i in range(20)])
+    assert [r["question_en"] for r in rows] == [f"t.small {i}" for i in range(20)]
+    question_bank_db.mark_questions_seen(1, [r["qb_id"] for r in rows], "Physics")
+
+    assert sorted(qt.pick(1, "Physics", 30, random.Random(0))) == \
+        sorted(qt.instance_key(tid, i) for i in range(20, 30))
+    assert qt.materialize([qt.instance_key(tid, 3)])[0]["qb_id"] == rows[3]["qb_id"]
+
+
+def test_exam_draw_materializes_template_instances(bank):
+    tid = qt.save_template(_template("t.exam", "medium", 50))
+    qs = question_bank_db.get_questions_for_exam("Physics", 10, 1, {"medium": 1.0})
+    assert len(qs) == len({q["qb_id"] for q in qs}) == 10
+    assert all(q["question_en"].startswith("t.exam ") for q in qs)
+    conn = question_bank_db._bank_conn()
+    assert conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0] == 10
+    assert conn.execute("SELECT COUNT(*) FROM template_instances").fetchone()[0] == 10
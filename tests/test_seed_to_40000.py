@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import seed_to_40000 as seed
+from question_bank_db import question_key
+
+
+def _keys(questions):
+    return {question_key(q["subject"], q["question_en"]) for q in questions}
+
+
+def test_plan_top_up_uses_fillers_left_after_a_partial_run():
+    fillers = seed.generate_parametric_fillers("Physics")
+    keys = (_keys(seed.get_subject_generators()["Physics"]())
+            | _keys(seed.get_subject_expanders()["Physics"]())
+            | _keys(fillers[:10]))
+
+    plan = seed.plan_top_up({"Physics": 100}, keys, target=110, subjects=["Physics"])
+
+    assert [(subject, source) for subject, source, _, _ in plan] == [("Physics", "fillers")]
+    _, _, fresh, take = plan[0]
+    assert fresh == len(_keys(fillers) - _keys(fillers[:10])) > 10
+    assert len(take) == 10
+    assert not _keys(take) & _keys(fillers[:10])
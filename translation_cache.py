@@ -0,0 +1,270 @@
+"""
+translation_cache.py — Bounded two-tier cache for translate_text
+=================================================================
+translate_text() in translation_engine_v2 and translation_engine kept
+their results in plain dicts: unbounded (long-lived Streamlit workers grew
+forever), lost on every restart (so the next miss could go back out to
+deep-translator), and translation_engine keyed on the first 50 characters
+only, so different texts sharing a prefix got each other's translation.
+
+Two tiers, both keyed by (lang, sha1 of the full text, engine):
+
+  memory  LRU of Config.system.TRANSLATION_CACHE_SIZE entries per process
+  disk    translation_cache table in question_bank.db, shared by every
+          process, capped at TRANSLATION_CACHE_SIZE ×
+          TRANSLATION_CACHE_DISK_MULTIPLIER rows (least recently used
+          rows are evicted)
+
+`engine` names whatever produced the text (e.g. "v2:<dictionary
+fingerprint>"), so changing a dictionary or enabling Argos never serves an
+older engine's output. The memory tier is warm-started from the most
+recently used disk rows on first use. Only results worth keeping are
+written to disk (callers pass persist=False for English fallbacks so a
+network blip is retried next time). Disk writes are buffered and flushed
+in small batches.
+
+Usage:
+    from translation_cache import get_cache
+    cache = get_cache()
+    hit = cache.get("hi", text, engine)        # (translation, method) or None
+    cache.put("hi", text, engine, result, method)
+    cache.stats()                              # hit rates, sizes, evictions
+"""
+
+import time
+import atexit
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import Config
+from question_bank_db import _bank_conn, _bank_lock
+
+_FLUSH_EVERY = 32          # buffered disk writes per flush
+_EVICT_EVERY = 512         # disk writes between size checks
+_TOUCH_EVERY = 256         # buffered recency updates per flush
+
+Key = Tuple[str, str, str]  # (lang, src_hash, engine)
+
+
+def _ensure_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS translation_cache (
+            lang      TEXT NOT NULL,
+            src_hash  TEXT NOT NULL,
+            engine    TEXT NOT NULL,
+            target    TEXT NOT NULL,
+            method    TEXT NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (lang, src_hash, engine)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tc_last_used ON translation_cache(last_used)")
+
+
+def src_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+class TranslationCache:
+    """Process-local LRU in front of the shared translation_cache table."""
+
+    def __init__(self, size: Optional[int] = None, disk_size: Optional[int] = None):
+        self.size = size if size is not None else Config.system.TRANSLATION_CACHE_SIZE
+        self.disk_size = disk_size if disk_size is not None else \
+            self.size * Config.system.TRANSLATION_CACHE_DISK_MULTIPLIER
+        self._lru: "OrderedDict[Key, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[Key, Tuple[str, str, float]] = {}   # key -> (target, method, put at)
+        self._touched: Dict[Key, float] = {}
+        self._writes = 0
+        self._warm = False
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0,
+                         "memory_evictions": 0, "disk_evictions": 0, "disk_errors": 0}
+
+    # ── memory tier ──────────────────────────────────────────────────────────
+
+    def _remember(self, key: Key, value: Tuple[str, str]):
+        lru = self._lru
+        lru[key] = value
+        lru.move_to_end(key)
+        while len(lru) > self.size:
+            lru.popitem(last=False)
+            self.counters["memory_evictions"] += 1
+
+    def warm(self):
+        """Fill the memory tier with the most recently used disk rows."""
+        if self._warm:
+            return
+        self._warm = True
+        if self.size <= 0:
+            return
+        try:
+            conn = _bank_conn()
+            with _bank_lock:
+                rows = conn.execute("""
+                    SELECT lang, src_hash, engine, target, method FROM translation_cache
+                    ORDER BY last_used DESC LIMIT ?
+                """, (self.size,)).fetchall()
+        except sqlite3.OperationalError:
+            return   # translation_cache not created yet
+        with self._lock:
+            for lang, h, engine, target, method in reversed(rows):
+                key = (lang, h, engine)
+                if key not in self._lru:
+                    self._remember(key, (target, method))
+
+    # ── lookups ──────────────────────────────────────────────────────────────
+
+    def get(self, lang: str, text: str, engine: str) -> Optional[Tuple[str, str]]:
+        """(translation, method) from memory or disk, or None."""
+        if not Config.performance.CACHE_TRANSLATION:
+            return None
+        self.warm()
+        key = (lang, src_hash(text), engine)
+        with self._lock:
+            hit = self._lru.get(key)
+            if hit is None and key in self._pending:
+                hit = self._pending[key][:2]
+            if hit is not None:
+                self._lru[key] = hit
+                self._lru.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                self._touched[key] = time.time()
+                flush = len(self._touched) >= _TOUCH_EVERY
+        if hit is not None:
+            if flush:
+                self.flush()
+            return hit
+        row = None
+        try:
+            conn = _bank_conn()
+            with _bank_lock:
+                row = conn.execute("""
+                    SELECT target, method FROM translation_cache
+                    WHERE lang=? AND src_hash=? AND engine=?
+                """, key).fetchone()
+        except sqlite3.OperationalError:
+            pass
+        with self._lock:
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+            hit = (row[0], row[1])
+            self._remember(key, hit)
+            self.counters["disk_hits"] += 1
+            self._touched[key] = time.time()
+        return hit
+
+    def put(self, lang: str, text: str, engine: str, target: str, method: str,
+            persist: bool = True):
+        if not Config.performance.CACHE_TRANSLATION or target is None:
+            return
+        key = (lang, src_hash(text), engine)
+        with self._lock:
+            self._remember(key, (target, method))
+            if not persist:
+                return
+            self._pending[key] = (target, method, time.time())
+            flush = len(self._pending) >= _FLUSH_EVERY
+        if flush:
+            self.flush()
+
+    # ── disk tier ────────────────────────────────────────────────────────────
+
+    def flush(self):
+        """Write buffered entries and recency updates; evict past disk_size."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, {}
+        if not pending and not touched:
+            return
+        conn = _bank_conn()
+        with _bank_lock:
+            try:
+                _ensure_table(conn)
+                conn.executemany("""
+                    INSERT OR REPLACE INTO translation_cache
+                        (lang, src_hash, engine, target, method, last_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [(*k, t, m, ts) for k, (t, m, ts) in pending.items()])
+                conn.executemany("""
+                    UPDATE translation_cache SET last_used=?
+                    WHERE lang=? AND src_hash=? AND engine=?
+                """, [(ts, *k) for k, ts in touched.items() if k not in pending])
+                self._writes += len(pending)
+                evicted = 0
+                if self._writes >= _EVICT_EVERY:
+                    self._writes = 0
+                    evicted = self._evict(conn)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                self.counters["disk_errors"] += 1
+                print(f"translation_cache flush error: {e}")
+                return
+        self.counters["disk_evictions"] += evicted
+
+    def _evict(self, conn) -> int:
+        total = conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+        excess = total - self.disk_size
+        if excess <= 0:
+            return 0
+        conn.execute("""
+            DELETE FROM translation_cache WHERE (lang, src_hash, engine) IN (
+                SELECT lang, src_hash, engine FROM translation_cache
+                ORDER BY last_used LIMIT ?)
+        """, (excess,))
+        return excess
+
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._lru.clear()
+            self._pending.clear()
+            self._touched.clear()
+        if disk:
+            conn = _bank_conn()
+            with _bank_lock:
+                try:
+                    conn.execute("DELETE FROM translation_cache")
+                    conn.commit()
+                except sqlite3.OperationalError:
+                    conn.rollback()
+
+    # ── metrics ──────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict:
+        with self._lock:
+            c = dict(self.counters)
+            c["memory_size"] = len(self._lru)
+        lookups = c["memory_hits"] + c["disk_hits"] + c["misses"]
+        c["lookups"] = lookups
+        c["hit_rate"] = (c["memory_hits"] + c["disk_hits"]) / lookups if lookups else None
+        c["memory_hit_rate"] = c["memory_hits"] / lookups if lookups else None
+        c["memory_limit"], c["disk_limit"] = self.size, self.disk_size
+        return c
+
+
+def format_stats(stats: Dict) -> str:
+    if not stats["lookups"]:
+        return "Translation cache: no lookups yet"
+    return (f"Translation cache: {stats['hit_rate']:.0%} hit rate "
+            f"({stats['memory_hits']:,} memory, {stats['disk_hits']:,} disk, "
+            f"{stats['misses']:,} misses), {stats['memory_size']:,}/{stats['memory_limit']:,} in memory")
+
+
+_cache: Optional[TranslationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> TranslationCache:
+    """The process-wide cache (limits from Config.system)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TranslationCache()
+                atexit.register(_cache.flush)
+    return _cache
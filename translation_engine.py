@@ -24,7 +24,9 @@ try:
 except ImportError:
     GOOGLETRANS_AVAILABLE = False
 
-from question_bank_db import _bank_conn, _bank_lock, save_translation, questions_needing_translation
+from question_bank_db import (_bank_conn, _bank_lock, save_translation, questions_needing_translation,
+                              count_sql, untranslated_sql)
+from translation_cache import get_cache
 
 LANG_CODES = {
     "hi": "Hindi",
@@ -49,8 +51,9 @@ DEEP_TRANS_CODES = {
     "or": "or",
 }
 
-# Simple translation cache in memory
-_cache = {}
+# Bounded memory + on-disk cache, keyed by a hash of the whole text
+_cache = get_cache()
+_CACHE_ENGINE = "google"
 
 
 def translate_text(text: str, target_lang: str) -> str:
@@ -60,16 +63,16 @@ def translate_text(text: str, target_lang: str) -> str:
     if target_lang == "en":
         return text
 
-    cache_key = f"{target_lang}:{text[:50]}"
-    if cache_key in _cache:
-        return _cache[cache_key]
+    cached = _cache.get(target_lang, text, _CACHE_ENGINE)
+    if cached is not None:
+        return cached[0]
 
     # Try deep-translator first
     if TRANSLATOR_AVAILABLE:
         try:
             translated = GoogleTranslator(source='en', target=DEEP_TRANS_CODES[target_lang]).translate(text)
             if translated:
-                _cache[cache_key] = translated
+                _cache.put(target_lang, text, _CACHE_ENGINE, translated, "deep-translator")
                 return translated
         except Exception as e:
             pass
@@ -80,7 +83,7 @@ def translate_text(text: str, target_lang: str) -> str:
             translator = GtTranslator()
             result = translator.translate(text, dest=target_lang)
             if result and result.text:
-                _cache[cache_key] = result.text
+                _cache.put(target_lang, text, _CACHE_ENGINE, result.text, "googletrans")
                 return result.text
         except Exception as e:
             pass
@@ -120,12 +123,7 @@ def batch_translate_subject(subject: str, lang: str, limit: int = 200):
     """Translate questions for a subject to a language."""
     conn = _bank_conn()
     with _bank_lock:
-        rows = conn.execute(f"""
-            SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en
-            FROM question_bank
-            WHERE subject=? AND (question_{lang} IS NULL OR question_{lang} = '')
-            LIMIT ?
-        """, (subject, limit)).fetchall()
+        rows = conn.execute(untranslated_sql(lang, by_subject=True), (subject, limit)).fetchall()
 
     if not rows:
         print(f"  ✅ {subject} → {LANG_CODES.get(lang, lang)}: all translated")
@@ -182,10 +180,7 @@ def get_translation_stats() -> Dict:
     stats = {}
     for lang in LANG_CODES.keys():
         with _bank_lock:
-            translated = conn.execute(f"""
-                SELECT COUNT(*) FROM question_bank
-                WHERE question_{lang} IS NOT NULL AND question_{lang} != ''
-            """).fetchone()[0]
+            translated = conn.execute(count_sql(lang)).fetchone()[0]
             total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
         stats[lang] = {
             "translated": translated,
@@ -14,19 +14,17 @@ FIXES in v2.1:
 
 import json
 import time
-import threading
-import re
-import hashlib
 from typing import Dict, List, Optional, Tuple
-from question_bank_db import _bank_conn, _bank_lock
+from question_bank_db import (_bank_conn, _bank_lock, _BatchWriter, bump_bank_generation,
+                              cached_bank_read, count_sql, untranslated_sql, update_sql)
+from phrase_matcher import PhraseMatcher
+import phrase_engine
+import translation_memory
+from translation_cache import get_cache
 
-# Translation libraries (optional)
-try:
-    import argostranslate.package
-    import argostranslate.translate
-    ARGOS_AVAILABLE = True
-except ImportError:
-    ARGOS_AVAILABLE = False
+# Translation libraries (optional); Argos models are loaded by argos_worker
+import argos_worker
+from argos_worker import ARGOS_AVAILABLE
 
 try:
     from deep_translator import GoogleTranslator
@@ -45,306 +43,35 @@ SUPPORTED_LANGS = {
     "or": {"name": "Odia",     "native": "ଓଡ଼ିଆ",     "argos": "or", "deep": "or"},
 }
 
-# ══════════════════════════════════════════════════════════════════════════════
-# COMPREHENSIVE PHRASE DICTIONARIES — all 8 Indian languages
-# Covers Physics, Chemistry, Biology, Maths, GK question patterns
-# ══════════════════════════════════════════════════════════════════════════════
-PHRASE_DICT: Dict[str, Dict[str, str]] = {
-"hi": {
-  "What is the formula for":"किसका सूत्र है","Which of the following is NOT correct":"निम्न में से कौन सा सही नहीं है",
-  "Which of the following is correct":"निम्न में से कौन सा सही है","Which of the following":"निम्न में से",
-  "None of the above":"उपरोक्त में से कोई नहीं","All of the above":"उपरोक्त सभी",
-  "Find the value of":"का मान ज्ञात कीजिए","Calculate the":"की गणना कीजिए","Determine the":"निर्धारित कीजिए",
-  "What is the":"क्या है","What is":"क्या है","Who is":"कौन है","Which is":"कौन सा है",
-  "When was":"कब था","Where is":"कहाँ है","How many":"कितने","The value of":"का मान",
-  "is equal to":"के बराबर है","is defined as":"को परिभाषित किया जाता है","is called":"कहलाता है",
-  "is known as":"के नाम से जाना जाता है","is given by":"द्वारा दिया गया है","is correct":"सही है",
-  "Find the":"ज्ञात कीजिए","The correct answer is":"सही उत्तर है","distance covered":"तय की गई दूरी",
-  "starts from rest":"विराम से प्रारम्भ होता है","The unit of":"की इकाई","SI unit of":"SI इकाई",
-  "acceleration due to gravity":"गुरुत्वीय त्वरण","centripetal force":"अभिकेन्द्रीय बल",
-  "angular momentum":"कोणीय संवेग","moment of inertia":"जड़त्व आघूर्ण",
-  "conservation of momentum":"संवेग संरक्षण","conservation of energy":"ऊर्जा संरक्षण",
-  "kinetic energy":"गतिज ऊर्जा","potential energy":"स्थितिज ऊर्जा","work done":"किया गया कार्य",
-  "electric field":"विद्युत क्षेत्र","magnetic field":"चुंबकीय क्षेत्र",
-  "initial velocity":"प्रारम्भिक वेग","final velocity":"अंतिम वेग",
-  "uniform acceleration":"समान त्वरण","time of flight":"उड़ान का समय","maximum height":"अधिकतम ऊँचाई",
-  "horizontal component":"क्षैतिज घटक","vertical component":"ऊर्ध्वाधर घटक",
-  "cell membrane":"कोशिका झिल्ली","cell division":"कोशिका विभाजन","cell wall":"कोशिका भित्ति",
-  "photosynthesis":"प्रकाश संश्लेषण","cellular respiration":"कोशिकीय श्वसन",
-  "natural selection":"प्राकृतिक चयन","blood group":"रक्त समूह",
-  "periodic table":"आवर्त सारणी","atomic number":"परमाणु क्रमांक","atomic mass":"परमाणु द्रव्यमान",
-  "molar mass":"मोलर द्रव्यमान","oxidation state":"ऑक्सीकरण अवस्था","chemical bond":"रासायनिक बंध",
-  "simple interest":"साधारण ब्याज","compound interest":"चक्रवृद्धि ब्याज",
-  "profit and loss":"लाभ और हानि","time and work":"समय और कार्य",
-  "velocity":"वेग","acceleration":"त्वरण","force":"बल","mass":"द्रव्यमान","weight":"भार",
-  "energy":"ऊर्जा","power":"शक्ति","work":"कार्य","momentum":"संवेग","pressure":"दाब",
-  "temperature":"तापमान","heat":"ऊष्मा","current":"धारा","voltage":"वोल्टेज",
-  "resistance":"प्रतिरोध","wavelength":"तरंगदैर्ध्य","frequency":"आवृत्ति","amplitude":"आयाम",
-  "displacement":"विस्थापन","distance":"दूरी","speed":"चाल","gravity":"गुरुत्वाकर्षण",
-  "friction":"घर्षण","photon":"फोटोन","electron":"इलेक्ट्रॉन","proton":"प्रोटॉन",
-  "neutron":"न्यूट्रॉन","nucleus":"नाभिक","atom":"परमाणु","molecule":"अणु","ion":"आयन",
-  "charge":"आवेश","capacitor":"संधारित्र","conductor":"चालक","insulator":"कुचालक",
-  "semiconductor":"अर्धचालक","lens":"लेंस","mirror":"दर्पण","reflection":"परावर्तन",
-  "refraction":"अपवर्तन","element":"तत्व","compound":"यौगिक","mixture":"मिश्रण",
-  "solution":"विलयन","acid":"अम्ल","base":"क्षार","salt":"लवण","oxidation":"ऑक्सीकरण",
-  "reduction":"अपचयन","catalyst":"उत्प्रेरक","reaction":"अभिक्रिया","bond":"बंध",
-  "orbital":"कक्षक","valence":"संयोजकता","mole":"मोल","concentration":"सांद्रता",
-  "solubility":"विलेयता","entropy":"एन्ट्रॉपी","enthalpy":"एन्थैल्पी",
-  "equilibrium":"साम्यावस्था","polymer":"बहुलक","isomer":"समावयवी",
-  "cell":"कोशिका","membrane":"झिल्ली","enzyme":"एंजाइम","protein":"प्रोटीन",
-  "gene":"जीन","chromosome":"गुणसूत्र","mitosis":"समसूत्री विभाजन",
-  "meiosis":"अर्धसूत्री विभाजन","respiration":"श्वसन","digestion":"पाचन",
-  "evolution":"विकास","mutation":"उत्परिवर्तन","DNA":"डीएनए","RNA":"आरएनए",
-  "derivative":"अवकलज","integral":"समाकल","matrix":"आव्यूह","vector":"सदिश",
-  "scalar":"अदिश","probability":"प्रायिकता","trigonometry":"त्रिकोणमिति",
-  "logarithm":"लघुगणक","equation":"समीकरण","function":"फलन","limit":"सीमा",
-  "percentage":"प्रतिशत","profit":"लाभ","loss":"हानि","ratio":"अनुपात",
-  "average":"औसत","area":"क्षेत्रफल","volume":"आयतन","perimeter":"परिमाप",
-  "maximum":"अधिकतम","minimum":"न्यूनतम","increase":"वृद्धि","decrease":"कमी",
-  "equal":"बराबर","greater":"अधिक","less":"कम","zero":"शून्य",
-  "positive":"धनात्मक","negative":"ऋणात्मक","horizontal":"क्षैतिज","vertical":"ऊर्ध्वाधर",
-  "correct":"सही","incorrect":"गलत","total":"कुल","approximately":"लगभग",
-  "first":"पहला","second":"दूसरा","third":"तीसरा",
-  "A body":"एक पिंड","A particle":"एक कण","A ball":"एक गेंद","An object":"एक वस्तु",
-  "and":"और","or":"या","not":"नहीं","only":"केवल","is":"है","are":"हैं",
-},
-"bn": {
-  "What is the formula for":"কীসের সূত্র","Which of the following is correct":"নিচের কোনটি সঠিক",
-  "Which of the following":"নিচের কোনটি","None of the above":"উপরের কোনটি নয়",
-  "All of the above":"উপরের সবগুলো","Find the value of":"মান নির্ণয় কর","What is":"কী হল",
-  "How many":"কতগুলো","is equal to":"এর সমান","is called":"বলা হয়",
-  "acceleration due to gravity":"মহাকর্ষীয় ত্বরণ","kinetic energy":"গতিশক্তি",
-  "potential energy":"স্থিতিশক্তি","electric field":"তড়িৎ ক্ষেত্র","magnetic field":"চৌম্বক ক্ষেত্র",
-  "initial velocity":"প্রারম্ভিক বেগ","final velocity":"চূড়ান্ত বেগ",
-  "simple interest":"সরল সুদ","compound interest":"চক্রবৃদ্ধি সুদ",
-  "photosynthesis":"সালোকসংশ্লেষণ","cell membrane":"কোষ ঝিল্লি","periodic table":"পর্যায় সারণী",
-  "velocity":"বেগ","acceleration":"ত্বরণ","force":"বল","mass":"ভর","weight":"ওজন",
-  "energy":"শক্তি","power":"ক্ষমতা","work":"কাজ","momentum":"ভরবেগ","pressure":"চাপ",
-  "temperature":"তাপমাত্রা","heat":"তাপ","current":"তড়িৎ প্রবাহ","voltage":"ভোল্টেজ",
-  "resistance":"রোধ","wavelength":"তরঙ্গদৈর্ঘ্য","frequency":"কম্পাঙ্ক","displacement":"সরণ",
-  "distance":"দূরত্ব","electron":"ইলেকট্রন","proton":"প্রোটন","neutron":"নিউট্রন",
-  "nucleus":"নিউক্লিয়াস","atom":"পরমাণু","molecule":"অণু","cell":"কোষ",
-  "enzyme":"এনজাইম","protein":"প্রোটিন","gene":"জিন","chromosome":"ক্রোমোজোম",
-  "DNA":"ডিএনএ","RNA":"আরএনএ","element":"মৌল","compound":"যৌগ","acid":"অ্যাসিড",
-  "base":"ক্ষার","catalyst":"অনুঘটক","equation":"সমীকরণ","probability":"সম্ভাবনা",
-  "percentage":"শতাংশ","profit":"লাভ","loss":"ক্ষতি","ratio":"অনুপাত","average":"গড়",
-  "area":"ক্ষেত্রফল","volume":"আয়তন","maximum":"সর্বোচ্চ","minimum":"সর্বনিম্ন",
-  "correct":"সঠিক","total":"মোট","first":"প্রথম","second":"দ্বিতীয়",
-  "and":"এবং","or":"বা","not":"নয়","is":"হয়","are":"হয়",
-},
-"ta": {
-  "What is the formula for":"சூத்திரம் என்ன","Which of the following is correct":"எது சரியானது",
-  "Which of the following":"பின்வருவனவற்றில்","None of the above":"எதுவும் இல்லை",
-  "All of the above":"அனைத்தும்","Find the value of":"மதிப்பு காண்க","What is":"என்ன",
-  "How many":"எத்தனை","is equal to":"சமம்","is called":"அழைக்கப்படுகிறது",
-  "acceleration due to gravity":"புவியீர்ப்பு முடுக்கம்","kinetic energy":"இயக்க ஆற்றல்",
-  "potential energy":"நிலை ஆற்றல்","electric field":"மின் புலம்","magnetic field":"காந்தப் புலம்",
-  "initial velocity":"தொடக்க திசைவேகம்","final velocity":"இறுதி திசைவேகம்",
-  "simple interest":"தனி வட்டி","compound interest":"கூட்டு வட்டி",
-  "photosynthesis":"ஒளிச்சேர்க்கை","cell membrane":"செல் சவ்வு","periodic table":"தனிம வரிசை அட்டவணை",
-  "velocity":"திசைவேகம்","acceleration":"முடுக்கம்","force":"விசை","mass":"நிறை","weight":"எடை",
-  "energy":"ஆற்றல்","power":"திறன்","work":"வேலை","momentum":"உந்தம்","pressure":"அழுத்தம்",
-  "temperature":"வெப்பநிலை","heat":"வெப்பம்","current":"மின்னோட்டம்","voltage":"மின்னழுத்தம்",
-  "resistance":"மின்தடை","wavelength":"அலை நீளம்","frequency":"அலைவெண்",
-  "displacement":"இடப்பெயர்ச்சி","distance":"தூரம்","electron":"எலக்ட்ரான்",
-  "proton":"புரோட்டான்","neutron":"நியூட்ரான்","nucleus":"கரு","atom":"அணு",
-  "molecule":"மூலக்கூறு","cell":"செல்","enzyme":"நொதி","protein":"புரதம்",
-  "gene":"மரபணு","chromosome":"நிறமூர்த்தம்","DNA":"டிஎன்ஏ","RNA":"ஆர்என்ஏ",
-  "element":"தனிமம்","compound":"சேர்மம்","acid":"அமிலம்","base":"காரம்",
-  "catalyst":"வினையூக்கி","equation":"சமன்பாடு","probability":"நிகழ்தகவு",
-  "percentage":"சதவீதம்","profit":"இலாபம்","loss":"நஷ்டம்","ratio":"விகிதம்",
-  "average":"சராசரி","area":"பரப்பளவு","volume":"கனவளவு",
-  "maximum":"அதிகபட்சம்","minimum":"குறைந்தபட்சம்",
-  "correct":"சரி","total":"மொத்தம்","first":"முதல்","second":"இரண்டாவது",
-  "and":"மற்றும்","or":"அல்லது","not":"இல்லை","is":"ஆகும்",
-},
-"te": {
-  "What is the formula for":"సూత్రం ఏమిటి","Which of the following is correct":"ఏది సరైనది",
-  "Which of the following":"కింది వాటిలో","None of the above":"పై వాటిలో ఏదీ కాదు",
-  "All of the above":"పై అన్నీ","Find the value of":"విలువ కనుగొనండి","What is":"ఏమిటి",
-  "How many":"ఎన్ని","is equal to":"కి సమానం","is called":"అని పిలుస్తారు",
-  "acceleration due to gravity":"గురుత్వాకర్షణ త్వరణం","kinetic energy":"గతిజ శక్తి",
-  "potential energy":"స్థితిజ శక్తి","electric field":"విద్యుత్ క్షేత్రం","magnetic field":"అయస్కాంత క్షేత్రం",
-  "initial velocity":"ప్రారంభ వేగం","final velocity":"చివరి వేగం",
-  "simple interest":"సాధారణ వడ్డీ","compound interest":"చక్రవడ్డీ",
-  "photosynthesis":"కిరణజన్య సంయోగక్రియ","cell membrane":"కణ త్వచం","periodic table":"ఆవర్తన పట్టిక",
-  "velocity":"వేగం","acceleration":"త్వరణం","force":"బలం","mass":"ద్రవ్యరాశి","weight":"బరువు",
-  "energy":"శక్తి","power":"శక్తి","work":"పని","momentum":"ద్రవ్యవేగం","pressure":"పీడనం",
-  "temperature":"ఉష్ణోగ్రత","heat":"వేడి","current":"విద్యుత్ ప్రవాహం","voltage":"వోల్టేజ్",
-  "resistance":"నిరోధం","wavelength":"తరంగ దైర్ఘ్యం","frequency":"పౌనఃపున్యం",
-  "displacement":"స్థానభ్రంశం","distance":"దూరం","electron":"ఎలక్ట్రాన్",
-  "proton":"ప్రోటాన్","neutron":"న్యూట్రాన్","nucleus":"కేంద్రకం","atom":"పరమాణువు",
-  "molecule":"అణువు","cell":"కణం","enzyme":"ఎంజైమ్","protein":"ప్రోటీన్",
-  "gene":"జన్యువు","chromosome":"క్రోమోజోమ్","DNA":"డీఎన్ఏ","RNA":"ఆర్ఎన్ఏ",
-  "element":"మూలకం","compound":"సమ్మేళనం","acid":"ఆమ్లం","base":"క్షారం",
-  "catalyst":"ఉత్ప్రేరకం","equation":"సమీకరణం","probability":"సంభావ్యత",
-  "percentage":"శాతం","profit":"లాభం","loss":"నష్టం","ratio":"నిష్పత్తి",
-  "average":"సగటు","area":"వైశాల్యం","volume":"ఘనపరిమాణం",
-  "maximum":"గరిష్ట","minimum":"కనిష్ట",
-  "correct":"సరైన","total":"మొత్తం","first":"మొదటి","second":"రెండవ",
-  "and":"మరియు","or":"లేదా","not":"కాదు","is":"అయి ఉంటుంది",
-},
-"gu": {
-  "What is the formula for":"સૂત્ર શું છે","Which of the following is correct":"કઈ સાચી છે",
-  "Which of the following":"નીચેનામાંથી","None of the above":"કોઈ નહીં","All of the above":"ઉપરોક્ત સૌ",
-  "Find the value of":"મૂલ્ય શોધો","What is":"શું છે","How many":"કેટલા","is equal to":"ની બરાબર",
-  "is called":"કહેવાય છે",
-  "acceleration due to gravity":"ગુરુત્વાકર્ષણ પ્રવેગ","kinetic energy":"ગતિ ઊર્જા",
-  "potential energy":"સ્થિતિ ઊર્જા","electric field":"વિદ્યુત ક્ષેત્ર","magnetic field":"ચુંબકીય ક્ષેત્ર",
-  "initial velocity":"પ્રારંભિક વેગ","final velocity":"અંતિમ વેગ",
-  "simple interest":"સાદો વ્યાજ","compound interest":"ચક્રવૃદ્ધિ વ્યાજ",
-  "photosynthesis":"પ્રકાશ સંશ્લેષણ","cell membrane":"કોષ પટલ","periodic table":"આવર્ત કોષ્ટક",
-  "velocity":"વેગ","acceleration":"પ્રવેગ","force":"બળ","mass":"દ્રવ્યમાન","weight":"વજન",
-  "energy":"ઊર્જા","power":"શક્તિ","work":"કાર્ય","momentum":"વેગમાન","pressure":"દબાણ",
-  "temperature":"તાપમાન","heat":"ઉષ્મા","current":"વિદ્યુત પ્રવાહ","voltage":"વોલ્ટેજ",
-  "resistance":"અવરોધ","wavelength":"તરંગલંબાઈ","frequency":"આવૃત્તિ",
-  "displacement":"સ્થાનાંતર","distance":"અંતર","electron":"ઇલેક્ટ્રોન",
-  "proton":"પ્રોટોન","neutron":"ન્યૂટ્રોન","nucleus":"ન્યૂક્લિયસ","atom":"પરમાણુ",
-  "molecule":"અણુ","cell":"કોષ","enzyme":"ઉત્સેચક","protein":"પ્રોટીન",
-  "gene":"જનીન","chromosome":"રંગસૂત્ર","DNA":"ડીએનએ","RNA":"આરએનએ",
-  "element":"તત્વ","compound":"સંયોજન","acid":"એસિડ","base":"ક્ષાર",
-  "catalyst":"ઉત્પ્રેરક","equation":"સમીકરણ","probability":"સંભાવના",
-  "percentage":"ટકાવારી","profit":"નફો","loss":"નુકસાન","ratio":"ગુણોત્તર",
-  "average":"સરેરાશ","area":"ક્ષેત્રફળ","volume":"કદ",
-  "maximum":"મહત્તમ","minimum":"લઘુત્તમ",
-  "correct":"સાચો","total":"કુલ","first":"પ્રથમ","second":"બીજો",
-  "and":"અને","or":"અથવા","not":"નહીં","is":"છે",
-},
-"mr": {
-  "What is the formula for":"सूत्र काय आहे","Which of the following is correct":"कोणते बरोबर आहे",
-  "Which of the following":"खालीलपैकी","None of the above":"कोणतेही नाही","All of the above":"वरील सर्व",
-  "Find the value of":"मूल्य शोधा","What is":"काय आहे","How many":"किती","is equal to":"समान आहे",
-  "is called":"म्हणतात",
-  "acceleration due to gravity":"गुरुत्वीय प्रवेग","kinetic energy":"गतिज ऊर्जा",
-  "potential energy":"स्थितिज ऊर्जा","electric field":"विद्युत क्षेत्र","magnetic field":"चुंबकीय क्षेत्र",
-  "initial velocity":"प्रारंभिक वेग","final velocity":"अंतिम वेग",
-  "simple interest":"साधे व्याज","compound interest":"चक्रवाढ व्याज",
-  "photosynthesis":"प्रकाशसंश्लेषण","cell membrane":"पेशी पडदा","periodic table":"आवर्त सारणी",
-  "velocity":"वेग","acceleration":"प्रवेग","force":"बल","mass":"वस्तुमान","weight":"वजन",
-  "energy":"ऊर्जा","power":"शक्ती","work":"काम","momentum":"संवेग","pressure":"दाब",
-  "temperature":"तापमान","heat":"उष्णता","current":"विद्युत प्रवाह","voltage":"व्होल्टेज",
-  "resistance":"प्रतिरोध","wavelength":"तरंगलांबी","frequency":"वारंवारता",
-  "displacement":"विस्थापन","distance":"अंतर","electron":"इलेक्ट्रॉन",
-  "proton":"प्रोटॉन","neutron":"न्यूट्रॉन","nucleus":"केंद्रक","atom":"अणू",
-  "molecule":"रेणू","cell":"पेशी","enzyme":"एन्झाइम","protein":"प्रथिने",
-  "gene":"जनुक","chromosome":"गुणसूत्र","DNA":"डीएनए","RNA":"आरएनए",
-  "element":"मूलद्रव्य","compound":"संयुग","acid":"आम्ल","base":"आधार",
-  "catalyst":"उत्प्रेरक","equation":"समीकरण","probability":"संभाव्यता",
-  "percentage":"टक्केवारी","profit":"नफा","loss":"तोटा","ratio":"गुणोत्तर",
-  "average":"सरासरी","area":"क्षेत्रफळ","volume":"आयतन",
-  "maximum":"कमाल","minimum":"किमान",
-  "correct":"बरोबर","total":"एकूण","first":"पहिला","second":"दुसरा",
-  "and":"आणि","or":"किंवा","not":"नाही","is":"आहे",
-},
-"kn": {
-  "What is the formula for":"ಸೂತ್ರ ಏನು","Which of the following is correct":"ಯಾವುದು ಸರಿ",
-  "Which of the following":"ಕೆಳಗಿನ ಯಾವುದು","None of the above":"ಯಾವುದೂ ಇಲ್ಲ","All of the above":"ಎಲ್ಲವೂ",
-  "Find the value of":"ಮೌಲ್ಯ ಕಂಡುಹಿಡಿ","What is":"ಏನು","How many":"ಎಷ್ಟು","is equal to":"ಸಮ",
-  "is called":"ಎಂದು ಕರೆಯುತ್ತಾರೆ",
-  "acceleration due to gravity":"ಗುರುತ್ವ ತ್ವರಣ","kinetic energy":"ಚಲನ ಶಕ್ತಿ",
-  "potential energy":"ಸ್ಥಿತಿಜ ಶಕ್ತಿ","electric field":"ವಿದ್ಯುತ್ ಕ್ಷೇತ್ರ","magnetic field":"ಕಾಂತ ಕ್ಷೇತ್ರ",
-  "initial velocity":"ಆರಂಭಿಕ ವೇಗ","final velocity":"ಅಂತಿಮ ವೇಗ",
-  "simple interest":"ಸರಳ ಬಡ್ಡಿ","compound interest":"ಚಕ್ರಬಡ್ಡಿ",
-  "photosynthesis":"ದ್ಯುತಿಸಂಶ್ಲೇಷಣೆ","cell membrane":"ಜೀವಕೋಶ ಪೊರೆ","periodic table":"ಆವರ್ತ ಕೋಷ್ಟಕ",
-  "velocity":"ವೇಗ","acceleration":"ತ್ವರಣ","force":"ಬಲ","mass":"ದ್ರವ್ಯರಾಶಿ","weight":"ತೂಕ",
-  "energy":"ಶಕ್ತಿ","power":"ಸಾಮರ್ಥ್ಯ","work":"ಕೆಲಸ","momentum":"ಆವೇಗ","pressure":"ಒತ್ತಡ",
-  "temperature":"ತಾಪಮಾನ","heat":"ಶಾಖ","current":"ವಿದ್ಯುತ್ ಪ್ರವಾಹ","voltage":"ವೋಲ್ಟೇಜ್",
-  "resistance":"ರೋಧ","wavelength":"ತರಂಗ ದೈರ್ಘ್ಯ","frequency":"ಆವೃತ್ತಿ",
-  "displacement":"ಸ್ಥಾನಾಂತರ","distance":"ದೂರ","electron":"ಎಲೆಕ್ಟ್ರಾನ್",
-  "proton":"ಪ್ರೋಟಾನ್","neutron":"ನ್ಯೂಟ್ರಾನ್","nucleus":"ನ್ಯೂಕ್ಲಿಯಸ್","atom":"ಪರಮಾಣು",
-  "molecule":"ಅಣು","cell":"ಜೀವಕೋಶ","enzyme":"ಕಿಣ್ವ","protein":"ಪ್ರೋಟೀನ್",
-  "gene":"ಜೀನ್","chromosome":"ಕ್ರೋಮೋಸೋಮ್","DNA":"ಡಿಎನ್ಎ","RNA":"ಆರ್ಎನ್ಎ",
-  "element":"ಮೂಲವಸ್ತು","compound":"ಸಂಯುಕ್ತ","acid":"ಆಮ್ಲ","base":"ಕ್ಷಾರ",
-  "catalyst":"ವೇಗವರ್ಧಕ","equation":"ಸಮೀಕರಣ","probability":"ಸಂಭಾವ್ಯತೆ",
-  "percentage":"ಶೇಕಡಾ","profit":"ಲಾಭ","loss":"ನಷ್ಟ","ratio":"ಅನುಪಾತ",
-  "average":"ಸರಾಸರಿ","area":"ವಿಸ್ತೀರ್ಣ","volume":"ಘನಗಾತ್ರ",
-  "maximum":"ಗರಿಷ್ಠ","minimum":"ಕನಿಷ್ಠ",
-  "correct":"ಸರಿ","total":"ಒಟ್ಟು","first":"ಮೊದಲ","second":"ಎರಡನೇ",
-  "and":"ಮತ್ತು","or":"ಅಥವಾ","not":"ಇಲ್ಲ","is":"ಆಗಿದೆ",
-},
-"or": {
-  "What is the formula for":"ସୂତ୍ର କ'ଣ","Which of the following is correct":"କେଉଁଟି ସଠିକ",
-  "Which of the following":"ନିମ୍ନ ମଧ୍ୟରୁ","None of the above":"କୌଣସି ନୁହେଁ","All of the above":"ସମସ୍ତ",
-  "Find the value of":"ର ମୂଲ୍ୟ ଖୋଜ","What is":"କ'ଣ","How many":"କେତେ","is equal to":"ସମାନ",
-  "is called":"କୁ କୁହାଯାଏ",
-  "acceleration due to gravity":"ଗୁରୁତ୍ୱୀୟ ତ୍ୱରଣ","kinetic energy":"ଗତି ଶକ୍ତି",
-  "potential energy":"ସ୍ଥିତିଜ ଶକ୍ତି","electric field":"ବୈଦ୍ୟୁତିକ କ୍ଷେତ୍ର","magnetic field":"ଚୁମ୍ବକ କ୍ଷେତ୍ର",
-  "initial velocity":"ପ୍ରାରମ୍ଭ ବେଗ","final velocity":"ଅନ୍ତିମ ବେଗ",
-  "simple interest":"ସରଳ ସୁଧ","compound interest":"ଚକ୍ରବୃଦ୍ଧି ସୁଧ",
-  "photosynthesis":"ସଂଶ୍ଳେଷଣ","cell membrane":"କୋଷ ଝିଲ୍ଲି","periodic table":"ଆବର୍ତ ସାରଣୀ",
-  "velocity":"ବେଗ","acceleration":"ତ୍ୱରଣ","force":"ବଳ","mass":"ଭର","weight":"ଓଜନ",
-  "energy":"ଶକ୍ତି","power":"ଶକ୍ତି","work":"କାର୍ଯ୍ୟ","momentum":"ସଂବେଗ","pressure":"ଚାପ",
-  "temperature":"ତାପମାତ୍ରା","heat":"ଉତ୍ତାପ","current":"ବିଦ୍ୟୁତ ପ୍ରବାହ","voltage":"ଭୋଲ୍ଟେଜ",
-  "resistance":"ପ୍ରତିରୋଧ","wavelength":"ତରଙ୍ଗ ଦୈର୍ଘ୍ୟ","frequency":"ଆବୃତ୍ତି",
-  "displacement":"ସ୍ଥାନଚ୍ୟୁତି","distance":"ଦୂରତ୍ୱ","electron":"ଇଲେକ୍ଟ୍ରନ",
-  "proton":"ପ୍ରୋଟନ","neutron":"ନ୍ୟୁଟ୍ରନ","nucleus":"ନ୍ୟୁକ୍ଲିୟସ","atom":"ପରମାଣୁ",
-  "molecule":"ଅଣୁ","cell":"କୋଷ","enzyme":"ଏନଜାଇମ","protein":"ପ୍ରୋଟିନ",
-  "gene":"ଜିନ","chromosome":"ଗୁଣସୂତ୍ର","DNA":"ଡିଏନଏ","RNA":"ଆରଏନଏ",
-  "element":"ମୂଳ ଧାତୁ","compound":"ଯୌଗିକ","acid":"ଅମ୍ଳ","base":"କ୍ଷାର",
-  "catalyst":"ଉତ୍ପ୍ରେରକ","equation":"ସମୀକରଣ","probability":"ସମ୍ଭାବ୍ୟତା",
-  "percentage":"ଶତାଂଶ","profit":"ଲାଭ","loss":"କ୍ଷତି","ratio":"ଅନୁପାତ",
-  "average":"ହାରାହାରି","area":"କ୍ଷେତ୍ରଫଳ","volume":"ଘନଫଳ",
-  "maximum":"ସର୍ବୋଚ୍ଚ","minimum":"ସର୍ବନିମ୍ନ",
-  "correct":"ଠିକ","total":"ମୋଟ","first":"ପ୍ରଥମ","second":"ଦ୍ୱିତୀୟ",
-  "and":"ଏବଂ","or":"ବା","not":"ନୁହେଁ","is":"ଅଟେ",
-},
-}
+# Phrase dictionaries live in phrase_dicts/v2.py; phrase_engine loads them per
+# language from compiled artifacts (see phrase_store.py) on first use.
+def get_phrase_matcher(lang: str) -> Optional[PhraseMatcher]:
+    if lang not in SUPPORTED_LANGS:
+        return None
+    return phrase_engine.get_matcher(lang, "v2")
 
-# Pre-sort phrase dictionaries: longest-first for greedy matching
-_SORTED_PHRASES: Dict[str, list] = {
-    lang: sorted(pd.items(), key=lambda x: -len(x[0]))
-    for lang, pd in PHRASE_DICT.items()
-}
+# translate_text results: bounded LRU in front of the translation_cache table
+_trans_cache = get_cache()
 
-# In-memory translation cache
-_trans_cache: Dict[str, str] = {}
-_cache_lock = threading.Lock()
+
+def _cache_engine(prefer_accuracy: bool) -> str:
+    """What produced a translate_text result (part of its cache key)."""
+    engine = translation_memory.engine_key("v2")
+    if prefer_accuracy and ARGOS_AVAILABLE:
+        engine += "+argos"
+    if DEEP_AVAILABLE:
+        engine += "+deep"
+    return engine
 
 # ══════════════════════════════════════════════════════════════════════════════
 # TRANSLATION FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
-_argos_initialized = False
-_argos_installed_pairs: set = set()
-
-
-def _init_argos():
-    global _argos_initialized, _argos_installed_pairs
-    if not ARGOS_AVAILABLE or _argos_initialized:
-        return
-    try:
-        argostranslate.package.update_package_index()
-        available_packages = argostranslate.package.get_available_packages()
-        for lang_code in SUPPORTED_LANGS.keys():
-            if ("en", lang_code) not in _argos_installed_pairs:
-                matching = [pkg for pkg in available_packages
-                           if pkg.from_code == "en" and pkg.to_code == lang_code]
-                if matching:
-                    try:
-                        argostranslate.package.install_from_path(matching[0].download())
-                        _argos_installed_pairs.add(("en", lang_code))
-                    except Exception as e:
-                        print(f"  Argos: en→{lang_code} failed: {e}")
-        _argos_initialized = True
-    except Exception as e:
-        print(f"  Argos init: {e}")
-        _argos_initialized = True
-
-
 def argos_translate(text: str, target_lang: str) -> Optional[str]:
+    """Argos translation with the process's cached model (None if unavailable)."""
     if not ARGOS_AVAILABLE:
         return None
-    try:
-        installed = argostranslate.translate.get_installed_languages()
-        fl = next((l for l in installed if l.code == "en"), None)
-        tl = next((l for l in installed if l.code == target_lang), None)
-        if fl and tl:
-            tr = fl.get_translation(tl)
-            if tr:
-                return tr.translate(text)
-    except Exception:
-        pass
-    return None
+    return argos_worker.translate_one(text, target_lang)
 
 
 def deep_translate(text: str, target_lang: str) -> Optional[str]:
@@ -364,18 +91,9 @@ def phrase_translate(text: str, target_lang: str) -> str:
     Offline phrase-replacement translation.
     Instantly covers all 100k+ questions without any API.
     """
-    if not text or target_lang == "en":
-        return text
-    phrases = _SORTED_PHRASES.get(target_lang, [])
-    if not phrases:
+    if not text or target_lang not in SUPPORTED_LANGS:
         return text
-    result = text
-    for eng, native in phrases:
-        if not native or not eng:
-            continue
-        if eng.lower() in result.lower():
-            result = re.sub(re.escape(eng), native, result, flags=re.IGNORECASE, count=5)
-    return result
+    return phrase_engine.translate(text, target_lang, "v2")
 
 
 def translate_text(text: str, target_lang: str,
@@ -387,11 +105,10 @@ def translate_text(text: str, target_lang: str,
     if not text or target_lang == "en":
         return text, "none"
 
-    cache_key = f"{target_lang}|{hashlib.md5(text.encode('utf-8', errors='replace')).hexdigest()}"
-    with _cache_lock:
-        cached = _trans_cache.get(cache_key)
-        if cached is not None:
-            return cached, "cache"
+    engine = _cache_engine(prefer_accuracy)
+    cached = _trans_cache.get(target_lang, text, engine)
+    if cached is not None:
+        return cached[0], "cache"
 
     result = None
     method = "english_fallback"
@@ -421,8 +138,9 @@ def translate_text(text: str, target_lang: str,
         result = phrase_result if (phrase_result and phrase_result != text) else text
         method = "phrase" if result != text else "english_fallback"
 
-    with _cache_lock:
-        _trans_cache[cache_key] = result
+    # English fallbacks stay in memory only, so a failed online call is retried after a restart
+    _trans_cache.put(target_lang, text, engine, result, method,
+                     persist=method != "english_fallback")
 
     return result, method
 
@@ -437,11 +155,7 @@ def save_translation_to_db(qb_id: int, lang: str, fields: Dict[str, str],
                            method: str = "unknown"):
     """Save translated fields. Thread-safe, Python 3.6+ compatible."""
     conn = _bank_conn()
-    set_parts = []
-    vals = []
-    for field_key, translated in fields.items():
-        set_parts.append(f"{field_key}_{lang}=?")
-        vals.append(translated)
+    vals = list(fields.values())
 
     with _bank_lock:
         try:
@@ -452,12 +166,10 @@ def save_translation_to_db(qb_id: int, lang: str, fields: Dict[str, str],
                 langs_list = json.loads(row[0] or "[]")
                 if lang not in langs_list:
                     langs_list.append(lang)
-                set_parts.append("translated_langs=?")
                 vals.append(json.dumps(langs_list))
             vals.append(qb_id)
-            conn.execute(
-                f"UPDATE question_bank SET {', '.join(set_parts)} WHERE qb_id=?", vals
-            )
+            conn.execute(update_sql(lang, fields.keys(), with_langs=bool(row)), vals)
+            bump_bank_generation(conn)
             conn.commit()
         except Exception as e:
             try:
@@ -466,26 +178,72 @@ def save_translation_to_db(qb_id: int, lang: str, fields: Dict[str, str],
                 pass
 
 
+# On-the-fly translations from get_question_in_lang are saved by one background
+# writer: keyed ("q", qb_id, lang) → fields and ("tm", lang, source) → target,
+# so repeated views of a question coalesce and each batch is one transaction.
+_QUESTION_FIELDS = ["question", "option_a", "option_b", "option_c", "option_d"]
+
+
+def _write_translations(conn, batch):
+    by_lang: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+    memory: Dict[str, Dict[str, str]] = {}
+    for key, value in batch:
+        if key[0] == "q":
+            by_lang.setdefault(key[2], []).append((key[1], value))
+        else:
+            memory.setdefault(key[1], {})[key[2]] = value
+    for lang, rows in by_lang.items():
+        ids = [qb_id for qb_id, _ in rows]
+        langs_of = dict(conn.execute(
+            f"SELECT qb_id, translated_langs FROM question_bank "
+            f"WHERE qb_id IN ({','.join('?' * len(ids))})", ids).fetchall())
+        params = []
+        for qb_id, fields in rows:
+            if qb_id not in langs_of:
+                continue
+            langs_list = json.loads(langs_of[qb_id] or "[]")
+            if lang not in langs_list:
+                langs_list.append(lang)
+            params.append([fields.get(f) for f in _QUESTION_FIELDS] + [json.dumps(langs_list), qb_id])
+        # a bulk job may have stored a translation since this one was made
+        conn.executemany(update_sql(lang, _QUESTION_FIELDS, with_langs=True, if_missing=True), params)
+    for lang, pairs in memory.items():
+        translation_memory.store(lang, pairs, "v2", conn=conn)
+    if by_lang:
+        bump_bank_generation(conn)
+
+
+_translation_writer = _BatchWriter("translation-writer", _write_translations)
+
+
+def queue_translation_save(qb_id: int, lang: str, fields: Dict[str, str],
+                           memory: Optional[Dict[str, str]] = None):
+    """Save an on-the-fly translation (and its new memory pairs) in the background."""
+    _translation_writer.put(("q", qb_id, lang), fields)
+    for src, target in (memory or {}).items():
+        _translation_writer.put(("tm", lang, src), target)
+
+
+def flush_translation_writes(timeout: float = 5.0) -> bool:
+    """Block until queued on-the-fly translations are committed."""
+    return _translation_writer.flush(timeout)
+
+
 def save_translations_batch(updates: list, lang: str):
     """Batch save translations — single transaction, much faster."""
     conn = _bank_conn()
-    fields_order = ["question", "option_a", "option_b", "option_c", "option_d"]
+    # rows with the same set of fields share one prepared UPDATE
+    by_shape: Dict[tuple, list] = {}
+    for qb_id, fields in updates:
+        shape = tuple(fk for fk in _QUESTION_FIELDS if fk in fields)
+        if shape:
+            by_shape.setdefault(shape, []).append([fields[fk] for fk in shape] + [qb_id])
     with _bank_lock:
         try:
             conn.execute("BEGIN")
-            for qb_id, fields in updates:
-                set_parts = []
-                vals = []
-                for fk in fields_order:
-                    if fk in fields:
-                        set_parts.append(f"{fk}_{lang}=?")
-                        vals.append(fields[fk])
-                if set_parts:
-                    vals.append(qb_id)
-                    conn.execute(
-                        f"UPDATE question_bank SET {', '.join(set_parts)} WHERE qb_id=?",
-                        vals
-                    )
+            for shape, params in by_shape.items():
+                conn.executemany(update_sql(lang, shape), params)
+            bump_bank_generation(conn)
             conn.execute("COMMIT")
         except Exception as e:
             try:
@@ -498,20 +256,20 @@ def save_translations_batch(updates: list, lang: str):
 def get_untranslated_count(lang: str) -> int:
     conn = _bank_conn()
     with _bank_lock:
-        return conn.execute(
-            f"SELECT COUNT(*) FROM question_bank WHERE question_{lang} IS NULL OR question_{lang} = ''"
-        ).fetchone()[0]
+        return conn.execute(count_sql(lang, translated=False)).fetchone()[0]
 
 
 def get_translated_count(lang: str) -> int:
     conn = _bank_conn()
     with _bank_lock:
-        return conn.execute(
-            f"SELECT COUNT(*) FROM question_bank WHERE question_{lang} IS NOT NULL AND question_{lang} != ''"
-        ).fetchone()[0]
+        return conn.execute(count_sql(lang)).fetchone()[0]
 
 
 def get_all_translation_stats() -> Dict:
+    return cached_bank_read("translation_stats", _load_translation_stats)
+
+
+def _load_translation_stats() -> Dict:
     conn = _bank_conn()
     total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
     stats = {"total": total, "languages": {}}
@@ -537,14 +295,10 @@ def translate_batch(lang: str, batch_size: int = 1000,
     500-1000 questions/second performance.
     """
     conn = _bank_conn()
-    subj_clause = f"AND subject='{subject_filter}'" if subject_filter else ""
+    sql = untranslated_sql(lang, by_subject=bool(subject_filter))
+    params = (subject_filter, batch_size) if subject_filter else (batch_size,)
     with _bank_lock:
-        rows = conn.execute(f"""
-            SELECT qb_id, question_en, option_a_en, option_b_en, option_c_en, option_d_en
-            FROM question_bank
-            WHERE (question_{lang} IS NULL OR question_{lang} = '') {subj_clause}
-            LIMIT {batch_size}
-        """).fetchall()
+        rows = conn.execute(sql, params).fetchall()
 
     if not rows:
         return {"translated": 0, "methods": {}}
@@ -572,33 +326,28 @@ def translate_batch(lang: str, batch_size: int = 1000,
 def translate_all_questions(langs: List[str] = None,
                              batch_size: int = 2000,
                              progress_callback=None) -> Dict:
-    """Translate all 100k+ questions into all specified languages."""
+    """
+    Translate all 100k+ questions into all specified languages.
+    Runs the multi-process pipeline (translation_pipeline.py): all languages
+    in one pass over the bank, one writer.
+    """
+    from translation_pipeline import run_translation_pipeline
     if langs is None:
         langs = list(SUPPORTED_LANGS.keys())
 
-    conn = _bank_conn()
-    total = conn.execute("SELECT COUNT(*) FROM question_bank").fetchone()[0]
-    results = {}
+    def report(done, totals):
+        if progress_callback:
+            for lang, n in done.items():
+                progress_callback(n, totals[lang], lang)
 
+    stats = run_translation_pipeline(langs, chunk_size=batch_size, progress=report)
+    results = {}
     for lang in langs:
-        lang_name = SUPPORTED_LANGS[lang]["name"]
-        remaining = get_untranslated_count(lang)
-        if remaining == 0:
-            results[lang] = {"status": "complete", "translated": 0}
-            continue
-
-        translated = 0
-        while True:
-            r = translate_batch(lang, batch_size=batch_size, progress_callback=progress_callback)
-            if r["translated"] == 0:
-                break
-            translated += r["translated"]
-
+        translated = stats["translated"].get(lang, 0)
         results[lang] = {
-            "status": "done", "translated": translated,
+            "status": "done" if translated else "complete", "translated": translated,
             "final_count": get_translated_count(lang),
         }
-
     return results
 
 
@@ -606,11 +355,44 @@ def translate_all_questions(langs: List[str] = None,
 # QUESTION DISPLAY
 # ══════════════════════════════════════════════════════════════════════════════
 
+def ensure_translations(questions: List[Dict], lang: str) -> Dict:
+    """
+    Fill every question of a drawn paper that lacks `lang`, in place, in one
+    batch: each unique English string once, translation memory first. Rows
+    are saved by the background writer, so rendering never translates.
+    Returns {"questions", "strings", "from_memory", "secs"}.
+    """
+    t0 = time.time()
+    out = {"questions": 0, "strings": 0, "from_memory": 0, "secs": 0.0}
+    if lang == "en" or lang not in SUPPORTED_LANGS:
+        return out
+    todo = [q for q in questions if not q.get(f"question_{lang}")]
+    if not todo:
+        return out
+    texts = {q.get(f"{f}_en") or "" for q in todo for f in _QUESTION_FIELDS} - {""}
+    known = translation_memory.lookup(lang, texts, "v2")
+    new = {t: phrase_translate(t, lang) for t in texts if t not in known}
+    known.update(new)
+    for q in todo:
+        fields = {f: known.get(q.get(f"{f}_en") or "", "") for f in _QUESTION_FIELDS}
+        for f, v in fields.items():
+            q[f"{f}_{lang}"] = v
+        if q.get("qb_id"):
+            _translation_writer.put(("q", q["qb_id"], lang), fields)
+    for src, target in new.items():
+        _translation_writer.put(("tm", lang, src), target)
+    out.update(questions=len(todo), strings=len(texts), from_memory=len(texts) - len(new),
+               secs=time.time() - t0)
+    return out
+
+
 def get_question_in_lang(row: dict, lang: str) -> dict:
     """
     Get question fields in specified language.
     Always returns something — never blank.
     Priority: DB → on-the-fly phrase → English fallback
+    (exam papers are filled up front by ensure_translations, so the
+    on-the-fly path is only a safety net there)
     """
     if lang == "en":
         return {
@@ -641,17 +423,17 @@ def get_question_in_lang(row: dict, lang: str) -> dict:
         "option_c": row.get("option_c_en") or "",
         "option_d": row.get("option_d_en") or "",
     }
-    translated = {k: phrase_translate(v, lang) for k, v in en_fields.items()}
-
-    # Async save to DB so next time it's instant
+    # Shared strings ("All of the above", units, stems) come from the translation memory
+    known, new = {}, {}
+    if lang in SUPPORTED_LANGS:
+        known = translation_memory.lookup(lang, en_fields.values(), "v2")
+        new = {t: phrase_translate(t, lang) for t in set(en_fields.values()) if t and t not in known}
+    translated = {k: known.get(v) or new.get(v, v) for k, v in en_fields.items()}
+
+    # Saved in the background so next time it's instant
     qb_id = row.get("qb_id")
-    if qb_id:
-        def _async_save():
-            try:
-                save_translation_to_db(qb_id, lang, translated, "phrase")
-            except Exception:
-                pass
-        threading.Thread(target=_async_save, daemon=True).start()
+    if qb_id and lang in SUPPORTED_LANGS:
+        queue_translation_save(qb_id, lang, translated, new)
 
     return {
         "question": translated["question"] or en_fields["question"],
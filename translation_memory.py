@@ -0,0 +1,183 @@
+"""
+translation_memory.py — Translation memory for offline phrase translation
+==========================================================================
+Options like "All of the above", units like "10 m/s" and templated stems
+repeat thousands of times across the bank, yet bulk jobs translated every
+field of every row on its own. The translation memory stores each unique
+source string's translation once per (language, engine) in
+question_bank.db, keyed by a hash of the source text:
+
+  translation_memory(lang, engine, src_hash) → target
+
+`engine` is "<phrase_engine profile>:<fingerprint>", the fingerprint
+covering the dictionary, the matcher and phrase_engine's rules, so editing
+any of them starts a fresh memory for that profile instead of serving
+stale translations.
+
+Bulk jobs call translate_unique() per batch: it dedups the batch, serves
+what the memory already knows, translates only the rest and records it.
+The on-the-fly path in translation_engine_v2.get_question_in_lang looks
+fields up the same way.
+
+Usage:
+    from translation_memory import translate_unique, new_stats, format_stats
+    stats = new_stats()
+    mapping = translate_unique(texts, "hi", "v2", stats=stats)
+    rows = [[mapping.get(t, t) for t in row] for row in batch]
+    print(format_stats(stats))
+"""
+
+import time
+import hashlib
+import sqlite3
+from typing import Callable, Dict, Iterable, Optional
+
+import phrase_engine
+import phrase_store
+from question_bank_db import _bank_conn, _bank_lock
+
+_LOOKUP_CHUNK = 500        # src_hash values per IN (...) query
+_engine_keys: Dict[str, str] = {}
+
+
+def _ensure_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS translation_memory (
+            lang     TEXT NOT NULL,
+            engine   TEXT NOT NULL,
+            src_hash TEXT NOT NULL,
+            target   TEXT NOT NULL,
+            PRIMARY KEY (lang, engine, src_hash)
+        ) WITHOUT ROWID
+    """)
+
+
+def src_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def engine_key(profile: str = "v2") -> str:
+    key = _engine_keys.get(profile)
+    if key is None:
+        source = phrase_engine.PROFILES[profile]["source"]
+        h = hashlib.sha1(phrase_store.fingerprint(source).encode())
+        with open(phrase_engine.__file__, "rb") as f:    # profile rules (protection etc.)
+            h.update(f.read())
+        key = _engine_keys[profile] = f"{profile}:{h.hexdigest()[:16]}"
+    return key
+
+
+def lookup(lang: str, texts: Iterable[str], profile: str = "v2", conn=None) -> Dict[str, str]:
+    """{source: translation} for the texts the memory already has."""
+    by_hash = {src_hash(t): t for t in texts if t}
+    if not by_hash:
+        return {}
+    engine = engine_key(profile)
+    hashes = list(by_hash)
+    found: Dict[str, str] = {}
+    own = conn is None
+    if own:
+        conn = _bank_conn()
+    try:
+        for i in range(0, len(hashes), _LOOKUP_CHUNK):
+            part = hashes[i:i + _LOOKUP_CHUNK]
+            sql = (f"SELECT src_hash, target FROM translation_memory "
+                   f"WHERE lang=? AND engine=? AND src_hash IN ({','.join('?' * len(part))})")
+            if own:
+                with _bank_lock:
+                    rows = conn.execute(sql, (lang, engine, *part)).fetchall()
+            else:
+                rows = conn.execute(sql, (lang, engine, *part)).fetchall()
+            for h, target in rows:
+                found[by_hash[h]] = target
+    except sqlite3.OperationalError:
+        return {}   # translation_memory not created yet
+    return found
+
+
+def store(lang: str, pairs: Dict[str, str], profile: str = "v2", conn=None):
+    """
+    Record {source: translation}. Pass `conn` to write inside the caller's
+    open transaction (caller commits); otherwise this commits itself.
+    """
+    engine = engine_key(profile)
+    params = [(lang, engine, src_hash(s), t) for s, t in pairs.items() if s and t is not None]
+    if not params:
+        return
+    sql = "INSERT OR IGNORE INTO translation_memory (lang, engine, src_hash, target) VALUES (?, ?, ?, ?)"
+    if conn is not None:
+        _ensure_table(conn)
+        conn.executemany(sql, params)
+        return
+    conn = _bank_conn()
+    with _bank_lock:
+        try:
+            _ensure_table(conn)
+            conn.executemany(sql, params)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"translation_memory store error: {e}")
+
+
+def new_stats() -> Dict:
+    # sample_*: timing of a few memory hits re-translated, used when nothing else was
+    return {"fields": 0, "unique": 0, "hits": 0, "translated": 0, "secs": 0.0,
+            "sample_n": 0, "sample_secs": 0.0}
+
+
+def record(stats: Optional[Dict], fields: int, unique: int, hits: int, translated: int, secs: float):
+    if stats is not None:
+        stats["fields"] += fields
+        stats["unique"] += unique
+        stats["hits"] += hits
+        stats["translated"] += translated
+        stats["secs"] += secs
+
+
+def summarize(stats: Dict) -> Dict:
+    """Adds dedup_ratio (fields per translation actually done) and secs_saved (estimated)."""
+    out = dict(stats)
+    if stats["translated"]:
+        per = stats["secs"] / stats["translated"]
+    else:
+        per = stats.get("sample_secs", 0.0) / stats["sample_n"] if stats.get("sample_n") else 0.0
+    out["dedup_ratio"] = stats["fields"] / stats["translated"] if stats["translated"] else None
+    out["secs_saved"] = per * (stats["fields"] - stats["translated"])
+    return out
+
+
+def format_stats(stats: Dict) -> str:
+    s = summarize(stats)
+    ratio = f"×{s['dedup_ratio']:.1f} dedup" if s["dedup_ratio"] else "all from memory"
+    return (f"TM: {s['fields']:,} fields → {s['unique']:,} unique, {s['hits']:,} from memory, "
+            f"{s['translated']:,} translated ({ratio}, ~{s['secs_saved']:.1f}s saved)")
+
+
+def translate_unique(texts: Iterable[str], lang: str, profile: str = "v2",
+                     translate: Optional[Callable[[str], str]] = None, conn=None,
+                     stats: Optional[Dict] = None) -> Dict[str, str]:
+    """
+    Translate a batch of source strings: each unique string once, memory first.
+    Returns {source: translation} for every non-empty source; new translations
+    are stored (in the caller's transaction when `conn` is given).
+    """
+    texts = list(texts)
+    unique = {t for t in texts if t}
+    known = lookup(lang, unique, profile, conn)
+    misses = [t for t in unique if t not in known]
+    translate = translate or (lambda t: phrase_engine.translate(t, lang, profile))
+    t0 = time.perf_counter()
+    new = {t: translate(t) for t in misses}
+    secs = time.perf_counter() - t0
+    if stats is not None and known and not misses and not stats["translated"] and not stats["sample_n"]:
+        sample = list(known)[:20]
+        translate(sample[0])            # first call may load the dictionary
+        t0 = time.perf_counter()
+        for t in sample:
+            translate(t)
+        stats["sample_n"], stats["sample_secs"] = len(sample), time.perf_counter() - t0
+    store(lang, new, profile, conn)
+    record(stats, len(texts), len(unique), len(known), len(new), secs)
+    known.update(new)
+    return known
@@ -0,0 +1,261 @@
+"""
+translation_pipeline.py — Parallel bulk phrase translation
+===========================================================
+Translates the whole bank into several languages at once:
+
+  reader  (calling thread) — streams rows that still miss any requested
+                             language, keyset-paged on qb_id; dedups each
+                             chunk's source strings and serves repeats from
+                             the translation memory (translation_memory.py)
+  workers (process pool)   — phrase-translate the chunk's remaining unique
+                             strings; CPU-bound, so throughput scales with cores.
+                             With engine="argos" each worker loads the Argos
+                             models once and translates in batches instead
+                             (argos_worker.py); those runs skip the phrase
+                             translation memory
+  writer  (one thread)     — one transaction per chunk: executemany per
+                             language plus the new memory entries, so SQLite
+                             only ever sees one writer
+
+Usage:
+    from translation_pipeline import run_translation_pipeline
+    stats = run_translation_pipeline(["hi", "ta"], progress=lambda done, totals: ...)
+
+    python translation_pipeline.py                 # all languages
+    python translation_pipeline.py --langs hi,bn --workers 4
+    python translation_pipeline.py --engine argos --workers 2
+"""
+
+import os
+import sys
+import time
+import queue
+import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from question_bank_db import (
+    _bank_conn, _bank_lock, bump_bank_generation, count_sql, iter_bank_rows, untranslated_where,
+    update_sql,
+)
+from translation_engine_v2 import SUPPORTED_LANGS, phrase_translate
+import translation_memory as tm
+import argos_worker
+
+ENGINES = ("phrase", "argos")
+
+FIELDS = ["question", "option_a", "option_b", "option_c", "option_d"]
+
+# (qb_id, [langs this row is missing], [5 english fields])
+Row = Tuple[int, List[str], List[str]]
+
+# Translations remembered across chunks within one run (repeats often arrive
+# before the writer has committed them to the memory table); bounded
+_RUN_MEMORY_MAX = 200_000
+
+
+def _translate_chunk(work: Dict[str, List[str]]) -> Tuple[Dict[str, List[str]], float, Dict]:
+    """Worker: {lang: [unique source strings]} → ({lang: [translations]}, seconds spent, {})."""
+    t0 = time.perf_counter()
+    out = {lang: [phrase_translate(t, lang) for t in texts] for lang, texts in work.items()}
+    return out, time.perf_counter() - t0, {}
+
+
+def _read_chunks(langs: List[str], chunk_size: int):
+    """Reader: yields lists of rows that miss at least one of `langs`."""
+    need = [untranslated_where(l) for l in langs]
+    columns = "question_en, option_a_en, option_b_en, option_c_en, option_d_en, " + ", ".join(need)
+    for rows in iter_bank_rows(columns, " OR ".join(need), batch_size=chunk_size):
+        yield [(r[0], [l for l, flag in zip(langs, r[6:]) if flag], [r[i] or "" for i in range(1, 6)])
+               for r in rows]
+
+
+def _writer(results: "queue.Queue", written: Dict[str, int], errors: List[str]):
+    """Writer thread: drains translated chunks into the DB, one transaction each."""
+    conn = _bank_conn()
+    while True:
+        item = results.get()
+        if item is None:
+            return
+        chunk, memory = item
+        with _bank_lock:
+            try:
+                conn.execute("BEGIN")
+                for lang, updates in chunk.items():
+                    conn.executemany(update_sql(lang), updates)
+                for lang, pairs in memory.items():
+                    tm.store(lang, pairs, "v2", conn)
+                bump_bank_generation(conn)
+                conn.commit()
+                for lang, updates in chunk.items():
+                    written[lang] = written.get(lang, 0) + len(updates)
+            except Exception as e:
+                conn.rollback()
+                errors.append(str(e))
+                print(f"translation_pipeline write error: {e}")
+
+
+def _plan_chunk(rows: List[Row], run_memory: Dict[str, Dict[str, str]], stats: Dict,
+                use_memory: bool = True):
+    """
+    Dedup a chunk per language and resolve what the memory already knows
+    (this run's translations only when use_memory is False).
+    Returns (known {lang: {src: target}}, work {lang: [unique misses]}).
+    """
+    texts: Dict[str, set] = {}
+    n_fields: Dict[str, int] = {}
+    for _, langs, en in rows:
+        for lang in langs:
+            texts.setdefault(lang, set()).update(t for t in en if t)
+            n_fields[lang] = n_fields.get(lang, 0) + len(en)
+    known: Dict[str, Dict[str, str]] = {}
+    work: Dict[str, List[str]] = {}
+    for lang, unique in texts.items():
+        seen = run_memory.setdefault(lang, {})
+        hit = {t: seen[t] for t in unique if t in seen}
+        if use_memory:
+            hit.update(tm.lookup(lang, [t for t in unique if t not in hit], "v2"))
+        known[lang] = hit
+        work[lang] = [t for t in unique if t not in hit]
+        tm.record(stats, n_fields[lang], len(unique), len(hit), 0, 0.0)
+    return known, work
+
+
+def _fan_out(rows: List[Row], known: Dict[str, Dict[str, str]]) -> Dict[str, List[tuple]]:
+    """{lang: [(q, a, b, c, d, qb_id), ...]} for one chunk."""
+    out: Dict[str, List[tuple]] = {}
+    for qb_id, langs, en in rows:
+        for lang in langs:
+            m = known[lang]
+            out.setdefault(lang, []).append(tuple(m.get(t, t) for t in en) + (qb_id,))
+    return out
+
+
+def run_translation_pipeline(langs: Optional[List[str]] = None, workers: Optional[int] = None,
+                             chunk_size: int = 500,
+                             progress: Optional[Callable[[Dict[str, int], Dict[str, int]], None]] = None,
+                             engine: str = "phrase") -> Dict:
+    """
+    Translate every question still missing any of `langs`.
+    progress(done_by_lang, total_by_lang) is called from the calling thread
+    after each chunk, so it is safe to update Streamlit widgets from it.
+    engine="argos" uses Argos models (phrase translation per failed text).
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"unknown translation engine: {engine}")
+    if engine == "argos" and not argos_worker.ARGOS_AVAILABLE:
+        print("⚠️ argostranslate is not installed — using phrase translation")
+        engine = "phrase"
+    argos = engine == "argos"
+    langs = [l for l in (langs or list(SUPPORTED_LANGS)) if l in SUPPORTED_LANGS]
+    # every Argos worker holds its own copy of the models
+    workers = workers or (max(1, (os.cpu_count() or 2) // 2) if argos else os.cpu_count() or 1)
+    conn = _bank_conn()
+    with _bank_lock:
+        totals = {l: conn.execute(count_sql(l, translated=False)).fetchone()[0] for l in langs}
+    done = {l: 0 for l in langs}
+    langs = [l for l in langs if totals[l]]
+    if not langs:
+        return {"rows": 0, "translated": done, "elapsed": 0.0, "errors": [],
+                "memory": tm.summarize(tm.new_stats()), "engine": engine, "argos": {}}
+
+    t0 = time.time()
+    results: "queue.Queue" = queue.Queue(maxsize=workers * 2)
+    written: Dict[str, int] = {}
+    errors: List[str] = []
+    writer = threading.Thread(target=_writer, args=(results, written, errors),
+                              name="translation-writer", daemon=True)
+    writer.start()
+
+    n_rows = 0
+    in_flight: Dict = {}          # future -> (rows, known)
+    run_memory: Dict[str, Dict[str, str]] = {}
+    run_size = [0]
+    stats = tm.new_stats()
+    argos_metrics: Dict[str, Dict] = {}
+    if argos:
+        pool_args = {"initializer": argos_worker.init_worker, "initargs": (langs,)}
+        worker_fn = argos_worker.translate_chunk
+    else:
+        pool_args, worker_fn = {}, _translate_chunk
+    # spawn: the app process has threads (Streamlit), so don't fork it
+    ctx = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, **pool_args) as pool:
+            def finish(rows, known, work, translated, secs, per_lang=None):
+                new = {lang: dict(zip(work[lang], translated.get(lang, []))) for lang in work}
+                for lang, pairs in new.items():
+                    known[lang].update(pairs)
+                    if run_size[0] < _RUN_MEMORY_MAX:
+                        run_memory[lang].update(pairs)
+                        run_size[0] += len(pairs)
+                tm.record(stats, 0, 0, 0, sum(len(p) for p in new.values()), secs)
+                argos_worker.merge_metrics(argos_metrics, per_lang or {})
+                chunk = _fan_out(rows, known)
+                results.put((chunk, {} if argos else new))
+                for lang, updates in chunk.items():
+                    done[lang] += len(updates)
+
+            def collect(block: bool):
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED) if block else (
+                    {f for f in in_flight if f.done()}, None)
+                for fut in finished:
+                    rows, known, work = in_flight.pop(fut)
+                    finish(rows, known, work, *fut.result())
+                if finished and progress:
+                    progress(dict(done), dict(totals))
+
+            for rows in _read_chunks(langs, chunk_size):
+                n_rows += len(rows)
+                known, work = _plan_chunk(rows, run_memory, stats, use_memory=not argos)
+                if not any(work.values()):
+                    finish(rows, known, work, {}, 0.0)     # all from memory
+                    if progress:
+                        progress(dict(done), dict(totals))
+                    continue
+                in_flight[pool.submit(worker_fn, work)] = (rows, known, work)
+                if len(in_flight) >= workers * 2:
+                    collect(block=True)
+                else:
+                    collect(block=False)
+            while in_flight:
+                collect(block=True)
+    finally:
+        results.put(None)
+        writer.join()
+
+    elapsed = time.time() - t0
+    return {"rows": n_rows, "translated": written, "elapsed": elapsed,
+            "qps": n_rows / elapsed if elapsed else 0.0, "errors": errors,
+            "memory": tm.summarize(stats), "engine": engine, "argos": argos_metrics}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parallel offline translation of the question bank")
+    ap.add_argument("--langs", default=",".join(SUPPORTED_LANGS), help="comma-separated language codes")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    ap.add_argument("--chunk-size", type=int, default=500)
+    ap.add_argument("--engine", choices=ENGINES, default="phrase", help="phrase (default) or argos")
+    args = ap.parse_args()
+
+    def report(done, totals):
+        line = "  ".join(f"{l}:{done[l] * 100 // max(1, totals[l])}%" for l in totals if totals[l])
+        print(f"  {line}", end="\r", flush=True)
+
+    stats = run_translation_pipeline([l.strip() for l in args.langs.split(",") if l.strip()],
+                                     args.workers, args.chunk_size, report, args.engine)
+    print(f"\n✅ {stats['rows']:,} questions in {stats['elapsed']:.1f}s "
+          f"({stats.get('qps', 0):,.0f} q/s) — {stats['translated']}")
+    print(f"   {tm.format_stats(stats['memory'])}")
+    if stats["engine"] == "argos":
+        print(f"   {argos_worker.format_metrics(stats['argos'])}")
+    if stats["errors"]:
+        print(f"❌ {len(stats['errors'])} chunk(s) failed to write: {stats['errors'][0]}")
+
+
+if __name__ == "__main__":
+    main()
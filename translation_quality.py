@@ -0,0 +1,275 @@
+"""
+translation_quality.py — Translation coverage and quality analyzer
+===================================================================
+Streams the bank once (keyset-paged, row chunks analysed by a process
+pool) and computes per (subject, language):
+
+  coverage        questions with a stored translation
+  untouched       stored "translations" identical to the English
+  latin_ratio     share of word tokens in the translated fields still in
+                  Latin script (acronyms and 1-letter symbols don't count)
+  top phrases     the most frequent runs of untranslated English words —
+                  the dictionary entries that would help most
+
+Results replace the translation_quality table in question_bank.db, which
+the admin panel reads.
+
+Usage:
+    from translation_quality import analyze, load_quality
+    analyze(["hi", "ta"])
+    rows = load_quality()
+
+    python translation_quality.py                       # all languages, all subjects
+    python translation_quality.py --langs hi --top 15
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from question_bank_db import _bank_conn, _bank_lock, iter_bank_rows, lang_columns
+
+LANGS = ["hi", "bn", "ta", "te", "gu", "mr", "kn", "or"]
+FIELDS = ["question", "option_a", "option_b", "option_c", "option_d"]
+TOP_PHRASES = 20
+_PHRASES_PER_CHUNK = 500      # per (subject, lang) sent back by a worker
+
+_WORD = re.compile(r"[^\W\d_]+")
+_LATIN = re.compile(r"[A-Za-z]+")
+
+Key = Tuple[str, str]         # (subject, lang)
+
+
+def _ensure_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS translation_quality (
+            subject      TEXT NOT NULL,
+            lang         TEXT NOT NULL,
+            total        INTEGER NOT NULL,
+            covered      INTEGER NOT NULL,
+            untouched    INTEGER NOT NULL,
+            tokens       INTEGER NOT NULL,
+            latin_tokens INTEGER NOT NULL,
+            top_phrases  TEXT NOT NULL,
+            computed_at  TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (subject, lang)
+        )
+    """)
+
+
+def _new_agg() -> Dict:
+    return {"total": 0, "covered": 0, "untouched": 0, "tokens": 0, "latin_tokens": 0,
+            "phrases": Counter()}
+
+
+def _is_untranslated(word: str) -> bool:
+    # "H", "DNA", "CO" are kept verbatim on purpose; "seconds" is not
+    return len(word) > 1 and not word.isupper() and _LATIN.fullmatch(word) is not None
+
+
+def _scan_field(text: str, agg: Dict):
+    run: List[str] = []
+    seen = set()
+    for m in _WORD.finditer(text):
+        word = m.group(0)
+        agg["tokens"] += 1
+        if _is_untranslated(word):
+            agg["latin_tokens"] += 1
+            # a run continues only across whitespace
+            if run and text[prev_end:m.start()].strip():
+                seen.add(" ".join(run)); run = []
+            run.append(word.lower())
+            prev_end = m.end()
+        elif run:
+            seen.add(" ".join(run)); run = []
+    if run:
+        seen.add(" ".join(run))
+    agg["phrases"].update(seen)
+
+
+def _analyze_chunk(rows: List[tuple], langs: List[str]) -> Dict[Key, Dict]:
+    """Worker: rows are (qb_id, subject, 5 english fields, 5 fields per lang...)."""
+    out: Dict[Key, Dict] = {}
+    n = len(FIELDS)
+    for row in rows:
+        subject, en = row[1] or "", row[2:2 + n]
+        for k, lang in enumerate(langs):
+            tr = row[2 + n * (k + 1): 2 + n * (k + 2)]
+            agg = out.get((subject, lang))
+            if agg is None:
+                agg = out[(subject, lang)] = _new_agg()
+            agg["total"] += 1
+            if not tr[0]:
+                continue
+            agg["covered"] += 1
+            if all((t or "") == (e or "") for t, e in zip(tr, en)):
+                agg["untouched"] += 1
+            for t in tr:
+                if t:
+                    _scan_field(t, agg)
+    for agg in out.values():
+        agg["phrases"] = Counter(dict(agg["phrases"].most_common(_PHRASES_PER_CHUNK)))
+    return out
+
+
+def _merge(into: Dict[Key, Dict], part: Dict[Key, Dict]):
+    for key, agg in part.items():
+        cur = into.get(key)
+        if cur is None:
+            into[key] = agg
+            continue
+        for f in ("total", "covered", "untouched", "tokens", "latin_tokens"):
+            cur[f] += agg[f]
+        cur["phrases"].update(agg["phrases"])
+
+
+def analyze(langs: Optional[List[str]] = None, subjects: Optional[List[str]] = None,
+            workers: Optional[int] = None, chunk_size: int = 2000,
+            progress: Optional[Callable[[int], None]] = None, save: bool = True) -> Dict:
+    """
+    One pass over the bank (optionally only `subjects`). Returns
+    {"rows", "elapsed", "stats": [per (subject, lang) dicts]}; with save=True
+    the rows replace those (subject, lang) entries in translation_quality.
+    progress(rows_done) is called from the calling thread.
+    """
+    langs = [l for l in (langs or LANGS) if l in LANGS]
+    workers = workers or os.cpu_count() or 1
+    columns = "subject, " + ", ".join(f"{f}_en" for f in FIELDS) + ", " + \
+        ", ".join(c for l in langs for c in lang_columns(l, FIELDS))
+    where, params = "1=1", ()
+    if subjects:
+        where, params = f"subject IN ({','.join('?' * len(subjects))})", tuple(subjects)
+
+    t0 = time.time()
+    totals: Dict[Key, Dict] = {}
+    n_rows = 0
+    chunks = iter_bank_rows(columns, where, params, batch_size=chunk_size)
+    if workers <= 1:
+        for rows in chunks:
+            _merge(totals, _analyze_chunk(rows, langs))
+            n_rows += len(rows)
+            if progress:
+                progress(n_rows)
+    else:
+        # spawn: the app process has threads (Streamlit), so don't fork it
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            in_flight = {}
+            for rows in chunks:
+                # plain tuples: sqlite3.Row doesn't pickle
+                in_flight[pool.submit(_analyze_chunk, [tuple(r) for r in rows], langs)] = len(rows)
+                while len(in_flight) >= workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        n_rows += in_flight.pop(fut)
+                        _merge(totals, fut.result())
+                    if progress:
+                        progress(n_rows)
+            for fut in list(in_flight):
+                n_rows += in_flight.pop(fut)
+                _merge(totals, fut.result())
+            if progress:
+                progress(n_rows)
+
+    stats = []
+    for (subject, lang), agg in sorted(totals.items()):
+        stats.append({
+            "subject": subject, "lang": lang, "total": agg["total"], "covered": agg["covered"],
+            "untouched": agg["untouched"], "tokens": agg["tokens"], "latin_tokens": agg["latin_tokens"],
+            "top_phrases": agg["phrases"].most_common(TOP_PHRASES),
+        })
+    if save:
+        _save(stats)
+    return {"rows": n_rows, "elapsed": time.time() - t0, "stats": [_derive(s) for s in stats]}
+
+
+def _save(stats: List[Dict]):
+    conn = _bank_conn()
+    with _bank_lock:
+        try:
+            _ensure_table(conn)
+            conn.executemany("""
+                INSERT OR REPLACE INTO translation_quality
+                    (subject, lang, total, covered, untouched, tokens, latin_tokens, top_phrases)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(s["subject"], s["lang"], s["total"], s["covered"], s["untouched"], s["tokens"],
+                   s["latin_tokens"], json.dumps(s["top_phrases"], ensure_ascii=False)) for s in stats])
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"translation_quality save error: {e}")
+
+
+def _derive(s: Dict) -> Dict:
+    s = dict(s)
+    s["coverage"] = s["covered"] / s["total"] if s["total"] else 0.0
+    s["untouched_ratio"] = s["untouched"] / s["covered"] if s["covered"] else 0.0
+    s["latin_ratio"] = s["latin_tokens"] / s["tokens"] if s["tokens"] else 0.0
+    return s
+
+
+def load_quality(lang: Optional[str] = None) -> List[Dict]:
+    """Last analysis results (all languages, or one), with derived ratios."""
+    conn = _bank_conn()
+    sql = ("SELECT subject, lang, total, covered, untouched, tokens, latin_tokens, top_phrases, "
+           "computed_at FROM translation_quality")
+    params: tuple = ()
+    if lang:
+        sql += " WHERE lang=?"; params = (lang,)
+    try:
+        with _bank_lock:
+            rows = conn.execute(sql + " ORDER BY lang, subject", params).fetchall()
+    except Exception:
+        return []   # translation_quality not created yet
+    keys = ["subject", "lang", "total", "covered", "untouched", "tokens", "latin_tokens",
+            "top_phrases", "computed_at"]
+    out = []
+    for r in rows:
+        s = dict(zip(keys, r))
+        s["top_phrases"] = [tuple(p) for p in json.loads(s["top_phrases"])]
+        out.append(_derive(s))
+    return out
+
+
+def top_phrases(stats: List[Dict], n: int = TOP_PHRASES) -> List[Tuple[str, int]]:
+    """Most frequent untranslated phrases across the given (subject, lang) rows."""
+    c: Counter = Counter()
+    for s in stats:
+        c.update(dict(s["top_phrases"]))
+    return c.most_common(n)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Translation coverage and quality, one pass over the bank")
+    ap.add_argument("--langs", default=",".join(LANGS), help="comma-separated language codes")
+    ap.add_argument("--subjects", default="", help="comma-separated subjects (default: all)")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    ap.add_argument("--top", type=int, default=10, help="untranslated phrases to list per language")
+    args = ap.parse_args()
+    langs = [l.strip() for l in args.langs.split(",") if l.strip()]
+    subjects = [s.strip() for s in args.subjects.split(",") if s.strip()] or None
+
+    res = analyze(langs, subjects, args.workers)
+    print(f"{'subject':<22}{'lang':<6}{'coverage':>10}{'untouched':>11}{'latin':>8}")
+    for s in res["stats"]:
+        print(f"{s['subject']:<22}{s['lang']:<6}{s['coverage']:>9.1%}{s['untouched_ratio']:>11.1%}"
+              f"{s['latin_ratio']:>8.1%}")
+    for lang in langs:
+        phrases = top_phrases([s for s in res["stats"] if s["lang"] == lang], args.top)
+        if phrases:
+            print(f"\n[{lang}] most frequent untranslated: " +
+                  ", ".join(f"{p} ({n:,})" for p, n in phrases))
+    print(f"\n✅ {res['rows']:,} questions analysed in {res['elapsed']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()